@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Charge concurrente sur l'API locale du corpus traité (src/api), comparée à la
+lecture de all_processed_data.json pour chaque requête.
+
+Le serveur tourne dans un processus séparé; les clients (threads, connexions
+persistantes) mélangent premières pages fréquentes, parcours de pages par
+curseur et articles complets: sans cache, avec le cache LRU du serveur, puis
+avec revalidation par ETag côté client.
+
+Usage:
+    python benchmarks/bench_api.py [--articles N] [--requests N]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import socket
+import argparse
+import tempfile
+import http.client
+import multiprocessing
+import concurrent.futures
+from datetime import datetime, timedelta, timezone
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.api.corpus_store import CorpusStore
+from src.api.server import CorpusAPIServer
+
+WORDS = ("lattice key encapsulation module signature standard migration hybrid certificate protocol "
+         "vulnerability patch release security update quantum algorithm implementation").split()
+CATEGORIES = ("post-quantum", "cryptography", "cybersecurity", "quantum")
+SOURCES = tuple(f"source-{i}" for i in range(20))
+
+
+def build_corpus(directory: str, count: int, rng: random.Random):
+    now = datetime.now(timezone.utc)
+    articles = []
+    for i in range(count):
+        text = " ".join(rng.choices(WORDS, k=400))
+        articles.append({"title": " ".join(rng.choices(WORDS, k=8)), "link": f"https://example.org/{i}",
+                         "source_name": rng.choice(SOURCES), "category": rng.choice(CATEGORIES),
+                         "published": (now - timedelta(minutes=rng.randint(0, 525600))).isoformat(),
+                         "cleaned_content": text, "normalized_text": text.lower(),
+                         "keywords": rng.sample(WORDS, 5), "language": "en"})
+    for start in range(0, count, 1000):
+        with open(os.path.join(directory, f"processed_rss_{start:06d}.json"), "w", encoding="utf-8") as f:
+            json.dump(articles[start:start + 1000], f, ensure_ascii=False, indent=2)
+    with open(os.path.join(directory, "all_processed_data.json"), "w", encoding="utf-8") as f:
+        json.dump(articles, f, ensure_ascii=False, indent=2)
+
+
+def run_server(directory: str, port: int, cache_size: int):
+    store = CorpusStore(directory)
+    server = CorpusAPIServer(store, port=port, cache_size=cache_size, refresh_interval=None)
+    server.serve_forever()
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def client(port: int, count: int, seed: int, revalidate: bool):
+    """Requêtes d'un client; renvoie les latences (secondes) et le nombre de 304"""
+    rng = random.Random(seed)
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    etags = {}
+    latencies, not_modified = [], 0
+
+    def get(path):
+        nonlocal not_modified
+        headers = {"If-None-Match": etags[path]} if path in etags else {}
+        start = time.perf_counter()
+        conn.request("GET", path, headers=headers)
+        response = conn.getresponse()
+        body = response.read()
+        latencies.append(time.perf_counter() - start)
+        if response.status == 304:
+            not_modified += 1
+        elif revalidate and response.getheader("ETag"):
+            etags[path] = response.getheader("ETag")
+        return body
+
+    while len(latencies) < count:
+        choice = rng.random()
+        if choice < 0.5:
+            # Première page d'une catégorie (requêtes fréquentes)
+            get(f"/articles?category={rng.choice(CATEGORIES)}&limit=50")
+        elif choice < 0.8:
+            # Parcours de quelques pages d'une source sur 90 jours
+            path = f"/articles?source={rng.choice(SOURCES)}&since=" \
+                   f"{(datetime.now(timezone.utc) - timedelta(days=90)).date()}&limit=50"
+            for _ in range(3):
+                page = json.loads(get(path) or b"{}")
+                if not page.get("next_cursor"):
+                    break
+                path = path.split("&cursor=")[0] + f"&cursor={page['next_cursor']}"
+        else:
+            page = json.loads(get(f"/articles?category={rng.choice(CATEGORIES)}&limit=50") or b"{}")
+            if page.get("items"):
+                get(f"/articles/{rng.choice(page['items'])['id']}")
+    conn.close()
+    return latencies, not_modified
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Charge concurrente sur l'API du corpus")
+    parser.add_argument("--articles", type=int, default=20000, help="Nombre d'articles")
+    parser.add_argument("--requests", type=int, default=4000, help="Requêtes par niveau de concurrence")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        build_corpus(directory, args.articles, random.Random(5))
+        size = os.path.getsize(os.path.join(directory, "all_processed_data.json"))
+
+        # Situation actuelle: relire le fichier combiné pour chaque requête
+        start = time.perf_counter()
+        with open(os.path.join(directory, "all_processed_data.json"), "r", encoding="utf-8") as f:
+            corpus = json.load(f)
+        page = sorted((a for a in corpus if a["category"] == "quantum"),
+                      key=lambda a: a["published"], reverse=True)[:50]
+        baseline = time.perf_counter() - start
+        print(f"{args.articles} articles ({size / 1e6:.0f} Mo): relecture de all_processed_data.json "
+              f"{baseline * 1e3:.0f} ms par requête")
+
+        store = CorpusStore(directory)
+        start = time.perf_counter()
+        store.refresh()
+        print(f"Indexation initiale: {time.perf_counter() - start:.1f} s")
+        store.close()
+
+        for mode, cache_size, revalidate in (("sans cache", 0, False), ("LRU", 1024, False),
+                                             ("LRU + ETag", 1024, True)):
+            port = free_port()
+            server = multiprocessing.Process(target=run_server, args=(directory, port, cache_size), daemon=True)
+            server.start()
+            for _ in range(100):
+                try:
+                    socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+                    break
+                except OSError:
+                    time.sleep(0.05)
+
+            for clients in (1, 8, 32):
+                start = time.perf_counter()
+                with concurrent.futures.ThreadPoolExecutor(max_workers=clients) as executor:
+                    results = list(executor.map(
+                        lambda seed: client(port, args.requests // clients, seed, revalidate), range(clients)))
+                elapsed = time.perf_counter() - start
+                latencies = sorted(latency for result, _ in results for latency in result)
+                not_modified = sum(count for _, count in results)
+                print(f"{mode:10s}, {clients:2d} clients: {len(latencies) / elapsed:6.0f} req/s | "
+                      f"p50 {latencies[len(latencies) // 2] * 1e3:5.2f} ms | "
+                      f"p99 {latencies[int(len(latencies) * 0.99)] * 1e3:6.2f} ms | "
+                      f"304: {not_modified / len(latencies):.0%}")
+            server.terminate()
+            server.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Mémoire de pointe des téléchargements face à des réponses hostiles: page
+énorme, bombe de décompression gzip et deflate brut, servies localement.
+Compare requests (response.text, corps complet en mémoire) au téléchargement
+borné (fetch_bounded).
+
+Usage:
+    python benchmarks/bench_download.py [--size-mb N] [--max-bytes N]
+"""
+
+import os
+import sys
+import gzip
+import zlib
+import argparse
+import threading
+import tracemalloc
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+from src.collectors.download import fetch_bounded
+
+BODIES = {}
+
+
+class Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        body, encoding = BODIES[self.path]
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # client arrivé à sa limite
+
+
+def peak(func) -> float:
+    """Mémoire de pointe (Mo) allouée pendant l'appel"""
+    tracemalloc.start()
+    func()
+    _, top = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return top / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mémoire de pointe des téléchargements")
+    parser.add_argument("--size-mb", type=int, default=100, help="Taille décompressée des réponses (Mo)")
+    parser.add_argument("--max-bytes", type=int, default=5 * 1024 * 1024, help="Limite du téléchargement borné")
+    args = parser.parse_args()
+
+    html = b"<html><body><main>" + b"<p>PQC</p>" * (args.size_mb * 1024 * 1024 // 10) + b"</main></body></html>"
+    deflater = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    BODIES["/huge"] = (html, None)
+    BODIES["/gzip-bomb"] = (gzip.compress(html), "gzip")
+    BODIES["/deflate-bomb"] = (deflater.compress(html) + deflater.flush(), "deflate")
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"Réponses de {args.size_mb} Mo décompressées - limite {args.max_bytes / 1e6:.1f} Mo")
+    for path, (body, _) in BODIES.items():
+        url = base + path
+        unbounded = peak(lambda: requests.get(url, timeout=30).text)
+        bounded = peak(lambda: fetch_bounded(url, {}, 30, args.max_bytes).text)
+        print(f"{path:14s} ({len(body) / 1e6:6.1f} Mo transférés): requests {unbounded:7.1f} Mo | "
+              f"borné {bounded:5.1f} Mo")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Extraction des entités et requêtes sur leur index: "articles qui citent
+FIPS 204 ces 30 derniers jours" par l'index, contre une relecture du corpus
+traité (all_processed_data.json) filtré sur son champ "entities".
+
+Usage:
+    python benchmarks/bench_entities.py [--articles N]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.processors.entities import get_entity_extractor
+from src.processors.entity_index import EntityIndex
+
+WORDS = ("lattice key encapsulation module signature standard migration hybrid certificate protocol "
+         "vulnerability patch release security update quantum algorithm implementation").split()
+MENTIONS = ("FIPS 204", "FIPS PUB 203", "CRYSTALS-Kyber", "SPHINCS+", "CVE-2024-3094", "RFC 9180",
+            "NIST SP 800-208", "ML-DSA", "Classic McEliece", "TLS 1.3")
+
+
+def build_articles(count: int, rng: random.Random):
+    now = datetime.now(timezone.utc)
+    articles = []
+    for i in range(count):
+        words = rng.choices(WORDS, k=500)
+        for _ in range(rng.randint(0, 3)):
+            words.insert(rng.randrange(len(words)), rng.choice(MENTIONS))
+        articles.append({"title": " ".join(rng.choices(WORDS, k=8)), "link": f"https://example.org/{i}",
+                         "source_name": "bench", "category": "post-quantum",
+                         "published": (now - timedelta(days=rng.uniform(0, 365))).isoformat(),
+                         "cleaned_content": " ".join(words)})
+    return articles
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extraction et index des entités")
+    parser.add_argument("--articles", type=int, default=20000, help="Nombre d'articles")
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    articles = build_articles(args.articles, rng)
+    extractor = get_entity_extractor()
+
+    start = time.perf_counter()
+    for article in articles:
+        article["entities"] = [{"type": kind, "name": name}
+                               for kind, name in extractor.extract(article["title"], article["cleaned_content"])]
+    extraction = time.perf_counter() - start
+    print(f"Extraction: {extraction / len(articles) * 1e6:.0f} µs/article "
+          f"({len(articles[0]['cleaned_content'])} caractères)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        corpus_path = os.path.join(directory, "all_processed_data.json")
+        with open(corpus_path, "w", encoding="utf-8") as f:
+            json.dump(articles, f, ensure_ascii=False)
+
+        index = EntityIndex(os.path.join(directory, "entity_index.sqlite"))
+        start = time.perf_counter()
+        mentions = index.add_articles(articles)
+        print(f"Indexation: {mentions} mentions en {time.perf_counter() - start:.2f} s")
+
+        since = datetime.now(timezone.utc) - timedelta(days=30)
+        start = time.perf_counter()
+        for _ in range(20):
+            indexed = index.articles("fips 204", days=30, limit=10 ** 6)
+        query = (time.perf_counter() - start) / 20
+
+        start = time.perf_counter()
+        with open(corpus_path, "r", encoding="utf-8") as f:
+            corpus = json.load(f)
+        scanned = [article for article in corpus
+                   if datetime.fromisoformat(article["published"]) >= since
+                   and {"type": "fips", "name": "FIPS 204"} in article["entities"]]
+        scan = time.perf_counter() - start
+        assert len(scanned) == len(indexed), (len(scanned), len(indexed))
+
+        print(f"FIPS 204, 30 derniers jours ({len(indexed)} articles): index {query * 1e3:.2f} ms | "
+              f"relecture du corpus {scan * 1e3:.0f} ms (x{scan / query:.0f})")
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
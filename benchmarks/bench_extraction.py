@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark de l'extraction web: implémentation BeautifulSoup historique
+contre les règles compilées lxml de ContentExtractor.
+
+Usage:
+    python benchmarks/bench_extraction.py [--pages N] [--items N]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from src.collectors.extraction import ContentExtractor, LXML_AVAILABLE
+
+
+def build_page(items: int, with_selector_match: bool = True) -> str:
+    """Construit une page de liste d'actualités synthétique"""
+    item_class = "news-list-item" if with_selector_match else "news-entry"
+    blocks = []
+    for i in range(items):
+        blocks.append(
+            f'<article class="{item_class}"><h3><a href="/actualites/{i}">Actualité {i} &amp; PQC</a></h3>'
+            f'<p>Publication du <b>FIPS 20{i % 6}</b> et migration ML-KEM.<!-- commentaire --></p>'
+            f'<script>var x = {i};</script><span class="date">1{i % 9} mars 2024</span></article>'
+        )
+    return (
+        "<html><head><title>Actualités ANSSI</title><style>body{}</style></head><body>"
+        "<header><nav><a href='/'>Accueil</a></nav></header>"
+        f"<main class='main-content'><div class='content-list'>{''.join(blocks)}</div>"
+        "<aside>Liens</aside></main><footer>Pied</footer></body></html>"
+    )
+
+
+def legacy_extract(html: str, selector: str):
+    """Extraction telle qu'implémentée avant les règles compilées"""
+    soup = BeautifulSoup(html, "html.parser")
+    title = soup.title.get_text() if soup.title else ""
+    content = ""
+    elements = soup.select(selector)
+    if elements:
+        for element in elements:
+            extracted_text = element.get_text(separator="\n", strip=True)
+            if extracted_text:
+                content += extracted_text + "\n\n"
+        return title, content
+
+    main_elements = soup.find_all(["article", "main", "div", "section"],
+                                  class_=lambda c: c and any(x in str(c).lower() for x in ["content", "main", "article", "text"]))
+    if main_elements:
+        for element in main_elements:
+            for tag in element.find_all(["script", "style", "nav", "header", "footer", "aside"]):
+                tag.decompose()
+            content += element.get_text(separator="\n", strip=True) + "\n\n"
+        return title, content
+
+    if soup.body:
+        for tag in soup.body.find_all(["script", "style", "nav", "header", "footer", "aside"]):
+            tag.decompose()
+        content = soup.body.get_text(separator="\n", strip=True)
+    return title, content
+
+
+def bench(label: str, func, pages):
+    start = time.perf_counter()
+    results = [func(page) for page in pages]
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed * 1000 / len(pages):8.3f} ms/page")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de l'extraction web")
+    parser.add_argument("--pages", type=int, default=200, help="Nombre de pages par scénario")
+    parser.add_argument("--items", type=int, default=40, help="Nombre d'actualités par page")
+    args = parser.parse_args()
+
+    print(f"lxml disponible: {LXML_AVAILABLE}")
+    selector = "article.news-list-item"
+
+    for scenario, matches in (("sélecteur", True), ("repli contenu principal", False)):
+        pages = [build_page(args.items, matches) for _ in range(args.pages)]
+        extractor = ContentExtractor()
+        print(f"\n=== Scénario: {scenario} ===")
+        legacy = bench("BeautifulSoup (historique)", lambda p: legacy_extract(p, selector), pages)
+        compiled = bench("Règles compilées", lambda p: extractor.extract(p, "https://cyber.gouv.fr/actualites", selector), pages)
+        identical = all(l == (c.title, c.content) for l, c in zip(legacy, compiled))
+        print(f"Sorties identiques: {identical}")
+
+
+if __name__ == "__main__":
+    main()
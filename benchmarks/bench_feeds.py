@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark de l'analyse des flux: feedparser contre l'analyse incrémentale lxml
+(iterparse), sur des flux RSS 2.0, RSS 1.0 (type listing arXiv) et Atom
+synthétiques, avec et sans arrêt anticipé sur les entrées déjà collectées.
+
+Usage:
+    python benchmarks/bench_feeds.py [--entries N] [--new N]
+"""
+
+import io
+import os
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feedparser
+from src.collectors.feed_parser import iter_feed_entries, FeedParseError
+from src.collectors.rss_collector import RSSCollector
+from src.collectors.source_registry import as_source
+
+ABSTRACT = ("We present a lattice-based key encapsulation mechanism with <b>tight</b> security "
+            "reductions in the quantum random oracle model &amp; evaluate side-channel resistance. ") * 4
+
+
+def build_rss2(entries: int) -> bytes:
+    items = "".join(
+        f"<item><title>Paper {i}: post-quantum signatures</title>"
+        f"<link>https://example.org/abs/{i}</link><guid>https://example.org/abs/{i}</guid>"
+        f"<description><![CDATA[<p>{ABSTRACT}</p>]]></description>"
+        f"<pubDate>Mon, 0{1 + i % 9} Apr 2024 10:00:00 GMT</pubDate></item>"
+        for i in range(entries))
+    return (f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Synth</title>'
+            f'<link>https://example.org</link><description>Synth</description>{items}</channel></rss>').encode("utf-8")
+
+
+def build_rss1(entries: int) -> bytes:
+    items = "".join(
+        f'<item rdf:about="https://example.org/abs/{i}"><title>Paper {i}: side channels</title>'
+        f"<link>https://example.org/abs/{i}</link><description>{ABSTRACT.replace('<b>', '').replace('</b>', '')}"
+        f"</description><dc:creator>Author {i}</dc:creator><dc:date>2024-04-0{1 + i % 9}T10:00:00Z</dc:date></item>"
+        for i in range(entries))
+    return ('<?xml version="1.0" encoding="UTF-8"?><rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" '
+            'xmlns="http://purl.org/rss/1.0/" xmlns:dc="http://purl.org/dc/elements/1.1/">'
+            f'<channel rdf:about="https://example.org"><title>cs.CR</title></channel>{items}</rdf:RDF>').encode("utf-8")
+
+
+def build_atom(entries: int) -> bytes:
+    items = "".join(
+        f'<entry><title>Paper {i}: hybrid key exchange</title><id>urn:paper:{i}</id>'
+        f'<link rel="alternate" href="https://example.org/abs/{i}"/><link rel="related" href="https://example.org/pdf/{i}"/>'
+        f"<published>2024-04-0{1 + i % 9}T10:00:00Z</published><updated>2024-04-10T10:00:00Z</updated>"
+        f'<summary type="html">&lt;p&gt;{ABSTRACT.replace("<", "&lt;").replace(">", "&gt;")}&lt;/p&gt;</summary></entry>'
+        for i in range(entries))
+    return ('<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom">'
+            f'<title>Synth</title><id>urn:synth</id>{items}</feed>').encode("utf-8")
+
+
+def best_of(func, repeat: int = 3) -> float:
+    times = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de l'analyse des flux")
+    parser.add_argument("--entries", type=int, default=5000, help="Entrées par flux")
+    parser.add_argument("--new", type=int, default=50, help="Entrées nouvelles (arrêt anticipé)")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    collector = RSSCollector(directory, directory, known_run=20)
+    source = as_source("rss", {"name": "Synth", "url": "https://example.org/feed", "category": "bench"})
+    # Toutes les entrées sauf les `new` premières ont déjà été collectées
+    known = {f"https://example.org/abs/{i}" for i in range(args.new, args.entries)}
+
+    print(f"Entrées par flux: {args.entries} - nouvelles: {args.new}")
+    for name, builder in (("RSS 2.0", build_rss2), ("RSS 1.0", build_rss1), ("Atom", build_atom)):
+        data = builder(args.entries)
+
+        # Même résultat (liens et titres) pour les deux analyseurs
+        reference = [(e.get("link"), e.get("title")) for e in feedparser.parse(data).entries]
+        fast = [(e.get("link"), e.get("title")) for e in iter_feed_entries(data)]
+        assert reference == fast, f"{name}: entrées différentes"
+
+        full_feedparser = best_of(lambda: collector._new_articles(feedparser.parse(data).entries, source, set()))
+        full_lxml = best_of(lambda: collector._new_articles(iter_feed_entries(data), source, set()))
+        incr_feedparser = best_of(lambda: collector._new_articles(feedparser.parse(data).entries, source, set(known)))
+        incr_lxml = best_of(lambda: collector._new_articles(iter_feed_entries(data), source, set(known)))
+
+        print(f"{name} ({len(data) / 1e6:.1f} Mo)")
+        print(f"  flux complet:      feedparser {full_feedparser * 1000:8.1f} ms | lxml {full_lxml * 1000:7.1f} ms "
+              f"(x{full_feedparser / full_lxml:.1f})")
+        print(f"  {args.new} nouvelles:     feedparser {incr_feedparser * 1000:8.1f} ms | lxml {incr_lxml * 1000:7.1f} ms "
+              f"(x{incr_feedparser / incr_lxml:.1f})")
+
+    # Flux mal formé: l'analyse incrémentale échoue, feedparser prend le relais
+    broken = build_rss2(10)[:-30] + b"<item><title>x</title></chan"
+    try:
+        list(iter_feed_entries(broken))
+    except FeedParseError:
+        print(f"Flux mal formé: repli feedparser ({len(feedparser.parse(broken).entries)} entrées récupérées)")
+
+
+if __name__ == "__main__":
+    main()
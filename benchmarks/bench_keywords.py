@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark de l'extraction de mots-clés: classement par fréquence article par
+article (historique) contre le moteur TF-IDF par lots.
+
+Usage:
+    python benchmarks/bench_keywords.py [--articles N] [--words N]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.processors.text_processor import TextProcessor
+from src.processors.keyword_engine import KeywordEngine
+
+# Vocabulaire générique (présent partout) et spécifique (quelques termes par article)
+COMMON = ["sécurité", "données", "système", "nouveau", "publication", "article", "version", "également",
+          "security", "update", "information", "année", "mise", "jour", "projet", "travail"]
+SPECIFIC = ["ml-kem", "kyber", "dilithium", "falcon", "sphincs", "lattice", "fips", "rsa", "ecdsa",
+            "hqc", "mceliece", "hybridation", "migration", "certificat", "tls", "ipsec", "hsm",
+            "side-channel", "quantique", "qkd"]
+
+
+def build_article(rng: random.Random, words: int):
+    """Construit un texte synthétique et ses termes spécifiques"""
+    topics = rng.sample(SPECIFIC, 3)
+    tokens = [rng.choice(COMMON) for _ in range(words)]
+    tokens += [rng.choice(topics) for _ in range(words // 10)]
+    rng.shuffle(tokens)
+    return " ".join(tokens), set(topics)
+
+
+def precision(keywords, topics, k: int = 3) -> float:
+    """Part des termes spécifiques de l'article parmi ses k premiers mots-clés"""
+    return sum(1 for word in keywords[:k] if word in topics) / k
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de l'extraction de mots-clés")
+    parser.add_argument("--articles", type=int, default=100000, help="Nombre d'articles du lot")
+    parser.add_argument("--words", type=int, default=200, help="Nombre de mots par article")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    corpus = [build_article(rng, args.words) for _ in range(args.articles)]
+    texts = [text for text, _ in corpus]
+    keys = [f"https://example.org/{i}" for i in range(args.articles)]
+
+    processor = TextProcessor(tempfile.mkdtemp(), tempfile.mkdtemp(), build_link_graph=False)
+    start = time.perf_counter()
+    legacy = [processor._extract_keywords(text) for text in texts]
+    legacy_elapsed = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        with KeywordEngine(os.path.join(directory, "keyword_df.sqlite")) as engine:
+            start = time.perf_counter()
+            tfidf = engine.extract_batch(texts, keys)
+            tfidf_elapsed = time.perf_counter() - start
+
+    print(f"Articles: {args.articles} - mots par article: {args.words}")
+    for label, elapsed, results in (("Fréquence (historique)", legacy_elapsed, legacy),
+                                    ("TF-IDF par lot", tfidf_elapsed, tfidf)):
+        score = sum(precision(k, topics) for k, (_, topics) in zip(results, corpus)) / len(corpus)
+        print(f"{label:<24} {elapsed * 1e6 / len(texts):8.1f} µs/article - précision@3 {score:.2f}")
+
+
+if __name__ == "__main__":
+    main()
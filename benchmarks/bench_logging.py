@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark du coût du logging et de la progression dans la boucle de traitement
+
+Compare le traitement de lots d'articles sans instrumentation au traitement avec
+logging configuré (messages de debug filtrés par niveau) et progression mise à
+jour une fois par lot, et mesure l'appel datetime.now() par article remplacé par
+une date de traitement par lot.
+
+Usage:
+    python benchmarks/bench_logging.py [--articles N] [--batch-size N]
+"""
+
+import os
+import sys
+import time
+import random
+import logging
+import argparse
+import tempfile
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.processors.text_processor import TextProcessor
+from src.utils.logging_utils import configure_logging, StageProgress
+
+WORDS = ("sécurité cryptographie post-quantique migration algorithme signature chiffrement "
+         "security lattice standard implementation attack quantum key exchange hybrid").split()
+
+
+def build_articles(count: int):
+    rng = random.Random(7)
+    return [{
+        "title": f"Article {i} {' '.join(rng.choice(WORDS) for _ in range(6))}",
+        "link": f"https://example.org/articles/{i}",
+        "summary": f"<p>{' '.join(rng.choice(WORDS) for _ in range(40))}</p>",
+        "content": f"<div><p>{' '.join(rng.choice(WORDS) for _ in range(300))}</p></div>",
+        "source": "NIST",
+        "category": "cryptographie",
+        "collected_at": "2024-10-01T10:00:00"
+    } for i in range(count)]
+
+
+def run(processor: TextProcessor, batches, instrumented: bool) -> float:
+    start = time.perf_counter()
+    progress = StageProgress("Benchmark", total=len(batches)) if instrumented else None
+    for batch in batches:
+        processed = processor.process_articles(batch)
+        if progress is not None:
+            progress.update(len(processed))
+    if progress is not None:
+        progress.close()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du coût du logging")
+    parser.add_argument("--articles", type=int, default=5000, help="Nombre d'articles traités")
+    parser.add_argument("--batch-size", type=int, default=100, help="Articles par lot")
+    args = parser.parse_args()
+
+    articles = build_articles(args.articles)
+    batches = [articles[i:i + args.batch_size] for i in range(0, len(articles), args.batch_size)]
+    directory = tempfile.mkdtemp()
+    processor = TextProcessor(directory, directory, build_link_graph=False, tfidf_keywords=False,
+                              build_reports=False)
+
+    # Échauffement (caches de langue et de racinisation)
+    processor.process_articles(articles[:args.batch_size])
+
+    # Mesures alternées (meilleur de 5) pour écarter la dérive de la machine
+    configure_logging()
+    bare_times, instrumented_times = [], []
+    for _ in range(5):
+        logging.disable(logging.CRITICAL)
+        bare_times.append(run(processor, batches, False))
+        logging.disable(logging.NOTSET)
+        instrumented_times.append(run(processor, batches, True))
+    bare, instrumented = min(bare_times), min(instrumented_times)
+
+    start = time.perf_counter()
+    for _ in range(args.articles):
+        datetime.now().isoformat()
+    per_article_now = (time.perf_counter() - start) / args.articles
+
+    print(f"Articles: {args.articles} - lots de {args.batch_size}")
+    print(f"Sans instrumentation:   {bare * 1e6 / args.articles:8.1f} µs/article")
+    print(f"Logging + progression:  {instrumented * 1e6 / args.articles:8.1f} µs/article "
+          f"({(instrumented - bare) / bare * 100:+.2f} %)")
+    print(f"datetime.now() par article (supprimé): {per_article_now * 1e6:.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark mémoire du traitement: dictionnaires historiques (article.copy() + champs
+ajoutés) contre ArticleRecord, avec et sans conservation du HTML brut.
+
+Les articles sont lus par fichiers successifs (comme process_all_files) et tous
+les articles traités restent en mémoire jusqu'à la fin, comme all_processed_data.
+
+Usage:
+    python benchmarks/bench_memory.py [--articles N] [--file-size N]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import tracemalloc
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.processors.text_processor import TextProcessor
+from src.processors.language import get_detector
+
+WORDS = ("sécurité cryptographie post-quantique migration algorithme signature chiffrement "
+         "security lattice standard implementation attack quantum key exchange hybrid").split()
+
+
+def build_file(rng: random.Random, start: int, count: int) -> str:
+    """Contenu JSON d'un fichier brut synthétique (flux RSS, HTML de 3 à 4 Ko)"""
+    articles = []
+    for i in range(start, start + count):
+        paragraphs = "".join(
+            f"<p>{' '.join(rng.choice(WORDS) for _ in range(60))} "
+            f"<a href='/articles/{rng.randrange(50)}'>lien</a></p>" for _ in range(6))
+        articles.append({
+            "title": f"Article {i} {' '.join(rng.choice(WORDS) for _ in range(6))}",
+            "link": f"https://example.org/articles/{i}",
+            "summary": f"<p>{' '.join(rng.choice(WORDS) for _ in range(40))}</p>",
+            "content": f"<div>{paragraphs}<a href='https://nist.gov/pqc'>NIST</a></div>",
+            "published": "Mon, 01 Oct 2024 10:00:00 GMT",
+            "source_name": "NIST",
+            "category": "cryptographie",
+            "collected_at": "2024-10-01T10:00:00"
+        })
+    return json.dumps(articles, ensure_ascii=False)
+
+
+def legacy_process(processor: TextProcessor, article):
+    """Traitement tel qu'implémenté avant ArticleRecord (dictionnaire par article)"""
+    processed = article.copy()
+    extracted_links = []
+    seen_urls = set()
+    base_url = article.get("link") or article.get("url")
+    if "content" in processed:
+        clean_content, links = processor._clean_html(processed["content"], base_url)
+        content_links = [{"text": text, "url": url} for url, text in links]
+        processed["cleaned_content"] = clean_content
+        processed["content_links"] = content_links
+        extracted_links.extend(content_links)
+        seen_urls.update(link["url"] for link in content_links)
+    if "summary" in processed:
+        clean_summary, links = processor._clean_html(processed["summary"], base_url)
+        summary_links = [{"text": text, "url": url} for url, text in links]
+        processed["cleaned_summary"] = clean_summary
+        processed["summary_links"] = summary_links
+        for link in summary_links:
+            if link["url"] not in seen_urls:
+                seen_urls.add(link["url"])
+                extracted_links.append(link)
+    language = get_detector().detect(
+        processed.get("cleaned_content") or processed.get("cleaned_summary") or processed.get("title"))
+    processed["language"] = language
+    if "cleaned_content" in processed:
+        processed["normalized_text"] = processor._clean_text(processed["cleaned_content"], language)
+        processed["keywords"] = processor._extract_keywords(processed["normalized_text"], language=language)
+    if processed.get("title"):
+        processed["cleaned_title"] = processor._clean_text(processed["title"], language)
+    processed["all_links"] = extracted_links
+    processed["processed_at"] = datetime.now().isoformat()
+    return processed
+
+
+def run(label: str, process, args):
+    rng = random.Random(7)
+    tracemalloc.start()
+    start = time.perf_counter()
+    retained = []
+    for offset in range(0, args.articles, args.file_size):
+        # Lecture d'un fichier: chaînes neuves, libérées après traitement du fichier
+        data = json.loads(build_file(rng, offset, min(args.file_size, args.articles - offset)))
+        retained.extend(process(article) for article in data)
+        del data
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    elapsed = time.perf_counter() - start
+    per_article = current / args.articles
+    print(f"{label:<34} conservé {current / 1e6:8.1f} Mo ({per_article / 1024:5.1f} Ko/article) - "
+          f"pic {peak / 1e6:8.1f} Mo - 1M articles ≈ {per_article * 1e6 / 1e9:5.1f} Go - {elapsed:.1f}s")
+    return retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark mémoire du traitement")
+    parser.add_argument("--articles", type=int, default=5000, help="Nombre d'articles traités")
+    parser.add_argument("--file-size", type=int, default=1000, help="Nombre d'articles par fichier brut")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    kwargs = dict(build_link_graph=False, tfidf_keywords=False)
+    legacy = TextProcessor(directory, directory, **kwargs)
+    compact = TextProcessor(directory, directory, **kwargs)
+    dropped = TextProcessor(directory, directory, keep_raw_html=False, **kwargs)
+
+    print(f"Articles: {args.articles} - {args.file_size} par fichier")
+    run("Dictionnaires (historique)", lambda a: legacy_process(legacy, a), args)
+    run("ArticleRecord", compact.process_record, args)
+    run("ArticleRecord sans HTML brut", dropped.process_record, args)
+
+
+if __name__ == "__main__":
+    main()
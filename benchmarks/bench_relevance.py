@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Coût du préfiltre de pertinence et gain sur le traitement: articles d'un flux
+généraliste synthétique (une petite part sur le post-quantique), traités avec
+et sans préfiltre (relevance.json, catégorie "post-quantum", action "cheap").
+
+Usage:
+    python benchmarks/bench_relevance.py [--articles N] [--relevant-share X]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.processors.text_processor import TextProcessor
+from src.utils.relevance import DEFAULT_RELEVANCE_PATH, get_relevance_filter
+
+ON_TOPIC = ["Migration vers ML-KEM: premiers retours d'expérience", "Kyber et Dilithium standardisés (FIPS 203, FIPS 204)",
+            "Cryptographie post-quantique: l'ANSSI publie un avis", "Harvest now, decrypt later: préparer la crypto-agilité"]
+OFF_TOPIC = ["Windows 11: les nouveautés de la mise à jour", "Cloud hybride: 5 conseils pour réduire les coûts",
+             "Webinaire: réussir sa transformation numérique", "Intelligence artificielle générative en entreprise",
+             "Sauvegarde: la règle 3-2-1 expliquée", "Télétravail et gestion des postes de travail"]
+PARAGRAPH = ("<p>Les entreprises doivent <a href='https://example.org/{i}'>revoir</a> leurs architectures, "
+             "former leurs équipes et <strong>mesurer</strong> les risques &amp; les coûts associés.</p>")
+
+
+def build_articles(count: int, relevant_share: float):
+    rng = random.Random(42)
+    articles = []
+    for i in range(count):
+        title = rng.choice(ON_TOPIC if rng.random() < relevant_share else OFF_TOPIC)
+        articles.append({
+            "title": title,
+            "link": f"https://example.org/article/{i}",
+            "summary": f"<p>{title}. " + "Analyse et recommandations pour les DSI.</p>",
+            "content": "".join(PARAGRAPH.format(i=i * 10 + j) for j in range(20)),
+            "category": "post-quantum",
+            "source": "Synth",
+        })
+    return articles
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Coût et gain du préfiltre de pertinence")
+    parser.add_argument("--articles", type=int, default=2000, help="Nombre d'articles")
+    parser.add_argument("--relevant-share", type=float, default=0.15, help="Part d'articles pertinents")
+    args = parser.parse_args()
+
+    relevance_filter = get_relevance_filter(DEFAULT_RELEVANCE_PATH)
+    if relevance_filter is None:
+        sys.exit(f"Configuration absente: {DEFAULT_RELEVANCE_PATH}")
+    articles = build_articles(args.articles, args.relevant_share)
+
+    scoring = timed(lambda: [relevance_filter.score_article(article) for article in articles])
+    relevant = sum(relevance_filter.score_article(article).relevant for article in articles)
+    print(f"{args.articles} articles, {relevant} pertinents selon le préfiltre")
+    print(f"Préfiltre: {scoring / len(articles) * 1e6:.1f} µs par article")
+
+    directory = tempfile.mkdtemp()
+    full = TextProcessor(directory, directory, build_link_graph=False, build_reports=False,
+                         tfidf_keywords=False, topic_vectorizer=None, relevance_path=None)
+    filtered = TextProcessor(directory, directory, build_link_graph=False, build_reports=False,
+                             tfidf_keywords=False, topic_vectorizer=None)
+    full_time = timed(lambda: full.process_articles(articles))
+    filtered_time = timed(lambda: filtered.process_articles(articles))
+    print(f"Traitement complet:      {full_time:6.2f} s ({full_time / len(articles) * 1000:.2f} ms par article)")
+    print(f"Avec préfiltre (cheap):  {filtered_time:6.2f} s ({filtered_time / len(articles) * 1000:.2f} ms par article, "
+          f"x{full_time / filtered_time:.1f})")
+
+
+if __name__ == "__main__":
+    main()
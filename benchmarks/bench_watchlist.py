@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Coût de la recherche des termes surveillés selon la taille de la liste:
+automate unique (Aho-Corasick) contre une expression régulière par terme.
+
+Usage:
+    python benchmarks/bench_watchlist.py [--articles N]
+"""
+
+import os
+import re
+import sys
+import time
+import random
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.alerts.watchlist import WatchlistEngine, _article_text
+from src.utils.aho_corasick import fold_text
+
+WORDS = ("lattice key encapsulation module signature standard migration hybrid certificate protocol "
+         "vulnerability patch release security update quantum algorithm implementation").split()
+
+
+def build_terms(count: int, rng: random.Random):
+    terms = ["FIPS 203", "Kyber", "ML-KEM"]
+    while len(terms) < count:
+        terms.append(f"CVE-{rng.randint(2015, 2025)}-{rng.randint(1000, 99999)}")
+    return terms
+
+
+def build_articles(count: int, rng: random.Random):
+    return [{"title": " ".join(rng.choices(WORDS, k=8)), "link": f"https://example.org/{i}",
+             "summary": " ".join(rng.choices(WORDS, k=60)) + (" Kyber" if i % 10 == 0 else ""),
+             "content": " ".join(rng.choices(WORDS, k=400))} for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recherche des termes surveillés")
+    parser.add_argument("--articles", type=int, default=300, help="Nombre d'articles")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    articles = build_articles(args.articles, rng)
+    length = sum(len(_article_text(article)) for article in articles) / len(articles)
+    print(f"{args.articles} articles, {length:.0f} caractères en moyenne")
+
+    for size in (100, 1000, 10000):
+        terms = build_terms(size, rng)
+        engine = WatchlistEngine({"sinks": {}, "watches": [{"name": "bench", "terms": terms, "sinks": []}]},
+                                 state_path=":memory:")
+        start = time.perf_counter()
+        automaton_hits = sum(bool(engine.match(article)) for article in articles)
+        automaton = (time.perf_counter() - start) / len(articles)
+
+        patterns = [re.compile(r"(?<!\w)" + re.escape(fold_text(term)) + r"(?!\w)") for term in terms]
+        sample = articles[:max(1, min(len(articles), 30000 // size))]
+        start = time.perf_counter()
+        regex_hits = 0
+        for article in sample:
+            text = fold_text(_article_text(article))
+            regex_hits += any(p.search(text) for p in patterns)
+        regex = (time.perf_counter() - start) / len(sample)
+        assert regex_hits == sum(bool(engine.match(article)) for article in sample)
+
+        print(f"{size:6d} termes: automate {automaton * 1e6:8.0f} µs/article | une regex par terme "
+              f"{regex * 1e6:9.0f} µs/article (x{regex / automaton:.0f}) - {automaton_hits} alertes")
+        engine.close()
+
+
+if __name__ == "__main__":
+    main()
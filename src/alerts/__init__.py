@@ -0,0 +1 @@
+# Initialisation du package alerts 
\ No newline at end of file
@@ -0,0 +1,150 @@
+import os
+import json
+import threading
+from abc import ABC, abstractmethod
+from email.message import EmailMessage
+from email.utils import formatdate, make_msgid
+from typing import Any, Callable, Dict, Type
+
+import requests
+
+
+class AlertSink(ABC):
+    """
+    Destination des alertes
+
+    Une destination reçoit une alerte à la fois (dictionnaire: watch, terms, title,
+    link, source, category, published, matched_at) et lève une exception en cas
+    d'échec: l'alerte reste en attente et sera retentée.
+    """
+
+    def __init__(self, name: str, **options: Any):
+        self.name = name
+
+    @abstractmethod
+    def send(self, alert: Dict[str, Any]) -> None:
+        """
+        Envoie une alerte
+
+        Args:
+            alert (Dict[str, Any]): Alerte à envoyer
+
+        Raises:
+            Exception: Échec de l'envoi (l'alerte sera retentée)
+        """
+
+
+class FileSink(AlertSink):
+    """Alertes ajoutées à un fichier JSON Lines"""
+
+    def __init__(self, name: str, path: str = "data/alerts/alerts.jsonl"):
+        super().__init__(name)
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def send(self, alert: Dict[str, Any]) -> None:
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(alert, ensure_ascii=False) + "\n")
+
+
+class WebhookSink(AlertSink):
+    """
+    Alertes envoyées en JSON (POST) à un webhook
+
+    Prévu pour un récepteur local (relais vers une messagerie, un SIEM): délai
+    court, aucune nouvelle tentative immédiate.
+    """
+
+    def __init__(self, name: str, url: str = "http://127.0.0.1:8765/alerts", timeout: float = 5.0,
+                 headers: Dict[str, str] = None):
+        super().__init__(name)
+        self.url = url
+        self.timeout = timeout
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+
+    def send(self, alert: Dict[str, Any]) -> None:
+        response = requests.post(self.url, data=json.dumps(alert, ensure_ascii=False).encode("utf-8"),
+                                 headers=self.headers, timeout=self.timeout)
+        response.raise_for_status()
+
+
+class EmailSink(AlertSink):
+    """
+    Alertes rédigées en courriels (.eml) dans un répertoire d'envoi
+
+    Aucun envoi SMTP: un relais (ou un outil de messagerie) dépose les messages
+    du répertoire. Un fichier par alerte.
+    """
+
+    def __init__(self, name: str, to: Any = (), sender: str = "veille@localhost",
+                 outbox: str = "data/alerts/outbox"):
+        super().__init__(name)
+        self.to = [to] if isinstance(to, str) else list(to)
+        self.sender = sender
+        self.outbox = outbox
+        os.makedirs(outbox, exist_ok=True)
+
+    def send(self, alert: Dict[str, Any]) -> None:
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = ", ".join(self.to)
+        message["Date"] = formatdate(localtime=True)
+        message["Message-ID"] = make_msgid(domain="veille.local")
+        message["Subject"] = f"[{alert['watch']}] {alert.get('title') or alert.get('link')}"
+        message.set_content(
+            f"Termes surveillés: {', '.join(alert['terms'])}\n"
+            f"Titre: {alert.get('title') or ''}\n"
+            f"Lien: {alert.get('link') or ''}\n"
+            f"Source: {alert.get('source') or ''} ({alert.get('category') or ''})\n"
+            f"Publication: {alert.get('published') or ''}\n")
+        filename = message["Message-ID"].strip("<>").replace("@", "_") + ".eml"
+        path = os.path.join(self.outbox, filename)
+        with open(path + ".tmp", "wb") as f:
+            f.write(bytes(message))
+        os.replace(path + ".tmp", path)
+
+
+# Types de destinations utilisables dans watchlist.json (clé "type")
+SINK_TYPES: Dict[str, Type[AlertSink]] = {
+    "file": FileSink,
+    "webhook": WebhookSink,
+    "email": EmailSink,
+}
+
+
+def register_sink(kind: str, factory: Callable[..., AlertSink]) -> None:
+    """
+    Ajoute un type de destination
+
+    Args:
+        kind (str): Valeur de la clé "type" dans watchlist.json
+        factory (Callable[..., AlertSink]): Classe ou fabrique appelée avec le nom de la
+            destination et ses options
+    """
+    SINK_TYPES[kind] = factory
+
+
+def create_sink(name: str, options: Dict[str, Any]) -> AlertSink:
+    """
+    Crée une destination à partir de sa configuration
+
+    Args:
+        name (str): Nom de la destination
+        options (Dict[str, Any]): Configuration ("type" et options du type)
+
+    Returns:
+        AlertSink: Destination
+
+    Raises:
+        ValueError: Type inconnu ou options invalides
+    """
+    options = dict(options)
+    kind = options.pop("type", None)
+    factory = SINK_TYPES.get(kind)
+    if factory is None:
+        raise ValueError(f"destination {name}: type inconnu {kind!r} (attendu: {', '.join(SINK_TYPES)})")
+    try:
+        return factory(name, **options)
+    except TypeError as e:
+        raise ValueError(f"destination {name}: {e}") from e
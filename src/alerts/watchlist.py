@@ -0,0 +1,460 @@
+import os
+import re
+import json
+import html
+import time
+import atexit
+import sqlite3
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .sinks import AlertSink, create_sink
+from ..utils.aho_corasick import AhoCorasick, fold_text
+from ..utils.raw_archive import link_hash
+
+logger = logging.getLogger("Watchlist")
+
+# Liste de surveillance à la racine du projet (absente: pas d'alertes)
+DEFAULT_WATCHLIST_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "watchlist.json")
+
+# État des alertes (dédoublonnage, file d'envoi), par défaut (relatif au répertoire de la liste)
+DEFAULT_STATE_PATH = "data/alerts/watchlist.sqlite"
+
+# Options de destination qui désignent un fichier ou un répertoire
+SINK_PATH_OPTIONS = ("path", "outbox")
+
+# Limite d'envoi par défaut d'une destination: max_alerts alertes par fenêtre glissante (secondes)
+DEFAULT_MAX_ALERTS = 60
+DEFAULT_WINDOW = 3600
+
+# Tentatives d'envoi d'une alerte avant abandon
+MAX_ATTEMPTS = 5
+
+# Intervalle de relance des envois en attente (limite d'envoi atteinte, destination en échec), en secondes
+RETRY_INTERVAL = 60.0
+
+# Champ ajouté aux articles examinés (empreinte de la liste): ils ne sont pas réexaminés au traitement
+WATCHLIST_FIELD = "watchlist"
+
+# Champs lus pour la recherche des termes (bruts ou traités)
+TEXT_FIELDS = (("title",), ("cleaned_summary", "summary"), ("cleaned_content", "content"))
+
+_TAGS = re.compile(r"<[^>]*>")
+
+# Un seul vidage à la fois par état (un moteur remplacé et son successeur partagent la file)
+_SEND_LOCKS: Dict[str, threading.Lock] = {}
+_SEND_LOCKS_LOCK = threading.Lock()
+
+
+class WatchlistConfigError(ValueError):
+    """Liste de surveillance invalide"""
+
+
+class Watch(NamedTuple):
+    """
+    Surveillance: des termes, des destinations, éventuellement limitée à des catégories
+
+    Attributes:
+        name (str): Nom (identifiant du dédoublonnage)
+        sinks (Tuple[str, ...]): Destinations des alertes
+        categories (Optional[frozenset]): Catégories surveillées (None: toutes)
+    """
+    name: str
+    sinks: Tuple[str, ...]
+    categories: Optional[frozenset]
+
+
+def _article_text(article: Any) -> str:
+    """Titre, résumé et contenu d'un article (brut ou traité), sans balises"""
+    parts = []
+    for names in TEXT_FIELDS:
+        for name in names:
+            value = article.get(name)
+            if isinstance(value, str) and value:
+                parts.append(value)
+                break
+    text = "\n".join(parts)
+    if "<" in text:
+        text = _TAGS.sub(" ", text)
+    if "&" in text:
+        text = html.unescape(text)
+    return text
+
+
+def _article_id(article: Any) -> int:
+    key = article.get("link") or article.get("url") or article.get("title") or ""
+    return link_hash(key)
+
+
+class WatchlistEngine:
+    """
+    Alertes sur les articles qui mentionnent des termes surveillés
+
+    Tous les termes de toutes les surveillances forment un seul automate
+    (Aho-Corasick): un article est lu une fois, en temps linéaire en la longueur
+    de son texte, quelle que soit la taille de la liste. Un article examiné à la
+    collecte est marqué (WATCHLIST_FIELD) et n'est pas réexaminé au traitement;
+    chaque couple (surveillance, article) ne produit qu'une alerte. Les alertes
+    passent par une file SQLite, vidée par un thread d'envoi: la recherche ne
+    bloque jamais sur une destination lente. Chaque destination respecte sa
+    limite d'envoi (fenêtre glissante) et les alertes en excès ou en échec sont
+    renvoyées plus tard.
+    """
+
+    def __init__(self, config: Dict[str, Any], state_path: Optional[str] = None,
+                 base_dir: Optional[str] = None):
+        """
+        Compile la liste et ouvre l'état des alertes
+
+        Args:
+            config (Dict[str, Any]): {"sinks": {nom: options}, "watches": [surveillance], "state": chemin}
+            state_path (Optional[str]): Base SQLite de l'état (sinon config["state"] ou DEFAULT_STATE_PATH)
+            base_dir (Optional[str]): Répertoire des chemins relatifs de la configuration (état,
+                fichiers des destinations), en général celui de la liste; sinon le répertoire courant
+
+        Raises:
+            WatchlistConfigError: Configuration invalide
+        """
+        if not isinstance(config, dict) or set(config) - {"sinks", "watches", "state"}:
+            raise WatchlistConfigError("clés attendues: sinks, watches, state")
+        sink_configs = config.get("sinks") or {}
+        if not isinstance(sink_configs, dict):
+            raise WatchlistConfigError("sinks doit associer des noms à des destinations")
+
+        self.watches: List[Watch] = []
+        terms: List[str] = []
+        term_watches: List[int] = []
+        for position, watch in enumerate(config.get("watches") or []):
+            if not isinstance(watch, dict) or not isinstance(watch.get("name"), str) or not watch["name"]:
+                raise WatchlistConfigError(f"surveillance {position}: nom manquant")
+            name = watch["name"]
+            watch_terms = watch.get("terms")
+            if not isinstance(watch_terms, list) or not watch_terms or not all(
+                    isinstance(term, str) and term.strip() for term in watch_terms):
+                raise WatchlistConfigError(f"{name}: terms doit être une liste de termes")
+            sinks = watch.get("sinks", list(sink_configs))
+            if isinstance(sinks, str):
+                sinks = [sinks]
+            unknown = [sink for sink in sinks if sink not in sink_configs]
+            if unknown:
+                raise WatchlistConfigError(f"{name}: destinations inconnues {unknown}")
+            categories = watch.get("categories")
+            self.watches.append(Watch(name, tuple(sinks), frozenset(categories) if categories else None))
+            for term in watch_terms:
+                terms.append(term)
+                term_watches.append(len(self.watches) - 1)
+
+        # Un terme commun à plusieurs surveillances n'est compilé qu'une fois
+        self.matcher = AhoCorasick(terms)
+        self._term_watches: Dict[int, List[int]] = {}
+        for term, watch_index in zip(terms, term_watches):
+            watches = self._term_watches.setdefault(self.matcher.index_of(term), [])
+            if watch_index not in watches:
+                watches.append(watch_index)
+
+        # Destinations utilisées et leurs limites d'envoi
+        self.sinks: Dict[str, AlertSink] = {}
+        self.limits: Dict[str, Tuple[int, float]] = {}
+        for name in sorted({sink for watch in self.watches for sink in watch.sinks}):
+            options = dict(sink_configs[name])
+            for option in SINK_PATH_OPTIONS:
+                if base_dir and isinstance(options.get(option), str):
+                    options[option] = os.path.join(base_dir, options[option])
+            max_alerts = options.pop("max_alerts", DEFAULT_MAX_ALERTS)
+            window = options.pop("window", DEFAULT_WINDOW)
+            if not isinstance(max_alerts, int) or max_alerts < 1 or not isinstance(window, (int, float)) or window <= 0:
+                raise WatchlistConfigError(f"destination {name}: max_alerts et window doivent être positifs")
+            try:
+                self.sinks[name] = create_sink(name, options)
+            except ValueError as e:
+                raise WatchlistConfigError(str(e)) from e
+            self.limits[name] = (max_alerts, float(window))
+
+        self.fingerprint = hashlib.blake2b(
+            json.dumps(config, sort_keys=True, ensure_ascii=False).encode("utf-8"), digest_size=4).hexdigest()
+        self.state_path = state_path or os.path.join(base_dir or "", config.get("state") or DEFAULT_STATE_PATH)
+        self._lock = threading.Lock()
+        # Envois en arrière-plan: un seul vidage de la file à la fois
+        with _SEND_LOCKS_LOCK:
+            self._send_lock = _SEND_LOCKS.setdefault(os.path.abspath(self.state_path), threading.Lock())
+        self._wake = threading.Event()
+        self._sender: Optional[threading.Thread] = None
+        self._retired = False
+        self._open_state()
+
+    def _open_state(self):
+        directory = os.path.dirname(os.path.abspath(self.state_path))
+        os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(self.state_path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS alerts (
+                watch TEXT NOT NULL,
+                article_id INTEGER NOT NULL,
+                matched_at REAL NOT NULL,
+                alert TEXT NOT NULL,
+                PRIMARY KEY (watch, article_id)
+            );
+            CREATE TABLE IF NOT EXISTS deliveries (
+                watch TEXT NOT NULL,
+                article_id INTEGER NOT NULL,
+                sink TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                sent_at REAL,
+                PRIMARY KEY (watch, article_id, sink)
+            );
+            CREATE INDEX IF NOT EXISTS deliveries_pending ON deliveries (sink, status);
+            CREATE INDEX IF NOT EXISTS deliveries_sent ON deliveries (sink, sent_at);
+        """)
+        self.conn.commit()
+
+    def match(self, article: Any) -> List[Tuple[Watch, Tuple[str, ...]]]:
+        """
+        Surveillances déclenchées par un article (sans effet sur l'état)
+
+        Args:
+            article (Any): Article brut ou traité (dictionnaire ou ArticleRecord)
+
+        Returns:
+            List[Tuple[Watch, Tuple[str, ...]]]: Surveillances et termes trouvés
+        """
+        found: Dict[int, List[int]] = {}
+        for _, _, index in self.matcher.iter_matches(fold_text(_article_text(article)), folded=True):
+            for watch_index in self._term_watches.get(index, ()):
+                terms = found.setdefault(watch_index, [])
+                if index not in terms:
+                    terms.append(index)
+        category = article.get("category")
+        patterns = self.matcher.patterns
+        return [(self.watches[watch_index], tuple(patterns[index] for index in terms))
+                for watch_index, terms in sorted(found.items())
+                if self.watches[watch_index].categories is None or category in self.watches[watch_index].categories]
+
+    def process(self, articles: Iterable[Any], now: Optional[float] = None) -> int:
+        """
+        Recherche les termes surveillés dans des articles et met les nouvelles alertes en file
+
+        Les articles déjà examinés avec la même liste (marqués à la collecte) sont
+        ignorés; les articles bruts (dictionnaires) examinés ici sont marqués.
+        L'envoi est fait par le thread d'envoi, sans attendre les destinations.
+
+        Args:
+            articles (Iterable[Any]): Articles bruts ou traités
+            now (Optional[float]): Horodatage (par défaut: maintenant)
+
+        Returns:
+            int: Nombre de nouvelles alertes (hors doublons)
+        """
+        now = time.time() if now is None else now
+        matched_at = datetime.fromtimestamp(now).isoformat()
+        created = 0
+        with self._lock:
+            for article in articles:
+                if article.get(WATCHLIST_FIELD) == self.fingerprint:
+                    continue
+                if isinstance(article, dict):
+                    article[WATCHLIST_FIELD] = self.fingerprint
+                matches = self.match(article)
+                if not matches:
+                    continue
+                article_id = _article_id(article)
+                for watch, terms in matches:
+                    alert = {
+                        "watch": watch.name,
+                        "terms": list(terms),
+                        "title": article.get("title"),
+                        "link": article.get("link") or article.get("url"),
+                        "source": article.get("source") or article.get("source_name"),
+                        "category": article.get("category"),
+                        "published": article.get("published"),
+                        "matched_at": matched_at,
+                    }
+                    inserted = self.conn.execute(
+                        "INSERT OR IGNORE INTO alerts (watch, article_id, matched_at, alert) VALUES (?, ?, ?, ?)",
+                        (watch.name, article_id, now, json.dumps(alert, ensure_ascii=False))).rowcount
+                    if not inserted:
+                        continue
+                    created += 1
+                    self.conn.executemany(
+                        "INSERT OR IGNORE INTO deliveries (watch, article_id, sink) VALUES (?, ?, ?)",
+                        [(watch.name, article_id, sink) for sink in watch.sinks])
+            self.conn.commit()
+        if created:
+            logger.info(f"Nouvelles alertes: {created}")
+            self._notify()
+        return created
+
+    def _notify(self):
+        """Réveille le thread d'envoi (démarré au premier appel)"""
+        if self._retired or not self.sinks:
+            return
+        if self._sender is None:
+            self._sender = threading.Thread(target=self._send_loop, name="watchlist-sender", daemon=True)
+            self._sender.start()
+        self._wake.set()
+
+    def _send_loop(self):
+        """Vide la file à chaque réveil, et toutes les RETRY_INTERVAL secondes pour les relances"""
+        while True:
+            self._wake.wait(RETRY_INTERVAL)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Erreur lors de l'envoi des alertes: {e}")
+            if self._retired:
+                return
+
+    def flush(self, now: Optional[float] = None) -> Dict[str, int]:
+        """
+        Envoie les alertes en attente, dans la limite de chaque destination
+
+        Appelé par le thread d'envoi; utilisable directement pour un envoi synchrone.
+
+        Args:
+            now (Optional[float]): Horodatage (par défaut: maintenant)
+
+        Returns:
+            Dict[str, int]: Alertes envoyées par destination
+        """
+        with self._send_lock:
+            return self._flush(time.time() if now is None else now)
+
+    def _flush(self, now: float) -> Dict[str, int]:
+        # L'état n'est verrouillé que pour les lectures et mises à jour: une destination
+        # lente ne bloque pas la recherche des termes
+        sent: Dict[str, int] = {}
+        for name, sink in self.sinks.items():
+            max_alerts, window = self.limits[name]
+            with self._lock:
+                recent = self.conn.execute(
+                    "SELECT COUNT(*) FROM deliveries WHERE sink = ? AND status = 'sent' AND sent_at > ?",
+                    (name, now - window)).fetchone()[0]
+                budget = max_alerts - recent
+                if budget <= 0:
+                    continue
+                pending = self.conn.execute(
+                    "SELECT d.watch, d.article_id, a.alert FROM deliveries d "
+                    "JOIN alerts a ON a.watch = d.watch AND a.article_id = d.article_id "
+                    "WHERE d.sink = ? AND d.status = 'pending' ORDER BY a.matched_at LIMIT ?",
+                    (name, budget)).fetchall()
+            for watch, article_id, alert in pending:
+                try:
+                    sink.send(json.loads(alert))
+                except Exception as e:
+                    logger.warning(f"Échec de l'envoi d'une alerte ({name}): {e}")
+                    with self._lock:
+                        self.conn.execute(
+                            "UPDATE deliveries SET attempts = attempts + 1, "
+                            "status = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE status END "
+                            "WHERE watch = ? AND article_id = ? AND sink = ?",
+                            (MAX_ATTEMPTS, watch, article_id, name))
+                        self.conn.commit()
+                    # Destination indisponible: les autres alertes attendent le prochain envoi
+                    break
+                with self._lock:
+                    self.conn.execute(
+                        "UPDATE deliveries SET status = 'sent', sent_at = ?, attempts = attempts + 1 "
+                        "WHERE watch = ? AND article_id = ? AND sink = ?", (now, watch, article_id, name))
+                    self.conn.commit()
+                sent[name] = sent.get(name, 0) + 1
+        return sent
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        État des envois par destination
+
+        Returns:
+            Dict[str, Dict[str, int]]: Nombre d'alertes par statut (pending, sent, failed)
+        """
+        with self._lock:
+            result: Dict[str, Dict[str, int]] = {name: {} for name in self.sinks}
+            for sink, status, count in self.conn.execute(
+                    "SELECT sink, status, COUNT(*) FROM deliveries GROUP BY sink, status"):
+                result.setdefault(sink, {})[status] = count
+            return result
+
+    def retire(self):
+        """
+        Arrête le thread d'envoi après un dernier vidage de la file, sans fermer l'état
+
+        Pour un moteur remplacé (liste modifiée) que d'autres appelants utilisent
+        peut-être encore: leurs alertes restent en file et sont envoyées par le
+        nouveau moteur (même état SQLite). La base est fermée avec le moteur.
+        """
+        self._retired = True
+        self._wake.set()
+
+    def close(self):
+        """Envoie une dernière fois les alertes en attente et ferme l'état"""
+        self.retire()
+        if self._sender is not None:
+            self._sender.join()
+        with self._lock:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+# Moteurs du processus, recompilés quand la liste change
+_ENGINES: Dict[str, Tuple[float, Optional[WatchlistEngine]]] = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def get_watchlist_engine(path: Optional[str] = DEFAULT_WATCHLIST_PATH) -> Optional[WatchlistEngine]:
+    """
+    Moteur d'alertes partagé du processus, recompilé seulement si la liste a changé
+
+    L'ancien moteur n'est pas fermé (un appelant peut encore l'utiliser): il est
+    retiré (plus de thread d'envoi) et sa base est fermée quand il est libéré.
+
+    Args:
+        path (Optional[str]): Liste de surveillance (None: pas d'alertes)
+
+    Returns:
+        Optional[WatchlistEngine]: Moteur, None si la liste est absente ou invalide
+    """
+    if not path:
+        return None
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    with _ENGINES_LOCK:
+        cached = _ENGINES.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        if cached is not None and cached[1] is not None:
+            cached[1].retire()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                # Chemins de la liste relatifs à son répertoire, quel que soit le répertoire courant
+                engine = WatchlistEngine(json.load(f), base_dir=os.path.dirname(os.path.abspath(path)))
+        except (OSError, ValueError, sqlite3.Error) as e:
+            logger.error(f"Liste de surveillance ignorée ({path}): {e}")
+            engine = None
+        _ENGINES[path] = (mtime, engine)
+        return engine
+
+
+@atexit.register
+def _close_engines():
+    """Dernier envoi des alertes en attente à la sortie du processus"""
+    with _ENGINES_LOCK:
+        for _, engine in _ENGINES.values():
+            if engine is not None:
+                try:
+                    engine.close()
+                except Exception as e:
+                    logger.error(f"Erreur lors de la fermeture de la liste de surveillance: {e}")
+        _ENGINES.clear()
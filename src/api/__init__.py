@@ -0,0 +1 @@
+# Initialisation du package api 
\ No newline at end of file
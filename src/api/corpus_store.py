@@ -0,0 +1,466 @@
+import os
+import json
+import mmap
+import base64
+import sqlite3
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..utils.date_utils import record_timestamp
+from ..utils.raw_archive import link_hash
+
+logger = logging.getLogger("CorpusStore")
+
+# Champs des articles renvoyés dans les listes (l'article complet est servi par son identifiant)
+SUMMARY_FIELDS = ("title", "cleaned_title", "link", "source", "source_name", "category", "published",
+                  "language", "keywords", "entities", "topic_id", "topic_label", "relevance", "processed_at")
+
+# Compactage du fichier de données quand les enregistrements remplacés dépassent les vivants
+MIN_COMPACT_BYTES = 1 << 20
+
+_MASK = (1 << 64) - 1
+
+
+def article_id(key: int) -> str:
+    """
+    Identifiant public d'un article (hexadécimal, sûr pour JavaScript)
+
+    Args:
+        key (int): Clé de l'index (hachage signé du lien)
+
+    Returns:
+        str: Identifiant
+    """
+    return format(key & _MASK, "016x")
+
+
+def parse_article_id(value: str) -> int:
+    """
+    Clé de l'index d'un identifiant public
+
+    Args:
+        value (str): Identifiant hexadécimal
+
+    Returns:
+        int: Clé de l'index
+
+    Raises:
+        ValueError: Identifiant invalide
+    """
+    if len(value) != 16:
+        raise ValueError(f"identifiant invalide: {value}")
+    key = int(value, 16)
+    return key - (1 << 64) if key >= 1 << 63 else key
+
+
+def encode_cursor(ts: int, key: int) -> str:
+    """Curseur opaque: position (date, article) du dernier article d'une page"""
+    return base64.urlsafe_b64encode(f"{ts}:{key}".encode("ascii")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[int, int]:
+    """
+    Position codée dans un curseur
+
+    Raises:
+        ValueError: Curseur invalide
+    """
+    try:
+        ts, key = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii").split(":")
+        return int(ts), int(key)
+    except Exception:
+        raise ValueError(f"curseur invalide: {cursor}")
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class CorpusStore:
+    """
+    Corpus traité servi sans relire les fichiers JSON
+
+    Les articles des sorties par fichier (processed_*.json) sont recopiés une
+    fois en JSON compact dans un fichier de données en ajout seul, projeté en
+    mémoire (mmap); un index SQLite donne pour chaque article sa date, sa
+    catégorie, sa source et la position de ses octets. Une page de résultats
+    est une lecture d'intervalle de l'index suivie de copies d'octets: aucun
+    article n'est décodé pour répondre.
+
+    Seules les sorties modifiées depuis le dernier rafraîchissement sont relues;
+    chaque modification incrémente la version du corpus (ETag des réponses). Un
+    article présent dans plusieurs sorties (table memberships) n'est retiré que
+    lorsque plus aucune sortie ne le contient.
+    """
+
+    def __init__(self, processed_dir: str = "data/processed", store_dir: Optional[str] = None):
+        """
+        Ouvre (ou crée) l'index et le fichier de données
+
+        Args:
+            processed_dir (str): Répertoire des données traitées
+            store_dir (Optional[str]): Répertoire de l'index (défaut: processed_dir/api)
+        """
+        self.processed_dir = processed_dir
+        self.store_dir = store_dir or os.path.join(processed_dir, "api")
+        os.makedirs(self.store_dir, exist_ok=True)
+        self.db_path = os.path.join(self.store_dir, "corpus.sqlite")
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._map_lock = threading.Lock()
+        self._maps: Dict[str, mmap.mmap] = {}
+
+        conn = self._connection()
+        migrate = conn.execute("SELECT name FROM sqlite_master WHERE name = 'articles'").fetchone() is not None \
+            and conn.execute("SELECT name FROM sqlite_master WHERE name = 'memberships'").fetchone() is None
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS files (
+                name TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS articles (
+                id INTEGER PRIMARY KEY,
+                ts INTEGER NOT NULL,
+                category TEXT,
+                source TEXT,
+                file TEXT NOT NULL,
+                offset INTEGER NOT NULL,
+                summary_length INTEGER NOT NULL,
+                length INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_articles_ts ON articles (ts, id);
+            CREATE INDEX IF NOT EXISTS idx_articles_category ON articles (category, ts, id);
+            CREATE INDEX IF NOT EXISTS idx_articles_source ON articles (source, ts, id);
+            CREATE INDEX IF NOT EXISTS idx_articles_file ON articles (file);
+            CREATE TABLE IF NOT EXISTS memberships (
+                file TEXT NOT NULL,
+                id INTEGER NOT NULL,
+                PRIMARY KEY (file, id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_memberships_id ON memberships (id);
+            INSERT OR IGNORE INTO meta (key, value) VALUES ('version', '0'), ('data', 'articles-0.jsonl');
+        """)
+        if migrate:
+            # Index créé sans appartenances: reconstruit au prochain rafraîchissement
+            conn.execute("DELETE FROM articles")
+            conn.execute("DELETE FROM files")
+        self.version = int(self._meta(conn, "version"))
+
+    def _connection(self) -> sqlite3.Connection:
+        """Connexion propre au thread (transactions explicites)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _meta(conn: sqlite3.Connection, key: str) -> str:
+        return conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()[0]
+
+    def _list_outputs(self) -> Dict[str, Tuple[int, int]]:
+        outputs = {}
+        for entry in os.scandir(self.processed_dir):
+            if entry.name.startswith("processed_") and entry.name.endswith(".json") and entry.is_file():
+                stat = entry.stat()
+                outputs[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        return outputs
+
+    def refresh(self) -> bool:
+        """
+        Indexe les sorties nouvelles ou modifiées et retire les sorties supprimées
+
+        Returns:
+            bool: True si le corpus a changé (nouvelle version)
+        """
+        with self._write_lock:
+            conn = self._connection()
+            outputs = self._list_outputs()
+            known = {name: (mtime_ns, size) for name, mtime_ns, size in
+                     conn.execute("SELECT name, mtime_ns, size FROM files")}
+            changed = sorted(name for name, signature in outputs.items() if known.get(name) != signature)
+            removed = [name for name in known if name not in outputs]
+            if not changed and not removed:
+                return False
+
+            data_path = os.path.join(self.store_dir, self._meta(conn, "data"))
+            added = 0
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                with open(data_path, "ab") as out:
+                    # Articles encore présents dans d'autres sorties, à relire depuis l'une d'elles,
+                    # et articles écrits par ce rafraîchissement, par sortie
+                    reread: Dict[str, set] = {}
+                    indexed: Dict[str, set] = {}
+                    for name in removed:
+                        self._release(conn, name, set(), reread)
+                        conn.execute("DELETE FROM files WHERE name = ?", (name,))
+                    for name in changed:
+                        articles = self._load_output(name)
+                        if articles is None:
+                            continue
+                        rows = self._append(out, name, articles)
+                        indexed[name] = {row[0] for row in rows}
+                        self._release(conn, name, indexed[name], reread)
+                        conn.executemany(
+                            "INSERT OR REPLACE INTO articles (id, ts, category, source, file, offset, "
+                            "summary_length, length) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+                        conn.executemany("INSERT OR IGNORE INTO memberships (file, id) VALUES (?, ?)",
+                                         [(name, row[0]) for row in rows])
+                        conn.execute("INSERT OR REPLACE INTO files (name, mtime_ns, size) VALUES (?, ?, ?)",
+                                     (name,) + outputs[name])
+                        added += len(rows)
+                    while reread:
+                        name, ids = reread.popitem()
+                        ids -= indexed.get(name, set())
+                        if not ids:
+                            continue
+                        articles = self._load_output(name)
+                        if articles is None:
+                            # Sortie illisible: ses articles seront relus avec elle
+                            conn.execute("DELETE FROM files WHERE name = ?", (name,))
+                            continue
+                        rows = self._append(out, name, [
+                            article for article in articles
+                            if link_hash(article.get("link") or article.get("url") or "") in ids])
+                        conn.executemany(
+                            "INSERT OR REPLACE INTO articles (id, ts, category, source, file, offset, "
+                            "summary_length, length) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+                        found = {row[0] for row in rows}
+                        indexed.setdefault(name, set()).update(found)
+                        # Sortie réécrite par ce rafraîchissement sans l'article: autre sortie, ou retrait
+                        for article_id in ids - found:
+                            conn.execute("DELETE FROM memberships WHERE file = ? AND id = ?", (name, article_id))
+                            other =conn.execute("SELECT MAX(file) FROM memberships WHERE id = ? AND file != ?",
+                                                 (article_id, name)).fetchone()[0]
+                            if other is None:
+                                conn.execute("DELETE FROM articles WHERE id = ?", (article_id,))
+                            else:
+                                reread.setdefault(other, set()).add(article_id)
+                    # Les octets sont sur disque avant que l'index n'y renvoie
+                    out.flush()
+                self.version += 1
+                conn.execute("UPDATE meta SET value = ? WHERE key = 'version'", (str(self.version),))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            logger.info(f"Corpus version {self.version}: {added} articles indexés "
+                        f"({len(changed)} sorties modifiées, {len(removed)} supprimées)")
+            self._maybe_compact(conn)
+            return True
+
+    def _load_output(self, name: str) -> Optional[List[Dict[str, Any]]]:
+        """Articles d'une sortie, None si elle est illisible"""
+        try:
+            with open(os.path.join(self.processed_dir, name), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            # Sortie en cours d'écriture ou illisible: reprise au prochain rafraîchissement
+            logger.error(f"Erreur lors de la lecture de {name}: {e}")
+            return None
+
+    @staticmethod
+    def _release(conn: sqlite3.Connection, name: str, kept: set, reread: Dict[str, set]):
+        """
+        Retire les appartenances d'une sortie supprimée ou réécrite
+
+        Un article qui n'est plus dans la sortie (hors kept) et dont l'index renvoie
+        à elle est supprimé s'il n'est dans aucune autre sortie; sinon il est noté
+        dans reread pour être relu depuis une autre sortie qui le contient.
+
+        Args:
+            conn (sqlite3.Connection): Connexion (transaction en cours)
+            name (str): Sortie
+            kept (set): Articles toujours présents dans la sortie
+            reread (Dict[str, set]): Articles à relire, par sortie (complété)
+        """
+        released = [article_id for article_id, in conn.execute(
+            "SELECT m.id FROM memberships m JOIN articles a ON a.id = m.id AND a.file = m.file "
+            "WHERE m.file = ?", (name,)) if article_id not in kept]
+        conn.execute("DELETE FROM memberships WHERE file = ?", (name,))
+        for article_id in released:
+            other = conn.execute("SELECT MAX(file) FROM memberships WHERE id = ?", (article_id,)).fetchone()[0]
+            if other is None:
+                conn.execute("DELETE FROM articles WHERE id = ?", (article_id,))
+            else:
+                reread.setdefault(other, set()).add(article_id)
+
+    @staticmethod
+    def _append(out, name: str, articles: Iterable[Dict[str, Any]]) -> List[Tuple]:
+        """Écrit les articles (résumé puis article complet) et renvoie leurs lignes d'index"""
+        rows = []
+        for article in articles:
+            link = article.get("link") or article.get("url")
+            if not link:
+                continue
+            key = link_hash(link)
+            public_id = article_id(key)
+            summary = {"id": public_id}
+            summary.update((field, article[field]) for field in SUMMARY_FIELDS if field in article)
+            summary = _dumps(summary)
+            full = _dumps({"id": public_id, **article})
+            offset = out.tell()
+            out.write(summary + b"\n" + full + b"\n")
+            ts = record_timestamp(article)
+            rows.append((key, ts if ts is not None else 0, article.get("category"),
+                         article.get("source") or article.get("source_name"), name,
+                         offset, len(summary), len(full)))
+        return rows
+
+    def _maybe_compact(self, conn: sqlite3.Connection):
+        """Réécrit le fichier de données quand les enregistrements remplacés y dominent"""
+        name = self._meta(conn, "data")
+        size = os.path.getsize(os.path.join(self.store_dir, name))
+        live = conn.execute("SELECT COALESCE(SUM(summary_length + length + 2), 0) FROM articles").fetchone()[0]
+        if size - live < max(live, MIN_COMPACT_BYTES):
+            return
+
+        new_name = f"articles-{self.version}.jsonl"
+        updates = []
+        with open(os.path.join(self.store_dir, name), "rb") as src, \
+                open(os.path.join(self.store_dir, new_name), "wb") as out:
+            for key, offset, summary_length, length in conn.execute(
+                    "SELECT id, offset, summary_length, length FROM articles ORDER BY offset"):
+                src.seek(offset)
+                updates.append((out.tell(), key))
+                out.write(src.read(summary_length + length + 2))
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany("UPDATE articles SET offset = ? WHERE id = ?", updates)
+        conn.execute("UPDATE meta SET value = ? WHERE key = 'data'", (new_name,))
+        conn.execute("COMMIT")
+        # La génération précédente reste lisible par les requêtes en cours
+        for entry in os.scandir(self.store_dir):
+            if entry.name.startswith("articles-") and entry.name not in (name, new_name):
+                os.remove(entry.path)
+        logger.info(f"Fichier de données compacté: {size} -> {live} octets")
+
+    def _view(self, name: str, end: int) -> mmap.mmap:
+        """Projection en mémoire du fichier de données, agrandie s'il a grossi"""
+        view = self._maps.get(name)
+        if view is None or len(view) < end:
+            with self._map_lock:
+                view = self._maps.get(name)
+                if view is None or len(view) < end:
+                    with open(os.path.join(self.store_dir, name), "rb") as f:
+                        view = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    # Les anciennes projections sont libérées quand plus aucune requête ne les lit
+                    self._maps = {name: view}
+        return view
+
+    def _read(self, sql: str, params: Tuple) -> Tuple[int, str, List[Tuple]]:
+        """Version du corpus, lignes d'index et fichier de données lus dans une même transaction"""
+        conn = self._connection()
+        conn.execute("BEGIN")
+        try:
+            version = int(self._meta(conn, "version"))
+            name = self._meta(conn, "data")
+            rows = conn.execute(sql, params).fetchall()
+        finally:
+            conn.execute("COMMIT")
+        return version, name, rows
+
+    def query(self, categories: Optional[List[str]] = None, sources: Optional[List[str]] = None,
+              since: Optional[int] = None, until: Optional[int] = None,
+              cursor: Optional[str] = None, limit: int = 50) -> Tuple[List[bytes], Optional[str], int]:
+        """
+        Page d'articles (résumés JSON), du plus récent au plus ancien
+
+        Args:
+            categories (Optional[List[str]]): Catégories acceptées
+            sources (Optional[List[str]]): Sources acceptées
+            since (Optional[int]): Début de l'intervalle, timestamp UTC inclus
+            until (Optional[int]): Fin de l'intervalle, timestamp UTC exclu
+            cursor (Optional[str]): Curseur de la page précédente
+            limit (int): Taille de la page
+
+        Returns:
+            Tuple[List[bytes], Optional[str], int]: Résumés encodés, curseur de la page
+                suivante (None à la fin) et version du corpus lue avec eux
+
+        Raises:
+            ValueError: Curseur invalide
+        """
+        clauses, params = [], []
+        for column, values in (("category", categories), ("source", sources)):
+            if values:
+                clauses.append(f"{column} IN ({','.join('?' * len(values))})")
+                params.extend(values)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("ts < ?")
+            params.append(until)
+        if cursor:
+            # Pagination par clé: la page suivante commence après le dernier article vu,
+            # même si des articles ont été ajoutés entre-temps
+            clauses.append("(ts, id) < (?, ?)")
+            params.extend(decode_cursor(cursor))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        version, name, rows = self._read(f"SELECT ts, id, offset, summary_length FROM articles{where} "
+                                         f"ORDER BY ts DESC, id DESC LIMIT ?", tuple(params) + (limit + 1,))
+
+        page = rows[:limit]
+        if not page:
+            return [], None, version
+        view = self._view(name, max(offset + length for _, _, offset, length in page))
+        items = [view[offset:offset + length] for _, _, offset, length in page]
+        next_cursor = encode_cursor(page[-1][0], page[-1][1]) if len(rows) > limit else None
+        return items, next_cursor, version
+
+    def get(self, public_id: str) -> Tuple[Optional[bytes], int]:
+        """
+        Article complet (JSON)
+
+        Args:
+            public_id (str): Identifiant de l'article
+
+        Returns:
+            Tuple[Optional[bytes], int]: Article encodé (None s'il est inconnu) et version
+                du corpus lue avec lui
+
+        Raises:
+            ValueError: Identifiant invalide
+        """
+        version, name, rows = self._read("SELECT offset, summary_length, length FROM articles WHERE id = ?",
+                                         (parse_article_id(public_id),))
+        if not rows:
+            return None, version
+        offset, summary_length, length = rows[0]
+        start = offset + summary_length + 1
+        return self._view(name, start + length)[start:start + length], version
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Nombre d'articles par catégorie et par source
+
+        Returns:
+            Dict[str, Any]: version (lue avec les comptes), total, categories, sources
+        """
+        conn = self._connection()
+        counts = {}
+        conn.execute("BEGIN")
+        try:
+            version = int(self._meta(conn, "version"))
+            for column in ("category", "source"):
+                counts[column] = {value or "": count for value, count in conn.execute(
+                    f"SELECT {column}, COUNT(*) FROM articles GROUP BY {column} ORDER BY COUNT(*) DESC")}
+        finally:
+            conn.execute("COMMIT")
+        return {"version": version, "total": sum(counts["category"].values()),
+                "categories": counts["category"], "sources": counts["source"]}
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -0,0 +1,279 @@
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from .corpus_store import CorpusStore
+from ..utils.date_utils import parse_date_string
+
+logger = logging.getLogger("CorpusAPI")
+
+# Taille de page par défaut et maximale
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+# Réponses gardées en mémoire (requêtes fréquentes)
+DEFAULT_CACHE_SIZE = 1024
+
+# Intervalle de prise en compte des nouvelles sorties du traitement (secondes)
+DEFAULT_REFRESH_INTERVAL = 60.0
+
+# Réponse: (statut, corps JSON, ETag)
+Response = Tuple[int, bytes, Optional[str]]
+
+
+class ResponseCache:
+    """
+    Cache LRU des réponses, partagé par les threads du serveur
+
+    Les clés contiennent la version du corpus: un rafraîchissement rend les
+    anciennes entrées inaccessibles, elles sortent du cache à mesure.
+    """
+
+    def __init__(self, size: int = DEFAULT_CACHE_SIZE):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[int, str], Response]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[int, str]) -> Optional[Response]:
+        with self._lock:
+            response = self._entries.get(key)
+            if response is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+
+    def put(self, key: Tuple[int, str], response: Response):
+        if self.size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+
+def _etag(version: int, resource: str) -> str:
+    """ETag d'une ressource pour une version du corpus"""
+    return '"' + hashlib.blake2b(repr((version, resource)).encode("utf-8"), digest_size=12).hexdigest() + '"'
+
+
+class BadRequest(ValueError):
+    """Paramètre de requête invalide (réponse 400)"""
+
+
+def _timestamp(value: Optional[str], name: str) -> Optional[int]:
+    if not value:
+        return None
+    ts, _ = parse_date_string(value)
+    if ts is None:
+        raise BadRequest(f"{name}: date invalide ({value})")
+    return ts
+
+
+def _values(params: Dict[str, List[str]], name: str) -> Optional[List[str]]:
+    """Valeurs d'un filtre: paramètre répété ou liste séparée par des virgules"""
+    values = [value.strip() for raw in params.get(name, []) for value in raw.split(",") if value.strip()]
+    return values or None
+
+
+class CorpusAPIHandler(BaseHTTPRequestHandler):
+    """
+    API en lecture seule sur le corpus traité
+
+    GET /articles?category=&source=&since=&until=&limit=&cursor=
+        Résumés des articles du plus récent au plus ancien; "next_cursor" donne
+        la page suivante
+    GET /articles/<id>
+        Article complet
+    GET /stats
+        Nombre d'articles par catégorie et par source
+    GET /health
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_version = "VeilleAPI/1.0"
+    # En-têtes et corps partent en deux écritures: sans TCP_NODELAY, l'accusé de
+    # réception différé du client ajoute 40 ms aux connexions persistantes
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._respond(head=False)
+
+    def do_HEAD(self):
+        self._respond(head=True)
+
+    def _respond(self, head: bool):
+        split = urlsplit(self.path)
+        path = split.path.rstrip("/") or "/"
+        # Clé canonique: l'ordre des paramètres ne change ni le cache ni l'ETag
+        query = sorted(parse_qsl(split.query))
+        resource = f"{path}?{query}"
+        # Version courante pour la revalidation et le cache; une réponse calculée porte
+        # la version lue avec ses données (un rafraîchissement a pu avoir lieu entre-temps)
+        version = self.server.store.version
+        etag = _etag(version, resource)
+
+        if path != "/health" and etag in self.headers.get("If-None-Match", ""):
+            self._send(304, b"", etag, head=True)
+            return
+        response = self.server.cache.get((version, resource))
+        if response is None:
+            try:
+                response, version = self._route(path, query, resource)
+            except BadRequest as e:
+                response = (400, json.dumps({"error": str(e)}, ensure_ascii=False).encode("utf-8"), None)
+            except Exception as e:
+                logger.error(f"Erreur lors du traitement de {self.path}: {e}")
+                response = (500, b'{"error":"erreur interne"}', None)
+            if response[0] == 200 and response[2]:
+                self.server.cache.put((version, resource), response)
+        self._send(*response, head=head)
+
+    def _route(self, path: str, query: List[Tuple[str, str]], resource: str) -> Tuple[Response, int]:
+        """
+        Réponse à une requête et version du corpus dont elle est issue
+
+        Args:
+            path (str): Chemin
+            query (List[Tuple[str, str]]): Paramètres triés
+            resource (str): Clé canonique de la requête (ETag)
+
+        Returns:
+            Tuple[Response, int]: Réponse (ETag de la version lue) et version
+
+        Raises:
+            BadRequest: Paramètre invalide
+        """
+        store: CorpusStore = self.server.store
+        params: Dict[str, List[str]] = {}
+        for name, value in query:
+            params.setdefault(name, []).append(value)
+
+        if path == "/health":
+            version = store.version
+            return (200, json.dumps({"status": "ok", "version": version}).encode("utf-8"), None), version
+        if path == "/stats":
+            stats = store.stats()
+            return (200, json.dumps(stats, ensure_ascii=False).encode("utf-8"),
+                    _etag(stats["version"], resource)), stats["version"]
+        if path == "/articles":
+            try:
+                limit = min(int(params.get("limit", [DEFAULT_LIMIT])[0]), MAX_LIMIT)
+            except ValueError:
+                raise BadRequest("limit: entier attendu")
+            if limit < 1:
+                raise BadRequest("limit: entier positif attendu")
+            try:
+                items, next_cursor, version = store.query(
+                    categories=_values(params, "category"),
+                    sources=_values(params, "source"),
+                    since=_timestamp(params.get("since", [None])[0], "since"),
+                    until=_timestamp(params.get("until", [None])[0], "until"),
+                    cursor=params.get("cursor", [None])[0],
+                    limit=limit)
+            except ValueError as e:
+                raise BadRequest(str(e))
+            # Les résumés sont recopiés tels quels depuis le fichier de données
+            body = b'{"items":[' + b",".join(items) + b'],"next_cursor":' + \
+                json.dumps(next_cursor).encode("ascii") + b"}"
+            return (200, body, _etag(version, resource)), version
+        if path.startswith("/articles/"):
+            try:
+                article, version = store.get(path[len("/articles/"):])
+            except ValueError as e:
+                raise BadRequest(str(e))
+            if article is None:
+                return (404, b'{"error":"article inconnu"}', None), version
+            return (200, bytes(article), _etag(version, resource)), version
+        return (404, b'{"error":"ressource inconnue"}', None), store.version
+
+    def _send(self, status: int, body: bytes, etag: Optional[str], head: bool = False):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+            # Le client garde la réponse et la revalide à chaque usage (304 si inchangée)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+class CorpusAPIServer(ThreadingHTTPServer):
+    """Serveur HTTP multithread du corpus traité, avec rafraîchissement périodique"""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, store: CorpusStore, host: str = "127.0.0.1", port: int = 8700,
+                 cache_size: int = DEFAULT_CACHE_SIZE,
+                 refresh_interval: Optional[float] = DEFAULT_REFRESH_INTERVAL):
+        """
+        Args:
+            store (CorpusStore): Corpus servi
+            host (str): Adresse d'écoute (locale par défaut)
+            port (int): Port (0: port libre)
+            cache_size (int): Nombre de réponses gardées en mémoire
+            refresh_interval (Optional[float]): Intervalle de rafraîchissement du corpus,
+                None pour ne jamais le rafraîchir
+        """
+        # Attributs créés avant l'ouverture du port: un échec de bind appelle server_close()
+        self.store = store
+        self.cache = ResponseCache(cache_size)
+        self.refresh_interval = refresh_interval
+        self._stop = threading.Event()
+        self._refresher = None
+        super().__init__((host, port), CorpusAPIHandler)
+        if refresh_interval:
+            self._refresher = threading.Thread(target=self._refresh_loop, name="corpus-refresh", daemon=True)
+            self._refresher.start()
+
+    def _refresh_loop(self):
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                self.store.refresh()
+            except Exception as e:
+                logger.error(f"Erreur lors du rafraîchissement du corpus: {e}")
+
+    def server_close(self):
+        self._stop.set()
+        super().server_close()
+
+
+def serve(processed_dir: str = "data/processed", host: str = "127.0.0.1", port: int = 8700,
+          cache_size: int = DEFAULT_CACHE_SIZE,
+          refresh_interval: Optional[float] = DEFAULT_REFRESH_INTERVAL) -> None:
+    """
+    Indexe le corpus traité puis le sert jusqu'à interruption
+
+    Args:
+        processed_dir (str): Répertoire des données traitées
+        host (str): Adresse d'écoute
+        port (int): Port
+        cache_size (int): Nombre de réponses gardées en mémoire
+        refresh_interval (Optional[float]): Intervalle de rafraîchissement du corpus (secondes)
+    """
+    store = CorpusStore(processed_dir)
+    store.refresh()
+    server = CorpusAPIServer(store, host, port, cache_size=cache_size, refresh_interval=refresh_interval)
+    logger.info(f"API du corpus sur http://{host}:{server.server_address[1]} (version {store.version})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        store.close()
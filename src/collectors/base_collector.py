@@ -1,11 +1,24 @@
 import os
+import re
 import json
 import time
 import hashlib
+import threading
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Set
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from .source_health import SourceHealthStore
+from .source_registry import CompiledSource
+from ..utils.date_utils import partition_by_date, partition_overlaps, select_time_range
+from ..utils.profiling import stage
+from ..utils.raw_archive import RawArchive
+from ..utils.relevance import DEFAULT_RELEVANCE_PATH, get_relevance_filter
+from ..alerts.watchlist import DEFAULT_WATCHLIST_PATH, get_watchlist_engine
+
+# Suffixe de partition mensuelle des fichiers de données brutes (ex: _2024-10.json)
+PARTITION_SUFFIX = re.compile(r"_(\d{4}-\d{2}|undated)\.json$")
+
 class BaseCollector:
     """
     Classe de base pour les collecteurs de données
@@ -26,8 +39,20 @@ class BaseCollector:
         self.cache_dir = cache_dir
         self.max_workers = max_workers
         self.cache_expiry = cache_expiry
+        # Préfixe des fichiers de données brutes ("rss", "web")
+        self.collector_type = self.__class__.__name__.lower().replace("collector", "")
         self._ensure_directories()
         
+        # Santé des sources (circuit breaker) et journal des échecs, hors flux d'articles
+        self.health = SourceHealthStore(os.path.join(self.cache_dir, "source_health.sqlite"))
+        self.failures_log_path = os.path.join(self.cache_dir, "failures.jsonl")
+        self._failures_lock = threading.Lock()
+        
+        # Préfiltre de pertinence appliqué avant la sauvegarde (None: désactivé)
+        self.relevance_path = DEFAULT_RELEVANCE_PATH
+        # Liste de surveillance: alertes dès la sauvegarde des éléments (None: désactivée)
+        self.watchlist_path = DEFAULT_WATCHLIST_PATH
+        
     def _ensure_directories(self):
         """Crée les répertoires nécessaires s'ils n'existent pas"""
         os.makedirs(self.output_dir, exist_ok=True)
@@ -47,6 +72,18 @@ class BaseCollector:
         url_hash = hashlib.md5(url.encode()).hexdigest()
         return os.path.join(self.cache_dir, f"{url_hash}.json")
     
+    def _source_cache_path(self, source: CompiledSource) -> str:
+        """
+        Chemin du fichier de cache d'une source compilée (clé précalculée)
+        
+        Args:
+            source (CompiledSource): Source compilée
+            
+        Returns:
+            str: Chemin du fichier de cache
+        """
+        return os.path.join(self.cache_dir, f"{source.cache_key}.json")
+    
     def _is_cache_valid(self, cache_path: str) -> bool:
         """
         Vérifie si le cache est valide (existe et n'est pas expiré)
@@ -95,34 +132,136 @@ class BaseCollector:
         except Exception as e:
             print(f"Erreur lors de l'écriture du cache: {e}")
     
-    def save_collected_data(self, data: Dict[str, List[Dict[str, Any]]]):
+    def _log_failure(self, source_info: Dict[str, Any], url: str, error: str):
+        """
+        Enregistre un échec de collecte dans le journal des échecs
+        
+        Les erreurs ne sont plus écrites dans data/raw afin de ne pas être traitées
+        comme du contenu par les processeurs.
+        
+        Args:
+            source_info (Dict[str, Any]): Informations sur la source
+            url (str): URL interrogée
+            error (str): Description de l'erreur
+        """
+        record = {
+            "url": url,
+            "source_name": source_info.get("name", ""),
+            "category": source_info.get("category", ""),
+            "collector": self.__class__.__name__,
+            "error": error,
+            "circuit_open": self.health.is_circuit_open(url),
+            "failed_at": datetime.now().isoformat()
+        }
+        try:
+            with self._failures_lock:
+                with open(self.failures_log_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except Exception as e:
+            print(f"Erreur lors de l'écriture du journal des échecs: {e}")
+    
+    @stage("serialize")
+    def save_collected_data(self, data: Dict[str, List[Dict[str, Any]]], batch_id: Optional[str] = None):
         """
         Sauvegarde les données collectées
         
+        Les éléments sont triés par date de publication et répartis dans un fichier
+        par mois, afin que les requêtes par période ne lisent que les partitions utiles.
+        Le préfiltre de pertinence (relevance.json) marque chaque élément et écarte
+        ceux des catégories dont la règle abandonne les articles sous le seuil. Les
+        éléments conservés passent ensuite par la liste de surveillance (alertes).
+        
         Args:
             data (Dict[str, List[Dict[str, Any]]]): Données collectées par catégorie
+            batch_id (Optional[str]): Identifiant ajouté au nom des fichiers, pour les
+                sauvegardes multiples au sein d'une même seconde (lots, workers)
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if batch_id:
+            timestamp = f"{timestamp}_{batch_id}"
         
+        relevance_filter = get_relevance_filter(self.relevance_path)
+        watchlist = get_watchlist_engine(self.watchlist_path)
         total_items = 0
         for category, items in data.items():
             if not items:
                 continue
-                
-            # Création d'un nom de fichier unique pour cette catégorie et ce collector
-            collector_type = self.__class__.__name__.lower().replace("collector", "")
-            filename = f"{collector_type}_{category}_{timestamp}.json"
-            filepath = os.path.join(self.output_dir, filename)
             
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(items, f, ensure_ascii=False, indent=2)
+            if relevance_filter is not None:
+                with stage("filter"):
+                    items, dropped = relevance_filter.apply(category, items)
+                if dropped:
+                    print(f"Éléments écartés par le préfiltre de pertinence ({category}): {dropped}")
+                if not items:
+                    continue
             
-            items_count = len(items)
-            total_items += items_count
-            print(f"Données sauvegardées: {filepath} ({items_count} éléments)")
+            if watchlist is not None:
+                try:
+                    with stage("alert"):
+                        watchlist.process(items)
+                except Exception as e:
+                    print(f"Erreur lors de la recherche des termes surveillés ({category}): {e}")
+                
+            # Création d'un nom de fichier unique pour cette catégorie, ce collector et ce mois
+            for partition, partition_items in partition_by_date(items).items():
+                filename = f"{self.collector_type}_{category}_{timestamp}_{partition}.json"
+                filepath = os.path.join(self.output_dir, filename)
+                
+                with open(filepath, "w", encoding="utf-8") as f:
+                    json.dump(partition_items, f, ensure_ascii=False, indent=2)
+                
+                items_count = len(partition_items)
+                total_items += items_count
+                print(f"Données sauvegardées: {filepath} ({items_count} éléments)")
         
         print(f"Total des éléments sauvegardés: {total_items}")
         
+    def load_time_range(self, category: str, start_ts: Optional[int] = None,
+                        end_ts: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Charge les éléments collectés publiés dans un intervalle de temps
+        
+        Seuls les fichiers dont la partition mensuelle recoupe l'intervalle sont lus,
+        puis les bornes sont trouvées par recherche dichotomique dans chaque fichier trié.
+        Les éléments compactés dans l'archive sont lus via son index de dates; les
+        fichiers déjà compactés ne sont pas relus.
+        
+        Args:
+            category (str): Catégorie des données
+            start_ts (Optional[int]): Début de l'intervalle, timestamp UTC inclus
+            end_ts (Optional[int]): Fin de l'intervalle, timestamp UTC exclu
+            
+        Returns:
+            List[Dict[str, Any]]: Éléments de l'intervalle
+        """
+        pattern = f"{self.collector_type}_{category}_"
+        
+        items = []
+        compacted: Set[str] = set()
+        archive_dir = os.path.join(self.output_dir, "archive")
+        if RawArchive.exists(archive_dir):
+            try:
+                with RawArchive(archive_dir) as archive:
+                    compacted = archive.compacted_files(self.output_dir)
+                    items.extend(archive.time_range(self.collector_type, category, start_ts, end_ts))
+            except Exception as e:
+                print(f"Erreur lors de la lecture de l'archive {archive_dir}: {e}")
+        
+        for filename in sorted(os.listdir(self.output_dir)):
+            if not filename.startswith(pattern) or filename in compacted:
+                continue
+            match = PARTITION_SUFFIX.search(filename)
+            if not match or not partition_overlaps(match.group(1), start_ts, end_ts):
+                continue
+            filepath = os.path.join(self.output_dir, filename)
+            try:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    items.extend(select_time_range(json.load(f), start_ts, end_ts))
+            except Exception as e:
+                print(f"Erreur lors de la lecture du fichier {filepath}: {e}")
+        
+        return items
+        
     def _get_known_ids(self, category: str) -> Set[str]:
         """
         Récupère les ID des éléments déjà collectés pour éviter les doublons
@@ -136,8 +275,7 @@ class BaseCollector:
         known_ids = set()
         
         # Recherche tous les fichiers de cette catégorie
-        collector_type = self.__class__.__name__.lower().replace("collector", "")
-        pattern = f"{collector_type}_{category}_"
+        pattern = f"{self.collector_type}_{category}_"
         
         try:
             for filename in os.listdir(self.output_dir):
@@ -156,4 +294,13 @@ class BaseCollector:
         except Exception as e:
             print(f"Erreur lors de la recherche des fichiers existants: {e}")
         
+        # Éléments déjà compactés dans l'archive (lus depuis l'index, sans décompression)
+        archive_dir = os.path.join(self.output_dir, "archive")
+        if RawArchive.exists(archive_dir):
+            try:
+                with RawArchive(archive_dir) as archive:
+                    known_ids |= archive.known_ids(self.collector_type, category)
+            except Exception as e:
+                print(f"Erreur lors de la lecture de l'archive {archive_dir}: {e}")
+        
         return known_ids 
\ No newline at end of file
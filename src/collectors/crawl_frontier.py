@@ -0,0 +1,261 @@
+import os
+import time
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+import requests
+
+from .download import fetch_bounded
+from .source_registry import DEFAULT_HEADERS
+
+# Taille maximale lue d'un robots.txt (la suite est ignorée, comme le font les moteurs)
+ROBOTS_MAX_BYTES = 500 * 1024
+
+STATUS_PENDING = "pending"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+class CrawlFrontier:
+    """
+    Frontière de crawl persistante (file d'attente + ensemble des URLs vues)
+
+    Chaque URL découverte est insérée une seule fois (clé primaire); son statut
+    indique si elle reste à visiter. Les pages déjà récupérées lors d'une
+    exécution précédente ne sont donc jamais revisitées.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Ouvre (ou crée) la frontière
+
+        Args:
+            db_path (str): Chemin de la base SQLite
+        """
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS frontier (
+                url TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                depth INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                discovered_at REAL NOT NULL,
+                fetched_at REAL,
+                attempts INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_frontier_queue ON frontier (source, status, depth, discovered_at);
+        """)
+
+    def add(self, source: str, urls: Iterable[str], depth: int) -> int:
+        """
+        Ajoute des URLs à la frontière (les URLs déjà vues sont ignorées)
+
+        Args:
+            source (str): Identifiant de la source (URL de départ)
+            urls (Iterable[str]): URLs découvertes
+            depth (int): Profondeur des URLs
+
+        Returns:
+            int: Nombre d'URLs réellement ajoutées
+        """
+        now = time.time()
+        rows = [(url, source, depth, STATUS_PENDING, now) for url in urls]
+        if not rows:
+            return 0
+        with self._lock, self.conn:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO frontier (url, source, depth, status, discovered_at) VALUES (?, ?, ?, ?, ?)",
+                rows)
+            return self.conn.total_changes - before
+
+    def next_batch(self, source: str, limit: int, max_depth: int) -> List[Tuple[str, int]]:
+        """
+        Récupère les prochaines URLs à visiter (parcours en largeur)
+
+        Args:
+            source (str): Identifiant de la source
+            limit (int): Nombre maximum d'URLs
+            max_depth (int): Profondeur maximale
+
+        Returns:
+            List[Tuple[str, int]]: Couples (URL, profondeur)
+        """
+        with self._lock:
+            return list(self.conn.execute(
+                "SELECT url, depth FROM frontier WHERE source = ? AND status = ? AND depth <= ? "
+                "ORDER BY depth, discovered_at LIMIT ?",
+                (source, STATUS_PENDING, max_depth, limit)))
+
+    def mark(self, url: str, status: str, max_attempts: int = 3):
+        """
+        Met à jour le statut d'une URL après une tentative
+
+        Une URL en échec reste en attente tant que le nombre de tentatives
+        maximal n'est pas atteint.
+
+        Args:
+            url (str): URL visitée
+            status (str): STATUS_DONE ou STATUS_FAILED
+            max_attempts (int): Tentatives avant abandon définitif
+        """
+        with self._lock, self.conn:
+            if status == STATUS_FAILED:
+                self.conn.execute(
+                    "UPDATE frontier SET attempts = attempts + 1, fetched_at = ?, "
+                    "status = CASE WHEN attempts + 1 >= ? THEN ? ELSE ? END WHERE url = ?",
+                    (time.time(), max_attempts, STATUS_FAILED, STATUS_PENDING, url))
+            else:
+                self.conn.execute(
+                    "UPDATE frontier SET attempts = attempts + 1, fetched_at = ?, status = ? WHERE url = ?",
+                    (time.time(), status, url))
+
+    def stats(self, source: str) -> Dict[str, int]:
+        """
+        Nombre d'URLs par statut pour une source
+
+        Args:
+            source (str): Identifiant de la source
+
+        Returns:
+            Dict[str, int]: Compteurs par statut
+        """
+        with self._lock:
+            return dict(self.conn.execute(
+                "SELECT status, COUNT(*) FROM frontier WHERE source = ? GROUP BY status", (source,)))
+
+    def close(self):
+        """Ferme la connexion"""
+        with self._lock:
+            self.conn.close()
+
+
+class HostPoliteness:
+    """
+    Espacement minimal des requêtes vers un même hôte, partagé entre threads
+    """
+
+    def __init__(self, default_delay: float = 1.0):
+        """
+        Initialise le contrôle de politesse
+
+        Args:
+            default_delay (float): Délai minimal entre deux requêtes vers un hôte, en secondes
+        """
+        self.default_delay = default_delay
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    def wait(self, url: str, delay: Optional[float] = None):
+        """
+        Attend le prochain créneau autorisé pour l'hôte de l'URL et le réserve
+
+        Args:
+            url (str): URL à récupérer
+            delay (Optional[float]): Délai spécifique (Crawl-delay, configuration de la source)
+        """
+        host = urlsplit(url).netloc.lower()
+        delay = self.default_delay if delay is None else delay
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + delay
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class RobotsCache:
+    """
+    Cache des règles robots.txt par hôte
+
+    Les règles sont interprétées pour l'agent réellement envoyé dans les requêtes
+    (celui des entêtes de la source): c'est celui que voit le site.
+    """
+
+    def __init__(self, timeout: float = 10.0, user_agent: str = DEFAULT_HEADERS["User-Agent"]):
+        """
+        Initialise le cache
+
+        Args:
+            timeout (float): Timeout de récupération de robots.txt
+            user_agent (str): Agent par défaut (entêtes par défaut des collecteurs)
+        """
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self._lock = threading.Lock()
+        self._parsers: Dict[str, RobotFileParser] = {}
+
+    def _parser_for(self, url: str, user_agent: str) -> RobotFileParser:
+        """
+        Récupère (une seule fois par hôte) et parse le robots.txt
+
+        Args:
+            url (str): URL quelconque de l'hôte
+            user_agent (str): Agent des requêtes vers l'hôte
+
+        Returns:
+            RobotFileParser: Règles de l'hôte
+        """
+        parts = urlsplit(url)
+        key = f"{parts.scheme}://{parts.netloc}".lower()
+        with self._lock:
+            parser = self._parsers.get(key)
+        if parser is not None:
+            return parser
+
+        parser = RobotFileParser(f"{key}/robots.txt")
+        try:
+            download = fetch_bounded(f"{key}/robots.txt", {"User-Agent": user_agent},
+                                     self.timeout, ROBOTS_MAX_BYTES)
+            parser.parse(download.text.splitlines())
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code in (401, 403):
+                parser.disallow_all = True
+            else:
+                parser.allow_all = True
+        except Exception as e:
+            # robots.txt inaccessible: on ne bloque pas la collecte
+            print(f"robots.txt indisponible pour {key}: {e}")
+            parser.allow_all = True
+
+        with self._lock:
+            self._parsers[key] = parser
+        return parser
+
+    def can_fetch(self, url: str, user_agent: Optional[str] = None) -> bool:
+        """
+        Indique si robots.txt autorise la récupération de l'URL
+
+        Args:
+            url (str): URL à récupérer
+            user_agent (Optional[str]): Agent envoyé dans la requête (défaut: agent du cache)
+
+        Returns:
+            bool: True si autorisé
+        """
+        user_agent = user_agent or self.user_agent
+        return self._parser_for(url, user_agent).can_fetch(user_agent, url)
+
+    def crawl_delay(self, url: str, user_agent: Optional[str] = None) -> Optional[float]:
+        """
+        Retourne le Crawl-delay déclaré pour l'hôte
+
+        Args:
+            url (str): URL de l'hôte
+            user_agent (Optional[str]): Agent envoyé dans la requête (défaut: agent du cache)
+
+        Returns:
+            Optional[float]: Délai en secondes ou None
+        """
+        user_agent = user_agent or self.user_agent
+        delay = self._parser_for(url, user_agent).crawl_delay(user_agent)
+        return float(delay) if delay is not None else None
@@ -0,0 +1,348 @@
+import re
+import zlib
+import codecs
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+import requests
+
+from ..utils.profiling import stage
+
+try:
+    import brotli
+    # Sortie bornée (output_buffer_limit, brotli >= 1.2) indispensable contre les bombes:
+    # sans elle (anciennes versions, brotlicffi), "br" n'est pas annoncé aux serveurs
+    BROTLI_AVAILABLE = hasattr(brotli.Decompressor(), "can_accept_more_data")
+except ImportError:
+    # Pas de décodeur brotli: "br" n'est pas annoncé aux serveurs
+    BROTLI_AVAILABLE = False
+
+# Taille maximale d'une réponse (après décompression), par défaut
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+
+# Taille des blocs lus sur la socket (avant décompression)
+CHUNK_SIZE = 64 * 1024
+
+# Octets examinés pour trouver l'encodage déclaré dans le document
+SNIFF_BYTES = 4096
+
+# Sortie brotli demandée par appel: le tampon du décodeur dépasse la limite demandée par
+# paliers (32 Ko au moins), la sortie est donc produite par tranches puis coupée
+BROTLI_SLICE = 32 * 1024
+
+# Encodages de transfert que l'on sait décompresser, annoncés dans Accept-Encoding
+SUPPORTED_ENCODINGS = ("gzip", "deflate", "br") if BROTLI_AVAILABLE else ("gzip", "deflate")
+ACCEPT_ENCODING = ", ".join(SUPPORTED_ENCODINGS)
+
+_CHARSET_PARAM = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.I)
+_DOCUMENT_CHARSET = re.compile(
+    rb"""<meta[^>]+charset\s*=\s*["']?([\w.:-]+)|<\?xml[^>]+encoding\s*=\s*["']([\w.:-]+)""", re.I)
+_BOMS = ((codecs.BOM_UTF8, "utf-8"), (codecs.BOM_UTF16_LE, "utf-16"), (codecs.BOM_UTF16_BE, "utf-16"))
+
+
+class Download(NamedTuple):
+    """
+    Réponse téléchargée dans la limite de taille
+
+    Attributes:
+        url (str): URL finale (après redirections)
+        status (int): Code HTTP
+        data (bytes): Corps décompressé, au plus max_bytes octets
+        encoding (Optional[str]): Encodage des caractères (entête, BOM ou déclaration du document)
+        truncated (bool): Le corps dépassait la limite et a été tronqué
+        stopped (bool): Le téléchargement s'est arrêté au marqueur de fin
+    """
+    url: str
+    status: int
+    data: bytes
+    encoding: Optional[str]
+    truncated: bool
+    stopped: bool
+
+    @property
+    def text(self) -> str:
+        """Corps décodé (UTF-8, puis cp1252 si l'encodage est inconnu)"""
+        if self.encoding:
+            return self.data.decode(self.encoding, errors="replace")
+        try:
+            return self.data.decode("utf-8")
+        except UnicodeDecodeError:
+            return self.data.decode("cp1252", errors="replace")
+
+
+def supported_accept_encoding(value: str) -> str:
+    """
+    Restreint une valeur Accept-Encoding aux encodages décompressables
+
+    Args:
+        value (str): Valeur de l'entête (ex: "gzip, deflate, br, zstd")
+
+    Returns:
+        str: Valeur filtrée (ACCEPT_ENCODING si rien ne reste)
+    """
+    kept = [part.strip() for part in value.split(",")
+            if part.split(";")[0].strip().lower() in SUPPORTED_ENCODINGS + ("identity",)]
+    return ", ".join(kept) or ACCEPT_ENCODING
+
+
+def _valid_encoding(name) -> Optional[str]:
+    if isinstance(name, bytes):
+        name = name.decode("ascii", errors="ignore")
+    try:
+        return codecs.lookup(name).name if name else None
+    except LookupError:
+        return None
+
+
+def detect_encoding(head: bytes, content_type: str = "") -> Optional[str]:
+    """
+    Encodage des caractères à partir des premiers octets du corps
+
+    Ordre: paramètre charset de Content-Type, BOM, puis <meta charset> ou
+    déclaration XML dans les SNIFF_BYTES premiers octets. Aucune détection
+    statistique sur le corps complet.
+
+    Args:
+        head (bytes): Début du corps (décompressé)
+        content_type (str): Entête Content-Type
+
+    Returns:
+        Optional[str]: Encodage, ou None s'il n'est déclaré nulle part
+    """
+    match = _CHARSET_PARAM.search(content_type or "")
+    if match and _valid_encoding(match.group(1)):
+        return _valid_encoding(match.group(1))
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return "utf-8-sig" if encoding == "utf-8" else encoding
+    match = _DOCUMENT_CHARSET.search(head[:SNIFF_BYTES])
+    if match:
+        return _valid_encoding(match.group(1) or match.group(2))
+    return None
+
+
+class _Decompressor:
+    """Décompression d'un Content-Encoding, la sortie étant bornée à chaque appel"""
+
+    def __init__(self, content_encoding: str):
+        codings = [c.strip().lower() for c in content_encoding.split(",") if c.strip()]
+        codings = [c for c in codings if c != "identity"]
+        if len(codings) > 1:
+            raise ValueError(f"Content-Encoding multiple non pris en charge: {content_encoding}")
+        self.coding = codings[0] if codings else None
+        if self.coding == "gzip" or self.coding == "x-gzip":
+            self._zlib = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif self.coding == "deflate":
+            self._zlib = zlib.decompressobj()
+            self._first = True
+        elif self.coding == "br" and BROTLI_AVAILABLE:
+            self._brotli = brotli.Decompressor()
+        elif self.coding is not None:
+            raise ValueError(f"Content-Encoding non pris en charge: {content_encoding}")
+
+    def decompress(self, data: bytes, max_length: int) -> bytes:
+        """
+        Décompresse un bloc sans produire (sensiblement) plus de max_length octets
+
+        Args:
+            data (bytes): Bloc reçu
+            max_length (int): Taille de sortie au-delà de laquelle le reste est abandonné
+
+        Returns:
+            bytes: Données décompressées
+        """
+        if self.coding is None:
+            return data
+        if self.coding == "br":
+            out = [self._brotli.process(data, output_buffer_limit=min(BROTLI_SLICE, max_length))]
+            size = len(out[0])
+            # Sortie en attente (limite atteinte par l'appel): vidée jusqu'à max_length;
+            # can_accept_more_data() ne signale que l'entrée consommée, pas la sortie restante
+            while size < max_length and not self._brotli.is_finished():
+                piece = self._brotli.process(b"", output_buffer_limit=min(BROTLI_SLICE, max_length - size))
+                if not piece:
+                    break
+                out.append(piece)
+                size += len(piece)
+            return b"".join(out)[:max_length]
+        if self.coding == "deflate" and self._first:
+            # "deflate" est parfois envoyé sans entête zlib (deflate brut)
+            self._first = False
+            try:
+                return self._zlib.decompress(data, max_length)
+            except zlib.error:
+                self._zlib = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self._zlib.decompress(data, max_length)
+
+
+class BoundedBody:
+    """
+    Corps d'une réponse lu au fil de l'eau, dans la limite de taille
+
+    Objet fichier binaire (read): un analyseur incrémental consomme le corps
+    pendant le téléchargement, et la lecture s'arrête dès que l'analyseur n'a
+    plus besoin de la suite (le reste n'est jamais téléchargé). Le corps est
+    décompressé bloc par bloc, avec une sortie bornée.
+
+    Usage:
+        with open_bounded(url, headers, timeout) as body:
+            for entry in iter_feed_entries(body):
+                ...
+    """
+
+    def __init__(self, response: requests.Response, max_bytes: int = DEFAULT_MAX_BYTES,
+                 stop_marker: Optional[bytes] = None, keep: bool = False):
+        """
+        Initialise la lecture du corps
+
+        Args:
+            response (requests.Response): Réponse ouverte avec stream=True
+            max_bytes (int): Taille maximale du corps décompressé
+            stop_marker (Optional[bytes]): Marqueur après lequel le reste du corps est inutile
+            keep (bool): Conserver les octets lus (received), pour une seconde analyse
+        """
+        self.response = response
+        self.url = response.url
+        self.status = response.status_code
+        self.max_bytes = max_bytes
+        self.stop_marker = stop_marker
+        self.size = 0
+        self.truncated = False
+        self.stopped = False
+        self.received: Optional[List[bytes]] = [] if keep else None
+        self._decompressor = _Decompressor(response.headers.get("Content-Encoding", ""))
+        self._chunks = self._iter_chunks()
+        self._buffer = b""
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        """Blocs décompressés, jusqu'à la limite de taille ou au marqueur de fin"""
+        tail = b""
+        marker = self.stop_marker
+        for raw in self.response.raw.stream(CHUNK_SIZE, decode_content=False):
+            data = self._decompressor.decompress(raw, self.max_bytes - self.size + 1)
+            if self.size + len(data) > self.max_bytes:
+                data = data[:self.max_bytes - self.size]
+                self.truncated = True
+            self.size += len(data)
+            if self.received is not None:
+                self.received.append(data)
+            yield data
+            if self.truncated:
+                return
+            if marker:
+                if marker in tail + data:
+                    self.stopped = True
+                    return
+                tail = (tail + data)[-(len(marker) - 1):] if len(marker) > 1 else b""
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Lit au plus size octets du corps décompressé (tout le reste si size < 0)
+
+        Args:
+            size (int): Nombre d'octets demandés
+
+        Returns:
+            bytes: Octets lus (b"" en fin de corps)
+        """
+        if size is None or size < 0:
+            data = self._buffer + b"".join(self._chunks)
+            self._buffer = b""
+            return data
+        while len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def received_data(self) -> bytes:
+        """
+        Corps complet: octets déjà lus (keep=True) puis reste du corps
+
+        Returns:
+            bytes: Corps décompressé, au plus max_bytes octets
+        """
+        self.read()
+        return b"".join(self.received or ())
+
+    @property
+    def encoding(self) -> Optional[str]:
+        """Encodage des caractères (entête, BOM ou déclaration dans le début du corps)"""
+        head = b"".join(self.received or ())[:SNIFF_BYTES]
+        return detect_encoding(head, self.response.headers.get("Content-Type", ""))
+
+    def close(self) -> None:
+        """Ferme la connexion (le reste du corps n'est pas téléchargé)"""
+        self.response.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def open_bounded(url: str, headers: Dict[str, str], timeout, max_bytes: int = DEFAULT_MAX_BYTES,
+                 stop_marker: Optional[bytes] = None, session: Optional[requests.Session] = None,
+                 keep: bool = False) -> BoundedBody:
+    """
+    Ouvre une réponse dont le corps sera lu au fil de l'eau (voir BoundedBody)
+
+    Args:
+        url (str): URL à récupérer
+        headers (Dict[str, str]): Entêtes HTTP (Accept-Encoding limité aux encodages pris en charge)
+        timeout: Timeout requests (connexion, lecture)
+        max_bytes (int): Taille maximale du corps décompressé
+        stop_marker (Optional[bytes]): Marqueur après lequel le reste du corps est inutile
+        session (Optional[requests.Session]): Session HTTP (requête isolée par défaut)
+        keep (bool): Conserver les octets lus, pour une seconde analyse
+
+    Returns:
+        BoundedBody: Corps à lire (à fermer, ou à utiliser comme gestionnaire de contexte)
+
+    Raises:
+        requests.RequestException: Erreur HTTP ou réseau
+        ValueError: Content-Encoding non pris en charge
+    """
+    headers = dict(headers)
+    headers["Accept-Encoding"] = supported_accept_encoding(headers.get("Accept-Encoding", ACCEPT_ENCODING))
+    response = (session or requests).get(url, headers=headers, timeout=timeout, stream=True)
+    try:
+        response.raise_for_status()
+        return BoundedBody(response, max_bytes, stop_marker, keep)
+    except Exception:
+        response.close()
+        raise
+
+
+@stage("fetch")
+def fetch_bounded(url: str, headers: Dict[str, str], timeout, max_bytes: int = DEFAULT_MAX_BYTES,
+                  stop_marker: Optional[bytes] = None,
+                  session: Optional[requests.Session] = None) -> Download:
+    """
+    Télécharge une réponse par blocs, dans une limite de taille
+
+    Le corps est décompressé ici, bloc par bloc et avec une sortie bornée: une
+    réponse compressée très dense (bombe de décompression) n'occupe jamais plus
+    de max_bytes plus un bloc. Le téléchargement s'arrête dès la limite atteinte,
+    ou dès que le marqueur de fin (ex: b"</main>") a été reçu.
+
+    Args:
+        url (str): URL à récupérer
+        headers (Dict[str, str]): Entêtes HTTP (Accept-Encoding limité aux encodages pris en charge)
+        timeout: Timeout requests (connexion, lecture)
+        max_bytes (int): Taille maximale du corps décompressé
+        stop_marker (Optional[bytes]): Marqueur après lequel le reste de la page est inutile
+        session (Optional[requests.Session]): Session HTTP (requête isolée par défaut)
+
+    Returns:
+        Download: Corps reçu et indicateurs de troncature
+
+    Raises:
+        requests.RequestException: Erreur HTTP ou réseau
+        ValueError: Content-Encoding non pris en charge
+    """
+    with open_bounded(url, headers, timeout, max_bytes, stop_marker, session, keep=True) as body:
+        data = body.received_data()
+    return Download(body.url, body.status, data, body.encoding, body.truncated, body.stopped)
@@ -0,0 +1,417 @@
+import os
+import json
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+
+from ..utils.profiling import stage
+from ..utils.url_utils import canonicalize_url
+
+try:
+    import lxml.html
+    from lxml import etree
+    from lxml.cssselect import CSSSelector
+    LXML_AVAILABLE = True
+except ImportError:
+    # lxml ou cssselect absent: extraction BeautifulSoup uniquement
+    LXML_AVAILABLE = False
+
+# Balises dont le contenu n'est pas considéré comme du texte (comme BeautifulSoup >= 4.9)
+NON_TEXT_TAGS = frozenset(["script", "style", "template"])
+
+# Balises éliminées avant l'extraction du contenu principal
+NOISE_TAGS = frozenset(["script", "style", "nav", "header", "footer", "aside"])
+
+# Balises et indices de classe utilisés pour repérer le contenu principal
+MAIN_CONTENT_TAGS = ["article", "main", "div", "section"]
+MAIN_CONTENT_HINTS = ["content", "main", "article", "text"]
+
+STRATEGY_MAIN_CONTENT = "main_content"
+STRATEGY_BODY = "body"
+
+if LXML_AVAILABLE:
+    _LOWER = "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+    _MAIN_CONTENT_XPATH = etree.XPath(
+        "//*[" + " or ".join(f"self::{tag}" for tag in MAIN_CONTENT_TAGS) + "]"
+        "[@class and (" + " or ".join(f"contains({_LOWER}, '{hint}')" for hint in MAIN_CONTENT_HINTS) + ")]"
+    )
+
+
+@dataclass
+class ExtractionResult:
+    """
+    Résultat de l'extraction d'une page
+
+    Attributes:
+        title (str): Titre de la page
+        content (str): Contenu extrait
+        blocks (List[str]): Texte de chaque élément retenu, dans l'ordre du document
+        strategy (str): Stratégie ayant produit le contenu
+    """
+    title: str
+    content: str
+    blocks: List[str] = field(default_factory=list)
+    strategy: str = ""
+
+
+@lru_cache(maxsize=256)
+def compile_selector(selector: str):
+    """
+    Compile un sélecteur CSS en expression XPath lxml (une seule fois par sélecteur)
+
+    Args:
+        selector (str): Sélecteur CSS
+
+    Returns:
+        CSSSelector: Expression XPath compilée
+    """
+    return CSSSelector(selector, translator="html")
+
+
+def _iter_strings(element, skip_tags: frozenset):
+    """
+    Parcourt les chaînes de texte d'un sous-arbre lxml dans l'ordre du document
+
+    Reproduit le comportement de `Tag.get_text()` de BeautifulSoup: les commentaires
+    et le contenu des balises ignorées sont exclus, leur texte de queue est conservé.
+
+    Args:
+        element: Élément lxml racine
+        skip_tags (frozenset): Balises dont le sous-arbre est ignoré
+
+    Yields:
+        str: Chaînes de texte
+    """
+    if element.text:
+        yield element.text
+    stack = [(iter(element), None)]
+    while stack:
+        children, tail = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            if tail:
+                yield tail
+            continue
+        if isinstance(child.tag, str) and child.tag not in skip_tags:
+            if child.text:
+                yield child.text
+            stack.append((iter(child), child.tail))
+        elif child.tail:
+            yield child.tail
+
+
+def element_text(element, skip_tags: frozenset = NON_TEXT_TAGS) -> str:
+    """
+    Équivalent lxml de `get_text(separator="\\n", strip=True)`
+
+    Args:
+        element: Élément lxml
+        skip_tags (frozenset): Balises dont le sous-arbre est ignoré
+
+    Returns:
+        str: Texte de l'élément
+    """
+    return "\n".join(s for s in (text.strip() for text in _iter_strings(element, skip_tags)) if s)
+
+
+class StrategyMemory:
+    """
+    Mémorise, par domaine, la stratégie d'extraction qui a fonctionné
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialise la mémoire des stratégies
+
+        Args:
+            path (Optional[str]): Fichier JSON de persistance (None: mémoire volatile)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._strategies: Dict[str, str] = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._strategies = json.load(f)
+            except Exception as e:
+                print(f"Erreur lors de la lecture des stratégies d'extraction: {e}")
+
+    def get(self, domain: str) -> Optional[str]:
+        with self._lock:
+            return self._strategies.get(domain)
+
+    def remember(self, domain: str, strategy: str):
+        with self._lock:
+            self._strategies[domain] = strategy
+
+    def save(self):
+        """Persiste les stratégies apprises"""
+        if not self.path:
+            return
+        with self._lock:
+            data = json.dumps(self._strategies, ensure_ascii=False, indent=2)
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                f.write(data)
+        except Exception as e:
+            print(f"Erreur lors de l'écriture des stratégies d'extraction: {e}")
+
+
+class ContentExtractor:
+    """
+    Extracteur de contenu à base de règles compilées
+
+    Les sélecteurs CSS de chaque source sont compilés une seule fois en XPath lxml.
+    La chaîne de stratégies (sélecteur, sélecteurs de repli, contenu principal, corps
+    de page) est parcourue dans l'ordre, sauf pour les domaines dont le sélecteur
+    gagnant est déjà connu: celui-ci est alors essayé en premier. Seuls les
+    sélecteurs ayant produit du contenu sont appris; les replis (contenu principal,
+    corps de page) ne remplacent jamais un sélecteur appris.
+    """
+
+    def __init__(self, memory_path: Optional[str] = None):
+        """
+        Initialise l'extracteur
+
+        Args:
+            memory_path (Optional[str]): Fichier de persistance des stratégies apprises
+        """
+        self.memory = StrategyMemory(memory_path)
+
+    @staticmethod
+    def strategies_for(selector: Optional[str], fallback_selectors: Sequence[str] = ()) -> List[str]:
+        """
+        Construit la chaîne de stratégies d'une source
+
+        Args:
+            selector (Optional[str]): Sélecteur principal
+            fallback_selectors (Sequence[str]): Sélecteurs de repli
+
+        Returns:
+            List[str]: Stratégies ordonnées
+        """
+        strategies = [f"selector:{s}" for s in [selector, *fallback_selectors] if s]
+        return strategies + [STRATEGY_MAIN_CONTENT, STRATEGY_BODY]
+
+    @stage("parse")
+    def extract(self, html: str, url: str, selector: Optional[str] = None,
+                fallback_selectors: Sequence[str] = ()) -> ExtractionResult:
+        """
+        Extrait le titre et le contenu d'une page
+
+        Args:
+            html (str): Code HTML de la page
+            url (str): URL de la page (le domaine sert de clé d'apprentissage)
+            selector (Optional[str]): Sélecteur CSS principal
+            fallback_selectors (Sequence[str]): Sélecteurs CSS de repli
+
+        Returns:
+            ExtractionResult: Résultat de l'extraction
+        """
+        domain = urlparse(url).netloc.lower()
+        strategies = self.strategies_for(selector, fallback_selectors)
+
+        # Sélecteur appris en premier, puis le reste de la chaîne dans l'ordre
+        learned = self.memory.get(domain)
+        if learned and learned.startswith("selector:") and learned in strategies and learned != strategies[0]:
+            strategies.remove(learned)
+            strategies.insert(0, learned)
+
+        result = None
+        if LXML_AVAILABLE:
+            document = self._parse_lxml(html)
+            if document is not None:
+                result = self._run_lxml(document, strategies)
+        if result is None:
+            result = self._run_bs4(BeautifulSoup(html, "html.parser"), strategies)
+
+        # Une page atypique (repli, sélecteur vide) ne fait pas oublier le sélecteur appris
+        if result.strategy.startswith("selector:") and result.blocks:
+            self.memory.remember(domain, result.strategy)
+        return result
+
+    @staticmethod
+    def _parse_lxml(html: str):
+        """
+        Parse le HTML avec lxml
+
+        Args:
+            html (str): Code HTML
+
+        Returns:
+            Document lxml ou None si le document ne peut pas être parsé
+        """
+        if not html or not html.strip():
+            return None
+        try:
+            return lxml.html.document_fromstring(html)
+        except ValueError:
+            # Chaîne unicode avec déclaration d'encodage XML: on repasse par les octets
+            try:
+                parser = lxml.html.HTMLParser(encoding="utf-8")
+                return lxml.html.document_fromstring(html.encode("utf-8"), parser=parser)
+            except Exception:
+                return None
+        except Exception:
+            return None
+
+    @staticmethod
+    def _run_lxml(document, strategies: List[str]) -> ExtractionResult:
+        """
+        Applique la chaîne de stratégies sur un document lxml
+
+        Args:
+            document: Document lxml
+            strategies (List[str]): Stratégies ordonnées
+
+        Returns:
+            ExtractionResult: Résultat de la première stratégie applicable
+        """
+        title_element = document.find(".//title")
+        title = "".join(_iter_strings(title_element, NON_TEXT_TAGS)) if title_element is not None else ""
+
+        for strategy in strategies:
+            if strategy.startswith("selector:"):
+                elements = compile_selector(strategy[len("selector:"):])(document)
+                if not elements:
+                    continue
+                blocks = [text for text in (element_text(e) for e in elements) if text]
+                content = "".join(text + "\n\n" for text in blocks)
+                return ExtractionResult(title, content, blocks, strategy)
+
+            if strategy == STRATEGY_MAIN_CONTENT:
+                elements = _MAIN_CONTENT_XPATH(document)
+                if not elements:
+                    continue
+                matched = set(elements)
+                blocks = []
+                for element in elements:
+                    if ContentExtractor._inside_removed_noise(element, matched):
+                        # Élément supprimé avec le bruit d'un élément englobant (cf. decompose())
+                        blocks.append("")
+                    else:
+                        blocks.append(element_text(element, NON_TEXT_TAGS | NOISE_TAGS))
+                content = "".join(text + "\n\n" for text in blocks)
+                return ExtractionResult(title, content, blocks, strategy)
+
+            if strategy == STRATEGY_BODY:
+                body = document.find(".//body")
+                content = element_text(body, NON_TEXT_TAGS | NOISE_TAGS) if body is not None else ""
+                return ExtractionResult(title, content, [content] if content else [], strategy)
+
+        return ExtractionResult(title, "", [], STRATEGY_BODY)
+
+    @staticmethod
+    def _inside_removed_noise(element, matched: set) -> bool:
+        """
+        Indique si un élément se trouve dans une balise de bruit d'un élément retenu englobant
+
+        Args:
+            element: Élément lxml
+            matched (set): Éléments retenus par la stratégie de contenu principal
+
+        Returns:
+            bool: True si l'élément aurait été éliminé avec ce bruit
+        """
+        in_noise = False
+        for ancestor in element.iterancestors():
+            if ancestor.tag in NOISE_TAGS:
+                in_noise = True
+            elif in_noise and ancestor in matched:
+                return True
+        return False
+
+    @staticmethod
+    def _run_bs4(soup: BeautifulSoup, strategies: List[str]) -> ExtractionResult:
+        """
+        Applique la chaîne de stratégies avec BeautifulSoup (repli sans lxml)
+
+        Args:
+            soup (BeautifulSoup): Document parsé
+            strategies (List[str]): Stratégies ordonnées
+
+        Returns:
+            ExtractionResult: Résultat de la première stratégie applicable
+        """
+        title = soup.title.get_text() if soup.title else ""
+
+        for strategy in strategies:
+            if strategy.startswith("selector:"):
+                elements = soup.select(strategy[len("selector:"):])
+                if not elements:
+                    continue
+                blocks = [text for text in (e.get_text(separator="\n", strip=True) for e in elements) if text]
+                content = "".join(text + "\n\n" for text in blocks)
+                return ExtractionResult(title, content, blocks, strategy)
+
+            if strategy == STRATEGY_MAIN_CONTENT:
+                elements = soup.find_all(
+                    MAIN_CONTENT_TAGS,
+                    class_=lambda c: c and any(x in str(c).lower() for x in MAIN_CONTENT_HINTS)
+                )
+                if not elements:
+                    continue
+                blocks = []
+                for element in elements:
+                    # Éliminer les éléments non pertinents
+                    for tag in element.find_all(list(NOISE_TAGS)):
+                        tag.decompose()
+                    blocks.append(element.get_text(separator="\n", strip=True))
+                content = "".join(text + "\n\n" for text in blocks)
+                return ExtractionResult(title, content, blocks, strategy)
+
+            if strategy == STRATEGY_BODY:
+                content = ""
+                if soup.body:
+                    for tag in soup.body.find_all(list(NOISE_TAGS)):
+                        tag.decompose()
+                    content = soup.body.get_text(separator="\n", strip=True)
+                return ExtractionResult(title, content, [content] if content else [], strategy)
+
+        return ExtractionResult(title, "", [], STRATEGY_BODY)
+
+
+def extract_links(html: str, base_url: str, link_selector: Optional[str] = None) -> List[str]:
+    """
+    Extrait les liens (canoniques, sans doublons) d'une page de liste
+
+    Args:
+        html (str): Code HTML de la page
+        base_url (str): URL de la page, pour résoudre les liens relatifs
+        link_selector (Optional[str]): Sélecteur CSS des liens ou de leurs conteneurs
+            (tous les liens de la page par défaut)
+
+    Returns:
+        List[str]: URLs dans l'ordre du document
+    """
+    hrefs: List[str] = []
+    document = ContentExtractor._parse_lxml(html) if LXML_AVAILABLE else None
+    if document is not None:
+        elements = compile_selector(link_selector)(document) if link_selector else [document]
+        for element in elements:
+            if element.tag == "a" and element.get("href"):
+                hrefs.append(element.get("href"))
+            else:
+                hrefs.extend(a.get("href") for a in element.iterfind(".//a[@href]"))
+    else:
+        soup = BeautifulSoup(html, "html.parser")
+        elements = soup.select(link_selector) if link_selector else [soup]
+        for element in elements:
+            if element.name == "a" and element.get("href"):
+                hrefs.append(element["href"])
+            else:
+                hrefs.extend(a["href"] for a in element.find_all("a", href=True))
+
+    links = []
+    seen = set()
+    for href in hrefs:
+        url = canonicalize_url(href, base_url)
+        if url and url not in seen:
+            seen.add(url)
+            links.append(url)
+    return links
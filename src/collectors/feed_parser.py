@@ -0,0 +1,116 @@
+import io
+from typing import Any, Dict, Iterator, Union
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    # lxml absent: les flux sont analysés par feedparser uniquement
+    LXML_AVAILABLE = False
+
+RSS1_NS = "http://purl.org/rss/1.0/"
+ATOM_NS = "http://www.w3.org/2005/Atom"
+CONTENT_NS = "http://purl.org/rss/1.0/modules/content/"
+DC_NS = "http://purl.org/dc/elements/1.1/"
+
+# Éléments d'entrée: RSS 2.0, RSS 1.0 (RDF, listings arXiv) et Atom
+ENTRY_TAGS = ("item", f"{{{RSS1_NS}}}item", f"{{{ATOM_NS}}}entry")
+
+# Enfants d'une entrée retenus, vers les clés des entrées feedparser
+FIELD_TAGS = {
+    "title": "title",
+    "link": "link",
+    "description": "summary",
+    "pubDate": "published",
+    "guid": "id",
+    f"{{{RSS1_NS}}}title": "title",
+    f"{{{RSS1_NS}}}link": "link",
+    f"{{{RSS1_NS}}}description": "summary",
+    f"{{{CONTENT_NS}}}encoded": "content",
+    f"{{{DC_NS}}}date": "published",
+    f"{{{DC_NS}}}description": "summary",
+    f"{{{ATOM_NS}}}title": "title",
+    f"{{{ATOM_NS}}}summary": "summary",
+    f"{{{ATOM_NS}}}content": "content",
+    f"{{{ATOM_NS}}}published": "published",
+    f"{{{ATOM_NS}}}updated": "updated",
+    f"{{{ATOM_NS}}}id": "id",
+}
+ATOM_LINK = f"{{{ATOM_NS}}}link"
+ATOM_ENTRY = f"{{{ATOM_NS}}}entry"
+
+# Entêtes propres aux flux (complètent les entêtes de la source)
+FEED_HEADERS = {
+    "Accept": "application/rss+xml, application/atom+xml, application/rdf+xml, "
+              "application/xml;q=0.9, text/xml;q=0.9, */*;q=0.8"
+}
+
+
+class FeedParseError(ValueError):
+    """Flux non conforme XML: à confier à feedparser, plus tolérant"""
+
+
+def _element_text(element) -> str:
+    """Texte d'un élément, ou son contenu XML si l'élément a des enfants (Atom xhtml)"""
+    if len(element) == 0:
+        return element.text or ""
+    return (element.text or "") + "".join(
+        etree.tostring(child, encoding="unicode", with_tail=True) for child in element)
+
+
+def _entry_fields(element) -> Dict[str, str]:
+    """Champs d'une entrée (le premier élément de chaque champ l'emporte)"""
+    entry: Dict[str, str] = {}
+    for child in element:
+        tag = child.tag
+        if tag == ATOM_LINK:
+            if "link" not in entry and child.get("rel", "alternate") == "alternate":
+                entry["link"] = child.get("href", "")
+            continue
+        key = FIELD_TAGS.get(tag) if isinstance(tag, str) else None
+        if key is not None and key not in entry:
+            entry[key] = _element_text(child).strip()
+    return entry
+
+
+def iter_feed_entries(data: Union[bytes, Any]) -> Iterator[Dict[str, str]]:
+    """
+    Analyse incrémentale d'un flux RSS 2.0, RSS 1.0 ou Atom
+
+    Les entrées sont produites dans l'ordre du document, au fil de l'analyse:
+    l'appelant peut s'arrêter dès les premières entrées, le reste du flux n'est
+    alors pas analysé. Chaque entrée traitée est libérée, la mémoire ne dépend
+    pas de la taille du flux.
+
+    Args:
+        data (Union[bytes, Any]): Contenu du flux, ou objet fichier binaire
+
+    Returns:
+        Iterator[Dict[str, str]]: Entrées avec les clés des entrées feedparser
+            (title, link, summary, content, published, updated, id) présentes dans le flux;
+            une entrée Atom sans résumé reçoit son contenu comme résumé
+
+    Raises:
+        FeedParseError: Flux mal formé (avant ou après des entrées déjà produites)
+    """
+    if isinstance(data, (bytes, bytearray)):
+        data = io.BytesIO(data)
+    context = etree.iterparse(data, events=("end",), tag=ENTRY_TAGS,
+                              resolve_entities=False, no_network=True, huge_tree=True)
+    try:
+        for _, element in context:
+            entry = _entry_fields(element)
+            # Entrée Atom sans <summary>: résumé tiré du contenu, comme feedparser
+            if element.tag == ATOM_ENTRY and "summary" not in entry and "content" in entry:
+                entry["summary"] = entry["content"]
+            # Libération de l'entrée et des entrées précédentes déjà produites
+            element.clear(keep_tail=True)
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+            yield entry
+    except etree.XMLSyntaxError as e:
+        raise FeedParseError(str(e)) from e
+    finally:
+        del context
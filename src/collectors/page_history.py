@@ -0,0 +1,210 @@
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Any, Dict, List, NamedTuple, Sequence, Tuple
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def block_hash(text: str) -> int:
+    """
+    Empreinte 64 bits d'un bloc de texte, insensible aux espaces
+
+    Args:
+        text (str): Texte d'un élément extrait
+
+    Returns:
+        int: Empreinte signée (utilisable comme entier SQLite)
+    """
+    normalized = _WHITESPACE.sub(" ", text).strip().lower()
+    digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class PageChange(NamedTuple):
+    """
+    Résultat de l'observation d'une page
+
+    Attributes:
+        changed (bool): Le contenu diffère de la dernière version enregistrée
+        version (int): Numéro de la version courante de la page
+        fingerprint (str): Empreinte du contenu extrait
+        new_blocks (List[str]): Blocs jamais vus sur cette page, dans l'ordre du document
+        removed_blocks (int): Blocs de la version précédente absents de la page
+        block_hashes (Tuple[int, ...]): Empreintes distinctes des blocs de la page (cf. commit)
+    """
+    changed: bool
+    version: int
+    fingerprint: str
+    new_blocks: List[str]
+    removed_blocks: int
+    block_hashes: Tuple[int, ...] = ()
+
+
+class PageHistory:
+    """
+    Historique des versions des pages surveillées, stocké dans SQLite
+
+    Chaque page est réduite à ses blocs (éléments retenus par le sélecteur): une
+    empreinte de l'ensemble détecte une page inchangée sans autre calcul, et les
+    empreintes des blocs déjà vus donnent, pour une page modifiée, exactement les
+    éléments nouveaux. Seules les empreintes sont conservées, pas le texte.
+
+    La comparaison (diff) et l'enregistrement de la version (commit) sont séparés:
+    une version n'est enregistrée qu'une fois l'élément qui la décrit sauvegardé,
+    sinon ses blocs nouveaux seraient considérés comme vus sans avoir été conservés.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Ouvre (ou crée) l'historique
+
+        Args:
+            db_path (str): Chemin de la base SQLite
+        """
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._lock = threading.Lock()
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                version INTEGER NOT NULL,
+                fingerprint TEXT NOT NULL,
+                checked_at REAL NOT NULL,
+                changed_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS versions (
+                url TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                fingerprint TEXT NOT NULL,
+                observed_at REAL NOT NULL,
+                blocks INTEGER NOT NULL,
+                new_blocks INTEGER NOT NULL,
+                removed_blocks INTEGER NOT NULL,
+                PRIMARY KEY (url, version)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS blocks (
+                url TEXT NOT NULL,
+                hash INTEGER NOT NULL,
+                first_version INTEGER NOT NULL,
+                last_version INTEGER NOT NULL,
+                PRIMARY KEY (url, hash)
+            ) WITHOUT ROWID;
+        """)
+
+    def diff(self, url: str, blocks: Sequence[str]) -> PageChange:
+        """
+        Compare le contenu extrait d'une page à sa dernière version enregistrée
+
+        Seule la date de vérification d'une page inchangée est mise à jour; une
+        nouvelle version n'est enregistrée que par commit().
+
+        Args:
+            url (str): URL de la page
+            blocks (Sequence[str]): Texte des éléments extraits, dans l'ordre du document
+
+        Returns:
+            PageChange: Version courante et blocs nouveaux (aucun si la page est inchangée)
+        """
+        hashes = [block_hash(text) for text in blocks]
+        fingerprint = hashlib.blake2b(
+            b"".join(h.to_bytes(8, "big", signed=True) for h in hashes), digest_size=16).hexdigest()
+
+        with self._lock, self.conn:
+            row = self.conn.execute("SELECT version, fingerprint FROM pages WHERE url = ?", (url,)).fetchone()
+            if row is not None and row[1] == fingerprint:
+                self.conn.execute("UPDATE pages SET checked_at = ? WHERE url = ?", (time.time(), url))
+                return PageChange(False, row[0], fingerprint, [], 0)
+
+            previous = row[0] if row else 0
+            known = {h: last for h, last in self.conn.execute(
+                "SELECT hash, last_version FROM blocks WHERE url = ?", (url,))}
+
+        # Blocs jamais vus sur la page (un élément qui revient n'est pas nouveau)
+        new_blocks = []
+        seen: Dict[int, None] = {}
+        for text, h in zip(blocks, hashes):
+            if h not in known and h not in seen:
+                new_blocks.append(text)
+            seen[h] = None
+        removed = sum(1 for h, last in known.items() if last == previous and h not in seen)
+        return PageChange(True, previous + 1, fingerprint, new_blocks, removed, tuple(seen))
+
+    def commit(self, url: str, change: PageChange) -> bool:
+        """
+        Enregistre la version décrite par diff(), une fois l'élément correspondant sauvegardé
+
+        Args:
+            url (str): URL de la page
+            change (PageChange): Résultat de diff()
+
+        Returns:
+            bool: False si rien n'est enregistré (page inchangée, ou version déjà
+                remplacée par un autre enregistrement)
+        """
+        if not change.changed:
+            return False
+        now = time.time()
+        with self._lock, self.conn:
+            row = self.conn.execute("SELECT version FROM pages WHERE url = ?", (url,)).fetchone()
+            if (row[0] if row else 0) != change.version - 1:
+                return False
+            self.conn.executemany(
+                "INSERT INTO blocks (url, hash, first_version, last_version) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (url, hash) DO UPDATE SET last_version = excluded.last_version",
+                [(url, h, change.version, change.version) for h in change.block_hashes])
+            self.conn.execute(
+                "INSERT INTO pages (url, version, fingerprint, checked_at, changed_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (url) DO UPDATE SET version = excluded.version, fingerprint = excluded.fingerprint, "
+                "checked_at = excluded.checked_at, changed_at = excluded.changed_at",
+                (url, change.version, change.fingerprint, now, now))
+            self.conn.execute(
+                "INSERT INTO versions (url, version, fingerprint, observed_at, blocks, new_blocks, removed_blocks) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, change.version, change.fingerprint, now, len(change.block_hashes),
+                 len(change.new_blocks), change.removed_blocks))
+        return True
+
+    def observe(self, url: str, blocks: Sequence[str]) -> PageChange:
+        """
+        Compare une page à sa dernière version et enregistre aussitôt la nouvelle (diff puis commit)
+
+        Args:
+            url (str): URL de la page
+            blocks (Sequence[str]): Texte des éléments extraits, dans l'ordre du document
+
+        Returns:
+            PageChange: Version courante et blocs nouveaux (aucun si la page est inchangée)
+        """
+        change = self.diff(url, blocks)
+        self.commit(url, change)
+        return change
+
+    def history(self, url: str) -> List[Dict[str, Any]]:
+        """
+        Versions enregistrées d'une page, de la plus ancienne à la plus récente
+
+        Args:
+            url (str): URL de la page
+
+        Returns:
+            List[Dict[str, Any]]: Version, empreinte, date et nombre de blocs (total, nouveaux, retirés)
+        """
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT version, fingerprint, observed_at, blocks, new_blocks, removed_blocks "
+                "FROM versions WHERE url = ? ORDER BY version", (url,)).fetchall()
+        return [{"version": v, "fingerprint": f, "observed_at": t, "blocks": b,
+                 "new_blocks": n, "removed_blocks": r} for v, f, t, b, n, r in rows]
+
+    def close(self):
+        """Ferme la base"""
+        with self._lock:
+            self.conn.close()
@@ -1,9 +1,15 @@
 import feedparser
 import json
 import os
+import time
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, Iterable, List, Any, Optional, Set
 from .base_collector import BaseCollector
+from .download import open_bounded
+from .feed_parser import FEED_HEADERS, LXML_AVAILABLE, FeedParseError, iter_feed_entries
+from .source_registry import CompiledSource, as_source
+from ..utils.date_utils import normalize_entry_date
+from ..utils.profiling import stage
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 class RSSCollector(BaseCollector):
@@ -12,7 +18,8 @@ class RSSCollector(BaseCollector):
     """
     
     def __init__(self, output_dir: str = "data/raw", cache_dir: str = "data/cache",
-                 max_workers: int = 5, cache_expiry: int = 3600):
+                 max_workers: int = 5, cache_expiry: int = 3600, fast_parser: bool = True,
+                 known_run: int = 20):
         """
         Initialise le collecteur RSS
         
@@ -21,25 +28,161 @@ class RSSCollector(BaseCollector):
             cache_dir (str): Répertoire pour le cache
             max_workers (int): Nombre maximum de threads simultanés
             cache_expiry (int): Durée de validité du cache en secondes (1h par défaut)
+            fast_parser (bool): Analyse incrémentale lxml des flux (feedparser si lxml est absent
+                ou si le flux est mal formé)
+            known_run (int): Nombre d'entrées déjà collectées consécutives au-delà duquel la
+                lecture du flux s'arrête (0 pour lire tout le flux)
         """
         super().__init__(output_dir, cache_dir, max_workers, cache_expiry)
+        self.fast_parser = fast_parser and LXML_AVAILABLE
+        self.known_run = known_run
+    
+    @staticmethod
+    def _entry_content(entry: Dict[str, Any]) -> str:
+        """
+        Contenu d'une entrée (feedparser ou analyse incrémentale)
+        
+        Args:
+            entry (Dict[str, Any]): Entrée du flux
+            
+        Returns:
+            str: Contenu de l'entrée
+        """
+        content = ""
+        
+        # Analyse incrémentale (dictionnaire simple): contenu complet, sinon résumé
+        if not isinstance(entry, feedparser.FeedParserDict):
+            text = entry.get("content") or entry.get("summary", "")
+            return text + "\n\n" if text else ""
+        
+        # Méthode 1: Via la clé 'content'
+        if 'content' in entry:
+            for content_item in entry.content:
+                if 'value' in content_item:
+                    content += content_item.value + "\n\n"
+        
+        # Méthode 2: Via la clé 'description'
+        elif 'description' in entry:
+            content += entry.description + "\n\n"
+        
+        # Méthode 3: Via la clé 'summary_detail'
+        elif 'summary_detail' in entry and 'value' in entry.summary_detail:
+            content += entry.summary_detail.value + "\n\n"
+        
+        # Méthode 4: Via la clé 'summary'
+        elif 'summary' in entry:
+            content += entry.summary + "\n\n"
+        
+        # Si aucun contenu trouvé, utiliser le résumé comme contenu
+        if not content.strip() and 'summary' in entry:
+            content = entry.summary
+        return content
+    
+    def _new_articles(self, entries: Iterable[Dict[str, Any]], source: CompiledSource,
+                      seen: Set[str]) -> List[Dict[str, Any]]:
+        """
+        Articles des entrées jamais collectées, dans l'ordre du flux
+        
+        Les flux listent les entrées de la plus récente à la plus ancienne: après
+        `known_run` entrées déjà collectées consécutives, le reste du flux l'est
+        aussi et n'est pas lu (avec l'analyse incrémentale, pas même analysé).
+        
+        Args:
+            entries (Iterable[Dict[str, Any]]): Entrées du flux
+            source (CompiledSource): Source du flux
+            seen (Set[str]): Liens déjà collectés (complété au fil des entrées)
+            
+        Returns:
+            List[Dict[str, Any]]: Nouveaux articles
+        """
+        collected_at = datetime.now().isoformat()
+        new_articles = []
+        known_streak = 0
+        
+        for entry in entries:
+            # Utilisation du lien comme identifiant unique
+            link = entry.get("link", "")
+            if link and link in seen:
+                known_streak += 1
+                if self.known_run and known_streak >= self.known_run:
+                    print(f"Fin des nouveautés de {source.name} après {len(new_articles)} articles "
+                          f"({known_streak} entrées déjà collectées consécutives)")
+                    break
+                continue  # Article déjà collecté
+            known_streak = 0
+            
+            # Normalisation de la date de publication (epoch UTC + ISO)
+            published_ts, published_iso = normalize_entry_date(entry)
+            
+            new_articles.append({
+                "title": entry.get("title", ""),
+                "link": link,
+                "published": entry.get("published", ""),
+                "published_ts": published_ts,
+                "published_iso": published_iso,
+                "summary": entry.get("summary", ""),
+                "content": self._entry_content(entry),
+                "source_name": source.name,
+                "category": source.category,
+                "collected_at": collected_at
+            })
+            if link:
+                seen.add(link)
+        return new_articles
+    
+    def _parse_feed(self, source: CompiledSource, seen: Set[str], start_time: float) -> List[Dict[str, Any]]:
+        """
+        Récupère et analyse un flux, puis en extrait les nouveaux articles
+        
+        Args:
+            source (CompiledSource): Source du flux
+            seen (Set[str]): Liens déjà collectés
+            start_time (float): Début de la collecte (santé de la source)
+            
+        Returns:
+            List[Dict[str, Any]]: Nouveaux articles
+        """
+        # Téléchargement borné, commun aux deux analyseurs; le corps est analysé au fil
+        # de la réception et la lecture s'arrête avec l'analyse (le reste du flux n'est pas
+        # téléchargé). Les octets reçus sont conservés pour feedparser en cas d'échec.
+        with open_bounded(source.url, {**source.headers, **FEED_HEADERS},
+                          self.health.timeout_for(source.url), source.max_bytes, keep=True) as body:
+            with stage("parse"):
+                articles = None
+                if self.fast_parser:
+                    try:
+                        articles = self._new_articles(iter_feed_entries(body), source, set(seen))
+                    except FeedParseError as e:
+                        # Flux mal formé: feedparser récupère ce qui peut l'être (sans nouvelle requête)
+                        print(f"Flux mal formé, analyse par feedparser: {source.name} ({e})")
+                if articles is None:
+                    feed = feedparser.parse(body.received_data())
+                    if feed.get("bozo") and not feed.entries:
+                        raise ValueError(f"Flux illisible: {feed.get('bozo_exception', 'erreur inconnue')}")
+                    articles = self._new_articles(feed.entries, source, seen)
+        
+        self.health.record_success(source.url, time.time() - start_time)
+        if body.truncated:
+            print(f"Flux tronqué à {source.max_bytes} octets: {source.name}")
+        return articles
     
     def collect_from_feed(self, feed_info: Dict[str, str], use_cache: bool = True) -> List[Dict[str, Any]]:
         """
         Collecte les articles d'un flux RSS avec gestion du cache
         
         Args:
-            feed_info (Dict[str, str]): Informations sur le flux RSS
+            feed_info (Dict[str, str]): Informations sur le flux RSS (ou CompiledSource du registre)
             use_cache (bool): Utiliser le cache si disponible
             
         Returns:
             List[Dict[str, Any]]: Liste des articles collectés
         """
-        url = feed_info["url"]
-        cache_path = self._get_cache_path(url)
+        source = as_source("rss", feed_info)
+        url = source.url
+        cache_path = self._source_cache_path(source)
         
         # Récupération des IDs déjà collectés pour éviter les doublons
-        category = feed_info["category"]
+        category = source.category
         known_ids = self._get_known_ids(category)
         
         # Vérification du cache si activé
@@ -47,7 +190,13 @@ class RSSCollector(BaseCollector):
         if use_cache and self._is_cache_valid(cache_path):
             print(f"Utilisation du cache pour {feed_info['name']} ({url})")
             cached_data = self._read_cache(cache_path)
+        
+        # Circuit ouvert: le flux est en échec, on attend la prochaine fenêtre de sondage
+        if not self.health.allow_request(url):
+            print(f"Flux ignoré (circuit ouvert): {feed_info['name']} ({url})")
+            return cached_data if cached_data else []
             
+        start_time = time.time()
         try:
             print(f"Collecte du flux RSS: {feed_info['name']} ({url})")
             
@@ -55,60 +204,14 @@ class RSSCollector(BaseCollector):
             articles = []
             if cached_data:
                 articles = cached_data
-                
-            # Chargement du flux RSS
-            feed = feedparser.parse(url)
-            new_articles = []
             
-            for entry in feed.entries:
-                # Utilisation du lien comme identifiant unique
-                link = entry.get("link", "")
-                if link and link in known_ids:
-                    continue  # Article déjà collecté
-                
-                # Extraction du contenu sous différents formats possibles
-                content = ""
-                
-                # Méthode 1: Via la clé 'content'
-                if 'content' in entry:
-                    for content_item in entry.content:
-                        if 'value' in content_item:
-                            content += content_item.value + "\n\n"
-                
-                # Méthode 2: Via la clé 'description'
-                elif 'description' in entry:
-                    content += entry.description + "\n\n"
-                
-                # Méthode 3: Via la clé 'summary_detail'
-                elif 'summary_detail' in entry and 'value' in entry.summary_detail:
-                    content += entry.summary_detail.value + "\n\n"
-                
-                # Méthode 4: Via la clé 'summary'
-                elif 'summary' in entry:
-                    content += entry.summary + "\n\n"
-                
-                # Si aucun contenu trouvé, utiliser le résumé comme contenu
-                if not content.strip() and 'summary' in entry:
-                    content = entry.summary
-                
-                article = {
-                    "title": entry.get("title", ""),
-                    "link": link,
-                    "published": entry.get("published", ""),
-                    "summary": entry.get("summary", ""),
-                    "content": content,
-                    "source_name": feed_info["name"],
-                    "category": category,
-                    "collected_at": datetime.now().isoformat()
-                }
-                
-                # Ajouter seulement les nouveaux articles
-                if link not in [a.get("link", "") for a in articles]:
-                    new_articles.append(article)
+            # Liens déjà collectés ou déjà en cache: seuls les autres sont ajoutés
+            seen = known_ids | {a.get("link", "") for a in articles}
+            seen.discard("")
+            new_articles = self._parse_feed(source, seen, start_time)
             
             # Combinaison des anciens et nouveaux articles
             articles.extend(new_articles)
-            
             # Mise en cache des résultats
             if use_cache and new_articles:
                 self._write_cache(cache_path, articles)
@@ -117,6 +220,8 @@ class RSSCollector(BaseCollector):
             return articles
         except Exception as e:
             print(f"Erreur lors de la collecte du flux {feed_info['name']}: {e}")
+            self.health.record_failure(url, str(e), time.time() - start_time)
+            self._log_failure(feed_info, url, str(e))
             return cached_data if cached_data else []
     
     def collect_from_feeds(self, feeds: List[Dict[str, str]], use_cache: bool = True) -> Dict[str, List[Dict[str, Any]]]:
@@ -157,11 +262,14 @@ class RSSCollector(BaseCollector):
                 except Exception as e:
                     print(f"Exception lors de la collecte du flux {feed['name']}: {e}")
         
+        # Persistance de l'état de santé des sources pour les prochaines exécutions
+        self.health.save()
+        
         return result
 
 def collect_rss_feeds(feeds: List[Dict[str, str]], output_dir: str = "data/raw",
                     cache_dir: str = "data/cache", max_workers: int = 5,
-                    use_cache: bool = True) -> None:
+                    use_cache: bool = True, fast_parser: bool = True) -> None:
     """
     Fonction utilitaire pour collecter des données à partir de flux RSS
     
@@ -171,7 +279,8 @@ def collect_rss_feeds(feeds: List[Dict[str, str]], output_dir: str = "data/raw",
         cache_dir (str): Répertoire pour le cache
         max_workers (int): Nombre maximum de threads simultanés
         use_cache (bool): Utiliser le cache si disponible
+        fast_parser (bool): Analyse incrémentale lxml (False: feedparser pour tous les flux)
     """
-    collector = RSSCollector(output_dir, cache_dir, max_workers)
+    collector = RSSCollector(output_dir, cache_dir, max_workers, fast_parser=fast_parser)
     data = collector.collect_from_feeds(feeds, use_cache)
     collector.save_collected_data(data) 
\ No newline at end of file
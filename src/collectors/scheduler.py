@@ -0,0 +1,227 @@
+import time
+import heapq
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
+
+from .rss_collector import RSSCollector
+from .web_collector import WebCollector
+from .source_registry import CompiledSource, SourceRegistry
+
+
+class SourceScheduler:
+    """
+    Collecte continue des sources du registre, chacune à son intervalle
+
+    À chaque tour, le registre est rafraîchi (sources.json n'est relu que s'il a
+    changé): une source ajoutée ou modifiée est collectée au tour suivant, une
+    source supprimée sort du planning, et les sources inchangées gardent leur
+    prochaine échéance (pas de nouvelle collecte après une modification du fichier).
+
+    Les collectes sont soumises sans attendre les précédentes: une source lente
+    (crawl) ne retarde pas les échéances des autres. Une source en cours n'est
+    pas soumise une seconde fois; ses résultats sont sauvegardés au tour qui
+    suit la fin de sa collecte.
+    """
+
+    def __init__(self, registry: SourceRegistry, output_dir: str = "data/raw", cache_dir: str = "data/cache",
+                 max_workers: int = 5, use_cache: bool = True):
+        """
+        Initialise l'ordonnanceur
+
+        Args:
+            registry (SourceRegistry): Registre des sources
+            output_dir (str): Répertoire de sortie pour les données collectées
+            cache_dir (str): Répertoire pour le cache
+            max_workers (int): Nombre de sources collectées simultanément
+            use_cache (bool): Utiliser le cache de collecte
+        """
+        self.registry = registry
+        self.max_workers = max_workers
+        self.use_cache = use_cache
+        self.collectors = {
+            "rss": RSSCollector(output_dir, cache_dir, max_workers),
+            "web": WebCollector(output_dir, cache_dir, max_workers)
+        }
+        # Échéances: tas (date, clé, empreinte); seule l'entrée enregistrée dans
+        # _scheduled est valide, les autres (source modifiée, retirée) sont ignorées
+        self._due: List[Tuple[float, str, str]] = []
+        self._scheduled: Dict[str, Tuple[float, str]] = {}
+        # Collectes en cours, par clé de source
+        self._in_flight: Dict[str, Tuple[Future, CompiledSource]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Numéro des sauvegardes (plusieurs tours peuvent sauvegarder dans la même seconde)
+        self._saves = 0
+        self.stats = {"cycles": 0, "collections": 0, "items": 0, "failures": 0}
+
+    def _schedule(self, source: CompiledSource, at: float):
+        self._scheduled[source.key] = (at, source.fingerprint)
+        heapq.heappush(self._due, (at, source.key, source.fingerprint))
+
+    def sync(self, now: Optional[float] = None) -> Dict[str, int]:
+        """
+        Rafraîchit le registre et met à jour le planning
+
+        Args:
+            now (Optional[float]): Date courante (time.time() par défaut)
+
+        Returns:
+            Dict[str, int]: Nombre de sources ajoutées, supprimées et modifiées
+        """
+        now = time.time() if now is None else now
+        changes = self.registry.refresh()
+        for source in changes.removed:
+            self._scheduled.pop(source.key, None)
+            print(f"Source retirée du planning: {source.name} ({source.url})")
+        for source in changes.added + changes.changed:
+            self._schedule(source, now)
+            print(f"Source {'ajoutée' if source in changes.added else 'modifiée'}: {source.name} ({source.url})")
+        # Premier appel: les sources déjà chargées par un autre composant sont planifiées
+        for key, source in self.registry.sources.items():
+            if key not in self._scheduled:
+                self._schedule(source, now)
+        return {"added": len(changes.added), "removed": len(changes.removed), "changed": len(changes.changed)}
+
+    def due_sources(self, now: Optional[float] = None) -> List[CompiledSource]:
+        """
+        Retire du planning les sources arrivées à échéance
+
+        Args:
+            now (Optional[float]): Date courante (time.time() par défaut)
+
+        Returns:
+            List[CompiledSource]: Sources à collecter
+        """
+        now = time.time() if now is None else now
+        due = []
+        while self._due and self._due[0][0] <= now:
+            at, key, fingerprint = heapq.heappop(self._due)
+            source = self.registry.sources.get(key)
+            if source is None or self._scheduled.get(key) != (at, fingerprint):
+                continue
+            due.append(source)
+        return due
+
+    def _collect(self, source: CompiledSource) -> List[Dict[str, Any]]:
+        """Collecte une source avec le collecteur de son type"""
+        collector = self.collectors[source.kind]
+        if source.kind == "rss":
+            return collector.collect_from_feed(source, self.use_cache)
+        if source.crawl:
+            return collector.crawl_website(source)
+        item = collector.collect_from_website(source, self.use_cache)
+        return [item] if item else []
+
+    def _harvest(self, block: bool = False) -> int:
+        """
+        Sauvegarde les résultats des collectes terminées et replanifie leurs sources
+
+        Args:
+            block (bool): Attendre la fin de toutes les collectes en cours
+
+        Returns:
+            int: Nombre de collectes terminées
+        """
+        if block and self._in_flight:
+            wait([future for future, _ in self._in_flight.values()])
+        done = [key for key, (future, _) in self._in_flight.items() if future.done()]
+        if not done:
+            return 0
+
+        collected: Dict[str, Dict[str, List[Dict[str, Any]]]] = {"rss": {}, "web": {}}
+        for key in done:
+            future, source = self._in_flight.pop(key)
+            try:
+                items = future.result()
+                if items:
+                    collected[source.kind].setdefault(source.category, []).extend(items)
+                self.stats["items"] += len(items)
+            except Exception as e:
+                self.stats["failures"] += 1
+                print(f"Exception lors de la collecte de {source.name}: {e}")
+            self.stats["collections"] += 1
+            # Prochaine échéance; une source modifiée pendant sa collecte est reprise tout de suite
+            current = self.registry.sources.get(key)
+            if current is source:
+                self._schedule(source, time.time() + source.interval)
+            elif current is not None:
+                self._schedule(current, time.time())
+
+        self._saves += 1
+        for kind, data in collected.items():
+            collector = self.collectors[kind]
+            if data:
+                collector.save_collected_data(data, batch_id=f"t{self._saves}")
+            collector.health.save()
+        self.collectors["web"].extractor.memory.save()
+        return len(done)
+
+    def run_once(self, now: Optional[float] = None, block: bool = False) -> int:
+        """
+        Un tour: sauvegarde des collectes terminées, synchronisation et soumission
+        des sources à échéance (sans attendre leur collecte)
+
+        Args:
+            now (Optional[float]): Date courante (time.time() par défaut)
+            block (bool): Attendre la fin des collectes soumises et les sauvegarder
+
+        Returns:
+            int: Nombre de sources soumises
+        """
+        self._harvest()
+        self.sync(now)
+        due = self.due_sources(now)
+        self.stats["cycles"] += 1
+
+        submitted = 0
+        for source in due:
+            if source.key in self._in_flight:
+                # Modifiée pendant sa collecte: replanifiée à la fin de celle-ci
+                continue
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            self._in_flight[source.key] = (self._executor.submit(self._collect, source), source)
+            submitted += 1
+        if block:
+            self._harvest(block=True)
+        return submitted
+
+    def next_due_in(self, now: Optional[float] = None) -> Optional[float]:
+        """Délai avant la prochaine échéance, en secondes (None si le planning est vide)"""
+        now = time.time() if now is None else now
+        while self._due and self._scheduled.get(self._due[0][1]) != (self._due[0][0], self._due[0][2]):
+            heapq.heappop(self._due)
+        return max(0.0, self._due[0][0] - now) if self._due else None
+
+    def run(self, stop_event: Optional[threading.Event] = None, tick: float = 5.0,
+            max_cycles: Optional[int] = None) -> Dict[str, int]:
+        """
+        Boucle de collecte continue
+
+        Args:
+            stop_event (Optional[threading.Event]): Arrêt demandé
+            tick (float): Attente maximale entre deux tours (surveillance de sources.json)
+            max_cycles (Optional[int]): Nombre maximal de tours (illimité par défaut)
+
+        Returns:
+            Dict[str, int]: Statistiques de collecte
+        """
+        stop_event = stop_event or threading.Event()
+        try:
+            while not stop_event.is_set():
+                self.run_once()
+                if max_cycles is not None and self.stats["cycles"] >= max_cycles:
+                    break
+                delay = self.next_due_in()
+                stop_event.wait(tick if delay is None else min(tick, delay))
+        finally:
+            # Collectes en cours terminées et sauvegardées avant l'arrêt
+            self._harvest(block=True)
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+            frontier = self.collectors["web"]._frontier
+            if frontier is not None:
+                frontier.close()
+                self.collectors["web"]._frontier = None
+        return self.stats
@@ -0,0 +1,275 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+
+class SourceHealthStore:
+    """
+    Suivi de l'état de santé des sources et disjoncteur (circuit breaker)
+
+    Pour chaque source, le store conserve le nombre d'échecs consécutifs, les
+    dernières latences observées et la date du dernier succès. Au-delà d'un seuil
+    d'échecs consécutifs, le circuit s'ouvre: la source n'est plus interrogée qu'à
+    intervalles croissants (sondage lent) jusqu'à ce qu'elle réponde à nouveau.
+
+    L'état est persisté dans SQLite, une ligne par source: plusieurs collecteurs
+    (RSS, web, workers distribués) partagent le même fichier et chacun n'écrit
+    que les sources qu'il a interrogées.
+    """
+
+    def __init__(self, path: str, failure_threshold: int = 3, base_cooldown: int = 900,
+                 max_cooldown: int = 86400, latency_window: int = 50,
+                 default_timeout: Tuple[float, float] = (10.0, 30.0)):
+        """
+        Initialise le store de santé des sources
+
+        Args:
+            path (str): Base SQLite de persistance
+            failure_threshold (int): Échecs consécutifs avant ouverture du circuit
+            base_cooldown (int): Délai initial avant une nouvelle tentative, en secondes (15 min par défaut)
+            max_cooldown (int): Délai maximal entre deux tentatives, en secondes (24h par défaut)
+            latency_window (int): Nombre de latences conservées par source
+            default_timeout (Tuple[float, float]): Timeouts (connexion, lecture) par défaut
+        """
+        self.path = path
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.latency_window = latency_window
+        self.default_timeout = default_timeout
+        self._lock = threading.Lock()
+        # Sources modifiées depuis la dernière sauvegarde
+        self._dirty: Set[str] = set()
+        self._sources: Dict[str, Dict[str, Any]] = self._load()
+
+    def _connect(self) -> sqlite3.Connection:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS sources (key TEXT PRIMARY KEY, state TEXT NOT NULL)")
+        return conn
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Charge l'état persisté
+
+        Returns:
+            Dict[str, Dict[str, Any]]: État par source
+        """
+        try:
+            conn = self._connect()
+            try:
+                return {key: json.loads(state) for key, state in conn.execute("SELECT key, state FROM sources")}
+            finally:
+                conn.close()
+        except Exception as e:
+            print(f"Erreur lors de la lecture de l'état des sources: {e}")
+            return {}
+
+    def save(self):
+        """
+        Persiste l'état des sources modifiées
+
+        Chaque source est écrite dans sa propre ligne: les sources d'un autre
+        collecteur partageant le fichier ne sont pas écrasées.
+        """
+        with self._lock:
+            keys = list(self._dirty)
+            rows = [(key, json.dumps(self._sources[key], ensure_ascii=False)) for key in keys]
+            self._dirty.difference_update(keys)
+        if not rows:
+            return
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executemany("INSERT OR REPLACE INTO sources (key, state) VALUES (?, ?)", rows)
+            finally:
+                conn.close()
+        except Exception as e:
+            with self._lock:
+                self._dirty.update(keys)
+            print(f"Erreur lors de l'écriture de l'état des sources: {e}")
+
+    def _state(self, key: str) -> Dict[str, Any]:
+        """Retourne (et crée si besoin) l'état d'une source à modifier. Appelé sous verrou."""
+        self._dirty.add(key)
+        state = self._sources.get(key)
+        if state is None:
+            state = {
+                "consecutive_failures": 0,
+                "total_failures": 0,
+                "total_successes": 0,
+                "latencies": [],
+                "last_success": None,
+                "last_failure": None,
+                "last_error": None,
+                "next_attempt_at": None
+            }
+            self._sources[key] = state
+        return state
+
+    def is_circuit_open(self, key: str) -> bool:
+        """
+        Indique si le circuit d'une source est ouvert
+
+        Args:
+            key (str): Identifiant de la source (URL)
+
+        Returns:
+            bool: True si la source a dépassé le seuil d'échecs consécutifs
+        """
+        with self._lock:
+            state = self._sources.get(key)
+            return bool(state) and state["consecutive_failures"] >= self.failure_threshold
+
+    def allow_request(self, key: str) -> bool:
+        """
+        Indique si la source peut être interrogée maintenant
+
+        Une source dont le circuit est ouvert n'est autorisée qu'une fois le délai
+        de refroidissement écoulé (requête de sondage, état "semi-ouvert").
+
+        Args:
+            key (str): Identifiant de la source (URL)
+
+        Returns:
+            bool: True si la requête peut être effectuée
+        """
+        with self._lock:
+            state = self._sources.get(key)
+            if not state or state["consecutive_failures"] < self.failure_threshold:
+                return True
+            next_attempt_at = state.get("next_attempt_at")
+            return next_attempt_at is None or time.time() >= next_attempt_at
+
+    def timeout_for(self, key: str) -> Tuple[float, float]:
+        """
+        Calcule les timeouts (connexion, lecture) adaptés à une source
+
+        Le timeout de lecture est dérivé du 95e percentile des latences observées;
+        une source en échec est sondée avec des timeouts courts.
+
+        Args:
+            key (str): Identifiant de la source (URL)
+
+        Returns:
+            Tuple[float, float]: Timeouts de connexion et de lecture en secondes
+        """
+        connect_timeout, read_timeout = self.default_timeout
+        with self._lock:
+            state = self._sources.get(key)
+            if not state:
+                return connect_timeout, read_timeout
+            if state["consecutive_failures"] > 0:
+                return min(connect_timeout, 5.0), min(read_timeout, 10.0)
+            latencies = list(state["latencies"])
+
+        if len(latencies) >= 5:
+            p95 = self._percentile(sorted(latencies), 95)
+            read_timeout = min(read_timeout, max(5.0, p95 * 3))
+        return connect_timeout, read_timeout
+
+    def record_success(self, key: str, latency: float):
+        """
+        Enregistre une collecte réussie
+
+        Args:
+            key (str): Identifiant de la source (URL)
+            latency (float): Durée de la requête en secondes
+        """
+        with self._lock:
+            state = self._state(key)
+            state["consecutive_failures"] = 0
+            state["total_successes"] += 1
+            state["last_success"] = time.time()
+            state["next_attempt_at"] = None
+            self._push_latency(state, latency)
+
+    def record_failure(self, key: str, error: str, latency: Optional[float] = None):
+        """
+        Enregistre un échec de collecte et ouvre le circuit si nécessaire
+
+        Args:
+            key (str): Identifiant de la source (URL)
+            error (str): Description de l'erreur
+            latency (Optional[float]): Durée écoulée avant l'échec en secondes
+        """
+        with self._lock:
+            state = self._state(key)
+            state["consecutive_failures"] += 1
+            state["total_failures"] += 1
+            state["last_failure"] = time.time()
+            state["last_error"] = error
+            if latency is not None:
+                self._push_latency(state, latency)
+
+            # Backoff exponentiel au-delà du seuil: 15 min, 30 min, 1h, ... jusqu'à 24h
+            excess = state["consecutive_failures"] - self.failure_threshold
+            if excess >= 0:
+                cooldown = min(self.max_cooldown, self.base_cooldown * (2 ** min(excess, 16)))
+                state["next_attempt_at"] = time.time() + cooldown
+
+    def _push_latency(self, state: Dict[str, Any], latency: float):
+        """Ajoute une latence à la fenêtre glissante. Appelé sous verrou."""
+        state["latencies"].append(round(latency, 3))
+        if len(state["latencies"]) > self.latency_window:
+            del state["latencies"][:-self.latency_window]
+
+    @staticmethod
+    def _percentile(sorted_values: List[float], percentile: float) -> float:
+        """
+        Calcule un percentile par interpolation linéaire
+
+        Args:
+            sorted_values (List[float]): Valeurs triées (non vide)
+            percentile (float): Percentile recherché (0-100)
+
+        Returns:
+            float: Valeur du percentile
+        """
+        rank = (len(sorted_values) - 1) * percentile / 100
+        lower = int(rank)
+        upper = min(lower + 1, len(sorted_values) - 1)
+        return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+    def latency_percentiles(self, key: str) -> Dict[str, Optional[float]]:
+        """
+        Retourne les percentiles de latence d'une source
+
+        Args:
+            key (str): Identifiant de la source (URL)
+
+        Returns:
+            Dict[str, Optional[float]]: Percentiles p50, p95 et p99 (None si aucune mesure)
+        """
+        with self._lock:
+            state = self._sources.get(key)
+            latencies = sorted(state["latencies"]) if state else []
+        if not latencies:
+            return {"p50": None, "p95": None, "p99": None}
+        return {f"p{p}": round(self._percentile(latencies, p), 3) for p in (50, 95, 99)}
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Résumé de l'état de toutes les sources
+
+        Returns:
+            Dict[str, Dict[str, Any]]: État, percentiles de latence et circuit par source
+        """
+        with self._lock:
+            keys = list(self._sources.keys())
+        result = {}
+        for key in keys:
+            with self._lock:
+                state = dict(self._sources[key])
+            state.pop("latencies", None)
+            state["latency"] = self.latency_percentiles(key)
+            state["circuit_open"] = self.is_circuit_open(key)
+            result[key] = state
+        return result
@@ -0,0 +1,280 @@
+import re
+import json
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, NamedTuple, Optional, Pattern, Tuple
+from urllib.parse import urlsplit
+
+from .download import ACCEPT_ENCODING, DEFAULT_MAX_BYTES
+# Schéma et validation de sources.json (configuration, hors des collecteurs)
+from ..utils.source_config import (DEFAULT_INTERVAL, DEFAULT_SOURCES_PATH, SOURCE_SECTIONS,
+                                   SourceValidationError, file_signature, read_sources_file,
+                                   valid_sources, validate_source)
+
+# Configuration des entêtes pour simuler un navigateur
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "fr,fr-FR;q=0.8,en-US;q=0.5,en;q=0.3",
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Cache-Control": "max-age=0"
+}
+
+# Valeurs par défaut du mode crawl (clé "crawl" d'un site dans sources.json)
+DEFAULT_CRAWL_SETTINGS = {
+    "max_depth": 1,
+    "max_pages": 50,
+    "link_selector": None,
+    "allow_pattern": None,
+    "article_selector": None,
+    "same_host": True,
+    "delay": 1.0
+}
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledSource:
+    """
+    Source validée, avec les valeurs dérivées calculées une seule fois
+
+    Se lit aussi comme le dictionnaire d'origine (source["url"], source.get("crawl")),
+    ce qui permet de la passer aux collecteurs à la place d'une source brute.
+
+    Attributes:
+        kind (str): Type de collecteur ("rss" ou "web")
+        key (str): Identifiant de la source ("{type}:{url}")
+        name (str): Nom de la source
+        url (str): URL de la source
+        category (str): Catégorie
+        host (str): Hôte de l'URL, en minuscules
+        cache_key (str): Nom du fichier de cache de la source (sans extension)
+        fingerprint (str): Empreinte de la configuration (détection des modifications)
+        interval (float): Intervalle de collecte, en secondes
+        selector (Optional[str]): Sélecteur CSS du contenu (sites web)
+        fallback_selectors (Tuple[str, ...]): Sélecteurs de repli (sites web)
+        headers (Dict[str, str]): Entêtes HTTP (défauts complétés par la source)
+        crawl (Optional[Dict[str, Any]]): Paramètres du mode crawl complétés, ou None
+        allow_pattern (Optional[Pattern]): Filtre compilé des liens du mode crawl
+        max_bytes (int): Taille maximale d'une réponse téléchargée
+        stop_marker (Optional[bytes]): Marqueur de fin de la zone utile de la page (sites web)
+        info (Dict[str, Any]): Source telle que définie dans sources.json
+    """
+    kind: str
+    key: str
+    name: str
+    url: str
+    category: str
+    host: str
+    cache_key: str
+    fingerprint: str
+    interval: float
+    selector: Optional[str] = None
+    fallback_selectors: Tuple[str, ...] = ()
+    headers: Dict[str, str] = field(default_factory=lambda: DEFAULT_HEADERS)
+    crawl: Optional[Dict[str, Any]] = None
+    allow_pattern: Optional[Pattern] = None
+    max_bytes: int = DEFAULT_MAX_BYTES
+    stop_marker: Optional[bytes] = None
+    info: Dict[str, Any] = field(default_factory=dict)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Accès par clé au dictionnaire d'origine"""
+        return self.info.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.info[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.info
+
+
+def cache_key(url: str) -> str:
+    """
+    Nom du fichier de cache d'une URL (identique à BaseCollector._get_cache_path)
+
+    Args:
+        url (str): URL de la source
+
+    Returns:
+        str: Empreinte MD5 de l'URL
+    """
+    return hashlib.md5(url.encode()).hexdigest()
+
+
+def compile_source(kind: str, info: Dict[str, Any]) -> CompiledSource:
+    """
+    Valide une source et calcule ses valeurs dérivées
+
+    Args:
+        kind (str): Type de collecteur ("rss" ou "web")
+        info (Dict[str, Any]): Source lue dans sources.json
+
+    Returns:
+        CompiledSource: Source compilée
+
+    Raises:
+        SourceValidationError: Si la source ne respecte pas le schéma
+    """
+    errors = validate_source(kind, info)
+    if errors:
+        name = info.get("name") if isinstance(info, dict) else None
+        raise SourceValidationError(f"Source {kind} {name or '?'} invalide: {'; '.join(errors)}")
+
+    crawl = None
+    allow_pattern = None
+    if info.get("crawl"):
+        crawl = {**DEFAULT_CRAWL_SETTINGS, **info["crawl"]}
+        allow_pattern = re.compile(crawl["allow_pattern"]) if crawl["allow_pattern"] else None
+    headers = {**DEFAULT_HEADERS, **info["headers"]} if info.get("headers") else DEFAULT_HEADERS
+
+    return CompiledSource(
+        kind=kind,
+        key=f"{kind}:{info['url']}",
+        name=info["name"],
+        url=info["url"],
+        category=info["category"],
+        host=urlsplit(info["url"]).netloc.lower(),
+        cache_key=cache_key(info["url"]),
+        fingerprint=hashlib.blake2b(json.dumps(info, sort_keys=True, ensure_ascii=False).encode("utf-8"),
+                                    digest_size=8).hexdigest(),
+        interval=float(info.get("interval", DEFAULT_INTERVAL)),
+        selector=info.get("selector"),
+        fallback_selectors=tuple(info.get("fallback_selectors", ())),
+        headers=headers,
+        crawl=crawl,
+        allow_pattern=allow_pattern,
+        max_bytes=info.get("max_bytes", DEFAULT_MAX_BYTES),
+        stop_marker=info["stop_marker"].encode("utf-8") if info.get("stop_marker") else None,
+        info=info
+    )
+
+
+def as_source(kind: str, source: Any) -> CompiledSource:
+    """
+    Source compilée à partir d'une source compilée ou brute (appels directs des collecteurs)
+
+    Args:
+        kind (str): Type de collecteur ("rss" ou "web")
+        source (Any): CompiledSource ou dictionnaire
+
+    Returns:
+        CompiledSource: Source compilée
+    """
+    return source if isinstance(source, CompiledSource) else compile_source(kind, source)
+
+
+class SourceChanges(NamedTuple):
+    """Différences entre deux versions de sources.json"""
+    added: List[CompiledSource]
+    removed: List[CompiledSource]
+    changed: List[CompiledSource]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+class SourceRegistry:
+    """
+    Registre des sources compilées, rechargé quand sources.json change
+
+    Le fichier est lu, validé et compilé une fois; refresh() ne le relit que si sa
+    date de modification ou sa taille a changé, et retourne les sources ajoutées,
+    supprimées ou modifiées (par empreinte de configuration). Une source invalide
+    est écartée avec un message; un fichier illisible laisse le registre inchangé.
+    """
+
+    def __init__(self, path: str = DEFAULT_SOURCES_PATH):
+        """
+        Initialise le registre (chargé au premier refresh)
+
+        Args:
+            path (str): Chemin de sources.json
+        """
+        self.path = path
+        self.sources: Dict[str, CompiledSource] = {}
+        self.errors: List[str] = []
+        self._signature: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+
+    def refresh(self, force: bool = False) -> SourceChanges:
+        """
+        Recharge sources.json s'il a changé depuis le dernier chargement
+
+        Args:
+            force (bool): Relire le fichier même s'il semble inchangé
+
+        Returns:
+            SourceChanges: Sources ajoutées, supprimées et modifiées
+        """
+        with self._lock:
+            signature = file_signature(self.path)
+            if not force and signature is not None and signature == self._signature:
+                return SourceChanges([], [], [])
+            try:
+                data = read_sources_file(self.path)
+            except (OSError, ValueError) as e:
+                print(f"Erreur lors du chargement des sources: {e}")
+                return SourceChanges([], [], [])
+            self._signature = signature
+
+            entries, errors = valid_sources(data)
+            sources: Dict[str, CompiledSource] = {}
+            for kind, info in entries:
+                source = compile_source(kind, info)
+                sources[source.key] = source
+            for error in errors:
+                print(f"Source ignorée: {error}")
+
+            previous = self.sources
+            changes = SourceChanges(
+                added=[s for key, s in sources.items() if key not in previous],
+                removed=[s for key, s in previous.items() if key not in sources],
+                changed=[s for key, s in sources.items()
+                         if key in previous and previous[key].fingerprint != s.fingerprint]
+            )
+            self.sources = sources
+            self.errors = errors
+            return changes
+
+    def by_kind(self, kind: str) -> List[CompiledSource]:
+        """
+        Sources compilées d'un type, dans l'ordre de sources.json
+
+        Args:
+            kind (str): Type de collecteur ("rss" ou "web")
+
+        Returns:
+            List[CompiledSource]: Sources du type
+        """
+        return [source for source in self.sources.values() if source.kind == kind]
+
+    def as_dict(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Sources valides au format de sources.json (dictionnaires d'origine)
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Sources RSS et sites web
+        """
+        return {section: [source.info for source in self.by_kind(kind)]
+                for kind, section in SOURCE_SECTIONS.items()}
+
+
+# Registre partagé: sources.json n'est relu que s'il change
+_REGISTRY: Optional[SourceRegistry] = None
+
+
+def get_source_registry() -> SourceRegistry:
+    """
+    Registre des sources du processus, partagé par tous les appels
+
+    Returns:
+        SourceRegistry: Registre des sources compilées
+    """
+    global _REGISTRY
+    if _REGISTRY is None:
+        _REGISTRY = SourceRegistry(DEFAULT_SOURCES_PATH)
+    _REGISTRY.refresh()
+    return _REGISTRY
@@ -1,10 +1,17 @@
 import requests
 import json
 import os
+import time
+import threading
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from bs4 import BeautifulSoup
+from typing import Dict, Iterable, List, Any, Optional
+from urllib.parse import urlsplit
 from .base_collector import BaseCollector
+from .source_registry import DEFAULT_HEADERS, DEFAULT_CRAWL_SETTINGS, as_source
+from .download import DEFAULT_MAX_BYTES, fetch_bounded
+from .crawl_frontier import CrawlFrontier, HostPoliteness, RobotsCache, STATUS_DONE, STATUS_FAILED
+from .extraction import ContentExtractor, extract_links
+from .page_history import PageChange, PageHistory
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 class WebCollector(BaseCollector):
@@ -13,7 +20,7 @@ class WebCollector(BaseCollector):
     """
     
     def __init__(self, output_dir: str = "data/raw", cache_dir: str = "data/cache",
-                 max_workers: int = 5, cache_expiry: int = 3600):
+                 max_workers: int = 5, cache_expiry: int = 3600, track_changes: bool = True):
         """
         Initialise le collecteur web
         
@@ -22,74 +29,80 @@ class WebCollector(BaseCollector):
             cache_dir (str): Répertoire pour le cache
             max_workers (int): Nombre maximum de threads simultanés
             cache_expiry (int): Durée de validité du cache en secondes (1h par défaut)
+            track_changes (bool): N'enregistrer que les éléments nouveaux des pages surveillées
         """
         super().__init__(output_dir, cache_dir, max_workers, cache_expiry)
         
+        # Règles d'extraction compilées et stratégies apprises par domaine
+        self.extractor = ContentExtractor(os.path.join(self.cache_dir, "extraction_strategies.json"))
+        
+        # Mode crawl: frontière persistante, politesse par hôte et robots.txt
+        self.frontier_path = os.path.join(self.cache_dir, "crawl_frontier.sqlite")
+        self._frontier: Optional[CrawlFrontier] = None
+        self._frontier_lock = threading.Lock()
+        self.politeness = HostPoliteness()
+        self.robots = RobotsCache()
+        
+        # Versions des pages surveillées (empreintes du contenu et des blocs)
+        self.page_history = (PageHistory(os.path.join(self.cache_dir, "page_history.sqlite"))
+                             if track_changes else None)
+        # Versions détectées en attente d'enregistrement, par URL (cf. commit_page_changes)
+        self._pending_changes: Dict[str, PageChange] = {}
+        self._pending_lock = threading.Lock()
+        
     def collect_from_website(self, website_info: Dict[str, str], use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Collecte les informations d'un site web avec gestion du cache
         
         Args:
-            website_info (Dict[str, str]): Informations sur le site web
+            website_info (Dict[str, str]): Informations sur le site web (ou CompiledSource du registre)
             use_cache (bool): Utiliser le cache si disponible
             
         Returns:
-            Optional[Dict[str, Any]]: Informations collectées ou None en cas d'erreur
+            Optional[Dict[str, Any]]: Informations collectées, ou None en cas d'erreur ou si
+                la page n'a pas d'élément nouveau (suivi des modifications actif)
         """
-        url = website_info["url"]
-        cache_path = self._get_cache_path(url)
+        source = as_source("web", website_info)
+        url = source.url
+        cache_path = self._source_cache_path(source)
         
         # Vérification du cache si activé
         if use_cache and self._is_cache_valid(cache_path):
             print(f"Utilisation du cache pour {website_info['name']} ({url})")
             cached_data = self._read_cache(cache_path)
             if cached_data:
-                return cached_data
+                # Suivi des modifications: le contenu en cache a déjà été enregistré
+                return None if self.page_history is not None else cached_data
         
+        # Circuit ouvert: la source est en échec, on attend la prochaine fenêtre de sondage
+        if not self.health.allow_request(url):
+            print(f"Source ignorée (circuit ouvert): {website_info['name']} ({url})")
+            return None
+        
+        start_time = time.time()
         try:
             print(f"Collecte du site web: {website_info['name']} ({url})")
             
-            # Configuration des entêtes pour simuler un navigateur
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "fr,fr-FR;q=0.8,en-US;q=0.5,en;q=0.3",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-                "Cache-Control": "max-age=0"
-            }
-            
-            # Requête HTTP avec un timeout plus long et gestion des erreurs
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
+            # Requête HTTP avec des timeouts adaptés à l'historique de la source
+            # Téléchargement borné, arrêté au marqueur de fin de la zone utile s'il est configuré
+            download = fetch_bounded(url, source.headers, self.health.timeout_for(url),
+                                     source.max_bytes, source.stop_marker)
+            self.health.record_success(url, time.time() - start_time)
+            if download.truncated:
+                print(f"Page tronquée à {source.max_bytes} octets: {website_info['name']} ({url})")
             
-            # Parsing du HTML
-            soup = BeautifulSoup(response.text, "html.parser")
+            # Extraction du titre et du contenu via les règles compilées de la source
+            selector = source.selector
+            extraction = self.extractor.extract(
+                download.text, url, selector, list(source.fallback_selectors)
+            )
+            title = extraction.title
+            content = extraction.content
             
-            # Extraction du titre
-            title = soup.title.get_text() if soup.title else ""
-            
-            # Extraction du contenu en fonction du sélecteur CSS
-            content = ""
-            if "selector" in website_info and website_info["selector"]:
-                print(f"Utilisation du sélecteur: {website_info['selector']}")
-                elements = soup.select(website_info["selector"])
-                
-                if elements:
-                    for element in elements:
-                        # Extraction du texte avec préservation des espaces
-                        extracted_text = element.get_text(separator="\n", strip=True)
-                        if extracted_text:
-                            content += extracted_text + "\n\n"
-                    print(f"Contenu extrait avec le sélecteur ({len(content)} caractères)")
-                else:
-                    print(f"Aucun élément trouvé avec le sélecteur: {website_info['selector']}")
-                    # Fallback: utiliser le corps de la page
-                    content = self._extract_main_content(soup)
-            else:
-                # Si aucun sélecteur n'est spécifié, on extrait le contenu principal
-                content = self._extract_main_content(soup)
+            if extraction.strategy.startswith("selector:"):
+                print(f"Contenu extrait avec le sélecteur {extraction.strategy[len('selector:'):]} ({len(content)} caractères)")
+            elif selector:
+                print(f"Sélecteur {selector} non utilisé, stratégie d'extraction: {extraction.strategy}")
             
             # Création de l'objet de résultat
             result = {
@@ -101,6 +114,34 @@ class WebCollector(BaseCollector):
                 "collected_at": datetime.now().isoformat()
             }
             
+            # Suivi des modifications: seuls les blocs jamais vus sur la page sont enregistrés
+            if self.page_history is not None:
+                blocks = [block for block in extraction.blocks if block.strip()] or ([content] if content else [])
+                change = self.page_history.diff(url, blocks)
+                if not change.new_blocks:
+                    # Aucun élément à sauvegarder: la version (blocs retirés) est enregistrée tout de suite
+                    self.page_history.commit(url, change)
+                    state = "inchangée" if not change.changed else "modifiée sans nouvel élément"
+                    print(f"Page {state}: {website_info['name']} (version {change.version})")
+                    if use_cache:
+                        self._write_cache(cache_path, {"url": url, "page_version": change.version,
+                                                       "page_fingerprint": change.fingerprint})
+                    return None
+                print(f"Page modifiée: {website_info['name']} (version {change.version}, "
+                      f"{len(change.new_blocks)} éléments nouveaux, {change.removed_blocks} retirés)")
+                result.update({
+                    # Identifiant propre à la version (dédoublonnage, archive, index)
+                    "link": f"{url}#version-{change.version}",
+                    "content": "".join(block + "\n\n" for block in change.new_blocks),
+                    "page_version": change.version,
+                    "page_fingerprint": change.fingerprint,
+                    "new_items": len(change.new_blocks),
+                    "removed_items": change.removed_blocks
+                })
+                # Version enregistrée une fois l'élément sauvegardé (cf. commit_page_changes)
+                with self._pending_lock:
+                    self._pending_changes[url] = change
+            
             # Mise en cache des résultats
             if use_cache:
                 self._write_cache(cache_path, result)
@@ -108,51 +149,186 @@ class WebCollector(BaseCollector):
             return result
         except Exception as e:
             print(f"Erreur lors de la collecte du site {website_info['name']}: {e}")
-            return {
-                "url": url,
-                "title": "",
-                "content": "",
-                "source_name": website_info["name"],
-                "category": website_info["category"],
-                "collected_at": datetime.now().isoformat(),
-                "error": str(e)
-            }
+            # L'échec est journalisé à part et ne produit pas d'enregistrement de contenu
+            self.health.record_failure(url, str(e), time.time() - start_time)
+            self._log_failure(website_info, url, str(e))
+            return None
+    
+    def commit_page_changes(self, items: Iterable[Dict[str, Any]]) -> int:
+        """
+        Enregistre dans l'historique les versions des pages dont l'élément a été sauvegardé
+
+        Appelé après l'écriture des éléments (save_collected_data, sorties du pipeline
+        en flux): une page dont l'élément est perdu reste à sa version précédente et
+        ses blocs nouveaux seront de nouveau détectés.
+
+        Args:
+            items (Iterable[Dict[str, Any]]): Éléments sauvegardés
+
+        Returns:
+            int: Nombre de versions enregistrées
+        """
+        if self.page_history is None:
+            return 0
+        committed = 0
+        for item in items:
+            if item.get("page_version") is None:
+                continue
+            with self._pending_lock:
+                change = self._pending_changes.get(item["url"])
+                if change is None or change.version != item["page_version"]:
+                    continue
+                del self._pending_changes[item["url"]]
+            committed += self.page_history.commit(item["url"], change)
+        return committed
+    
+    def save_collected_data(self, data: Dict[str, List[Dict[str, Any]]], batch_id: Optional[str] = None):
+        """
+        Sauvegarde les données collectées, puis enregistre les versions des pages sauvegardées
+        
+        Args:
+            data (Dict[str, List[Dict[str, Any]]]): Données collectées par catégorie
+            batch_id (Optional[str]): Identifiant ajouté au nom des fichiers
+        """
+        super().save_collected_data(data, batch_id)
+        self.commit_page_changes(item for items in data.values() for item in items)
+    
+    @property
+    def frontier(self) -> CrawlFrontier:
+        """Frontière de crawl, ouverte à la première utilisation (une seule fois entre threads)"""
+        frontier = self._frontier
+        if frontier is None:
+            with self._frontier_lock:
+                if self._frontier is None:
+                    self._frontier = CrawlFrontier(self.frontier_path)
+                frontier = self._frontier
+        return frontier
     
-    def _extract_main_content(self, soup: BeautifulSoup) -> str:
+    def _fetch_page(self, session: requests.Session, url: str, delay: float,
+                    headers: Optional[Dict[str, str]] = None, max_bytes: int = DEFAULT_MAX_BYTES,
+                    stop_marker: Optional[bytes] = None) -> Optional[str]:
         """
-        Tente d'extraire le contenu principal d'une page web
+        Récupère une page en respectant robots.txt et la politesse par hôte
         
         Args:
-            soup (BeautifulSoup): Objet BeautifulSoup
+            session (requests.Session): Session HTTP (connexions réutilisées)
+            url (str): URL à récupérer
+            delay (float): Délai minimal entre deux requêtes vers l'hôte
+            headers (Optional[Dict[str, str]]): Entêtes HTTP de la source
+            max_bytes (int): Taille maximale de la page
+            stop_marker (Optional[bytes]): Marqueur de fin de la zone utile
             
         Returns:
-            str: Contenu principal extrait
+            Optional[str]: Code HTML, ou None si la page est interdite ou en erreur
         """
-        content = ""
+        # robots.txt est interprété pour l'agent effectivement envoyé
+        headers = headers or DEFAULT_HEADERS
+        user_agent = headers.get("User-Agent")
+        if not self.robots.can_fetch(url, user_agent):
+            print(f"Récupération interdite par robots.txt: {url}")
+            return None
         
-        # Stratégie 1: Rechercher les balises d'article
-        main_elements = soup.find_all(["article", "main", "div", "section"], 
-                                      class_=lambda c: c and any(x in str(c).lower() for x in ["content", "main", "article", "text"]))
+        crawl_delay = self.robots.crawl_delay(url, user_agent)
+        self.politeness.wait(url, max(delay, crawl_delay or 0.0))
         
-        if main_elements:
-            for element in main_elements:
-                # Éliminer les éléments non pertinents
-                for tag in element.find_all(["script", "style", "nav", "header", "footer", "aside"]):
-                    tag.decompose()
-                    
-                content += element.get_text(separator="\n", strip=True) + "\n\n"
+        download = fetch_bounded(url, headers, self.health.timeout_for(url),
+                                 max_bytes, stop_marker, session=session)
+        if download.truncated:
+            print(f"Page tronquée à {max_bytes} octets: {url}")
+        return download.text
+    
+    def crawl_website(self, website_info: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Crawl borné d'un site: page de liste puis articles liés
+        
+        La page de liste est récupérée à chaque exécution; les liens d'articles
+        découverts alimentent la frontière persistante, et seules les pages jamais
+        récupérées sont visitées, dans la limite de `max_pages` par exécution.
+        
+        Args:
+            website_info (Dict[str, Any]): Informations sur le site web (avec une clé "crawl"),
+                ou CompiledSource du registre
             
-            return content
+        Returns:
+            List[Dict[str, Any]]: Articles collectés
+        """
+        # Paramètres complétés, filtre compilé et hôte calculés une fois par source
+        source = as_source("web", website_info)
+        url = source.url
+        settings = source.crawl or DEFAULT_CRAWL_SETTINGS
+        allow_pattern = source.allow_pattern
+        listing_host = source.host
+        headers = source.headers
+        
+        def admissible(link: str) -> bool:
+            if settings["same_host"] and urlsplit(link).netloc.lower() != listing_host:
+                return False
+            return not allow_pattern or bool(allow_pattern.search(link))
         
-        # Stratégie 2: Prendre le corps en entier si rien d'autre ne fonctionne
-        if not content and soup.body:
-            # Éliminer les éléments non pertinents
-            for tag in soup.body.find_all(["script", "style", "nav", "header", "footer", "aside"]):
-                tag.decompose()
-                
-            content = soup.body.get_text(separator="\n", strip=True)
+        if not self.health.allow_request(url):
+            print(f"Source ignorée (circuit ouvert): {website_info['name']} ({url})")
+            return []
+        
+        articles = []
+        with requests.Session() as session:
+            # Page de liste: point d'entrée, relu à chaque exécution
+            start_time = time.time()
+            try:
+                print(f"Crawl du site web: {website_info['name']} ({url})")
+                html = self._fetch_page(session, url, settings["delay"], headers,
+                                        source.max_bytes, source.stop_marker)
+                self.health.record_success(url, time.time() - start_time)
+            except Exception as e:
+                print(f"Erreur lors du crawl du site {website_info['name']}: {e}")
+                self.health.record_failure(url, str(e), time.time() - start_time)
+                self._log_failure(website_info, url, str(e))
+                return []
+            if html is None:
+                return []
+            
+            links = [link for link in extract_links(html, url, settings["link_selector"]) if admissible(link)]
+            added = self.frontier.add(url, links, depth=1)
+            print(f"Liens découverts: {len(links)} ({added} nouveaux)")
+            
+            # Parcours en largeur de la frontière, borné en profondeur et en nombre de pages
+            fetched = 0
+            while fetched < settings["max_pages"]:
+                batch = self.frontier.next_batch(url, settings["max_pages"] - fetched, settings["max_depth"])
+                if not batch:
+                    break
+                for page_url, depth in batch:
+                    fetched += 1
+                    try:
+                        page_html = self._fetch_page(session, page_url, settings["delay"], headers,
+                                                     source.max_bytes)
+                    except Exception as e:
+                        print(f"Erreur lors de la récupération de {page_url}: {e}")
+                        self.frontier.mark(page_url, STATUS_FAILED)
+                        continue
+                    self.frontier.mark(page_url, STATUS_DONE)
+                    if page_html is None:
+                        continue
+                    
+                    extraction = self.extractor.extract(page_html, page_url, settings["article_selector"])
+                    articles.append({
+                        "url": page_url,
+                        "title": extraction.title,
+                        "content": extraction.content,
+                        "source_name": website_info["name"],
+                        "category": website_info["category"],
+                        "listing_url": url,
+                        "crawl_depth": depth,
+                        "collected_at": datetime.now().isoformat()
+                    })
+                    
+                    if depth < settings["max_depth"]:
+                        sub_links = [link for link in extract_links(page_html, page_url, settings["link_selector"]) if admissible(link)]
+                        self.frontier.add(url, sub_links, depth=depth + 1)
         
-        return content
+        stats = self.frontier.stats(url)
+        print(f"Crawl terminé pour {website_info['name']}: {len(articles)} articles, "
+              f"{stats.get('pending', 0)} URLs en attente")
+        return articles
     
     def collect_from_websites(self, websites: List[Dict[str, str]], use_cache: bool = True) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -175,8 +351,12 @@ class WebCollector(BaseCollector):
         # Exécution des tâches en parallèle
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             # Soumission des tâches
-            future_to_website = {executor.submit(self.collect_from_website, website, use_cache): website 
-                                for website, use_cache in tasks}
+            # Les sites configurés en mode crawl suivent les liens de leur page de liste
+            future_to_website = {
+                (executor.submit(self.crawl_website, website) if website.get("crawl")
+                 else executor.submit(self.collect_from_website, website, use_cache)): website
+                for website, use_cache in tasks
+            }
             
             # Traitement des résultats
             for future in as_completed(future_to_website):
@@ -187,10 +367,20 @@ class WebCollector(BaseCollector):
                         category = website["category"]
                         if category not in result:
                             result[category] = []
-                        result[category].append(website_data)
+                        if isinstance(website_data, list):
+                            result[category].extend(website_data)
+                        else:
+                            result[category].append(website_data)
                 except Exception as e:
                     print(f"Exception lors de la collecte du site {website['name']}: {e}")
         
+        # Persistance de l'état de santé des sources et des stratégies apprises
+        self.health.save()
+        self.extractor.memory.save()
+        if self._frontier is not None:
+            self._frontier.close()
+            self._frontier = None
+        
         return result
 
 def collect_websites(websites: List[Dict[str, str]], output_dir: str = "data/raw", 
@@ -0,0 +1 @@
+# Initialisation du package pipeline 
\ No newline at end of file
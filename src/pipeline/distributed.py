@@ -0,0 +1,469 @@
+import os
+import json
+import time
+import bisect
+import socket
+import hashlib
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+STATUS_PENDING = "pending"
+STATUS_LEASED = "leased"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+def _hash(value: str) -> int:
+    """Hachage stable (indépendant du processus, contrairement à hash())"""
+    return int.from_bytes(hashlib.md5(value.encode("utf-8")).digest()[:8], "big")
+
+
+def source_host(source: Dict[str, Any]) -> str:
+    """
+    Hôte d'une source, clé de partitionnement
+
+    Args:
+        source (Dict[str, Any]): Informations sur la source
+
+    Returns:
+        str: Nom d'hôte en minuscules
+    """
+    return urlsplit(source["url"]).netloc.lower()
+
+
+class ConsistentHashRing:
+    """
+    Anneau de hachage cohérent avec nœuds virtuels
+
+    Toutes les sources d'un même hôte sont attribuées au même shard, ce qui garde
+    la politesse par hôte locale à un seul worker. L'ajout ou le retrait d'un shard
+    ne déplace qu'une fraction des hôtes.
+    """
+
+    def __init__(self, shards: List[int], replicas: int = 64):
+        """
+        Construit l'anneau
+
+        Args:
+            shards (List[int]): Identifiants des shards
+            replicas (int): Nombre de nœuds virtuels par shard
+        """
+        self._ring: List[Tuple[int, int]] = sorted(
+            (_hash(f"shard-{shard}#{replica}"), shard)
+            for shard in shards for replica in range(replicas)
+        )
+        self._keys = [key for key, _ in self._ring]
+
+    def shard_for(self, key: str) -> int:
+        """
+        Shard responsable d'une clé
+
+        Args:
+            key (str): Clé (hôte)
+
+        Returns:
+            int: Identifiant du shard
+        """
+        index = bisect.bisect(self._keys, _hash(key)) % len(self._ring)
+        return self._ring[index][1]
+
+
+class WorkCoordinator:
+    """
+    Coordinateur de collecte distribuée à base de baux (leases) dans SQLite
+
+    Chaque source est une tâche attribuée à un shard. Un worker ne réclame que les
+    tâches de son shard, sauf celles d'un worker disparu (bail expiré, ou shard dont
+    le worker a cessé d'envoyer des signaux de vie), qui peuvent être reprises par
+    n'importe quel worker. Tâches et workers sont rattachés à une exécution: un
+    worker d'une exécution précédente ne réclame pas les tâches de la suivante.
+    """
+
+    def __init__(self, db_path: str, lease_seconds: float = 300.0, max_attempts: int = 3):
+        """
+        Ouvre (ou crée) la base du coordinateur
+
+        Args:
+            db_path (str): Chemin de la base SQLite (partagée par les workers)
+            lease_seconds (float): Durée d'un bail avant qu'une tâche puisse être reprise
+            max_attempts (int): Tentatives avant abandon d'une source
+        """
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # isolation_level=None: transactions gérées explicitement (BEGIN IMMEDIATE)
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                source_key TEXT PRIMARY KEY,
+                run_id TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                host TEXT NOT NULL,
+                shard INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                worker TEXT,
+                lease_expires REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                items INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_tasks_claim ON tasks (run_id, status, shard);
+            CREATE TABLE IF NOT EXISTS workers (
+                run_id TEXT NOT NULL,
+                worker TEXT NOT NULL,
+                shard INTEGER NOT NULL,
+                last_seen REAL NOT NULL,
+                PRIMARY KEY (run_id, worker)
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        """)
+        # Exécution à laquelle ce coordinateur est rattaché (la plus récente à l'ouverture)
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'run_id'").fetchone()
+        self.run_id: Optional[str] = row[0] if row else None
+
+    def init_run(self, sources: List[Tuple[str, Dict[str, Any]]], num_shards: int) -> Dict[int, int]:
+        """
+        Initialise une exécution: répartit les sources entre les shards
+
+        Les tâches et signaux de vie des exécutions précédentes sont effacés; un
+        worker encore actif d'une exécution précédente reste rattaché à celle-ci et
+        ne réclame pas les nouvelles tâches.
+
+        Args:
+            sources (List[Tuple[str, Dict[str, Any]]]): Couples (type, source)
+            num_shards (int): Nombre de workers
+
+        Returns:
+            Dict[int, int]: Nombre de sources par shard
+        """
+        ring = ConsistentHashRing(list(range(num_shards)))
+        now = time.time()
+        run_id = f"{now:.6f}-{os.getpid()}"
+        rows = []
+        distribution: Dict[int, int] = {shard: 0 for shard in range(num_shards)}
+        for kind, source in sources:
+            host = source_host(source)
+            shard = ring.shard_for(host)
+            distribution[shard] += 1
+            rows.append((f"{kind}:{source['url']}", run_id, kind, json.dumps(source, ensure_ascii=False),
+                         host, shard, STATUS_PENDING, now))
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute("DELETE FROM tasks WHERE run_id != ?", (run_id,))
+            self.conn.execute("DELETE FROM workers WHERE run_id != ?", (run_id,))
+            self.conn.executemany(
+                "INSERT INTO tasks (source_key, run_id, kind, payload, host, shard, status, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('num_shards', ?)", (str(num_shards),))
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('run_id', ?)", (run_id,))
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.run_id = run_id
+        return distribution
+
+    def num_shards(self) -> Optional[int]:
+        """
+        Nombre de shards de l'exécution en cours
+
+        Returns:
+            Optional[int]: Nombre de shards, None si aucune exécution n'a été initialisée
+        """
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'num_shards'").fetchone()
+        return int(row[0]) if row else None
+
+    def heartbeat(self, worker: str, shard: int):
+        """
+        Signale qu'un worker est vivant
+
+        Args:
+            worker (str): Identifiant du worker
+            shard (int): Shard du worker
+        """
+        self.conn.execute(
+            "INSERT OR REPLACE INTO workers (run_id, worker, shard, last_seen) VALUES (?, ?, ?, ?)",
+            (self.run_id, worker, shard, time.time()))
+
+    def renew(self, source_key: str, worker: str) -> bool:
+        """
+        Prolonge le bail d'une tâche en cours (tâches longues)
+
+        Args:
+            source_key (str): Clé de la tâche
+            worker (str): Worker détenteur du bail
+
+        Returns:
+            bool: False si le bail a été perdu (expiré puis repris par un autre worker)
+        """
+        cursor = self.conn.execute(
+            "UPDATE tasks SET lease_expires = ? WHERE run_id = ? AND source_key = ? AND worker = ? AND status = ?",
+            (time.time() + self.lease_seconds, self.run_id, source_key, worker, STATUS_LEASED))
+        return cursor.rowcount > 0
+
+    def claim(self, worker: str, shard: int) -> Optional[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Réclame atomiquement la prochaine tâche disponible
+
+        Ordre de priorité: tâches en attente du shard du worker, puis tâches dont
+        le bail a expiré, puis tâches en attente d'un shard dont le worker s'est
+        signalé puis s'est tu. Un shard dont le worker n'a pas encore démarré
+        n'est pas repris: ses hôtes restent sur leur shard.
+
+        Args:
+            worker (str): Identifiant du worker
+            shard (int): Shard du worker
+
+        Returns:
+            Optional[Tuple[str, str, Dict[str, Any]]]: (clé, type, source) ou None
+        """
+        now = time.time()
+        stale_before = now - self.lease_seconds
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.conn.execute(
+                "SELECT source_key, kind, payload FROM tasks WHERE run_id = ? AND status = ? AND shard = ? LIMIT 1",
+                (self.run_id, STATUS_PENDING, shard)).fetchone()
+            if row is None:
+                row = self.conn.execute(
+                    "SELECT source_key, kind, payload FROM tasks "
+                    "WHERE run_id = ? AND status = ? AND lease_expires < ? LIMIT 1",
+                    (self.run_id, STATUS_LEASED, now)).fetchone()
+            if row is None:
+                row = self.conn.execute(
+                    "SELECT source_key, kind, payload FROM tasks t WHERE t.run_id = ? AND t.status = ? "
+                    "AND t.shard IN (SELECT shard FROM workers WHERE run_id = ? "
+                    "GROUP BY shard HAVING MAX(last_seen) < ?) LIMIT 1",
+                    (self.run_id, STATUS_PENDING, self.run_id, stale_before)).fetchone()
+            if row is None:
+                self.conn.execute("COMMIT")
+                return None
+
+            self.conn.execute(
+                "UPDATE tasks SET status = ?, worker = ?, lease_expires = ?, attempts = attempts + 1, "
+                "updated_at = ? WHERE run_id = ? AND source_key = ?",
+                (STATUS_LEASED, worker, now + self.lease_seconds, now, self.run_id, row[0]))
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return row[0], row[1], json.loads(row[2])
+
+    def complete(self, source_key: str, worker: str, items: int) -> bool:
+        """
+        Marque une tâche comme terminée
+
+        Args:
+            source_key (str): Clé de la tâche
+            worker (str): Worker détenteur du bail
+            items (int): Nombre d'éléments collectés
+
+        Returns:
+            bool: False si le worker ne détenait plus le bail (rien n'est modifié)
+        """
+        cursor = self.conn.execute(
+            "UPDATE tasks SET status = ?, items = ?, error = NULL, updated_at = ? "
+            "WHERE run_id = ? AND source_key = ? AND worker = ? AND status = ?",
+            (STATUS_DONE, items, time.time(), self.run_id, source_key, worker, STATUS_LEASED))
+        return cursor.rowcount > 0
+
+    def fail(self, source_key: str, worker: str, error: str):
+        """
+        Enregistre l'échec d'une tâche (remise en attente ou abandon)
+
+        Args:
+            source_key (str): Clé de la tâche
+            worker (str): Worker détenteur du bail
+            error (str): Description de l'erreur
+        """
+        self.conn.execute(
+            "UPDATE tasks SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+            "error = ?, lease_expires = NULL, updated_at = ? "
+            "WHERE run_id = ? AND source_key = ? AND worker = ? AND status = ?",
+            (self.max_attempts, STATUS_FAILED, STATUS_PENDING, error, time.time(), self.run_id, source_key, worker,
+             STATUS_LEASED))
+
+    def unfinished(self) -> int:
+        """
+        Nombre de tâches ni terminées ni abandonnées
+
+        Returns:
+            int: Tâches en attente ou en cours
+        """
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM tasks WHERE run_id = ? AND status IN (?, ?)",
+            (self.run_id, STATUS_PENDING, STATUS_LEASED)).fetchone()[0]
+
+    def progress(self) -> Dict[str, int]:
+        """
+        Nombre de tâches par statut
+
+        Returns:
+            Dict[str, int]: Compteurs par statut
+        """
+        return dict(self.conn.execute(
+            "SELECT status, COUNT(*) FROM tasks WHERE run_id = ? GROUP BY status", (self.run_id,)))
+
+    def close(self):
+        """Ferme la connexion"""
+        self.conn.close()
+
+
+class LeaseKeeper:
+    """
+    Prolonge le bail d'une tâche et le signal de vie du worker pendant son exécution
+
+    Une collecte plus longue que le bail (crawl) serait sinon reprise par un autre
+    worker alors qu'elle est toujours en cours. Le thread utilise sa propre
+    connexion SQLite (une connexion ne se partage pas entre threads).
+
+    Exemple:
+        with LeaseKeeper(path, run_id, source_key, worker, shard, lease_seconds):
+            collecter(source)
+    """
+
+    def __init__(self, db_path: str, run_id: Optional[str], source_key: str, worker: str, shard: int,
+                 lease_seconds: float):
+        """
+        Args:
+            db_path (str): Base SQLite du coordinateur
+            run_id (Optional[str]): Exécution de la tâche
+            source_key (str): Clé de la tâche
+            worker (str): Worker détenteur du bail
+            shard (int): Shard du worker
+            lease_seconds (float): Durée du bail (renouvelé au tiers de sa durée)
+        """
+        self.db_path = db_path
+        self.run_id = run_id
+        self.source_key = source_key
+        self.worker = worker
+        self.shard = shard
+        self.lease_seconds = lease_seconds
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="lease-keeper", daemon=True)
+
+    def _run(self):
+        coordinator = WorkCoordinator(self.db_path, lease_seconds=self.lease_seconds)
+        coordinator.run_id = self.run_id
+        try:
+            while not self._stop.wait(self.lease_seconds / 3):
+                try:
+                    coordinator.heartbeat(self.worker, self.shard)
+                    if not coordinator.renew(self.source_key, self.worker):
+                        self.lost = True
+                        return
+                except sqlite3.Error as e:
+                    print(f"Erreur lors du renouvellement du bail de {self.source_key}: {e}")
+        finally:
+            coordinator.close()
+
+    def __enter__(self) -> "LeaseKeeper":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def run_worker(coordinator_path: str, shard: int, raw_dir: str = "data/raw",
+               cache_dir: str = "data/cache", use_cache: bool = True,
+               worker_id: Optional[str] = None, poll_interval: float = 1.0,
+               lease_seconds: float = 300.0) -> Dict[str, int]:
+    """
+    Boucle d'un worker: réclame les sources de son shard et les collecte
+
+    Les données sont écrites dans le répertoire brut partagé, au format habituel
+    des collecteurs, de sorte que l'index de dédoublonnage (`_get_known_ids`)
+    et le traitement restent communs à tous les workers. Le cache (santé des
+    sources, frontière de crawl, stratégies d'extraction) est propre au shard:
+    comme un hôte reste sur le même shard, son état reste stable entre exécutions.
+
+    Args:
+        coordinator_path (str): Base SQLite du coordinateur
+        shard (int): Shard du worker
+        raw_dir (str): Répertoire brut partagé
+        cache_dir (str): Répertoire de cache racine
+        use_cache (bool): Utiliser le cache de collecte
+        worker_id (Optional[str]): Identifiant du worker (hôte:pid par défaut)
+        poll_interval (float): Attente entre deux tentatives quand aucune tâche n'est disponible
+        lease_seconds (float): Durée des baux, renouvelés tant que la collecte d'une source dure
+
+    Returns:
+        Dict[str, int]: Nombre de sources et d'éléments collectés, d'échecs et de baux perdus
+    """
+    # Import local: les collecteurs ne sont nécessaires que dans les workers
+    from ..collectors.rss_collector import RSSCollector
+    from ..collectors.web_collector import WebCollector
+
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    shard_cache = os.path.join(cache_dir, f"shard-{shard}")
+    collectors = {
+        "rss": RSSCollector(raw_dir, shard_cache, max_workers=1),
+        "web": WebCollector(raw_dir, shard_cache, max_workers=1)
+    }
+    coordinator = WorkCoordinator(coordinator_path, lease_seconds=lease_seconds)
+    stats = {"sources": 0, "items": 0, "failures": 0, "lost": 0}
+    batch_number = 0
+
+    try:
+        while True:
+            coordinator.heartbeat(worker_id, shard)
+            task = coordinator.claim(worker_id, shard)
+            if task is None:
+                # Plus rien à réclamer: on attend les baux d'autres workers éventuellement perdus
+                if coordinator.unfinished() == 0:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            source_key, kind, source = task
+            collector = collectors[kind]
+            try:
+                with LeaseKeeper(coordinator_path, coordinator.run_id, source_key, worker_id, shard,
+                                 lease_seconds) as keeper:
+                    if kind == "rss":
+                        items = collector.collect_from_feed(source, use_cache)
+                    elif source.get("crawl"):
+                        items = collector.crawl_website(source)
+                    else:
+                        item = collector.collect_from_website(source, use_cache)
+                        items = [item] if item else []
+
+                # Bail repris par un autre worker pendant la collecte: c'est lui qui sauvegarde
+                if keeper.lost or not coordinator.renew(source_key, worker_id):
+                    print(f"Bail perdu pour {source_key}, résultats du worker {worker_id} ignorés")
+                    stats["lost"] += 1
+                    continue
+                if items:
+                    batch_number += 1
+                    collector.save_collected_data(
+                        {source["category"]: items}, batch_id=f"s{shard}w{os.getpid()}n{batch_number}")
+                if not coordinator.complete(source_key, worker_id, len(items)):
+                    print(f"Bail perdu pour {source_key} pendant la sauvegarde du worker {worker_id}")
+                stats["sources"] += 1
+                stats["items"] += len(items)
+            except Exception as e:
+                print(f"Erreur du worker {worker_id} sur {source_key}: {e}")
+                coordinator.fail(source_key, worker_id, str(e))
+                stats["failures"] += 1
+    finally:
+        for collector in collectors.values():
+            collector.health.save()
+        collectors["web"].extractor.memory.save()
+        coordinator.close()
+
+    return stats
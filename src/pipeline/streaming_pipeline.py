@@ -0,0 +1,353 @@
+import os
+import json
+import time
+import queue
+import logging
+import threading
+import concurrent.futures
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..collectors.rss_collector import RSSCollector
+from ..collectors.web_collector import WebCollector
+from ..processors.text_processor import TextProcessor
+from ..utils.logging_utils import LogListener, StageProgress, init_worker_logging
+from ..utils.raw_archive import RawArchive
+from ..utils.profiling import worker_initializer
+
+logger = logging.getLogger("StreamingPipeline")
+
+# Marqueur de fin de flux entre les étapes
+_END = object()
+
+
+class PipelineMetrics:
+    """
+    Mesures de débit et de latence du pipeline
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+        self.collected = 0
+        self.duplicates = 0
+        self.processed = 0
+        self.failed = 0
+        self.batches = 0
+        self.fetch_blocked_seconds = 0.0
+        self.max_queue_depth = 0
+        self.lags: List[float] = []
+
+    def add(self, name: str, value: float = 1):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + value)
+
+    def observe_queue(self, depth: int):
+        with self._lock:
+            if depth > self.max_queue_depth:
+                self.max_queue_depth = depth
+
+    def observe_lags(self, lags: List[float]):
+        with self._lock:
+            self.lags.extend(lags)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Synthèse des mesures
+
+        Returns:
+            Dict[str, Any]: Compteurs, débit (articles/s) et latence collecte -> traitement
+        """
+        with self._lock:
+            elapsed = time.time() - self.started_at
+            lags = sorted(self.lags)
+
+        def percentile(p: float) -> Optional[float]:
+            if not lags:
+                return None
+            return round(lags[min(len(lags) - 1, int(len(lags) * p / 100))], 3)
+
+        return {
+            "collected_articles": self.collected,
+            "duplicates_skipped": self.duplicates,
+            "processed_articles": self.processed,
+            "failed_articles": self.failed,
+            "batches": self.batches,
+            "elapsed_seconds": round(elapsed, 3),
+            "throughput_per_second": round(self.processed / elapsed, 2) if elapsed > 0 else 0.0,
+            "lag_p50_seconds": percentile(50),
+            "lag_p95_seconds": percentile(95),
+            "lag_max_seconds": round(lags[-1], 3) if lags else None,
+            "fetch_blocked_seconds": round(self.fetch_blocked_seconds, 3),
+            "max_queue_depth": self.max_queue_depth
+        }
+
+
+class StreamingPipeline:
+    """
+    Pipeline unifié collecte -> traitement -> sauvegarde
+
+    Les collecteurs alimentent une file bornée; un répartiteur forme des lots et
+    les soumet aux processus de traitement avec un nombre limité de lots en vol.
+    Quand le traitement prend du retard, la file se remplit et les threads de
+    collecte se bloquent (contre-pression) au lieu d'accumuler les articles en mémoire.
+    """
+
+    def __init__(self, output_dir: str = "data/processed", raw_dir: str = "data/raw",
+                 cache_dir: str = "data/cache", fetch_workers: int = 5, process_workers: int = 4,
+                 queue_size: int = 500, batch_size: int = 50, flush_interval: float = 1.0,
+                 save_raw: bool = False, use_cache: bool = True, keep_raw_html: bool = True):
+        """
+        Initialise le pipeline
+
+        Args:
+            output_dir (str): Répertoire de sortie des données traitées
+            raw_dir (str): Répertoire des données brutes (dédoublonnage, persistance optionnelle)
+            cache_dir (str): Répertoire pour le cache de collecte
+            fetch_workers (int): Nombre de threads de collecte
+            process_workers (int): Nombre de processus de traitement
+            queue_size (int): Capacité de la file entre collecte et traitement
+            batch_size (int): Nombre d'articles par lot de traitement
+            flush_interval (float): Délai maximal avant l'envoi d'un lot incomplet, en secondes
+            save_raw (bool): Conserver aussi les données brutes dans raw_dir (rejouables)
+            use_cache (bool): Utiliser le cache de collecte
+            keep_raw_html (bool): Conserver le HTML brut dans les données traitées
+        """
+        self.output_dir = output_dir
+        self.raw_dir = raw_dir
+        self.fetch_workers = fetch_workers
+        self.process_workers = process_workers
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.save_raw = save_raw
+        self.use_cache = use_cache
+
+        self.rss_collector = RSSCollector(raw_dir, cache_dir, fetch_workers)
+        self.web_collector = WebCollector(raw_dir, cache_dir, fetch_workers)
+        self.collectors = {"rss": self.rss_collector, "web": self.web_collector}
+        self.processor = TextProcessor(raw_dir, output_dir, keep_raw_html=keep_raw_html)
+
+        # Liens déjà traités, persistés dans l'index de l'archive brute (avec ou sans save_raw)
+        self.archive_dir = os.path.join(raw_dir, "archive")
+        self._archive: Optional[RawArchive] = None
+
+        self.metrics = PipelineMetrics()
+        self._seen_ids = set()
+        self._seen_lock = threading.Lock()
+        self._run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._progress: Optional[StageProgress] = None
+
+    def _collect_source(self, kind: str, source: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Collecte une source avec le collecteur adapté
+
+        Args:
+            kind (str): Type de source ("rss" ou "web")
+            source (Dict[str, Any]): Informations sur la source
+
+        Returns:
+            List[Dict[str, Any]]: Éléments collectés
+        """
+        if kind == "rss":
+            return self.rss_collector.collect_from_feed(source, self.use_cache)
+        if source.get("crawl"):
+            return self.web_collector.crawl_website(source)
+        item = self.web_collector.collect_from_website(source, self.use_cache)
+        return [item] if item else []
+
+    def _fetch_stage(self, sources: List[Tuple[str, Dict[str, Any]]], raw_queue: queue.Queue):
+        """
+        Étape de collecte: alimente la file bornée, source par source
+
+        Args:
+            sources (List[Tuple[str, Dict[str, Any]]]): Couples (type, source)
+            raw_queue (queue.Queue): File vers l'étape de traitement
+        """
+        def fetch(kind: str, source: Dict[str, Any]):
+            for item in self._collect_source(kind, source):
+                item_id = item.get("link") or item.get("url")
+                with self._seen_lock:
+                    if item_id in self._seen_ids:
+                        self.metrics.add("duplicates")
+                        continue
+                    self._seen_ids.add(item_id)
+                self.metrics.add("collected")
+
+                # put() bloquant: la collecte ralentit quand le traitement est en retard
+                blocked_since = time.time()
+                raw_queue.put((kind, item))
+                self.metrics.add("fetch_blocked_seconds", time.time() - blocked_since)
+                self.metrics.observe_queue(raw_queue.qsize())
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.fetch_workers) as executor:
+                futures = {executor.submit(fetch, kind, source): source for kind, source in sources}
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Erreur lors de la collecte de {futures[future].get('name')}: {e}")
+        finally:
+            for collector in self.collectors.values():
+                collector.health.save()
+            self.web_collector.extractor.memory.save()
+            raw_queue.put(_END)
+
+    def _sink_stage(self, results: queue.Queue, in_flight: threading.Semaphore):
+        """
+        Étape de sortie: sauvegarde des lots traités (et bruts si demandé)
+
+        Args:
+            results (queue.Queue): Lots traités (lot brut, future)
+            in_flight (threading.Semaphore): Jetons des lots en vol, libérés après écriture
+        """
+        while True:
+            entry = results.get()
+            if entry is _END:
+                break
+            batch_number, raw_batch, future = entry
+            try:
+                processed = future.result()
+            except Exception as e:
+                logger.error(f"Erreur lors du traitement du lot {batch_number}: {e}")
+                self.metrics.add("failed", len(raw_batch))
+                in_flight.release()
+                continue
+
+            try:
+                if self.save_raw:
+                    self._save_raw_batch(batch_number, raw_batch)
+
+                output_path = os.path.join(
+                    self.output_dir, f"processed_stream_{self._run_id}_{batch_number:05d}.json")
+                start = time.perf_counter()
+                self.processor._assign_topics(processed)
+                assigned = time.perf_counter()
+                self.processor.save_to_json(processed, output_path)
+                saved = time.perf_counter()
+                self.processor._index_processed_data(processed)
+                self._progress.add_stage_time("thèmes", assigned - start, len(processed))
+                self._progress.add_stage_time("écriture", saved - assigned, len(processed))
+                self._progress.add_stage_time("index", time.perf_counter() - saved, len(processed))
+
+                now = datetime.now()
+                lags = []
+                for article in processed:
+                    try:
+                        lags.append((now - datetime.fromisoformat(article.collected_at)).total_seconds())
+                    except (KeyError, TypeError, ValueError):
+                        continue
+                self.metrics.observe_lags(lags)
+                # Marqués vus une fois les sorties écrites: un lot en échec sera repris
+                self._mark_seen(raw_batch)
+                self.web_collector.commit_page_changes(item for kind, item in raw_batch if kind == "web")
+                self.metrics.add("processed", len(processed))
+                self._progress.update(len(processed))
+            except Exception as e:
+                logger.error(f"Erreur lors de la sauvegarde du lot {batch_number}: {e}")
+            finally:
+                in_flight.release()
+
+    def _mark_seen(self, raw_batch: List[Tuple[str, Dict[str, Any]]]):
+        """
+        Marque les articles d'un lot traité comme vus dans l'index de l'archive brute
+
+        Args:
+            raw_batch (List[Tuple[str, Dict[str, Any]]]): Couples (type, élément brut)
+        """
+        grouped: Dict[Tuple[str, str], List[str]] = {}
+        for kind, item in raw_batch:
+            grouped.setdefault((kind, item.get("category", "unknown")), []).append(
+                item.get("link") or item.get("url"))
+        for (kind, category), links in grouped.items():
+            self._archive.mark_seen(kind, category, links)
+
+    def _save_raw_batch(self, batch_number: int, raw_batch: List[Tuple[str, Dict[str, Any]]]):
+        """
+        Sauvegarde un lot brut au format des collecteurs (rejouable par run_processors)
+
+        Args:
+            batch_number (int): Numéro du lot
+            raw_batch (List[Tuple[str, Dict[str, Any]]]): Couples (type, élément brut)
+        """
+        grouped: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        for kind, item in raw_batch:
+            grouped.setdefault(kind, {}).setdefault(item.get("category", "unknown"), []).append(item)
+        for kind, data in grouped.items():
+            self.collectors[kind].save_collected_data(data, batch_id=f"b{batch_number:05d}")
+
+    def run(self, rss_feeds: List[Dict[str, Any]], websites: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Exécute le pipeline complet sur les sources données
+
+        Args:
+            rss_feeds (List[Dict[str, Any]]): Flux RSS
+            websites (List[Dict[str, Any]]): Sites web
+
+        Returns:
+            Dict[str, Any]: Mesures de débit et de latence
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        sources = [("rss", feed) for feed in rss_feeds] + [("web", site) for site in websites]
+
+        # Articles traités lors des exécutions précédentes (archivés ou marqués vus)
+        self._archive = RawArchive(self.archive_dir)
+        self._seen_ids = self._archive.known_ids()
+
+        raw_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        results: queue.Queue = queue.Queue()
+        in_flight = threading.BoundedSemaphore(self.process_workers * 2)
+
+        # Lots traités (nombre inconnu à l'avance: débit sans ETA)
+        self._progress = StageProgress("Pipeline", unit="lot", logger=logger)
+
+        fetcher = threading.Thread(target=self._fetch_stage, args=(sources, raw_queue),
+                                   name="pipeline-fetch", daemon=True)
+        sink = threading.Thread(target=self._sink_stage, args=(results, in_flight),
+                                name="pipeline-sink", daemon=True)
+        fetcher.start()
+        sink.start()
+
+        batch_number = 0
+        batch: List[Tuple[str, Dict[str, Any]]] = []
+
+        # Les messages des workers sont écrits par le processus principal
+        with LogListener() as log_listener, concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.process_workers, **worker_initializer(init_worker_logging, log_listener.initargs)) as executor:
+            def submit(raw_batch):
+                nonlocal batch_number
+                batch_number += 1
+                # Bloque tant que trop de lots sont en vol: la file amont se remplit
+                in_flight.acquire()
+                future = executor.submit(self.processor.process_articles, [item for _, item in raw_batch])
+                self.metrics.add("batches")
+                future.add_done_callback(lambda f, n=batch_number, b=raw_batch: results.put((n, b, f)))
+
+            while True:
+                try:
+                    entry = raw_queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    # Lot incomplet envoyé après flush_interval pour limiter la latence
+                    if batch:
+                        submit(batch)
+                        batch = []
+                    continue
+                if entry is _END:
+                    break
+                batch.append(entry)
+                if len(batch) >= self.batch_size:
+                    submit(batch)
+                    batch = []
+
+            if batch:
+                submit(batch)
+
+        # Toutes les futures sont terminées à la sortie de l'executor
+        results.put(_END)
+        sink.join()
+        fetcher.join()
+        self._progress.close()
+        self._archive.close()
+
+        return self.metrics.report()
@@ -0,0 +1,168 @@
+import sys
+from typing import Any, Dict, Iterable, List, Tuple
+
+# Lien extrait: (URL canonique, texte du lien)
+Link = Tuple[str, str]
+
+# Champs bruts représentés par des attributs; les autres sont conservés dans extra
+# (noms produits par les collecteurs: la source est dans "source_name")
+RAW_FIELDS = ("title", "link", "url", "summary", "content", "category", "source_name", "published", "collected_at")
+
+# Champs bruts volumineux supprimables une fois nettoyés
+RAW_HTML_FIELDS = ("content", "summary")
+
+# Ordre des champs ajoutés par le traitement dans la sortie JSON
+PROCESSED_FIELDS = ("cleaned_content", "content_links", "cleaned_summary", "summary_links", "language",
+                    "normalized_text", "keywords", "entities", "topic_id", "topic_label", "relevance", "cleaned_title", "all_links", "processed_at", "processor_version")
+
+_LINK_FIELDS = ("content_links", "summary_links", "all_links")
+
+# Tables partagées du processus: ordres de clés et liens identiques entre articles
+_KEY_ORDERS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+_LINKS: Dict[Link, Link] = {}
+_MAX_SHARED_LINKS = 500000
+
+
+def intern_text(value: Any) -> Any:
+    """Internalise une chaîne répétée entre articles (catégorie, source, langue)"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def shared_link(url: str, text: str) -> Link:
+    """
+    Lien partagé: un même couple (URL, texte) est représenté par un seul tuple
+
+    Args:
+        url (str): URL canonique
+        text (str): Texte du lien
+
+    Returns:
+        Link: Tuple partagé
+    """
+    link = (url, text)
+    shared = _LINKS.get(link)
+    if shared is None:
+        if len(_LINKS) >= _MAX_SHARED_LINKS:
+            _LINKS.clear()
+        shared = _LINKS[link] = link
+    return shared
+
+
+def _key_order(keys: Iterable[str]) -> Tuple[str, ...]:
+    """Ordre des clés brutes, partagé par tous les articles d'une même source"""
+    keys = tuple(keys)
+    return _KEY_ORDERS.setdefault(keys, keys)
+
+
+class ArticleRecord:
+    """
+    Représentation compacte d'un article traité
+
+    Les attributs sont déclarés dans __slots__ (pas de dictionnaire par article),
+    les chaînes répétées sont internalisées et les listes de liens sont des tuples
+    partagés (all_links réutilise le tuple content_links quand le résumé n'apporte
+    aucun lien). to_dict() reconstruit le dictionnaire de sortie habituel.
+    """
+
+    __slots__ = RAW_FIELDS + PROCESSED_FIELDS + ("raw_keys", "extra")
+
+    def __init__(self, article: Dict[str, Any], keep_raw_html: bool = True):
+        """
+        Initialise l'enregistrement à partir d'un article brut
+
+        Args:
+            article (Dict[str, Any]): Article collecté
+            keep_raw_html (bool): Conserver le HTML brut (content, summary) dans la sortie
+        """
+        keys = article.keys() if keep_raw_html else [k for k in article if k not in RAW_HTML_FIELDS]
+        self.raw_keys = _key_order(keys)
+        for name in RAW_FIELDS:
+            setattr(self, name, article.get(name))
+        self.category = intern_text(self.category)
+        self.source_name = intern_text(self.source_name)
+        extra = {k: v for k, v in article.items() if k not in RAW_FIELDS}
+        self.extra = extra or None
+        for name in PROCESSED_FIELDS:
+            setattr(self, name, None)
+
+    def drop_raw_html(self):
+        """Libère le HTML brut une fois nettoyé (s'il est exclu de la sortie)"""
+        for name in RAW_HTML_FIELDS:
+            if name not in self.raw_keys:
+                setattr(self, name, None)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Accès par clé, comme sur le dictionnaire de sortie
+
+        Args:
+            key (str): Nom du champ
+            default (Any): Valeur par défaut
+
+        Returns:
+            Any: Valeur du champ
+        """
+        if key in RAW_FIELDS:
+            return getattr(self, key) if key in self.raw_keys else default
+        if key in PROCESSED_FIELDS:
+            value = getattr(self, key)
+            if value is None:
+                return default
+            if key in _LINK_FIELDS:
+                return [{"text": text, "url": url} for url, text in value]
+            if key == "entities":
+                return [{"type": kind, "name": name} for kind, name in value]
+            return value
+        return self.extra.get(key, default) if self.extra else default
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, KeyError)
+        if value is KeyError:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, KeyError) is not KeyError
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Dictionnaire de sortie (mêmes clés et même ordre que le traitement historique)
+
+        Returns:
+            Dict[str, Any]: Article traité
+        """
+        result = {}
+        for key in self.raw_keys:
+            result[key] = getattr(self, key) if key in RAW_FIELDS else self.extra[key]
+        for key in PROCESSED_FIELDS:
+            value = getattr(self, key)
+            if value is None:
+                continue
+            if key in _LINK_FIELDS:
+                value = [{"text": text, "url": url} for url, text in value]
+            elif key == "keywords":
+                value = list(value)
+            elif key == "entities":
+                value = [{"type": kind, "name": name} for kind, name in value]
+            result[key] = value
+        return result
+
+
+def to_serializable(value: Any) -> Any:
+    """Hook json.dump: convertit un ArticleRecord en dictionnaire"""
+    if isinstance(value, ArticleRecord):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def as_dicts(articles: Iterable[Any]) -> List[Dict[str, Any]]:
+    """
+    Convertit une liste d'articles (dictionnaires ou ArticleRecord) en dictionnaires
+
+    Args:
+        articles (Iterable[Any]): Articles traités
+
+    Returns:
+        List[Dict[str, Any]]: Dictionnaires de sortie
+    """
+    return [a.to_dict() if isinstance(a, ArticleRecord) else a for a in articles]
@@ -0,0 +1,117 @@
+import os
+import re
+import json
+import hashlib
+from typing import Dict, List, Optional, Tuple
+
+from ..utils.aho_corasick import AhoCorasick
+
+# Dictionnaire des noms d'algorithmes et de protocoles (forme canonique -> variantes)
+GAZETTEER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "entities.json")
+
+# Entité extraite: (type, nom canonique)
+Entity = Tuple[str, str]
+
+# Identifiants normalisés: un seul passage de l'expression régulière sur le texte
+_IDENTIFIERS = re.compile(r"""
+    \b(?:
+        CVE[\s\-‐‑–]?(?P<cve_year>\d{4})[\-‐‑–](?P<cve_number>\d{4,7})
+      | FIPS(?:[\s\-]*PUB(?:LICATION)?)?[\s\-]*(?P<fips>\d{2,3})(?:-(?P<fips_version>\d))?
+      | (?:NIST[\s\-]+)?(?:SP|Special[\s\-]+Publication)[\s\-]*800[\s\-]+(?P<sp>\d{1,3}[A-D]?)
+      | NIST[\s\-]*IR[\s\-]*(?P<nistir>\d{4})
+      | RFC[\s\-]?(?P<rfc>\d{3,5})
+    )\b
+""", re.IGNORECASE | re.VERBOSE)
+
+
+def _identifier(match: "re.Match") -> Entity:
+    groups = match.groupdict()
+    if groups["cve_year"]:
+        return "cve", f"CVE-{groups['cve_year']}-{groups['cve_number']}"
+    if groups["fips"]:
+        version = f"-{groups['fips_version']}" if groups["fips_version"] else ""
+        return "fips", f"FIPS {groups['fips']}{version}"
+    if groups["sp"]:
+        return "sp800", f"SP 800-{groups['sp'].upper()}"
+    if groups["nistir"]:
+        return "nistir", f"NIST IR {groups['nistir']}"
+    return "rfc", f"RFC {int(groups['rfc'])}"
+
+
+class EntityExtractor:
+    """
+    Extraction des entités nommées utiles à la veille
+
+    Identifiants (CVE, FIPS, SP 800, NIST IR, RFC) par une expression régulière
+    précompilée, noms d'algorithmes et de protocoles par un dictionnaire de
+    variantes compilé en automate d'Aho-Corasick. Chaque entité est ramenée à sa
+    forme canonique ("CRYSTALS-Kyber" -> "ML-KEM", "FIPS PUB 204" -> "FIPS 204").
+    """
+
+    def __init__(self, gazetteer_path: str = GAZETTEER_PATH):
+        """
+        Charge et compile le dictionnaire
+
+        Args:
+            gazetteer_path (str): Fichier JSON {type: {nom canonique: [variantes]}}
+        """
+        with open(gazetteer_path, "rb") as f:
+            data = f.read()
+        self.fingerprint = hashlib.blake2b(data, digest_size=8).hexdigest()
+        variants: List[str] = []
+        self._entities: List[Entity] = []
+        for kind, names in json.loads(data.decode("utf-8")).items():
+            for name, aliases in names.items():
+                for alias in [name] + list(aliases):
+                    variants.append(alias)
+                    self._entities.append((kind, name))
+        self.matcher = AhoCorasick(variants)
+
+    def extract(self, *texts: Optional[str]) -> Tuple[Entity, ...]:
+        """
+        Entités distinctes d'un ou plusieurs textes, dans l'ordre de première apparition
+
+        Args:
+            *texts (Optional[str]): Textes (titre, contenu nettoyé...)
+
+        Returns:
+            Tuple[Entity, ...]: Couples (type, nom canonique)
+        """
+        found: Dict[Entity, None] = {}
+        for text in texts:
+            if not text:
+                continue
+            for match in _IDENTIFIERS.finditer(text):
+                found.setdefault(_identifier(match), None)
+            for _, _, index in self.matcher.iter_matches(text):
+                found.setdefault(self._entities[index], None)
+        return tuple(found)
+
+    def canonical(self, query: str) -> Optional[Entity]:
+        """
+        Forme canonique d'une entité saisie (requêtes sur l'index)
+
+        Args:
+            query (str): Entité, sous une forme quelconque ("fips 204", "Kyber", "cve-2024-3094")
+
+        Returns:
+            Optional[Entity]: (type, nom canonique), None si rien n'est reconnu
+        """
+        entities = self.extract(query)
+        return entities[0] if entities else None
+
+
+_EXTRACTOR: Optional[EntityExtractor] = None
+
+
+def get_entity_extractor() -> EntityExtractor:
+    """
+    Extracteur partagé du processus (compilé une seule fois par worker)
+
+    Returns:
+        EntityExtractor: Extracteur
+    """
+    global _EXTRACTOR
+    if _EXTRACTOR is None:
+        _EXTRACTOR = EntityExtractor()
+    return _EXTRACTOR
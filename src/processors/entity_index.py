@@ -0,0 +1,209 @@
+import os
+import time
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .entities import Entity, get_entity_extractor
+from ..utils.date_utils import record_timestamp
+from ..utils.raw_archive import link_hash
+
+
+class EntityIndex:
+    """
+    Index entité -> articles, stocké dans SQLite
+
+    Les mentions sont rangées par (entité, date, article) dans une table sans
+    rowid: "articles qui citent FIPS 204 ces 30 derniers jours" est une lecture
+    d'intervalle de l'index, indépendante de la taille du corpus. Les métadonnées
+    des articles (titre, lien, source) sont conservées pour répondre sans relire
+    les fichiers traités.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Ouvre (ou crée) l'index
+
+        Args:
+            db_path (str): Chemin de la base SQLite
+        """
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        """Crée les tables et index s'ils n'existent pas"""
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS entities (
+                id INTEGER PRIMARY KEY,
+                kind TEXT NOT NULL,
+                name TEXT NOT NULL UNIQUE
+            );
+            CREATE TABLE IF NOT EXISTS mentions (
+                entity_id INTEGER NOT NULL,
+                ts INTEGER NOT NULL,
+                article_id INTEGER NOT NULL,
+                PRIMARY KEY (entity_id, ts, article_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_mentions_article ON mentions (article_id);
+            CREATE TABLE IF NOT EXISTS articles (
+                id INTEGER PRIMARY KEY,
+                link TEXT,
+                title TEXT,
+                source TEXT,
+                category TEXT,
+                language TEXT,
+                ts INTEGER NOT NULL
+            );
+        """)
+
+    def _entity_ids(self, entities: Iterable[Entity]) -> Dict[str, int]:
+        entities = dict((name, kind) for kind, name in entities)
+        self.conn.executemany("INSERT OR IGNORE INTO entities (kind, name) VALUES (?, ?)",
+                              [(kind, name) for name, kind in entities.items()])
+        ids = {}
+        names = list(entities)
+        for start in range(0, len(names), 500):
+            chunk = names[start:start + 500]
+            ids.update((name, entity_id) for entity_id, name in self.conn.execute(
+                f"SELECT id, name FROM entities WHERE name IN ({','.join('?' * len(chunk))})", chunk))
+        return ids
+
+    def _first_seen(self, article_ids: List[int]) -> Dict[int, int]:
+        """Date déjà enregistrée des articles indexés (première indexation)"""
+        first_seen = {}
+        for start in range(0, len(article_ids), 500):
+            chunk = article_ids[start:start + 500]
+            first_seen.update(self.conn.execute(
+                f"SELECT id, ts FROM articles WHERE id IN ({','.join('?' * len(chunk))})", chunk))
+        return first_seen
+
+    def add_articles(self, articles: Iterable[Any]) -> int:
+        """
+        Ajoute (ou remplace) les entités d'un lot d'articles traités
+
+        Date d'un article: publication, sinon collecte; à défaut des deux, date
+        de sa première indexation (stable d'un retraitement à l'autre). Un article
+        retraité sans entité est retiré de l'index.
+
+        Args:
+            articles (Iterable[Any]): Articles traités (ArticleRecord ou dictionnaires)
+                avec leur champ "entities"
+
+        Returns:
+            int: Nombre de mentions écrites
+        """
+        rows = []
+        for article in articles:
+            entities = article.get("entities")
+            if entities is None:
+                continue
+            entities = [(e["type"], e["name"]) if isinstance(e, dict) else tuple(e) for e in entities]
+            key = article.get("link") or article.get("url")
+            if not key:
+                continue
+            ts = record_timestamp(article)
+            rows.append((link_hash(key), key, article, entities, int(ts) if ts is not None else None))
+        if not rows:
+            return 0
+        undated = [row[0] for row in rows if row[4] is None]
+        if undated:
+            first_seen = self._first_seen(undated)
+            now = int(time.time())
+            rows = [row if row[4] is not None else row[:4] + (first_seen.get(row[0], now),) for row in rows]
+
+        ids = self._entity_ids(entity for _, _, _, entities, _ in rows for entity in entities)
+        mentions = []
+        with self.conn:
+            # Un article retraité remplace ses mentions précédentes
+            self.conn.executemany("DELETE FROM mentions WHERE article_id = ?", [(row[0],) for row in rows])
+            self.conn.executemany("DELETE FROM articles WHERE id = ?", [(row[0],) for row in rows if not row[3]])
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO articles (id, link, title, source, category, language, ts) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(article_id, key, article.get("title"), article.get("source") or article.get("source_name"),
+                  article.get("category"), article.get("language"), ts)
+                 for article_id, key, article, entities, ts in rows if entities])
+            for article_id, _, _, entities, ts in rows:
+                mentions.extend((ids[name], ts, article_id) for _, name in entities)
+            self.conn.executemany("INSERT OR IGNORE INTO mentions (entity_id, ts, article_id) VALUES (?, ?, ?)",
+                                  mentions)
+        return len(mentions)
+
+    def resolve(self, query: str) -> Optional[Tuple[int, str, str]]:
+        """
+        Entité de l'index correspondant à une saisie
+
+        Args:
+            query (str): Entité sous une forme quelconque ("fips 204", "Kyber")
+
+        Returns:
+            Optional[Tuple[int, str, str]]: (identifiant, type, nom canonique), None si inconnue
+        """
+        entity = get_entity_extractor().canonical(query)
+        name = entity[1] if entity else query.strip()
+        row = self.conn.execute("SELECT id, kind, name FROM entities WHERE name = ? COLLATE NOCASE",
+                                (name,)).fetchone()
+        return tuple(row) if row else None
+
+    def articles(self, query: str, since: Optional[int] = None, until: Optional[int] = None,
+                 days: Optional[float] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Articles qui mentionnent une entité, du plus récent au plus ancien
+
+        Args:
+            query (str): Entité ("FIPS 204", "CVE-2024-3094", "Kyber"...)
+            since (Optional[int]): Début de l'intervalle, timestamp UTC inclus
+            until (Optional[int]): Fin de l'intervalle, timestamp UTC exclu
+            days (Optional[float]): Derniers jours (remplace since)
+            limit (int): Nombre maximal d'articles
+
+        Returns:
+            List[Dict[str, Any]]: Articles (link, title, source, category, language, ts)
+        """
+        entity = self.resolve(query)
+        if entity is None:
+            return []
+        if days is not None:
+            since = int(time.time() - days * 86400)
+        rows = self.conn.execute(
+            "SELECT a.link, a.title, a.source, a.category, a.language, m.ts FROM mentions m "
+            "JOIN articles a ON a.id = m.article_id "
+            "WHERE m.entity_id = ? AND m.ts >= ? AND m.ts < ? ORDER BY m.ts DESC LIMIT ?",
+            (entity[0], since if since is not None else -2 ** 63,
+             until if until is not None else 2 ** 63 - 1, limit)).fetchall()
+        return [{"link": link, "title": title, "source": source, "category": category,
+                 "language": language, "ts": ts} for link, title, source, category, language, ts in rows]
+
+    def top_entities(self, kind: Optional[str] = None, days: Optional[float] = None,
+                     limit: int = 20) -> List[Tuple[str, str, int]]:
+        """
+        Entités les plus citées
+
+        Args:
+            kind (Optional[str]): Type d'entité ("cve", "fips", "sp800", "nistir", "rfc",
+                "algorithm", "protocol"), tous par défaut
+            days (Optional[float]): Derniers jours seulement
+            limit (int): Nombre d'entités
+
+        Returns:
+            List[Tuple[str, str, int]]: (type, nom, nombre d'articles)
+        """
+        since = int(time.time() - days * 86400) if days is not None else -2 ** 63
+        return [tuple(row) for row in self.conn.execute(
+            "SELECT e.kind, e.name, COUNT(*) AS n FROM entities e JOIN mentions m ON m.entity_id = e.id "
+            "WHERE (? IS NULL OR e.kind = ?) AND m.ts >= ? GROUP BY e.id ORDER BY n DESC, e.name LIMIT ?",
+            (kind, kind, since, limit))]
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,280 @@
+import os
+import sqlite3
+import hashlib
+import itertools
+from array import array
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .language import get_language_resources
+
+try:
+    from scipy import sparse
+    SCIPY_AVAILABLE = True
+except ImportError:
+    # Sans scipy, les mots-clés restent classés par fréquence dans chaque article
+    SCIPY_AVAILABLE = False
+
+def _document_id(document_key: str) -> int:
+    """Identifiant 64 bits signé d'un document (clé de la table des documents vus)"""
+    digest = hashlib.blake2b(document_key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class KeywordEngine:
+    """
+    Extraction de mots-clés par TF-IDF sur des lots d'articles
+
+    Un lot est converti en matrice creuse documents x termes; la fréquence
+    documentaire (DF) est maintenue incrémentalement dans SQLite sur l'ensemble du
+    corpus (chaque document n'est compté qu'une fois, même s'il est retraité) et
+    les k meilleurs termes de chaque ligne sont sélectionnés par argpartition sur
+    des blocs de lignes.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, max_keywords: int = 10, row_chunk: int = 2048):
+        """
+        Initialise le moteur
+
+        Args:
+            db_path (Optional[str]): Base SQLite de la table DF (None: DF du lot uniquement)
+            max_keywords (int): Nombre de mots-clés par article
+            row_chunk (int): Nombre de lignes traitées à la fois pour la sélection top-k
+        """
+        self.max_keywords = max_keywords
+        self.row_chunk = row_chunk
+        self.conn = None
+        if db_path:
+            directory = os.path.dirname(db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Base partagée par les workers de traitement: les écritures concurrentes attendent leur tour
+            self.conn = sqlite3.connect(db_path, timeout=60)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS terms (
+                    term TEXT PRIMARY KEY,
+                    df INTEGER NOT NULL
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS documents (
+                    id INTEGER PRIMARY KEY
+                );
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                );
+            """)
+
+    def _build_matrix(self, texts: Sequence[str], languages: Optional[Sequence[str]] = None):
+        """
+        Construit la matrice creuse des fréquences de termes du lot
+
+        Chaque texte est tokenisé et raciné selon sa langue; les colonnes sont des racines.
+
+        Args:
+            texts (Sequence[str]): Textes normalisés
+            languages (Optional[Sequence[str]]): Langue de chaque texte
+
+        Returns:
+            Tuple[sparse.csr_matrix, np.ndarray, np.ndarray]: Matrice documents x racines, racines et forme affichée de chaque racine
+        """
+        # Mots numérotés à la volée par langue (au niveau C); les identifiants sont globaux
+        next_id = itertools.count().__next__
+        words_by_language: Dict[str, defaultdict] = {}
+        word_ids = array("q")
+        lengths = np.empty(len(texts), dtype=np.int64)
+        for i, text in enumerate(texts):
+            resources = get_language_resources(languages[i] if languages else None)
+            ids = words_by_language.get(resources.language)
+            if ids is None:
+                ids = words_by_language[resources.language] = defaultdict(next_id)
+            words = resources.tokenize(text) if text else []
+            word_ids.extend(map(ids.__getitem__, words))
+            lengths[i] = len(words)
+
+        # Racinisation une seule fois par mot distinct; mots communs et nombres écartés (-1)
+        word_count = sum(len(ids) for ids in words_by_language.values())
+        word_to_term = np.full(word_count, -1, dtype=np.int64)
+        term_ids: Dict[str, int] = {}
+        stems: List[str] = []
+        surfaces: List[str] = []
+        for language, ids in words_by_language.items():
+            resources = get_language_resources(language)
+            for word, word_id in ids.items():
+                stem = resources.term(word)
+                if not stem:
+                    continue
+                term_id = term_ids.get(stem)
+                if term_id is None:
+                    term_id = term_ids[stem] = len(stems)
+                    stems.append(stem)
+                    surfaces.append(resources.surface.get(stem, word))
+                word_to_term[word_id] = term_id
+
+        columns = word_to_term[np.frombuffer(word_ids, dtype=np.int64)] if len(word_ids) else \
+            np.array([], dtype=np.int64)
+        doc_ids = np.repeat(np.arange(len(texts)), lengths)
+        valid = columns >= 0
+        vocabulary = np.array(stems, dtype=object)
+        surfaces = np.array(surfaces, dtype=object)
+
+        # Les doublons (document, terme) sont additionnés à la conversion en CSR
+        matrix = sparse.coo_matrix(
+            (np.ones(int(valid.sum()), dtype=np.float32), (doc_ids[valid], columns[valid])),
+            shape=(len(texts), len(vocabulary))).tocsr()
+        return matrix, vocabulary, surfaces
+
+    def _update_document_frequency(self, matrix, vocabulary: np.ndarray,
+                                   document_keys: Optional[Sequence[str]]):
+        """
+        Met à jour la table DF avec les documents nouveaux du lot
+
+        Args:
+            matrix (sparse.csr_matrix): Matrice documents x termes
+            vocabulary (np.ndarray): Termes des colonnes
+            document_keys (Optional[Sequence[str]]): Identifiants des documents (lien, URL)
+
+        Returns:
+            Tuple[np.ndarray, int]: DF de chaque terme du vocabulaire et nombre total de documents
+        """
+        batch_df = np.diff((matrix > 0).tocsc().indptr)
+        if self.conn is None:
+            return batch_df, matrix.shape[0]
+
+        keys = document_keys if document_keys is not None else [None] * matrix.shape[0]
+        ids = [_document_id(key) if key else None for key in keys]
+        keyed = list({i for i in ids if i is not None})
+        anonymous = sum(1 for doc_id in ids if doc_id is None)
+        terms = vocabulary.tolist()
+
+        with self.conn:
+            # Documents connus lus dans la transaction d'écriture: deux workers qui
+            # traitent le même document ne le comptent qu'une fois
+            self.conn.execute("BEGIN IMMEDIATE")
+            known = set()
+            for start in range(0, len(keyed), 500):
+                chunk = keyed[start:start + 500]
+                known.update(row[0] for row in self.conn.execute(
+                    f"SELECT id FROM documents WHERE id IN ({','.join('?' * len(chunk))})", chunk))
+
+            # Seuls les documents jamais comptés contribuent à la DF
+            new_rows = np.ones(matrix.shape[0], dtype=bool)
+            new_ids = set()
+            for row, doc_id in enumerate(ids):
+                if doc_id is None:
+                    continue
+                if doc_id in known or doc_id in new_ids:
+                    new_rows[row] = False
+                else:
+                    new_ids.add(doc_id)
+            new_df = np.diff((matrix[new_rows] > 0).tocsc().indptr) if new_rows.any() else np.zeros_like(batch_df)
+
+            self.conn.executemany(
+                "INSERT INTO terms (term, df) VALUES (?, ?) ON CONFLICT(term) DO UPDATE SET df = df + excluded.df",
+                [(term, int(df)) for term, df in zip(terms, new_df) if df])
+            self.conn.executemany("INSERT INTO documents (id) VALUES (?)", [(i,) for i in new_ids])
+            if anonymous:
+                # Les documents sans identifiant sont seulement comptés
+                self.conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('anonymous_documents', ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = value + excluded.value", (anonymous,))
+
+        corpus_df = np.zeros(len(terms), dtype=np.int64)
+        for start in range(0, len(terms), 500):
+            chunk = terms[start:start + 500]
+            rows = dict(self.conn.execute(
+                f"SELECT term, df FROM terms WHERE term IN ({','.join('?' * len(chunk))})", chunk))
+            corpus_df[start:start + len(chunk)] = [rows.get(term, 0) for term in chunk]
+
+        total = self.conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'anonymous_documents'").fetchone()
+        total += row[0] if row else 0
+        # Documents déjà comptés mais retraités: la DF du lot reste un minimum
+        return np.maximum(corpus_df, batch_df), max(total, matrix.shape[0])
+
+    def _top_k(self, scores) -> List[List[int]]:
+        """
+        Sélectionne les k colonnes de plus haut score de chaque ligne
+
+        Les lignes sont recopiées par blocs dans une matrice dense (complétée par -inf)
+        de largeur égale au nombre maximal de termes d'une ligne du bloc, puis
+        np.argpartition est appliqué sur tout le bloc à la fois.
+
+        Args:
+            scores (sparse.csr_matrix): Scores TF-IDF
+
+        Returns:
+            List[List[int]]: Indices de colonnes triés par score décroissant, par ligne
+        """
+        k = self.max_keywords
+        results: List[List[int]] = []
+        for start in range(0, scores.shape[0], self.row_chunk):
+            block = scores[start:start + self.row_chunk]
+            counts = np.diff(block.indptr)
+            width = int(counts.max()) if len(counts) else 0
+            if width == 0:
+                results.extend([] for _ in range(block.shape[0]))
+                continue
+
+            rows = np.repeat(np.arange(block.shape[0]), counts)
+            cols = np.arange(block.nnz) - np.repeat(block.indptr[:-1], counts)
+            dense = np.full((block.shape[0], width), -np.inf, dtype=np.float32)
+            dense[rows, cols] = block.data
+            terms = np.full((block.shape[0], width), -1, dtype=np.int64)
+            terms[rows, cols] = block.indices
+
+            kk = min(k, width)
+            top = np.argpartition(-dense, kk - 1, axis=1)[:, :kk] if kk < width else \
+                np.tile(np.arange(width), (block.shape[0], 1))
+            top_scores = np.take_along_axis(dense, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind="stable")
+            top = np.take_along_axis(top, order, axis=1)
+            top_terms = np.take_along_axis(terms, top, axis=1)
+            top_valid = np.isfinite(np.take_along_axis(top_scores, order, axis=1))
+
+            for row_terms, row_valid in zip(top_terms, top_valid):
+                results.append(row_terms[row_valid].tolist())
+        return results
+
+    def extract_batch(self, texts: Sequence[str], document_keys: Optional[Sequence[str]] = None,
+                      languages: Optional[Sequence[str]] = None) -> List[List[str]]:
+        """
+        Extrait les mots-clés d'un lot de textes
+
+        Args:
+            texts (Sequence[str]): Textes normalisés
+            document_keys (Optional[Sequence[str]]): Identifiants des documents pour la DF incrémentale
+            languages (Optional[Sequence[str]]): Langue de chaque texte (cf. LanguageDetector)
+
+        Returns:
+            List[List[str]]: Mots-clés de chaque texte, par score TF-IDF décroissant
+        """
+        if not texts:
+            return []
+
+        matrix, vocabulary, surfaces = self._build_matrix(texts, languages)
+        if matrix.nnz == 0:
+            return [[] for _ in texts]
+
+        df, total = self._update_document_frequency(matrix, vocabulary, document_keys)
+
+        # TF sous-linéaire, IDF lissé
+        idf = (np.log((1.0 + total) / (1.0 + df)) + 1.0).astype(np.float32)
+        scores = matrix.copy()
+        scores.data = (1.0 + np.log(scores.data)) * idf[scores.indices]
+
+        return [surfaces[row].tolist() for row in self._top_k(scores)]
+
+    def close(self):
+        """Ferme la base de la table DF"""
+        if self.conn is not None:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,261 @@
+import os
+import re
+import json
+import math
+import hashlib
+import threading
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+try:
+    from nltk.stem.snowball import SnowballStemmer
+    NLTK_AVAILABLE = True
+except ImportError:
+    NLTK_AVAILABLE = False
+
+# Profils n-grammes et mots communs livrés avec le paquet
+RESOURCES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "languages.json")
+
+# Langue indéterminée (texte trop court ou vide)
+UNKNOWN_LANGUAGE = "und"
+
+NGRAM_SIZE = 3
+
+# Seul le début du texte est utilisé pour l'identification
+SAMPLE_CHARS = 1500
+
+# Mots d'au moins 3 caractères: équivalent à \b\w{3,}\b (les suites de \w sont
+# maximales), sans le coût des assertions de frontière
+TOKEN_PATTERN = re.compile(r'\w{3,}')
+
+# Mots communs (stop words) sans langue identifiée - liste minimaliste
+STOP_WORDS = {'le', 'la', 'les', 'un', 'une', 'des', 'et', 'ou', 'pour', 'par', 'sur', 'dans', 'en', 'qui', 'que', 'quoi',
+              'dont', 'avec', 'sans', 'the', 'a', 'an', 'of', 'to', 'in', 'for', 'on', 'at', 'from', 'by', 'with'}
+
+# Caractères conservés par _clean_text
+DEFAULT_CLEAN_PATTERN = re.compile(r'[^\w\s.,;:!?\(\)\[\]\'\"«»]')
+CLEAN_PATTERNS = {
+    # Apostrophe typographique, guillemets français et traits d'union (post-quantique)
+    "fr": re.compile(r'[^\w\s.,;:!?\(\)\[\]\'\"«»’\-]'),
+    "en": re.compile(r'[^\w\s.,;:!?\(\)\[\]\'\"“”’\-]'),
+}
+
+# Élisions françaises (l'agence -> agence) et possessif anglais (NIST's -> NIST)
+ELISION_PATTERNS = {
+    "fr": re.compile(r"\b(?:[cdjlmnst]|qu|jusqu|lorsqu|puisqu|quoiqu)['’]", re.IGNORECASE),
+    "en": re.compile(r"['’]s\b", re.IGNORECASE),
+}
+
+STEMMER_LANGUAGES = {"fr": "french", "en": "english"}
+
+_NON_LETTERS = re.compile(r"[^\w]+|[\d_]+")
+
+
+def _ngrams(text: str) -> Counter:
+    """
+    Compte les n-grammes de caractères d'un texte (mots bornés par des espaces)
+
+    Args:
+        text (str): Texte d'entrée
+
+    Returns:
+        Counter: Occurrences des n-grammes
+    """
+    counts = Counter()
+    for word in _NON_LETTERS.sub(" ", text.lower()).split():
+        padded = f" {word} "
+        counts.update(padded[i:i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1))
+    return counts
+
+
+def build_profile(text: str, size: int = 400) -> Dict[str, float]:
+    """
+    Construit un profil de langue: log-probabilités des n-grammes les plus fréquents
+
+    Utilisé pour générer resources/languages.json à partir d'un texte de référence.
+
+    Args:
+        text (str): Texte de référence de la langue
+        size (int): Nombre de n-grammes conservés
+
+    Returns:
+        Dict[str, float]: Log-probabilité de chaque n-gramme
+    """
+    counts = _ngrams(text)
+    total = sum(counts.values())
+    return {gram: round(math.log(count / total), 4) for gram, count in counts.most_common(size)}
+
+
+@lru_cache(maxsize=1)
+def load_language_data() -> Dict[str, Dict]:
+    """
+    Charge les profils et mots communs livrés (une fois par processus)
+
+    Returns:
+        Dict[str, Dict]: Données par langue
+    """
+    with open(RESOURCES_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class LanguageDetector:
+    """
+    Identification hors ligne de la langue par profils de n-grammes de caractères
+
+    Les résultats sont mis en cache par empreinte du contenu: un même article
+    retraité ou partagé par plusieurs flux n'est analysé qu'une fois par processus.
+    """
+
+    def __init__(self, cache_size: int = 100000, min_chars: int = 20):
+        """
+        Initialise le détecteur
+
+        Args:
+            cache_size (int): Nombre de résultats gardés en cache
+            min_chars (int): Longueur minimale d'un texte identifiable
+        """
+        data = load_language_data()
+        self.profiles = {language: entry["profile"] for language, entry in data.items()}
+        # Pénalité d'un n-gramme absent d'un profil
+        self.unseen = {language: min(profile.values()) - 1.0 for language, profile in self.profiles.items()}
+        self.cache_size = cache_size
+        self.min_chars = min_chars
+        self._cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _score(self, sample: str) -> str:
+        """Langue dont le profil explique le mieux les n-grammes de l'échantillon"""
+        counts = _ngrams(sample)
+        if not counts:
+            return UNKNOWN_LANGUAGE
+        best, best_score = UNKNOWN_LANGUAGE, -math.inf
+        for language, profile in self.profiles.items():
+            unseen = self.unseen[language]
+            score = sum(count * profile.get(gram, unseen) for gram, count in counts.items())
+            if score > best_score:
+                best, best_score = language, score
+        return best
+
+    def detect(self, text: Optional[str]) -> str:
+        """
+        Identifie la langue d'un texte
+
+        Args:
+            text (Optional[str]): Texte à identifier
+
+        Returns:
+            str: Code de langue ("fr", "en") ou "und"
+        """
+        sample = (text or "")[:SAMPLE_CHARS]
+        if len(sample.strip()) < self.min_chars:
+            return UNKNOWN_LANGUAGE
+
+        key = hashlib.blake2b(sample.encode("utf-8"), digest_size=16).digest()
+        with self._lock:
+            language = self._cache.get(key)
+            if language is not None:
+                self._cache.move_to_end(key)
+                return language
+
+        language = self._score(sample)
+        with self._lock:
+            self._cache[key] = language
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return language
+
+
+@lru_cache(maxsize=1)
+def get_detector() -> LanguageDetector:
+    """Détecteur partagé du processus (profils chargés une seule fois)"""
+    return LanguageDetector()
+
+
+class LanguageResources:
+    """
+    Traitements propres à une langue: nettoyage, tokenisation, mots communs et racinisation
+    """
+
+    def __init__(self, language: str):
+        """
+        Charge les ressources d'une langue
+
+        Args:
+            language (str): Code de langue ("fr", "en" ou "und")
+        """
+        self.language = language
+        entry = load_language_data().get(language)
+        stop_words = set(entry["stop_words"]) if entry else set(STOP_WORDS)
+        if entry and NLTK_AVAILABLE:
+            # Listes nltk si le corpus a été téléchargé (nltk.download('stopwords'))
+            try:
+                from nltk.corpus import stopwords
+                stop_words.update(stopwords.words(STEMMER_LANGUAGES[language]))
+            except LookupError:
+                pass
+        self.stop_words = frozenset(stop_words)
+
+        self.clean_pattern = CLEAN_PATTERNS.get(language, DEFAULT_CLEAN_PATTERN)
+        self.elision_pattern = ELISION_PATTERNS.get(language)
+        self.stemmer = (SnowballStemmer(STEMMER_LANGUAGES[language])
+                        if NLTK_AVAILABLE and language in STEMMER_LANGUAGES else None)
+
+        # Forme affichée de chaque racine: premier mot rencontré
+        self.surface: Dict[str, str] = {}
+        self.term = lru_cache(maxsize=200000)(self._term)
+
+    def clean(self, text: str) -> str:
+        """Supprime les caractères spéciaux non pertinents pour la langue"""
+        return self.clean_pattern.sub('', text)
+
+    def tokenize(self, text: str) -> List[str]:
+        """
+        Découpe un texte en mots (minuscules, élisions retirées)
+
+        Args:
+            text (str): Texte normalisé
+
+        Returns:
+            List[str]: Mots d'au moins 3 caractères
+        """
+        text = text.lower()
+        if self.elision_pattern is not None:
+            text = self.elision_pattern.sub(" ", text)
+        return TOKEN_PATTERN.findall(text)
+
+    def _term(self, word: str) -> str:
+        """
+        Terme d'indexation d'un mot (racine), ou "" pour un mot commun ou un nombre
+
+        Args:
+            word (str): Mot en minuscules
+
+        Returns:
+            str: Racine du mot
+        """
+        if word in self.stop_words or word.isdigit():
+            return ""
+        stem = self.stemmer.stem(word) if self.stemmer else word
+        self.surface.setdefault(stem, word)
+        return stem
+
+
+@lru_cache(maxsize=None)
+def _load_resources(language: str) -> LanguageResources:
+    return LanguageResources(language)
+
+
+def get_language_resources(language: Optional[str]) -> LanguageResources:
+    """
+    Ressources d'une langue, chargées une seule fois par processus
+
+    Args:
+        language (Optional[str]): Code de langue
+
+    Returns:
+        LanguageResources: Ressources (langue indéterminée si la langue n'est pas prise en charge)
+    """
+    if language not in load_language_data():
+        language = UNKNOWN_LANGUAGE
+    return _load_resources(language)
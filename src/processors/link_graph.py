@@ -0,0 +1,185 @@
+import os
+import sqlite3
+import hashlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..utils.url_utils import canonicalize_url
+
+
+def url_id(url: str) -> int:
+    """
+    Identifiant entier stable d'une URL (hachage 64 bits signé)
+
+    Args:
+        url (str): URL canonique
+
+    Returns:
+        int: Identifiant utilisable comme clé primaire SQLite
+    """
+    digest = hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class LinkGraph:
+    """
+    Graphe des liens entre articles, stocké dans SQLite
+
+    Les nœuds sont identifiés par le hachage 64 bits de leur URL canonique et les
+    arêtes (source -> cible) sont stockées dans une table sans rowid indexée par
+    cible, ce qui rend les requêtes "qui cite cette page" et "pages les plus citées"
+    indépendantes de la taille du corpus.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Ouvre (ou crée) le graphe de liens
+
+        Args:
+            db_path (str): Chemin de la base SQLite
+        """
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        """Crée les tables et index s'ils n'existent pas"""
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS nodes (
+                id INTEGER PRIMARY KEY,
+                url TEXT NOT NULL,
+                in_degree INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS edges (
+                dst INTEGER NOT NULL,
+                src INTEGER NOT NULL,
+                PRIMARY KEY (dst, src)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_edges_src ON edges (src);
+            CREATE INDEX IF NOT EXISTS idx_nodes_in_degree ON nodes (in_degree);
+        """)
+
+    def add_articles(self, articles: Iterable[Tuple[str, Iterable[str]]]) -> int:
+        """
+        Ajoute (ou remplace) les liens sortants d'un lot d'articles
+
+        Args:
+            articles (Iterable[Tuple[str, Iterable[str]]]): Couples (URL de l'article, URLs canoniques citées)
+
+        Returns:
+            int: Nombre d'arêtes écrites
+        """
+        nodes: Dict[int, str] = {}
+        edges: List[Tuple[int, int]] = []
+        sources: List[int] = []
+
+        for article_url, links in articles:
+            canonical = canonicalize_url(article_url)
+            if not canonical:
+                continue
+            src = url_id(canonical)
+            nodes[src] = canonical
+            sources.append(src)
+            targets = set()
+            for link in links:
+                dst = url_id(link)
+                if dst == src or dst in targets:
+                    continue
+                targets.add(dst)
+                nodes[dst] = link
+                edges.append((dst, src))
+
+        if not sources:
+            return 0
+
+        with self.conn:
+            # Les cibles dont le nombre de citations doit être recalculé
+            affected = {dst for dst, _ in edges}
+            for chunk in self._chunks(sources):
+                placeholders = ",".join("?" * len(chunk))
+                affected.update(row[0] for row in self.conn.execute(
+                    f"SELECT dst FROM edges WHERE src IN ({placeholders})", chunk))
+                self.conn.execute(f"DELETE FROM edges WHERE src IN ({placeholders})", chunk)
+
+            self.conn.executemany("INSERT OR IGNORE INTO nodes (id, url) VALUES (?, ?)", nodes.items())
+            self.conn.executemany("INSERT OR IGNORE INTO edges (dst, src) VALUES (?, ?)", edges)
+
+            for chunk in self._chunks(list(affected)):
+                placeholders = ",".join("?" * len(chunk))
+                self.conn.execute(
+                    f"UPDATE nodes SET in_degree = (SELECT COUNT(*) FROM edges WHERE edges.dst = nodes.id) "
+                    f"WHERE id IN ({placeholders})", chunk)
+
+        return len(edges)
+
+    @staticmethod
+    def _chunks(values: List[int], size: int = 500):
+        """Découpe une liste pour rester sous la limite de paramètres SQLite"""
+        for i in range(0, len(values), size):
+            yield values[i:i + size]
+
+    def cited_by(self, url: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Liste les articles qui citent une URL
+
+        Args:
+            url (str): URL citée (canonicalisée avant la recherche)
+            limit (Optional[int]): Nombre maximum de résultats
+
+        Returns:
+            List[str]: URLs des articles citants
+        """
+        canonical = canonicalize_url(url)
+        if not canonical:
+            return []
+        query = "SELECT n.url FROM edges e JOIN nodes n ON n.id = e.src WHERE e.dst = ?"
+        params: list = [url_id(canonical)]
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [row[0] for row in self.conn.execute(query, params)]
+
+    def outgoing(self, url: str) -> List[str]:
+        """
+        Liste les URLs citées par un article
+
+        Args:
+            url (str): URL de l'article
+
+        Returns:
+            List[str]: URLs citées
+        """
+        canonical = canonicalize_url(url)
+        if not canonical:
+            return []
+        return [row[0] for row in self.conn.execute(
+            "SELECT n.url FROM edges e JOIN nodes n ON n.id = e.dst WHERE e.src = ?",
+            (url_id(canonical),))]
+
+    def most_cited(self, limit: int = 20) -> List[Tuple[str, int]]:
+        """
+        Retourne les URLs les plus citées du corpus
+
+        Args:
+            limit (int): Nombre de résultats
+
+        Returns:
+            List[Tuple[str, int]]: Couples (URL, nombre d'articles citants)
+        """
+        return list(self.conn.execute(
+            "SELECT url, in_degree FROM nodes WHERE in_degree > 0 ORDER BY in_degree DESC LIMIT ?",
+            (limit,)))
+
+    def close(self):
+        """Ferme la connexion"""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
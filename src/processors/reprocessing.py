@@ -0,0 +1,227 @@
+import os
+import json
+import time
+import sqlite3
+import logging
+import concurrent.futures
+from typing import Any, Dict, List, Optional
+
+from .text_processor import TextProcessor
+from .article_record import ArticleRecord, to_serializable
+from ..utils.logging_utils import LogListener, StageProgress, init_worker_logging
+from ..utils.profiling import stage, worker_initializer
+from ..utils.relevance import DEFAULT_RELEVANCE_PATH
+
+logger = logging.getLogger("Reprocessing")
+
+
+class ReprocessCheckpoint:
+    """
+    Points de reprise du retraitement, stockés dans SQLite
+
+    Une entrée brute est marquée terminée pour une version du processeur et une
+    empreinte de son contenu: un retraitement interrompu reprend aux entrées non
+    marquées, et une entrée modifiée depuis est retraitée.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Ouvre (ou crée) la base des points de reprise
+
+        Args:
+            db_path (str): Chemin de la base SQLite
+        """
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS units (
+                name TEXT PRIMARY KEY,
+                processor_version TEXT NOT NULL,
+                signature TEXT NOT NULL,
+                articles INTEGER NOT NULL,
+                recomputed INTEGER NOT NULL,
+                completed_at REAL NOT NULL
+            )
+        """)
+
+    def is_done(self, name: str, processor_version: str, signature: str) -> bool:
+        """Indique si l'entrée a déjà été traitée avec cette version et ce contenu"""
+        row = self.conn.execute(
+            "SELECT processor_version, signature FROM units WHERE name = ?", (name,)).fetchone()
+        return row is not None and row[0] == processor_version and row[1] == signature
+
+    def mark_done(self, name: str, processor_version: str, signature: str, articles: int, recomputed: int):
+        """Enregistre la fin du traitement d'une entrée"""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO units (name, processor_version, signature, articles, recomputed, completed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (name, processor_version, signature, articles, recomputed, time.time()))
+
+    def close(self):
+        """Ferme la base"""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _write_output(data: List[Any], output_path: str):
+    """
+    Écrit une sortie par fichier de façon atomique
+
+    Contrairement à TextProcessor.save_to_json, une erreur est propagée: la sortie
+    précédente reste en place et le fichier n'est pas marqué terminé.
+
+    Args:
+        data (List[Any]): Articles (dictionnaires ou ArticleRecord)
+        output_path (str): Chemin de la sortie
+    """
+    tmp_path = output_path + ".tmp"
+    try:
+        with stage("serialize"), open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, default=to_serializable)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, output_path)
+
+
+def _write_combined(output_paths: List[str], combined_path: str) -> int:
+    """
+    Reconstruit le fichier combiné en flux, une sortie à la fois
+
+    Args:
+        output_paths (List[str]): Sorties par fichier brut
+        combined_path (str): Chemin du fichier combiné
+
+    Returns:
+        int: Nombre d'articles écrits
+    """
+    count = 0
+    tmp_path = combined_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as out:
+        out.write("[")
+        for path in output_paths:
+            with open(path, "r", encoding="utf-8") as f:
+                articles = json.load(f)
+            for article in articles:
+                out.write(",\n" if count else "\n")
+                json.dump(article, out, ensure_ascii=False, indent=2)
+                count += 1
+        out.write("\n]")
+    os.replace(tmp_path, combined_path)
+    return count
+
+
+def reprocess_all_data(input_dir: str = "data/raw", output_dir: str = "data/processed",
+                       max_workers: Optional[int] = None, save_csv: bool = True,
+                       keep_raw_html: bool = True, topic_vectorizer: Optional[str] = "tfidf",
+                       relevance_path: Optional[str] = DEFAULT_RELEVANCE_PATH,
+                       extract_entities: bool = True) -> Dict[str, Any]:
+    """
+    Retraite les données brutes dont la sortie est obsolète (version du processeur)
+
+    Seuls les articles dont la version enregistrée diffère sont recalculés, sur
+    tous les cœurs; chaque fichier terminé est enregistré comme point de reprise.
+
+    Args:
+        input_dir (str): Répertoire des données brutes
+        output_dir (str): Répertoire des données traitées
+        max_workers (Optional[int]): Nombre de processus (par défaut: nombre de cœurs)
+        save_csv (bool): Régénérer aussi le fichier CSV combiné
+        keep_raw_html (bool): Conserver le HTML brut dans les données traitées
+        topic_vectorizer (Optional[str]): Vectorisation du regroupement en thèmes (None: désactivé)
+        relevance_path (Optional[str]): Configuration du préfiltre de pertinence (None: désactivé)
+        extract_entities (bool): Extraire les entités et alimenter leur index
+
+    Returns:
+        Dict[str, Any]: Statistiques du retraitement
+    """
+    processor = TextProcessor(input_dir, output_dir, keep_raw_html=keep_raw_html,
+                              topic_vectorizer=topic_vectorizer, relevance_path=relevance_path,
+                              extract_entities=extract_entities)
+    max_workers = max_workers or os.cpu_count() or 1
+    version = processor.processor_version
+    stats = {
+        "processor_version": version,
+        "total_files": 0,
+        "skipped_files": 0,
+        "reprocessed_files": 0,
+        "failed_files": 0,
+        "recomputed_articles": 0,
+        "kept_articles": 0
+    }
+
+    checkpoint = ReprocessCheckpoint(os.path.join(output_dir, "reprocess_state.sqlite"))
+    output_paths = []
+    pending = []
+    for filename, file_path in sorted(processor._list_input_files()):
+        stats["total_files"] += 1
+        output_path = os.path.join(output_dir, f"processed_{filename}")
+        output_paths.append(output_path)
+        signature = processor._input_signature(file_path)
+        if os.path.exists(output_path) and checkpoint.is_done(filename, version, signature):
+            stats["skipped_files"] += 1
+            continue
+        pending.append((filename, file_path, output_path, signature))
+
+    logger.info(f"Retraitement (version {version}): {len(pending)} fichiers à vérifier, "
+                f"{stats['skipped_files']} déjà à jour")
+
+    def finish(filename: str, output_path: str, signature: str, merged: List[Any], recomputed: int):
+        records = [article for article in merged if isinstance(article, ArticleRecord)]
+        if recomputed or not os.path.exists(output_path):
+            processor._assign_topics(records)
+            # Écriture atomique: une interruption ou une erreur ne laisse jamais de sortie tronquée
+            _write_output(merged, output_path)
+            processor._index_processed_data(records)
+        # Point de reprise enregistré seulement une fois la sortie en place
+        checkpoint.mark_done(filename, version, signature, len(merged), recomputed)
+        stats["reprocessed_files"] += 1
+        stats["recomputed_articles"] += recomputed
+        stats["kept_articles"] += len(merged) - recomputed
+        logger.debug(f"Fichier retraité: {filename} ({recomputed}/{len(merged)} articles recalculés)")
+
+    progress = StageProgress("Retraitement", total=len(pending), logger=logger)
+    try:
+        # Les messages des workers sont écrits par le processus principal
+        with LogListener() as log_listener, concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers, **worker_initializer(init_worker_logging, log_listener.initargs)) as executor:
+            # Fenêtre bornée de fichiers en vol: la mémoire ne dépend pas du nombre de fichiers
+            queue = list(reversed(pending))
+            futures = {}
+            while queue or futures:
+                while queue and len(futures) < max_workers * 2:
+                    filename, file_path, output_path, signature = queue.pop()
+                    future = executor.submit(processor.reprocess_file, file_path, output_path)
+                    futures[future] = (filename, output_path, signature)
+                done, _ = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    filename, output_path, signature = futures.pop(future)
+                    merged = []
+                    try:
+                        merged, recomputed = future.result()
+                        finish(filename, output_path, signature, merged, recomputed)
+                    except Exception as e:
+                        stats["failed_files"] += 1
+                        logger.error(f"Erreur lors du retraitement du fichier {filename}: {e}")
+                    progress.update(len(merged))
+    finally:
+        progress.close()
+        checkpoint.close()
+
+    # Fichiers combinés reconstruits à partir des sorties par fichier
+    existing = [path for path in output_paths if os.path.exists(path)]
+    if existing:
+        combined_json_path = os.path.join(output_dir, "all_processed_data.json")
+        _write_combined(existing, combined_json_path)
+        if save_csv:
+            with open(combined_json_path, "r", encoding="utf-8") as f:
+                processor.save_to_csv(json.load(f), os.path.join(output_dir, "all_processed_data.csv"))
+
+    return stats
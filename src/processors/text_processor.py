@@ -1,21 +1,52 @@
 import json
 import os
 import re
+import html
+import time
+import hashlib
 import logging
-from typing import Dict, List, Any, Set, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple
 from datetime import datetime
 from bs4 import BeautifulSoup
 import pandas as pd
 import concurrent.futures
-from urllib.parse import urljoin
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from .link_graph import LinkGraph
+from .keyword_engine import KeywordEngine, SCIPY_AVAILABLE
+from .topic_clusters import get_topic_clusterer
+from .entities import get_entity_extractor
+from .entity_index import EntityIndex
+from .language import get_detector, get_language_resources, RESOURCES_PATH, NLTK_AVAILABLE
+from .article_record import ArticleRecord, Link, shared_link, intern_text, to_serializable, as_dicts
+from ..utils.url_utils import canonicalize_url
+from ..utils.raw_archive import RawArchive, ARCHIVE_SCHEME
+from ..utils.logging_utils import LogListener, StageProgress, init_worker_logging
+from ..utils.profiling import stage, worker_initializer
+from ..utils.relevance import DEFAULT_RELEVANCE_PATH, get_relevance_filter
+from ..reports.report_engine import ReportEngine
+from ..alerts.watchlist import DEFAULT_WATCHLIST_PATH, get_watchlist_engine
+
 logger = logging.getLogger("TextProcessor")
 
+# Version de la logique de traitement: à incrémenter à chaque changement du nettoyage
+# ou de l'enrichissement des articles (les sorties existantes deviennent obsolètes)
+PROCESSOR_VERSION = 2
+
+# Traitement allégé: balises et espaces retirés par expression régulière
+_TAGS = re.compile(r"<[^>]*>")
+_SPACES = re.compile(r"\s+")
+
+def _strip_tags(text: Any) -> Optional[str]:
+    """Texte sans balises ni entités HTML, espaces réduits (sans analyse du document)"""
+    if not isinstance(text, str):
+        return None
+    if "<" in text:
+        text = _TAGS.sub(" ", text)
+    if "&" in text:
+        text = html.unescape(text)
+    return _SPACES.sub(" ", text).strip()
+
+
 class TextProcessor:
     """
     Processeur de texte pour les données collectées avec fonctionnalités améliorées:
@@ -24,50 +55,100 @@ class TextProcessor:
     - Préparation pour la vectorisation
     """
     
-    def __init__(self, input_dir: str = "data/raw", output_dir: str = "data/processed"):
+    def __init__(self, input_dir: str = "data/raw", output_dir: str = "data/processed",
+                 build_link_graph: bool = True, tfidf_keywords: bool = True, keep_raw_html: bool = True,
+                 build_reports: bool = True, topic_vectorizer: Optional[str] = "tfidf", extract_entities: bool = True,
+                 relevance_path: Optional[str] = DEFAULT_RELEVANCE_PATH,
+                 watchlist_path: Optional[str] = DEFAULT_WATCHLIST_PATH):
         """
         Initialise le processeur
         
         Args:
             input_dir (str): Répertoire d'entrée contenant les données brutes
             output_dir (str): Répertoire de sortie pour les données traitées
+            build_link_graph (bool): Alimenter le graphe de liens du corpus
+            tfidf_keywords (bool): Classer les mots-clés par TF-IDF sur le corpus (nécessite scipy)
+            keep_raw_html (bool): Conserver le HTML brut (content, summary) dans les données traitées
+            build_reports (bool): Alimenter les agrégats des rapports (par catégorie et par jour)
+            topic_vectorizer (Optional[str]): Vectorisation du regroupement en thèmes ("tfidf",
+                "embeddings"), None pour ne pas regrouper
+            extract_entities (bool): Extraire les entités (CVE, FIPS, SP 800, RFC, algorithmes)
+                et alimenter l'index entité -> articles
+            relevance_path (Optional[str]): Configuration du préfiltre de pertinence (traitement
+                allégé des articles hors sujet), None pour tout traiter complètement
+            watchlist_path (Optional[str]): Liste de surveillance des alertes, None pour
+                ne pas envoyer d'alertes
         """
         self.input_dir = input_dir
         self.output_dir = output_dir
+        self.link_graph_path = os.path.join(output_dir, "link_graph.sqlite") if build_link_graph else None
+        self.keyword_df_path = (os.path.join(output_dir, "keyword_df.sqlite")
+                                if tfidf_keywords and SCIPY_AVAILABLE else None)
+        self.report_db_path = os.path.join(output_dir, "report_buckets.sqlite") if build_reports else None
+        self.topic_db_path = os.path.join(output_dir, "topic_clusters.sqlite") if topic_vectorizer else None
+        self.topic_vectorizer = topic_vectorizer
+        self.entity_index_path = os.path.join(output_dir, "entity_index.sqlite") if extract_entities else None
+        self.relevance_path = relevance_path
+        self.watchlist_path = watchlist_path
+        self.keep_raw_html = keep_raw_html
+        self.processor_version = self._compute_processor_version()
         self._ensure_output_dir()
     
+    def _compute_processor_version(self) -> str:
+        """
+        Version des sorties: version du code et empreinte de la configuration
+        
+        Returns:
+            str: Version de la forme "{PROCESSOR_VERSION}-{empreinte}"
+        """
+        with open(RESOURCES_PATH, "rb") as f:
+            resources_hash = hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+        relevance_filter = get_relevance_filter(self.relevance_path)
+        config = {
+            "keep_raw_html": self.keep_raw_html,
+            "tfidf_keywords": self.keyword_df_path is not None,
+            "topics": self.topic_vectorizer,
+            "relevance": relevance_filter.fingerprint if relevance_filter else None,
+            "entities": get_entity_extractor().fingerprint if self.entity_index_path else None,
+            "language_resources": resources_hash,
+            "stemming": NLTK_AVAILABLE
+        }
+        digest = hashlib.blake2b(json.dumps(config, sort_keys=True).encode("utf-8"), digest_size=4).hexdigest()
+        return f"{PROCESSOR_VERSION}-{digest}"
+    
     def _ensure_output_dir(self):
         """Crée le répertoire de sortie s'il n'existe pas"""
         os.makedirs(self.output_dir, exist_ok=True)
     
-    def _clean_html(self, html_content: str) -> Tuple[str, List[Dict[str, str]]]:
+    def _clean_html(self, html_content: str, base_url: str = None) -> Tuple[str, Tuple[Link, ...]]:
         """
         Nettoie le HTML et extrait les liens
         
         Args:
             html_content (str): Contenu HTML à nettoyer
+            base_url (str): URL de l'article, pour résoudre les liens relatifs
             
         Returns:
-            Tuple[str, List[Dict[str, str]]]: 
+            Tuple[str, Tuple[Link, ...]]: 
                 - Texte nettoyé
-                - Liste de liens extraits avec leur texte et URL
+                - Liens extraits (URL, texte)
         """
         if not html_content:
-            return "", []
+            return "", ()
         
         # Utiliser BeautifulSoup pour un nettoyage HTML plus robuste
         try:
             soup = BeautifulSoup(html_content, 'html.parser')
             
-            # Extraire les liens avant de nettoyer le texte
+            # Extraire les liens avant de nettoyer le texte (URLs résolues et canoniques)
             links = []
+            seen_urls = set()
             for a_tag in soup.find_all('a', href=True):
-                link_text = a_tag.get_text().strip()
-                href = a_tag['href']
-                links.append({
-                    "text": link_text, 
-                    "url": href
-                })
+                url = canonicalize_url(a_tag['href'], base_url)
+                if not url or url in seen_urls:
+                    continue
+                seen_urls.add(url)
+                links.append(shared_link(url, a_tag.get_text().strip()))
             
             # Extraire le texte
             text = soup.get_text(separator=' ', strip=True)
@@ -76,21 +157,22 @@ class TextProcessor:
             text = re.sub(r'\s+', ' ', text)
             text = text.strip()
             
-            return text, links
+            return text, tuple(links)
             
         except Exception as e:
             logger.error(f"Erreur lors du nettoyage HTML: {e}")
             # Fallback au nettoyage par regex en cas d'erreur
             clean_text = re.sub(r'<[^>]+>', ' ', html_content)
             clean_text = re.sub(r'\s+', ' ', clean_text)
-            return clean_text.strip(), []
+            return clean_text.strip(), ()
     
-    def _clean_text(self, text: str) -> str:
+    def _clean_text(self, text: str, language: str = None) -> str:
         """
         Nettoie un texte (sans balises HTML)
         
         Args:
             text (str): Texte à nettoyer
+            language (str): Langue du texte (caractères conservés propres à la langue)
             
         Returns:
             str: Texte nettoyé
@@ -105,43 +187,37 @@ class TextProcessor:
         text = re.sub(r'\s+', ' ', text)
         
         # Supprimer les caractères spéciaux inutiles
-        text = re.sub(r'[^\w\s.,;:!?\(\)\[\]\'\"«»]', '', text)
+        text = get_language_resources(language).clean(text)
         
         return text.strip()
     
-    def _extract_keywords(self, text: str, max_keywords: int = 10) -> List[str]:
+    def _extract_keywords(self, text: str, max_keywords: int = 10, language: str = None) -> List[str]:
         """
         Extrait des mots-clés à partir du texte (simple implémentation)
         
         Args:
             text (str): Texte d'entrée
             max_keywords (int): Nombre maximum de mots-clés à extraire
+            language (str): Langue du texte (mots communs, tokenisation et racinisation)
             
         Returns:
             List[str]: Liste de mots-clés
         """
         if not text:
             return []
-            
-        # Conversion en minuscules et tokenisation basique
-        words = re.findall(r'\b\w{3,}\b', text.lower())
         
-        # Filtrer les mots communs (stop words) - liste minimaliste
-        stop_words = {'le', 'la', 'les', 'un', 'une', 'des', 'et', 'ou', 'pour', 'par', 'sur', 'dans', 'en', 'qui', 'que', 'quoi',
-                     'dont', 'avec', 'sans', 'the', 'a', 'an', 'of', 'to', 'in', 'for', 'on', 'at', 'from', 'by', 'with'}
-        filtered_words = [w for w in words if w not in stop_words]
+        resources = get_language_resources(language)
         
-        # Compter les occurrences
+        # Tokenisation et racinisation; les mots communs donnent une racine vide
         word_counts = {}
-        for word in filtered_words:
-            if word in word_counts:
-                word_counts[word] += 1
-            else:
-                word_counts[word] = 1
+        for word in resources.tokenize(text):
+            term = resources.term(word)
+            if term:
+                word_counts[term] = word_counts.get(term, 0) + 1
         
         # Trier par fréquence et retourner les plus fréquents
         sorted_words = sorted(word_counts.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, _ in sorted_words[:max_keywords]]
+        return [resources.surface.get(term, term) for term, _ in sorted_words[:max_keywords]]
     
     def process_article(self, article: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -153,48 +229,154 @@ class TextProcessor:
         Returns:
             Dict[str, Any]: Article traité
         """
-        processed = article.copy()
-        extracted_links = []
+        record = self.process_record(article)
+        self._rank_keywords([record])
+        return record.to_dict()
+    
+    def process_record(self, article: Dict[str, Any], processed_at: Optional[str] = None) -> ArticleRecord:
+        """
+        Traite un article vers sa représentation compacte
+        
+        Args:
+            article (Dict[str, Any]): Article à traiter
+            processed_at (Optional[str]): Date de traitement, partagée par les articles d'un lot
+            
+        Returns:
+            ArticleRecord: Article traité
+        """
+        record = ArticleRecord(article, self.keep_raw_html)
+        
+        # Article hors sujet (préfiltre): traitement allégé
+        record.relevance, cheap = self._relevance(article)
+        if cheap:
+            return self._process_cheap(record, processed_at)
+        
+        base_url = record.link or record.url
+        all_links = ()
         
         # Traitement du contenu
-        if "content" in processed:
-            clean_content, content_links = self._clean_html(processed["content"])
-            processed["cleaned_content"] = clean_content
-            processed["content_links"] = content_links
-            extracted_links.extend(content_links)
+        if "content" in article:
+            record.cleaned_content, record.content_links = self._clean_html(record.content, base_url)
+            all_links = record.content_links
         
         # Traitement du résumé
-        if "summary" in processed:
-            clean_summary, summary_links = self._clean_html(processed["summary"])
-            processed["cleaned_summary"] = clean_summary
-            processed["summary_links"] = summary_links
+        if "summary" in article:
+            record.cleaned_summary, record.summary_links = self._clean_html(record.summary, base_url)
             
-            # Ajouter des liens qui ne sont pas déjà dans le contenu
-            for link in summary_links:
-                if link not in extracted_links:
-                    extracted_links.append(link)
+            # Ajouter des liens qui ne sont pas déjà dans le contenu (tuple partagé sinon)
+            seen_urls = {url for url, _ in all_links}
+            extra_links = tuple(link for link in record.summary_links if link[0] not in seen_urls)
+            if extra_links:
+                all_links = all_links + extra_links if all_links else record.summary_links
+        
+        # Le HTML brut n'est plus nécessaire une fois nettoyé
+        record.drop_raw_html()
+        
+        # Identification de la langue (contenu, à défaut résumé ou titre)
+        language = intern_text(get_detector().detect(
+            record.cleaned_content or record.cleaned_summary or record.title))
+        record.language = language
         
         # Normalisation du texte pour la vectorisation
-        if "cleaned_content" in processed:
-            # Utilisé pour la vectorisation
-            processed["normalized_text"] = self._clean_text(processed["cleaned_content"])
+        if record.cleaned_content is not None:
+            # Utilisé pour la vectorisation (chaîne partagée si le nettoyage ne change rien)
+            normalized_text = self._clean_text(record.cleaned_content, language)
+            record.normalized_text = record.cleaned_content if normalized_text == record.cleaned_content else normalized_text
             
-            # Extraire des mots-clés
-            processed["keywords"] = self._extract_keywords(processed["normalized_text"])
+            # Extraire des mots-clés (classés par TF-IDF sur le lot, cf. process_articles)
+            if not self.keyword_df_path:
+                record.keywords = tuple(self._extract_keywords(record.normalized_text, language=language))
+        
+        # Entités nommées (identifiants normalisés, algorithmes), dans le worker; le résumé
+        # RSS est lu aussi: un identifiant peut n'y figurer que lui
+        if self.entity_index_path:
+            record.entities = get_entity_extractor().extract(
+                record.title, record.cleaned_content, record.cleaned_summary)
         
         # S'assurer qu'il y a un champ "title" nettoyé
-        if "title" in processed and processed["title"]:
-            processed["cleaned_title"] = self._clean_text(processed["title"])
+        if record.title:
+            cleaned_title = self._clean_text(record.title, language)
+            record.cleaned_title = record.title if cleaned_title == record.title else cleaned_title
         
         # Conserver tous les liens extraits
-        processed["all_links"] = extracted_links
+        record.all_links = all_links
         
         # Ajouter des métadonnées
-        processed["processed_at"] = datetime.now().isoformat()
+        record.processed_at = processed_at or datetime.now().isoformat()
+        record.processor_version = self.processor_version
+        
+        return record
+    
+    def _relevance(self, article: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Pertinence d'un article: marquage de la collecte, sinon évaluée ici
+        
+        Args:
+            article (Dict[str, Any]): Article brut
+            
+        Returns:
+            Tuple[Optional[Dict[str, Any]], bool]: Champ "relevance" (None si la catégorie
+                n'est pas filtrée) et choix du traitement allégé
+        """
+        relevance = article.get("relevance")
+        relevance_filter = get_relevance_filter(self.relevance_path)
+        rule = relevance_filter.rule_for(article.get("category")) if relevance_filter else None
+        if rule is None:
+            return relevance, False
+        if not isinstance(relevance, dict):
+            relevance = relevance_filter.score_article(article).as_dict()
+        # "drop" s'applique à la collecte; un article déjà collecté est traité comme "cheap"
+        return relevance, not relevance.get("relevant", True) and rule.action != "tag"
+    
+    def _process_cheap(self, record: ArticleRecord, processed_at: Optional[str] = None) -> ArticleRecord:
+        """
+        Traitement allégé d'un article hors sujet
+        
+        Texte sans balises (expression régulière, sans BeautifulSoup), langue du
+        titre et du début du résumé, entités; ni liens, ni normalisation, ni
+        mots-clés (l'article n'entre donc pas dans le TF-IDF ni dans les thèmes).
         
-        return processed
+        Args:
+            record (ArticleRecord): Article à traiter (modifié en place)
+            processed_at (Optional[str]): Date de traitement, partagée par les articles d'un lot
+            
+        Returns:
+            ArticleRecord: Article traité
+        """
+        if record.content is not None:
+            record.cleaned_content = _strip_tags(record.content)
+        if record.summary is not None:
+            record.cleaned_summary = _strip_tags(record.summary)
+        record.drop_raw_html()
+        
+        record.language = intern_text(get_detector().detect(
+            f"{record.title or ''} {(record.cleaned_summary or record.cleaned_content or '')[:300]}"))
+        record.cleaned_title = record.title
+        if self.entity_index_path:
+            record.entities = get_entity_extractor().extract(
+                record.title, record.cleaned_content, record.cleaned_summary)
+        record.processed_at = processed_at or datetime.now().isoformat()
+        record.processor_version = self.processor_version
+        return record
     
-    def process_file(self, file_path: str) -> List[Dict[str, Any]]:
+    @stage("clean")
+    def process_articles(self, articles: List[Dict[str, Any]]) -> List[ArticleRecord]:
+        """
+        Traite un lot d'articles, mots-clés TF-IDF compris
+        
+        Args:
+            articles (List[Dict[str, Any]]): Articles à traiter
+            
+        Returns:
+            List[ArticleRecord]: Articles traités (cf. ArticleRecord.to_dict)
+        """
+        # Une seule date de traitement par lot
+        processed_at = datetime.now().isoformat()
+        records = [self.process_record(article, processed_at) for article in articles]
+        self._rank_keywords(records)
+        return records
+    
+    def process_file(self, file_path: str) -> List[ArticleRecord]:
         """
         Traite un fichier de données
         
@@ -202,50 +384,288 @@ class TextProcessor:
             file_path (str): Chemin du fichier à traiter
             
         Returns:
-            List[Dict[str, Any]]: Liste des articles traités
+            List[ArticleRecord]: Liste des articles traités
         """
         try:
-            logger.info(f"Traitement du fichier: {file_path}")
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            logger.debug(f"Traitement du fichier: {file_path}")
+            data = self._read_input(file_path)
                 
-            processed_data = []
-            for article in data:
-                processed = self.process_article(article)
-                processed_data.append(processed)
+            processed_data = self.process_articles(data)
                 
-            logger.info(f"Fichier traité avec succès: {len(processed_data)} articles")
+            logger.debug(f"Fichier traité avec succès: {len(processed_data)} articles")
             return processed_data
         except Exception as e:
             logger.error(f"Erreur lors du traitement du fichier {file_path}: {e}")
             return []
     
-    def save_to_json(self, data: List[Dict[str, Any]], output_path: str) -> None:
+    def _process_file_timed(self, file_path: str) -> Tuple[List[ArticleRecord], float]:
+        """
+        Traite un fichier dans un worker et mesure la durée du traitement
+        
+        Args:
+            file_path (str): Chemin du fichier à traiter
+            
+        Returns:
+            Tuple[List[ArticleRecord], float]: Articles traités et durée (secondes)
+        """
+        start = time.perf_counter()
+        processed_data = self.process_file(file_path)
+        return processed_data, time.perf_counter() - start
+    
+    def _save_processed_file(self, filename: str, processed_data: List[ArticleRecord],
+                             progress: StageProgress) -> None:
+        """
+        Affecte les thèmes, sauvegarde et indexe les articles traités d'un fichier
+        
+        Appelé dans le processus principal (les mots-clés sont classés dans les
+        workers); la durée de chaque étape est cumulée dans la progression.
+        
+        Args:
+            filename (str): Nom du fichier brut
+            processed_data (List[ArticleRecord]): Articles traités
+            progress (StageProgress): Progression du traitement
+        """
+        count = len(processed_data)
+        output_filename = f"processed_{filename}"
+        
+        start = time.perf_counter()
+        self._assign_topics(processed_data)
+        assigned = time.perf_counter()
+        self.save_to_json(processed_data, os.path.join(self.output_dir, output_filename))
+        saved = time.perf_counter()
+        self._index_processed_data(processed_data)
+        indexed = time.perf_counter()
+        
+        progress.add_stage_time("thèmes", assigned - start, count)
+        progress.add_stage_time("écriture", saved - assigned, count)
+        progress.add_stage_time("index", indexed - saved, count)
+        logger.debug(f"Fichier traité: {filename} -> {output_filename} ({count} articles)")
+    
+    def reprocess_file(self, file_path: str, output_path: str) -> Tuple[List[Any], int]:
+        """
+        Retraite un fichier en ne recalculant que les articles dont la version est obsolète
+        
+        Args:
+            file_path (str): Chemin du fichier brut (ou unité d'archive)
+            output_path (str): Sortie existante du fichier
+            
+        Returns:
+            Tuple[List[Any], int]: Articles (dictionnaires conservés ou ArticleRecord recalculés)
+                et nombre d'articles recalculés
+        """
+        existing = {}
+        if os.path.exists(output_path):
+            try:
+                with open(output_path, "r", encoding="utf-8") as f:
+                    for i, article in enumerate(json.load(f)):
+                        existing[article.get("link") or article.get("url") or f"#{i}"] = article
+            except Exception as e:
+                # Sortie interrompue ou illisible: tout est recalculé
+                logger.warning(f"Sortie illisible, retraitement complet de {output_path}: {e}")
+        
+        merged = []
+        records = []
+        for i, article in enumerate(self._read_input(file_path)):
+            current = existing.get(article.get("link") or article.get("url") or f"#{i}")
+            if current is not None and current.get("processor_version") == self.processor_version:
+                merged.append(current)
+            else:
+                record = self.process_record(article)
+                merged.append(record)
+                records.append(record)
+        self._rank_keywords(records)
+        return merged, len(records)
+    
+    @stage("parse")
+    def _read_input(self, file_path: str) -> List[Dict[str, Any]]:
+        """
+        Lit les articles bruts d'un fichier JSON ou d'une unité d'archive
+        
+        Args:
+            file_path (str): Chemin du fichier ou unité archive://
+            
+        Returns:
+            List[Dict[str, Any]]: Articles bruts
+        """
+        if file_path.startswith(ARCHIVE_SCHEME):
+            return self._read_archive_unit(file_path)
+        with open(file_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    
+    def _input_signature(self, file_path: str) -> str:
+        """
+        Empreinte d'une entrée brute: change quand son contenu change
+        
+        Args:
+            file_path (str): Chemin du fichier ou unité archive://
+            
+        Returns:
+            str: Taille et date de modification, ou nombre d'enregistrements de l'unité d'archive
+        """
+        if file_path.startswith(ARCHIVE_SCHEME):
+            collector_type, group = file_path[len(ARCHIVE_SCHEME):].split("/")
+            with RawArchive(os.path.join(self.input_dir, "archive")) as archive:
+                return f"records:{archive.count(collector_type, int(group))}"
+        stat = os.stat(file_path)
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+    
+    def _read_archive_unit(self, unit: str) -> List[Dict[str, Any]]:
+        """
+        Lit une unité de l'archive brute (un type de collecteur dans un groupe de blocs)
+        
+        Args:
+            unit (str): Unité de la forme archive://{type}/{groupe}
+            
+        Returns:
+            List[Dict[str, Any]]: Enregistrements bruts
+        """
+        collector_type, group = unit[len(ARCHIVE_SCHEME):].split("/")
+        with RawArchive(os.path.join(self.input_dir, "archive")) as archive:
+            return list(archive.iter_records(collector_type, int(group)))
+    
+    def _list_input_files(self) -> List[Tuple[str, str]]:
+        """
+        Liste les entrées à traiter: fichiers JSON bruts et segments de l'archive
+        
+        Returns:
+            List[Tuple[str, str]]: Couples (nom de l'entrée, chemin ou unité d'archive)
+        """
+        archive_dir = os.path.join(self.input_dir, "archive")
+        if not RawArchive.exists(archive_dir):
+            return [(f, os.path.join(self.input_dir, f))
+                    for f in os.listdir(self.input_dir) if f.endswith(".json")]
+        
+        with RawArchive(archive_dir) as archive:
+            # Les fichiers compactés (conservés par défaut) sont lus dans l'archive
+            compacted = archive.compacted_files(self.input_dir)
+            inputs = [(f, os.path.join(self.input_dir, f))
+                      for f in os.listdir(self.input_dir) if f.endswith(".json") and f not in compacted]
+            for collector_type, group in archive.units():
+                inputs.append((f"{collector_type}_archive_{group:06d}.json",
+                               f"{ARCHIVE_SCHEME}{collector_type}/{group}"))
+        return inputs
+    
+    @stage("keyword")
+    def _rank_keywords(self, processed_data: List[ArticleRecord]) -> None:
+        """
+        Calcule les mots-clés d'un lot d'articles traités par TF-IDF
+        
+        Appelé dans les workers, une fois par lot: la fréquence documentaire du
+        corpus (base SQLite partagée) est mise à jour avec les nouveaux articles du lot.
+        
+        Args:
+            processed_data (List[ArticleRecord]): Articles traités (modifiés en place)
+        """
+        if not self.keyword_df_path:
+            return
+        articles = [article for article in processed_data if article.normalized_text is not None]
+        if not articles:
+            return
+        try:
+            with KeywordEngine(self.keyword_df_path) as engine:
+                keywords = engine.extract_batch(
+                    [article.normalized_text for article in articles],
+                    [article.link or article.url for article in articles],
+                    [article.language for article in articles])
+            for article, article_keywords in zip(articles, keywords):
+                article.keywords = tuple(article_keywords)
+        except Exception as e:
+            logger.error(f"Erreur lors du classement TF-IDF des mots-clés: {e}")
+            for article in articles:
+                article.keywords = tuple(self._extract_keywords(article.normalized_text,
+                                                                language=article.language))
+    
+    @stage("keyword")
+    def _assign_topics(self, processed_data: List[ArticleRecord]) -> None:
+        """
+        Affecte chaque article traité à un thème (regroupement incrémental)
+        
+        Appelé dans le processus principal, après le classement des mots-clés (qui
+        servent de libellés aux thèmes).
+        
+        Args:
+            processed_data (List[ArticleRecord]): Articles traités (modifiés en place)
+        """
+        if not self.topic_db_path:
+            return
+        try:
+            topics = get_topic_clusterer(self.topic_db_path, self.topic_vectorizer).assign(processed_data)
+            for article, topic in zip(processed_data, topics):
+                if topic is not None:
+                    article.topic_id, article.topic_label = topic
+        except Exception as e:
+            logger.error(f"Erreur lors du regroupement en thèmes: {e}")
+    
+    def _index_processed_data(self, processed_data: List[ArticleRecord]) -> None:
+        """
+        Met à jour les index du corpus avec un lot d'articles traités, puis envoie
+        les alertes de la liste de surveillance (une seule fois par article, même
+        déjà signalé à la collecte)
+        
+        Appelé dans le processus principal, une fois par fichier traité.
+        
+        Args:
+            processed_data (List[ArticleRecord]): Articles traités
+        """
+        if self.link_graph_path:
+            try:
+                with LinkGraph(self.link_graph_path) as graph:
+                    graph.add_articles(
+                        (article.link or article.url or "",
+                         [url for url, _ in article.all_links or ()])
+                        for article in processed_data
+                    )
+            except Exception as e:
+                logger.error(f"Erreur lors de la mise à jour du graphe de liens: {e}")
+        if self.report_db_path:
+            try:
+                with ReportEngine(self.report_db_path) as engine:
+                    engine.add_articles(processed_data)
+            except Exception as e:
+                logger.error(f"Erreur lors de la mise à jour des agrégats de rapports: {e}")
+        if self.entity_index_path:
+            try:
+                with EntityIndex(self.entity_index_path) as index:
+                    index.add_articles(processed_data)
+            except Exception as e:
+                logger.error(f"Erreur lors de la mise à jour de l'index des entités: {e}")
+        engine = get_watchlist_engine(self.watchlist_path)
+        if engine is not None:
+            try:
+                with stage("alert"):
+                    engine.process(processed_data)
+            except Exception as e:
+                logger.error(f"Erreur lors de la recherche des termes surveillés: {e}")
+    
+    @stage("serialize")
+    def save_to_json(self, data: List[Any], output_path: str) -> None:
         """
         Sauvegarde les données au format JSON
         
         Args:
-            data (List[Dict[str, Any]]): Données à sauvegarder
+            data (List[Any]): Données à sauvegarder (dictionnaires ou ArticleRecord)
             output_path (str): Chemin de sortie
         """
         try:
             with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            logger.info(f"Données sauvegardées au format JSON: {output_path}")
+                # Les ArticleRecord sont convertis un par un pendant l'écriture
+                json.dump(data, f, ensure_ascii=False, indent=2, default=to_serializable)
+            logger.debug(f"Données sauvegardées au format JSON: {output_path}")
         except Exception as e:
             logger.error(f"Erreur lors de la sauvegarde JSON: {e}")
     
-    def save_to_csv(self, data: List[Dict[str, Any]], output_path: str) -> None:
+    @stage("serialize")
+    def save_to_csv(self, data: List[Any], output_path: str) -> None:
         """
         Sauvegarde les données au format CSV
         
         Args:
-            data (List[Dict[str, Any]]): Données à sauvegarder
+            data (List[Any]): Données à sauvegarder (dictionnaires ou ArticleRecord)
             output_path (str): Chemin de sortie
         """
         try:
             # Convertir en DataFrame
-            df = pd.DataFrame(data)
+            df = pd.DataFrame(as_dicts(data))
             
             # Convertir les colonnes contenant des listes/dictionnaires en JSON
             for col in df.columns:
@@ -278,23 +698,18 @@ class TextProcessor:
         
         all_processed_data = []
         
-        # Liste des fichiers JSON dans le répertoire d'entrée
-        for filename in os.listdir(self.input_dir):
-            if not filename.endswith(".json"):
-                continue
-                
+        # Liste des fichiers JSON (et segments d'archive) du répertoire d'entrée
+        input_files = self._list_input_files()
+        progress = StageProgress("Traitement", total=len(input_files), logger=logger)
+        for filename, file_path in input_files:
             stats["total_files"] += 1
             
-            file_path = os.path.join(self.input_dir, filename)
-            processed_data = self.process_file(file_path)
+            processed_data, seconds = self._process_file_timed(file_path)
+            progress.add_stage_time("traitement", seconds, len(processed_data))
             
             if processed_data:
-                # Création du nom de fichier de sortie
-                output_filename = f"processed_{filename}"
-                output_path = os.path.join(self.output_dir, output_filename)
-                
                 # Sauvegarde des données traitées au format JSON
-                self.save_to_json(processed_data, output_path)
+                self._save_processed_file(filename, processed_data, progress)
                 
                 # Mettre à jour les statistiques
                 stats["processed_files"] += 1
@@ -308,8 +723,9 @@ class TextProcessor:
                 
                 # Ajouter à la liste complète
                 all_processed_data.extend(processed_data)
-                
-                logger.info(f"Fichier traité: {filename} -> {output_filename} ({len(processed_data)} articles)")
+            
+            progress.update(len(processed_data))
+        stats["throughput"] = progress.close()
         
         # Sauvegarder toutes les données traitées dans un seul fichier
         if all_processed_data:
@@ -341,33 +757,33 @@ class TextProcessor:
             "rss_articles": 0
         }
         
-        # Liste des fichiers JSON dans le répertoire d'entrée
-        json_files = [f for f in os.listdir(self.input_dir) if f.endswith(".json")]
+        # Liste des fichiers JSON (et segments d'archive) du répertoire d'entrée
+        json_files = self._list_input_files()
         stats["total_files"] = len(json_files)
         
         all_processed_data = []
         
-        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Les messages des workers sont écrits par le processus principal
+        progress = StageProgress("Traitement", total=len(json_files), logger=logger)
+        with LogListener() as log_listener, concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers, **worker_initializer(init_worker_logging, log_listener.initargs)) as executor:
             futures = {}
             
             # Soumettre les tâches
-            for filename in json_files:
-                file_path = os.path.join(self.input_dir, filename)
-                futures[executor.submit(self.process_file, file_path)] = filename
+            for filename, file_path in json_files:
+                futures[executor.submit(self._process_file_timed, file_path)] = filename
             
             # Traiter les résultats
             for future in concurrent.futures.as_completed(futures):
                 filename = futures[future]
+                processed_data = []
                 try:
-                    processed_data = future.result()
+                    processed_data, seconds = future.result()
+                    progress.add_stage_time("traitement (par worker)", seconds, len(processed_data))
                     
                     if processed_data:
-                        # Création du nom de fichier de sortie
-                        output_filename = f"processed_{filename}"
-                        output_path = os.path.join(self.output_dir, output_filename)
-                        
                         # Sauvegarde des données traitées au format JSON
-                        self.save_to_json(processed_data, output_path)
+                        self._save_processed_file(filename, processed_data, progress)
                         
                         # Mettre à jour les statistiques
                         stats["processed_files"] += 1
@@ -381,11 +797,11 @@ class TextProcessor:
                         
                         # Ajouter à la liste complète
                         all_processed_data.extend(processed_data)
-                        
-                        logger.info(f"Fichier traité: {filename} -> {output_filename} ({len(processed_data)} articles)")
                 
                 except Exception as e:
                     logger.error(f"Erreur lors du traitement du fichier {filename}: {e}")
+                progress.update(len(processed_data))
+        stats["throughput"] = progress.close()
         
         # Sauvegarder toutes les données traitées dans un seul fichier
         if all_processed_data:
@@ -399,7 +815,10 @@ class TextProcessor:
         return stats
 
 def process_all_data(input_dir: str = "data/raw", output_dir: str = "data/processed", 
-                    parallel: bool = True, max_workers: int = 4) -> Dict[str, Any]:
+                    parallel: bool = True, max_workers: int = 4, keep_raw_html: bool = True,
+                    topic_vectorizer: Optional[str] = "tfidf",
+                    relevance_path: Optional[str] = DEFAULT_RELEVANCE_PATH,
+                    extract_entities: bool = True) -> Dict[str, Any]:
     """
     Fonction utilitaire pour traiter toutes les données collectées
     
@@ -408,11 +827,17 @@ def process_all_data(input_dir: str = "data/raw", output_dir: str = "data/proces
         output_dir (str): Répertoire de sortie
         parallel (bool): Utiliser le traitement parallèle
         max_workers (int): Nombre maximum de workers pour le traitement parallèle
+        keep_raw_html (bool): Conserver le HTML brut dans les données traitées
+        topic_vectorizer (Optional[str]): Vectorisation du regroupement en thèmes (None: désactivé)
+        relevance_path (Optional[str]): Configuration du préfiltre de pertinence (None: désactivé)
+        extract_entities (bool): Extraire les entités et alimenter leur index
         
     Returns:
         Dict[str, Any]: Statistiques de traitement
     """
-    processor = TextProcessor(input_dir, output_dir)
+    processor = TextProcessor(input_dir, output_dir, keep_raw_html=keep_raw_html,
+                              topic_vectorizer=topic_vectorizer, relevance_path=relevance_path,
+                              extract_entities=extract_entities)
     
     if parallel:
         return processor.process_files_parallel(max_workers=max_workers)
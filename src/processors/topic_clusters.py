@@ -0,0 +1,562 @@
+import os
+import zlib
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .language import get_language_resources
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    # Sans sentence-transformers, les articles sont représentés par TF-IDF haché
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+logger = logging.getLogger("TopicClusterer")
+
+VECTORIZERS = ("tfidf", "embeddings")
+
+# Dimension des vecteurs TF-IDF hachés (pas de vocabulaire à maintenir)
+HASH_DIM = 1 << 14
+
+# Modèle d'embeddings multilingue (articles en français et en anglais)
+DEFAULT_EMBEDDING_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
+
+# Plancher du taux d'apprentissage: les thèmes suivent la dérive du corpus
+MIN_LEARNING_RATE = 1e-3
+
+# Mots-clés retenus pour le libellé d'un thème
+LABEL_TERMS = 3
+
+Vector = Tuple[Optional[np.ndarray], np.ndarray]
+
+
+def _article_id(key: str) -> int:
+    """Identifiant 64 bits signé d'un article (lien ou URL)"""
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class TopicClusterer:
+    """
+    Regroupement incrémental des articles en thèmes (k-moyennes sphériques)
+
+    Un nouvel article est affecté au centroïde le plus proche (similarité cosinus,
+    O(k) par article) qui est aussitôt déplacé vers lui (k-moyennes en ligne, pas
+    de 1/n). Tant que moins de k thèmes existent, un article éloigné de tous en
+    ouvre un nouveau. Un échantillon réservoir des articles sert à réajuster
+    périodiquement les centroïdes en arrière-plan (itérations partant des
+    centroïdes courants: les identifiants des thèmes restent stables).
+
+    Chaque réajustement ouvre une génération: seuls les articles de l'échantillon
+    sont réaffectés aussitôt (les autres vecteurs ne sont pas conservés); un
+    article affecté lors d'une génération antérieure est réaffecté aux thèmes
+    courants quand il est revu, sans déplacer les centroïdes.
+    """
+
+    def __init__(self, db_path: str, k: int = 24, vectorizer: str = "tfidf",
+                 model_name: str = DEFAULT_EMBEDDING_MODEL, new_topic_threshold: float = 0.25,
+                 refit_every: int = 2000, sample_size: int = 5000, refit_iterations: int = 8,
+                 background: bool = True):
+        """
+        Ouvre (ou crée) l'état du regroupement
+
+        Args:
+            db_path (str): Base SQLite (centroïdes, affectations, échantillon)
+            k (int): Nombre maximal de thèmes
+            vectorizer (str): "tfidf" (TF-IDF haché de normalized_text) ou "embeddings"
+                (sentence-transformers, TF-IDF si le paquet est absent)
+            model_name (str): Modèle d'embeddings
+            new_topic_threshold (float): Similarité en dessous de laquelle un article ouvre un thème
+            refit_every (int): Nouveaux articles entre deux réajustements (0 pour désactiver)
+            sample_size (int): Taille de l'échantillon réservoir
+            refit_iterations (int): Itérations d'un réajustement
+            background (bool): Réajuster dans un thread (sinon de façon synchrone)
+        """
+        if vectorizer not in VECTORIZERS:
+            raise ValueError(f"Vectorisation inconnue: {vectorizer}")
+        if vectorizer == "embeddings" and not SENTENCE_TRANSFORMERS_AVAILABLE:
+            logger.warning("sentence-transformers absent: regroupement sur TF-IDF haché")
+            vectorizer = "tfidf"
+        self.k = k
+        self.vectorizer = vectorizer
+        self.model_name = model_name
+        self.new_topic_threshold = new_topic_threshold
+        self.refit_every = refit_every
+        self.sample_size = sample_size
+        self.refit_iterations = refit_iterations
+        self.background = background
+        self._model = None
+        self._rng = np.random.default_rng()
+        self._lock = threading.RLock()
+        self._refit_thread: Optional[threading.Thread] = None
+        # Poids des mots-clés ajoutés pendant un réajustement (None hors réajustement)
+        self._refit_terms: Optional[Counter] = None
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value
+            );
+            CREATE TABLE IF NOT EXISTS topics (
+                id INTEGER PRIMARY KEY,
+                centroid BLOB NOT NULL,
+                count INTEGER NOT NULL,
+                label TEXT NOT NULL DEFAULT ''
+            );
+            CREATE TABLE IF NOT EXISTS topic_terms (
+                topic_id INTEGER NOT NULL,
+                term TEXT NOT NULL,
+                weight REAL NOT NULL,
+                PRIMARY KEY (topic_id, term)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS assignments (
+                article_id INTEGER PRIMARY KEY,
+                topic_id INTEGER NOT NULL,
+                similarity REAL NOT NULL,
+                generation INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS samples (
+                slot INTEGER PRIMARY KEY,
+                article_id INTEGER NOT NULL,
+                indices BLOB,
+                data BLOB NOT NULL,
+                keywords TEXT NOT NULL
+            );
+        """)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(assignments)")}
+        if "generation" not in columns:
+            # Base créée sans générations: affectations considérées comme de la génération 0
+            with self.conn:
+                self.conn.execute("ALTER TABLE assignments ADD COLUMN generation INTEGER NOT NULL DEFAULT 0")
+        self._load_state()
+
+    def _meta(self, key: str, default: Any = None) -> Any:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, **values: Any):
+        self.conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?) "
+                              "ON CONFLICT(key) DO UPDATE SET value = excluded.value", values.items())
+
+    def _load_state(self):
+        """Charge centroïdes, DF hachée et compteurs (réinitialise si la vectorisation a changé)"""
+        stored = self._meta("vectorizer")
+        if stored is not None and stored != self.vectorizer:
+            logger.warning(f"Vectorisation modifiée ({stored} -> {self.vectorizer}): thèmes réinitialisés")
+            with self.conn:
+                for table in ("meta", "topics", "topic_terms", "assignments", "samples"):
+                    self.conn.execute(f"DELETE FROM {table}")
+        rows = self.conn.execute("SELECT id, centroid, count, label FROM topics ORDER BY id").fetchall()
+        self.centroids = np.stack([np.frombuffer(blob, dtype=np.float32) for _, blob, _, _ in rows]) \
+            if rows else None
+        if self.centroids is not None:
+            self.centroids = self.centroids.copy()
+        self.counts = [count for _, _, count, _ in rows]
+        self.labels = [label for _, _, _, label in rows]
+        df = self._meta("df")
+        self.df = np.frombuffer(df, dtype=np.int64).copy() if df is not None else np.zeros(HASH_DIM, dtype=np.int64)
+        self.documents = int(self._meta("documents", 0))
+        self.documents_seen = int(self._meta("documents_seen", 0))
+        self.since_fit = int(self._meta("since_fit", 0))
+        self.generation = int(self._meta("generation", 0))
+
+    def _save_topics(self, topic_ids: Sequence[int]):
+        self.conn.executemany(
+            "INSERT INTO topics (id, centroid, count, label) VALUES (?, ?, ?, ?) ON CONFLICT(id) DO UPDATE "
+            "SET centroid = excluded.centroid, count = excluded.count, label = excluded.label",
+            [(t, self.centroids[t].tobytes(), self.counts[t], self.labels[t]) for t in topic_ids])
+
+    def _vectorize(self, texts: Sequence[str], languages: Sequence[Optional[str]],
+                   update_df: bool = True) -> List[Vector]:
+        """
+        Vecteurs normalisés des textes: (indices, valeurs) creux pour le TF-IDF haché,
+        (None, vecteur dense) pour les embeddings
+
+        La DF hachée est mise à jour avec les textes (articles jamais vus uniquement:
+        update_df=False pour les articles déjà comptés).
+        """
+        if self.vectorizer == "embeddings":
+            if self._model is None:
+                self._model = SentenceTransformer(self.model_name)
+            dense = self._model.encode(list(texts), batch_size=32, normalize_embeddings=True,
+                                       show_progress_bar=False)
+            return [(None, np.asarray(row, dtype=np.float32)) for row in dense]
+
+        counts = []
+        for text, language in zip(texts, languages):
+            resources = get_language_resources(language)
+            terms = Counter(resources.term(word) for word in resources.tokenize(text))
+            terms.pop("", None)
+            buckets: Dict[int, float] = {}
+            for term, count in terms.items():
+                bucket = zlib.crc32(term.encode("utf-8")) & (HASH_DIM - 1)
+                buckets[bucket] = buckets.get(bucket, 0) + count
+            indices = np.fromiter(buckets.keys(), dtype=np.int64, count=len(buckets))
+            counts.append((indices, np.fromiter(buckets.values(), dtype=np.float32, count=len(buckets))))
+            if update_df:
+                self.df[indices] += 1
+        if update_df:
+            self.documents += len(texts)
+
+        vectors = []
+        for indices, tf in counts:
+            if not len(indices):
+                vectors.append((indices, tf))
+                continue
+            idf = np.log((1.0 + self.documents) / (1.0 + self.df[indices])) + 1.0
+            values = ((1.0 + np.log(tf)) * idf).astype(np.float32)
+            vectors.append((indices, values / np.linalg.norm(values)))
+        return vectors
+
+    def _similarities(self, centroids: np.ndarray, vector: Vector) -> np.ndarray:
+        indices, values = vector
+        return centroids @ values if indices is None else centroids[:, indices] @ values
+
+    def _update_centroid(self, topic: int, vector: Vector):
+        """Déplace un centroïde vers un article (k-moyennes en ligne) et le renormalise"""
+        self.counts[topic] += 1
+        rate = max(1.0 / self.counts[topic], MIN_LEARNING_RATE)
+        centroid = self.centroids[topic]
+        centroid *= 1.0 - rate
+        indices, values = vector
+        if indices is None:
+            centroid += rate * values
+        else:
+            centroid[indices] += rate * values
+        norm = np.linalg.norm(centroid)
+        if norm > 0:
+            centroid /= norm
+
+    def _new_topic(self, vector: Vector) -> int:
+        dim = HASH_DIM if vector[0] is not None else len(vector[1])
+        centroid = np.zeros(dim, dtype=np.float32)
+        if vector[0] is None:
+            centroid[:] = vector[1]
+        else:
+            centroid[vector[0]] = vector[1]
+        self.centroids = centroid[None, :] if self.centroids is None else np.vstack([self.centroids, centroid])
+        self.counts.append(0)
+        self.labels.append("")
+        return len(self.counts) - 1
+
+    def _label(self, topic: int) -> str:
+        rows = self.conn.execute("SELECT term FROM topic_terms WHERE topic_id = ? ORDER BY weight DESC LIMIT ?",
+                                 (topic, LABEL_TERMS)).fetchall()
+        return " / ".join(term for term, in rows)
+
+    def _add_sample(self, slot_count: int, article_id: int, vector: Vector, keywords: Sequence[str]):
+        """Échantillon réservoir uniforme des articles affectés"""
+        if slot_count < self.sample_size:
+            slot = slot_count
+        else:
+            slot = int(self._rng.integers(0, self.documents_seen))
+            if slot >= self.sample_size:
+                return
+        indices, values = vector
+        self.conn.execute(
+            "INSERT OR REPLACE INTO samples (slot, article_id, indices, data, keywords) VALUES (?, ?, ?, ?, ?)",
+            (slot, article_id, indices.astype(np.int32).tobytes() if indices is not None else None,
+             values.tobytes(), "\t".join(keywords or ())))
+
+    def _add_terms(self, term_weights: Counter):
+        self.conn.executemany(
+            "INSERT INTO topic_terms (topic_id, term, weight) VALUES (?, ?, ?) "
+            "ON CONFLICT(topic_id, term) DO UPDATE SET weight = weight + excluded.weight",
+            [(topic, term, weight) for (topic, term), weight in term_weights.items()])
+
+    def _reassign(self, articles: Sequence[Any], stale: List[Tuple[int, int]],
+                  results: List[Optional[Tuple[int, str]]]):
+        """
+        Réaffecte aux thèmes courants des articles affectés avant le dernier réajustement
+
+        Les centroïdes, la DF et l'échantillon ne sont pas modifiés (article déjà compté).
+
+        Args:
+            articles (Sequence[Any]): Articles du lot
+            stale (List[Tuple[int, int]]): Position dans le lot et identifiant des articles
+            results (List[Optional[Tuple[int, str]]]): Résultats du lot (complétés en place)
+        """
+        vectors = self._vectorize([articles[i].get("normalized_text") for i, _ in stale],
+                                  [articles[i].get("language") for i, _ in stale], update_df=False)
+        updates = []
+        for (i, article_id), vector in zip(stale, vectors):
+            if not len(vector[1]):
+                continue
+            similarities = self._similarities(self.centroids, vector)
+            topic = int(np.argmax(similarities))
+            updates.append((topic, float(similarities[topic]), self.generation, article_id))
+            results[i] = (topic, self.labels[topic])
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE assignments SET topic_id = ?, similarity = ?, generation = ? WHERE article_id = ?", updates)
+
+    def assign(self, articles: Sequence[Any]) -> List[Optional[Tuple[int, str]]]:
+        """
+        Affecte un lot d'articles traités à leurs thèmes
+
+        Un article déjà affecté (même lien) garde son thème sans modifier les
+        centroïdes: retraitements et doublons ne déplacent pas les thèmes. S'il a
+        été affecté avant le dernier réajustement, il est réaffecté au thème
+        courant le plus proche (toujours sans déplacer les centroïdes).
+
+        Args:
+            articles (Sequence[Any]): Articles traités (ArticleRecord ou dictionnaires)
+
+        Returns:
+            List[Optional[Tuple[int, str]]]: Identifiant et libellé du thème de chaque
+                article (None sans texte normalisé)
+        """
+        results: List[Optional[Tuple[int, str]]] = [None] * len(articles)
+        with self._lock:
+            keyed = []
+            for i, article in enumerate(articles):
+                text = article.get("normalized_text")
+                if text:
+                    key = article.get("link") or article.get("url") or text[:200]
+                    keyed.append((i, _article_id(key)))
+            known = {}
+            ids = [article_id for _, article_id in keyed]
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                known.update((article_id, (topic, generation)) for article_id, topic, generation in self.conn.execute(
+                    f"SELECT article_id, topic_id, generation FROM assignments "
+                    f"WHERE article_id IN ({','.join('?' * len(chunk))})", chunk))
+
+            pending = []
+            pending_ids = set()
+            stale = []
+            for i, article_id in keyed:
+                if article_id in known:
+                    topic, generation = known[article_id]
+                    if generation < self.generation and self.centroids is not None:
+                        stale.append((i, article_id))
+                    else:
+                        results[i] = (topic, self.labels[topic]) if topic < len(self.labels) else None
+                elif article_id not in pending_ids:
+                    pending.append((i, article_id))
+                    pending_ids.add(article_id)
+            if stale:
+                self._reassign(articles, stale, results)
+            if not pending:
+                return results
+
+            vectors = self._vectorize([articles[i].get("normalized_text") for i, _ in pending],
+                                      [articles[i].get("language") for i, _ in pending])
+            sample_count = self.conn.execute("SELECT COUNT(*) FROM samples").fetchone()[0]
+            assignments = []
+            term_weights: Counter = Counter()
+            touched = set()
+            for (i, article_id), vector in zip(pending, vectors):
+                if not len(vector[1]):
+                    continue
+                if self.centroids is None:
+                    topic, similarity = self._new_topic(vector), 1.0
+                else:
+                    similarities = self._similarities(self.centroids, vector)
+                    topic = int(np.argmax(similarities))
+                    similarity = float(similarities[topic])
+                    if similarity < self.new_topic_threshold and len(self.counts) < self.k:
+                        topic, similarity = self._new_topic(vector), 1.0
+                self._update_centroid(topic, vector)
+                touched.add(topic)
+                keywords = articles[i].get("keywords") or ()
+                for term in keywords:
+                    term_weights[(topic, term)] += 1.0
+                assignments.append((article_id, topic, similarity))
+                self.documents_seen += 1
+                self._add_sample(sample_count, article_id, vector, keywords)
+                sample_count = min(sample_count + 1, self.sample_size)
+                results[i] = topic
+
+            if self._refit_terms is not None:
+                self._refit_terms.update(term_weights)
+            with self.conn:
+                self._add_terms(term_weights)
+                for topic in touched:
+                    self.labels[topic] = self._label(topic)
+                self._save_topics(sorted(touched))
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO assignments (article_id, topic_id, similarity, generation) "
+                    "VALUES (?, ?, ?, ?)", [row + (self.generation,) for row in assignments])
+                self.since_fit += len(assignments)
+                self._set_meta(vectorizer=self.vectorizer, df=self.df.tobytes(), documents=self.documents,
+                               documents_seen=self.documents_seen, since_fit=self.since_fit)
+
+            results = [(r, self.labels[r]) if isinstance(r, int) else r for r in results]
+            refit_due = self.refit_every and self.since_fit >= self.refit_every
+
+        if refit_due:
+            self.refit(wait=not self.background)
+        return results
+
+    def refit(self, wait: bool = True) -> bool:
+        """
+        Réajuste les centroïdes sur l'échantillon réservoir
+
+        Args:
+            wait (bool): Attendre la fin du réajustement (sinon thread d'arrière-plan)
+
+        Returns:
+            bool: Réajustement lancé (False si un réajustement est déjà en cours)
+        """
+        if self._refit_thread is not None and self._refit_thread.is_alive():
+            if wait:
+                self._refit_thread.join()
+            return False
+        if wait:
+            self._refit()
+            return True
+        self._refit_thread = threading.Thread(target=self._refit, name="topic-refit")
+        self._refit_thread.start()
+        return True
+
+    def _refit(self):
+        start = time.perf_counter()
+        with self._lock:
+            if self.centroids is None:
+                return
+            rows = self.conn.execute("SELECT article_id, indices, data, keywords FROM samples").fetchall()
+            snapshot = self.centroids.copy()
+            snapshot_counts = list(self.counts)
+            fitted_since = self.since_fit
+            self._refit_terms = Counter()
+        try:
+            if rows:
+                fitted = self._fit_sample(rows, snapshot)
+                self._merge_refit(rows, snapshot, snapshot_counts, fitted_since, *fitted)
+                logger.info(f"Thèmes réajustés sur {len(rows)} articles en {time.perf_counter() - start:.1f} s")
+        finally:
+            with self._lock:
+                self._refit_terms = None
+
+    def _fit_sample(self, rows: List[Tuple], snapshot: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        k-moyennes sphériques sur l'échantillon, à partir des centroïdes courants (sans verrou)
+
+        Args:
+            rows (List[Tuple]): Échantillon (article_id, indices, data, keywords)
+            snapshot (np.ndarray): Centroïdes au début du réajustement
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Centroïdes réajustés, thème et similarité
+                de chaque article de l'échantillon
+        """
+        vectors = [(np.frombuffer(idx, dtype=np.int32) if idx is not None else None,
+                    np.frombuffer(data, dtype=np.float32)) for _, idx, data, _ in rows]
+        centroids = snapshot.copy()
+        labels = np.zeros(len(vectors), dtype=np.int64)
+        similarities = np.zeros(len(vectors), dtype=np.float32)
+        for _ in range(self.refit_iterations):
+            for j, vector in enumerate(vectors):
+                scores = self._similarities(centroids, vector)
+                labels[j] = int(np.argmax(scores))
+                similarities[j] = scores[labels[j]]
+            sums = np.zeros_like(centroids)
+            for j, (indices, values) in enumerate(vectors):
+                if indices is None:
+                    sums[labels[j]] += values
+                else:
+                    sums[labels[j], indices] += values
+            norms = np.linalg.norm(sums, axis=1)
+            # Un thème sans membre dans l'échantillon garde son centroïde
+            filled = norms > 0
+            centroids[filled] = sums[filled] / norms[filled, None]
+        return centroids, labels, similarities
+
+    def _merge_refit(self, rows: List[Tuple], snapshot: np.ndarray, snapshot_counts: List[int],
+                     fitted_since: int, centroids: np.ndarray, labels: np.ndarray, similarities: np.ndarray):
+        """
+        Remplace les centroïdes par ceux du réajustement, sous le verrou
+
+        Les affectations faites pendant le réajustement sont conservées: les
+        déplacements en ligne des centroïdes sont réappliqués aux centroïdes
+        réajustés, les thèmes ouverts entre-temps sont gardés tels quels, et les
+        mots-clés de leurs articles restent dans les libellés.
+        """
+        fitted_topics = len(snapshot)
+        term_weights: Counter = Counter()
+        for (_, _, _, keywords), topic in zip(rows, labels):
+            for term in keywords.split("\t") if keywords else ():
+                term_weights[(int(topic), term)] += 1.0
+        members = np.bincount(labels, minlength=fitted_topics)
+
+        with self._lock:
+            merged = centroids + (self.centroids[:fitted_topics] - snapshot)
+            norms = np.linalg.norm(merged, axis=1)
+            merged[norms > 0] /= norms[norms > 0, None]
+            self.centroids = np.vstack([merged, self.centroids[fitted_topics:]])
+            self.counts = [max(int(members[t]), 1) + self.counts[t] - snapshot_counts[t]
+                           for t in range(fitted_topics)] + self.counts[fitted_topics:]
+            term_weights.update({key: weight for key, weight in self._refit_terms.items()
+                                 if key[0] < fitted_topics})
+            self.generation += 1
+            with self.conn:
+                self.conn.execute("DELETE FROM topic_terms WHERE topic_id < ?", (fitted_topics,))
+                self._add_terms(term_weights)
+                self.labels = [self._label(topic) for topic in range(len(self.centroids))]
+                self._save_topics(range(len(self.centroids)))
+                self.conn.executemany(
+                    "UPDATE assignments SET topic_id = ?, similarity = ?, generation = ? WHERE article_id = ?",
+                    [(int(topic), float(sim), self.generation, row[0])
+                     for row, topic, sim in zip(rows, labels, similarities)])
+                self.since_fit = max(0, self.since_fit - fitted_since)
+                self._set_meta(since_fit=self.since_fit, generation=self.generation, fitted_at=time.time())
+
+    def topics(self) -> List[Dict[str, Any]]:
+        """
+        Thèmes courants
+
+        Returns:
+            List[Dict[str, Any]]: Identifiant, libellé et nombre d'articles de chaque thème
+        """
+        with self._lock:
+            counts = dict(self.conn.execute("SELECT topic_id, COUNT(*) FROM assignments GROUP BY topic_id"))
+            return [{"id": topic, "label": label, "articles": counts.get(topic, 0)}
+                    for topic, label in enumerate(self.labels)]
+
+    def close(self):
+        """Attend la fin d'un réajustement en cours et ferme la base"""
+        if self._refit_thread is not None:
+            self._refit_thread.join()
+        with self._lock:
+            self.conn.close()
+
+
+# Regroupements ouverts du processus principal (l'état reste en mémoire d'un lot à l'autre)
+_CLUSTERERS: Dict[str, TopicClusterer] = {}
+_CLUSTERERS_LOCK = threading.Lock()
+
+
+def get_topic_clusterer(db_path: str, vectorizer: str = "tfidf") -> TopicClusterer:
+    """
+    Regroupement partagé du processus pour une base
+
+    Args:
+        db_path (str): Base SQLite du regroupement
+        vectorizer (str): Vectorisation ("tfidf" ou "embeddings")
+
+    Returns:
+        TopicClusterer: Regroupement ouvert
+    """
+    with _CLUSTERERS_LOCK:
+        clusterer = _CLUSTERERS.get(db_path)
+        if clusterer is None or clusterer.vectorizer != vectorizer and not (
+                vectorizer == "embeddings" and not SENTENCE_TRANSFORMERS_AVAILABLE):
+            if clusterer is not None:
+                clusterer.close()
+            clusterer = _CLUSTERERS[db_path] = TopicClusterer(db_path, vectorizer=vectorizer)
+        return clusterer
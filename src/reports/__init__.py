@@ -0,0 +1 @@
+# Initialisation du package reports
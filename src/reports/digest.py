@@ -0,0 +1,151 @@
+import os
+import html
+import logging
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from .report_engine import ReportEngine
+from .summarizer import CachedSummarizer
+
+logger = logging.getLogger("Digest")
+
+FORMATS = {"markdown": "md", "html": "html"}
+
+TITLES = {"daily": "Rapport de veille quotidien", "weekly": "Rapport de veille hebdomadaire"}
+
+
+def _window_label(digest: Dict[str, Any]) -> str:
+    days = digest["days"]
+    return days[0] if len(days) == 1 else f"du {days[0]} au {days[-1]}"
+
+
+def add_summaries(digest: Dict[str, Any], summarizer: CachedSummarizer) -> Dict[str, Any]:
+    """
+    Ajoute à chaque section le résumé de ses articles représentatifs
+
+    Args:
+        digest (Dict[str, Any]): Contenu du rapport (ReportEngine.build_digest)
+        summarizer (CachedSummarizer): Résumeur
+
+    Returns:
+        Dict[str, Any]: Le rapport, complété
+    """
+    for section in digest["sections"]:
+        stories = section["stories"]
+        languages = Counter(story["language"] for story in stories if story["language"])
+        language = languages.most_common(1)[0][0] if languages else None
+        section["summary"] = summarizer.summarize([story["snippet"] or story["title"] or "" for story in stories],
+                                                  language)
+    return digest
+
+
+def render_markdown(digest: Dict[str, Any]) -> str:
+    """
+    Rendu Markdown d'un rapport
+
+    Args:
+        digest (Dict[str, Any]): Contenu du rapport
+
+    Returns:
+        str: Document Markdown
+    """
+    lines = [f"# {TITLES[digest['period']]} - {_window_label(digest)}", ""]
+    if not digest["sections"]:
+        lines.append("Aucun article sur la période.")
+    for section in digest["sections"]:
+        lines.append(f"## {section['category']}")
+        lines.append("")
+        lines.append(f"{section['articles']} articles ({section['duplicates']} doublons regroupés)")
+        lines.append("")
+        if section.get("summary"):
+            lines.extend([section["summary"], ""])
+        if section["keywords"]:
+            lines.append("**Mots-clés:** " + ", ".join(f"{keyword} ({count})" for keyword, count in section["keywords"]))
+            lines.append("")
+        for story in section["stories"]:
+            title = story["title"] or story["link"]
+            entry = f"- [{title}]({story['link']})" if story["link"] else f"- {title}"
+            details = [story["source"] or "", story["day"]]
+            if story["size"] > 1:
+                details.append(f"{story['size']} articles")
+            lines.append(f"{entry} - {', '.join(d for d in details if d)}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def render_html(digest: Dict[str, Any]) -> str:
+    """
+    Rendu HTML d'un rapport
+
+    Args:
+        digest (Dict[str, Any]): Contenu du rapport
+
+    Returns:
+        str: Document HTML
+    """
+    esc = html.escape
+    title = f"{TITLES[digest['period']]} - {_window_label(digest)}"
+    parts = ['<!DOCTYPE html>', '<html lang="fr">', '<head><meta charset="utf-8">',
+             f"<title>{esc(title)}</title></head>", "<body>", f"<h1>{esc(title)}</h1>"]
+    if not digest["sections"]:
+        parts.append("<p>Aucun article sur la période.</p>")
+    for section in digest["sections"]:
+        parts.append(f"<section><h2>{esc(section['category'])}</h2>")
+        parts.append(f"<p>{section['articles']} articles ({section['duplicates']} doublons regroupés)</p>")
+        if section.get("summary"):
+            parts.append(f"<p>{esc(section['summary'])}</p>")
+        if section["keywords"]:
+            parts.append("<p><strong>Mots-clés:</strong> " + ", ".join(
+                f"{esc(keyword)} ({count})" for keyword, count in section["keywords"]) + "</p>")
+        if section["stories"]:
+            parts.append("<ul>")
+            for story in section["stories"]:
+                label = esc(story["title"] or story["link"] or "")
+                entry = f'<a href="{esc(story["link"])}">{label}</a>' if story["link"] else label
+                details = [esc(story["source"] or ""), story["day"]]
+                if story["size"] > 1:
+                    details.append(f"{story['size']} articles")
+                parts.append(f"<li>{entry} - {', '.join(d for d in details if d)}</li>")
+            parts.append("</ul>")
+        parts.append("</section>")
+    parts.extend(["</body>", "</html>"])
+    return "\n".join(parts)
+
+
+def generate_report(db_path: str, output_dir: str = "data/reports", period: str = "daily",
+                    day: Optional[str] = None, formats: List[str] = ("markdown",),
+                    categories: Optional[List[str]] = None, summarize: bool = False,
+                    backend: str = "extractive") -> List[str]:
+    """
+    Génère un rapport quotidien ou hebdomadaire à partir des agrégats
+
+    Args:
+        db_path (str): Base des agrégats (report_buckets.sqlite)
+        output_dir (str): Répertoire des rapports
+        period (str): "daily" ou "weekly"
+        day (Optional[str]): Dernier jour du rapport (YYYY-MM-DD, par défaut aujourd'hui)
+        formats (List[str]): Formats produits ("markdown", "html")
+        categories (Optional[List[str]]): Catégories retenues (toutes par défaut)
+        summarize (bool): Ajouter un résumé par catégorie
+        backend (str): Backend de résumé ("extractive" ou "openai")
+
+    Returns:
+        List[str]: Chemins des rapports écrits
+    """
+    with ReportEngine(db_path) as engine:
+        digest = engine.build_digest(period, day, categories)
+    if summarize:
+        with CachedSummarizer(os.path.join(output_dir, "summary_cache.sqlite"), backend=backend) as summarizer:
+            add_summaries(digest, summarizer)
+            logger.info(f"Résumés: {summarizer.hits} en cache, {summarizer.misses} calculés")
+
+    os.makedirs(output_dir, exist_ok=True)
+    renderers = {"markdown": render_markdown, "html": render_html}
+    paths = []
+    for fmt in formats:
+        path = os.path.join(output_dir, f"{period}_{digest['days'][-1]}.{FORMATS[fmt]}")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(renderers[fmt](digest))
+        logger.info(f"Rapport {period} écrit: {path}")
+        paths.append(path)
+    return paths
@@ -0,0 +1,339 @@
+import os
+import re
+import json
+import sqlite3
+import hashlib
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..utils.date_utils import record_timestamp
+from ..utils.raw_archive import link_hash
+
+logger = logging.getLogger("ReportEngine")
+
+PERIODS = {"daily": 1, "weekly": 7}
+
+# Deux articles d'un même jour et d'une même catégorie sont des doublons si leurs
+# empreintes SimHash diffèrent d'au plus SIMILARITY_BITS bits
+SIMILARITY_BITS = 3
+
+# Mots utilisés pour l'empreinte (titre et début du texte)
+SIGNATURE_WORDS = 300
+
+# Extrait conservé pour le représentant d'un groupe (résumé, rendu)
+SNIPPET_CHARS = 600
+
+_WORDS = re.compile(r'\w+')
+
+
+def article_day(article: Any) -> Optional[str]:
+    """
+    Jour (UTC) d'un article: date de publication, sinon date de collecte
+
+    Args:
+        article (Any): Article traité (dictionnaire ou ArticleRecord)
+
+    Returns:
+        Optional[str]: Jour au format YYYY-MM-DD, ou None si l'article n'est pas daté
+    """
+    ts = record_timestamp(article)
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(ts, timezone.utc).date().isoformat()
+
+
+def simhash(text: str) -> int:
+    """
+    Empreinte SimHash 64 bits d'un texte (mots hachés, vote bit à bit vectorisé)
+
+    Args:
+        text (str): Texte de l'article
+
+    Returns:
+        int: Empreinte signée (utilisable comme entier SQLite)
+    """
+    words = _WORDS.findall(text.lower())[:SIGNATURE_WORDS]
+    if not words:
+        return 0
+    hashes = np.frombuffer(
+        b"".join(hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest() for word in words), dtype=np.uint8)
+    bits = np.unpackbits(hashes).reshape(len(words), 64)
+    votes = bits.sum(axis=0) * 2 > len(words)
+    return int.from_bytes(np.packbits(votes).tobytes(), "big", signed=True)
+
+
+def hamming(a: int, b: int) -> int:
+    """Nombre de bits différents entre deux empreintes"""
+    return bin((a ^ b) & 0xFFFFFFFFFFFFFFFF).count("1")
+
+
+def window_days(period: str, day: Optional[str] = None) -> List[str]:
+    """
+    Jours couverts par un rapport
+
+    Args:
+        period (str): "daily" ou "weekly"
+        day (Optional[str]): Dernier jour du rapport (YYYY-MM-DD, par défaut aujourd'hui)
+
+    Returns:
+        List[str]: Jours du plus ancien au plus récent
+    """
+    if period not in PERIODS:
+        raise ValueError(f"Période inconnue: {period} (attendu: {', '.join(PERIODS)})")
+    end = date.fromisoformat(day) if day else datetime.now(timezone.utc).date()
+    return [(end - timedelta(days=offset)).isoformat() for offset in range(PERIODS[period] - 1, -1, -1)]
+
+
+class ReportEngine:
+    """
+    Agrégats matérialisés par catégorie et par jour, alimentés au fil du traitement
+
+    Chaque lot d'articles traités met à jour, pour son couple (catégorie, jour), le
+    nombre d'articles, les occurrences des mots-clés et les groupes de doublons
+    (SimHash) dont le premier article sert de représentant. Un rapport ne lit que
+    les agrégats des jours de sa fenêtre: son coût ne dépend pas de l'historique.
+    """
+
+    def __init__(self, db_path: str, similarity_bits: int = SIMILARITY_BITS):
+        """
+        Ouvre (ou crée) la base des agrégats
+
+        Args:
+            db_path (str): Chemin de la base SQLite
+            similarity_bits (int): Distance de Hamming maximale entre doublons
+        """
+        self.db_path = db_path
+        self.similarity_bits = similarity_bits
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        """Crée les tables et index s'ils n'existent pas"""
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS buckets (
+                category TEXT NOT NULL,
+                day TEXT NOT NULL,
+                articles INTEGER NOT NULL DEFAULT 0,
+                duplicates INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (category, day)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS bucket_keywords (
+                category TEXT NOT NULL,
+                day TEXT NOT NULL,
+                keyword TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (category, day, keyword)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS clusters (
+                id INTEGER PRIMARY KEY,
+                category TEXT NOT NULL,
+                day TEXT NOT NULL,
+                signature INTEGER NOT NULL,
+                size INTEGER NOT NULL DEFAULT 1,
+                title TEXT,
+                link TEXT,
+                source TEXT,
+                language TEXT,
+                snippet TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_clusters_bucket ON clusters (category, day, size);
+            CREATE TABLE IF NOT EXISTS members (
+                article_id INTEGER PRIMARY KEY,
+                cluster_id INTEGER NOT NULL,
+                keywords TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_buckets_day ON buckets (day);
+        """)
+
+    def add_articles(self, articles: Iterable[Any]) -> int:
+        """
+        Ajoute (ou remplace) un lot d'articles traités dans les agrégats
+
+        Un article déjà compté (même lien) remplace sa contribution précédente
+        (compartiment, mots-clés, groupe de doublons): un retraitement qui change
+        ses mots-clés ou sa date corrige les agrégats sans les compter deux fois.
+
+        Args:
+            articles (Iterable[Any]): Articles traités (dictionnaires ou ArticleRecord)
+
+        Returns:
+            int: Nombre d'articles ajoutés ou remplacés
+        """
+        # Groupes des compartiments touchés par le lot, chargés une fois
+        bucket_clusters: Dict[Tuple[str, str], List[List[int]]] = {}
+        buckets: Dict[Tuple[str, str], List[int]] = {}
+        keywords: Dict[Tuple[str, str, str], int] = {}
+        added = 0
+
+        with self.conn:
+            for article in articles:
+                identifier = article.get("link") or article.get("url") or article.get("title")
+                day = article_day(article)
+                if not identifier or day is None:
+                    continue
+                article_id = link_hash(identifier)
+                self._remove_member(article_id, bucket_clusters, buckets, keywords)
+
+                key = (article.get("category") or "non classé", day)
+                clusters = bucket_clusters.get(key)
+                if clusters is None:
+                    clusters = bucket_clusters[key] = [
+                        [cluster_id, signature] for cluster_id, signature in self.conn.execute(
+                            "SELECT id, signature FROM clusters WHERE category = ? AND day = ?", key)]
+
+                text = article.get("normalized_text") or article.get("cleaned_summary") or ""
+                title = article.get("cleaned_title") or article.get("title") or ""
+                signature = simhash(f"{title} {text}")
+                cluster_id = next((cid for cid, other in clusters
+                                   if hamming(signature, other) <= self.similarity_bits), None)
+
+                counts = buckets.setdefault(key, [0, 0])
+                counts[0] += 1
+                if cluster_id is None:
+                    snippet = (article.get("cleaned_summary") or text)[:SNIPPET_CHARS]
+                    cluster_id = self.conn.execute(
+                        "INSERT INTO clusters (category, day, signature, title, link, source, language, snippet) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (key[0], day, signature, article.get("title"), identifier,
+                         article.get("source_name") or article.get("source"), article.get("language"),
+                         snippet)).lastrowid
+                    clusters.append([cluster_id, signature])
+                else:
+                    counts[1] += 1
+                    self.conn.execute("UPDATE clusters SET size = size + 1 WHERE id = ?", (cluster_id,))
+                article_keywords = list(article.get("keywords") or ())
+                self.conn.execute("INSERT INTO members (article_id, cluster_id, keywords) VALUES (?, ?, ?)",
+                                  (article_id, cluster_id, json.dumps(article_keywords, ensure_ascii=False)))
+
+                for keyword in article_keywords:
+                    keyword_key = (key[0], day, keyword)
+                    keywords[keyword_key] = keywords.get(keyword_key, 0) + 1
+                added += 1
+
+            self.conn.executemany(
+                "INSERT INTO buckets (category, day, articles, duplicates) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (category, day) DO UPDATE SET "
+                "articles = articles + excluded.articles, duplicates = duplicates + excluded.duplicates",
+                [(category, day, count, duplicates) for (category, day), (count, duplicates) in buckets.items()])
+            self.conn.executemany(
+                "INSERT INTO bucket_keywords (category, day, keyword, count) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (category, day, keyword) DO UPDATE SET count = count + excluded.count",
+                [(category, day, keyword, count) for (category, day, keyword), count in keywords.items()])
+            # Contributions retirées: compartiments et mots-clés qui n'ont plus d'article
+            self.conn.execute("DELETE FROM bucket_keywords WHERE count <= 0")
+            self.conn.execute("DELETE FROM buckets WHERE articles <= 0")
+        return added
+
+    def _remove_member(self, article_id: int, bucket_clusters: Dict[Tuple[str, str], List[List[int]]],
+                       buckets: Dict[Tuple[str, str], List[int]], keywords: Dict[Tuple[str, str, str], int]):
+        """
+        Retire la contribution d'un article déjà compté (deltas du lot en cours)
+
+        Le groupe de l'article perd un membre (supprimé s'il devient vide); le nombre
+        de doublons du compartiment reste égal à (articles - groupes).
+
+        Args:
+            article_id (int): Article (hachage du lien)
+            bucket_clusters (Dict[Tuple[str, str], List[List[int]]]): Groupes chargés par compartiment
+            buckets (Dict[Tuple[str, str], List[int]]): Deltas (articles, doublons) par compartiment
+            keywords (Dict[Tuple[str, str, str], int]): Deltas des mots-clés par compartiment
+        """
+        row = self.conn.execute(
+            "SELECT m.cluster_id, m.keywords, c.category, c.day, c.size FROM members m "
+            "JOIN clusters c ON c.id = m.cluster_id WHERE m.article_id = ?", (article_id,)).fetchone()
+        if row is None:
+            return
+        cluster_id, old_keywords, category, day, size = row
+        key = (category, day)
+        counts = buckets.setdefault(key, [0, 0])
+        counts[0] -= 1
+        if size <= 1:
+            self.conn.execute("DELETE FROM clusters WHERE id = ?", (cluster_id,))
+            if key in bucket_clusters:
+                bucket_clusters[key] = [cluster for cluster in bucket_clusters[key] if cluster[0] != cluster_id]
+        else:
+            counts[1] -= 1
+            self.conn.execute("UPDATE clusters SET size = size - 1 WHERE id = ?", (cluster_id,))
+        for keyword in json.loads(old_keywords):
+            keyword_key = (category, day, keyword)
+            keywords[keyword_key] = keywords.get(keyword_key, 0) - 1
+        self.conn.execute("DELETE FROM members WHERE article_id = ?", (article_id,))
+
+    def build_digest(self, period: str = "daily", day: Optional[str] = None,
+                     categories: Optional[List[str]] = None, top_keywords: int = 10,
+                     top_articles: int = 5) -> Dict[str, Any]:
+        """
+        Contenu d'un rapport, lu dans les agrégats des jours de la fenêtre
+
+        Args:
+            period (str): "daily" ou "weekly"
+            day (Optional[str]): Dernier jour du rapport (YYYY-MM-DD, par défaut aujourd'hui)
+            categories (Optional[List[str]]): Catégories retenues (toutes par défaut)
+            top_keywords (int): Nombre de mots-clés par catégorie
+            top_articles (int): Nombre d'articles représentatifs par catégorie
+
+        Returns:
+            Dict[str, Any]: Période, jours couverts et sections par catégorie
+        """
+        days = window_days(period, day)
+        start, end = days[0], days[-1]
+        rows = self.conn.execute(
+            "SELECT category, SUM(articles), SUM(duplicates) FROM buckets "
+            "WHERE day BETWEEN ? AND ? GROUP BY category ORDER BY SUM(articles) DESC, category",
+            (start, end)).fetchall()
+
+        sections = []
+        for category, articles, duplicates in rows:
+            if categories and category not in categories:
+                continue
+            keywords = self.conn.execute(
+                "SELECT keyword, SUM(count) AS total FROM bucket_keywords "
+                "WHERE category = ? AND day BETWEEN ? AND ? GROUP BY keyword "
+                "ORDER BY total DESC, keyword LIMIT ?",
+                (category, start, end, top_keywords)).fetchall()
+            # Candidats de chaque jour, puis fusion des doublons d'un jour à l'autre
+            candidates = []
+            for current in days:
+                candidates.extend(self.conn.execute(
+                    "SELECT signature, size, title, link, source, language, snippet, day FROM clusters "
+                    "WHERE category = ? AND day = ? ORDER BY size DESC, id LIMIT ?",
+                    (category, current, top_articles)))
+            stories: List[Dict[str, Any]] = []
+            signatures: List[int] = []
+            for signature, size, title, link, source, language, snippet, story_day in sorted(
+                    candidates, key=lambda row: -row[1]):
+                merged = next((i for i, other in enumerate(signatures)
+                               if hamming(signature, other) <= self.similarity_bits), None)
+                if merged is not None:
+                    stories[merged]["size"] += size
+                    continue
+                signatures.append(signature)
+                stories.append({"title": title, "link": link, "source": source, "language": language,
+                                "snippet": snippet, "day": story_day, "size": size})
+            sections.append({
+                "category": category,
+                "articles": articles,
+                "duplicates": duplicates,
+                "keywords": [(keyword, count) for keyword, count in keywords],
+                "stories": stories[:top_articles]
+            })
+
+        return {"period": period, "days": days, "sections": sections}
+
+    def close(self):
+        """Ferme la base"""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
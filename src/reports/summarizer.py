@@ -0,0 +1,147 @@
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import logging
+from collections import Counter
+from typing import List, Optional
+
+from ..processors.language import get_language_resources
+
+try:
+    import openai
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+
+logger = logging.getLogger("Summarizer")
+
+BACKENDS = ("extractive", "openai")
+
+_SENTENCES = re.compile(r'(?<=[.!?])\s+')
+
+
+class CachedSummarizer:
+    """
+    Résumés de rapports, mis en cache dans SQLite
+
+    Le cache est indexé par l'empreinte du backend, du modèle et des textes: un
+    rapport régénéré sans nouvel article ne rappelle pas le backend. Le backend
+    "openai" (optionnel) se replie sur le résumé extractif local s'il n'est pas
+    disponible.
+    """
+
+    def __init__(self, cache_path: str, backend: str = "extractive", model: str = "gpt-3.5-turbo",
+                 max_sentences: int = 3):
+        """
+        Initialise le résumeur
+
+        Args:
+            cache_path (str): Chemin de la base SQLite du cache
+            backend (str): "extractive" (local) ou "openai"
+            model (str): Modèle utilisé par le backend openai
+            max_sentences (int): Nombre de phrases d'un résumé extractif
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Backend de résumé inconnu: {backend} (attendu: {', '.join(BACKENDS)})")
+        if backend == "openai" and not (OPENAI_AVAILABLE and os.getenv("OPENAI_API_KEY")):
+            logger.warning("Backend openai indisponible (paquet ou OPENAI_API_KEY manquant), résumé extractif utilisé")
+            backend = "extractive"
+        self.backend = backend
+        self.model = model
+        self.max_sentences = max_sentences
+        directory = os.path.dirname(cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(cache_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS summaries (
+                key BLOB PRIMARY KEY,
+                summary TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """)
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, texts: List[str], language: Optional[str]) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{self.backend}\0{self.model}\0{self.max_sentences}\0{language}".encode("utf-8"))
+        for text in texts:
+            digest.update(b"\0")
+            digest.update(text.encode("utf-8"))
+        return digest.digest()
+
+    def summarize(self, texts: List[str], language: Optional[str] = None) -> str:
+        """
+        Résume un ensemble de textes (articles représentatifs d'une catégorie)
+
+        Args:
+            texts (List[str]): Textes à résumer
+            language (Optional[str]): Langue dominante des textes
+
+        Returns:
+            str: Résumé (chaîne vide si aucun texte)
+        """
+        texts = [text for text in texts if text]
+        if not texts:
+            return ""
+        key = self._key(texts, language)
+        row = self.conn.execute("SELECT summary FROM summaries WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            self.hits += 1
+            return row[0]
+
+        self.misses += 1
+        if self.backend == "openai":
+            try:
+                summary = self._summarize_openai(texts, language)
+            except Exception as e:
+                # Un échec n'est pas mis en cache: le prochain rapport réessaiera
+                logger.error(f"Erreur du backend openai, résumé extractif utilisé: {e}")
+                return self._summarize_extractive(texts, language)
+        else:
+            summary = self._summarize_extractive(texts, language)
+
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO summaries (key, summary, created_at) VALUES (?, ?, ?)",
+                              (key, summary, time.time()))
+        return summary
+
+    def _summarize_extractive(self, texts: List[str], language: Optional[str]) -> str:
+        """Phrases dont les mots sont les plus fréquents dans l'ensemble, dans leur ordre d'origine"""
+        resources = get_language_resources(language)
+        sentences = [s.strip() for text in texts for s in _SENTENCES.split(text) if len(s.strip()) > 20]
+        if not sentences:
+            return " ".join(texts)[:500]
+        tokenized = [[w for w in resources.tokenize(s) if w not in resources.stop_words] for s in sentences]
+        frequencies = Counter(word for words in tokenized for word in words)
+        scores = [sum(frequencies[w] for w in words) / (len(words) + 1) for words in tokenized]
+        best = sorted(range(len(sentences)), key=lambda i: -scores[i])[:self.max_sentences]
+        return " ".join(sentences[i] for i in sorted(best))
+
+    def _summarize_openai(self, texts: List[str], language: Optional[str]) -> str:
+        """Résumé par l'API OpenAI (interface openai 0.27)"""
+        target = "en anglais" if language == "en" else "en français"
+        response = openai.ChatCompletion.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": "Tu rédiges des synthèses de veille technologique concises."},
+                {"role": "user", "content": f"Résume {target}, en {self.max_sentences} phrases au plus, "
+                                            "les points clés des articles suivants:\n\n" + "\n\n".join(texts)}
+            ],
+            temperature=0.2
+        )
+        return response["choices"][0]["message"]["content"].strip()
+
+    def close(self):
+        """Ferme le cache"""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Script principal pour servir le corpus traité par une API HTTP locale en lecture seule
+"""
+
+import os
+import sys
+import shutil
+import argparse
+import logging
+
+# Ajout du répertoire parent au chemin de recherche des modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Import des modules
+from src.utils.logging_utils import configure_logging
+from src.api.corpus_store import CorpusStore
+from src.api.server import serve, DEFAULT_CACHE_SIZE, DEFAULT_REFRESH_INTERVAL
+
+# Configuration du logging
+configure_logging()
+logger = logging.getLogger("run_api")
+
+def parse_arguments():
+    """
+    Parse les arguments de la ligne de commande
+
+    Returns:
+        argparse.Namespace: Arguments parsés
+    """
+    parser = argparse.ArgumentParser(description="API locale du corpus traité")
+
+    parser.add_argument(
+        "--processed-dir",
+        default="data/processed",
+        help="Répertoire des données traitées (défaut: data/processed)"
+    )
+
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Adresse d'écoute (défaut: 127.0.0.1)"
+    )
+
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8700,
+        help="Port d'écoute (défaut: 8700)"
+    )
+
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_SIZE,
+        help=f"Nombre de réponses gardées en mémoire (défaut: {DEFAULT_CACHE_SIZE})"
+    )
+
+    parser.add_argument(
+        "--refresh-interval",
+        type=float,
+        default=DEFAULT_REFRESH_INTERVAL,
+        help=f"Intervalle de prise en compte des nouvelles données en secondes, 0 pour aucun "
+             f"(défaut: {DEFAULT_REFRESH_INTERVAL:g})"
+    )
+
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Reconstruire l'index du corpus à partir de toutes les sorties du traitement"
+    )
+
+    parser.add_argument(
+        "--index-only",
+        action="store_true",
+        help="Mettre à jour l'index du corpus sans lancer le serveur"
+    )
+
+    return parser.parse_args()
+
+def main():
+    """
+    Fonction principale pour lancer l'API
+    """
+    args = parse_arguments()
+
+    if not os.path.isdir(args.processed_dir):
+        logger.error(f"Répertoire des données traitées introuvable: {args.processed_dir}")
+        return
+
+    if args.rebuild:
+        shutil.rmtree(os.path.join(args.processed_dir, "api"), ignore_errors=True)
+
+    if args.index_only:
+        store = CorpusStore(args.processed_dir)
+        store.refresh()
+        logger.info(f"Index du corpus à jour (version {store.version}, {store.stats()['total']} articles)")
+        store.close()
+        return
+
+    serve(args.processed_dir, host=args.host, port=args.port, cache_size=args.cache_size,
+          refresh_interval=args.refresh_interval or None)
+
+if __name__ == "__main__":
+    main()
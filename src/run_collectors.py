@@ -17,8 +17,12 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import des modules
 from src.utils.config_loader import load_sources, load_environment_variables
+from src.collectors.source_registry import get_source_registry
+from src.collectors.scheduler import SourceScheduler
 from src.collectors.rss_collector import collect_rss_feeds
 from src.collectors.web_collector import collect_websites
+from src.utils.raw_archive import RawArchive
+from src.utils.profiling import ProfileSession
 
 def parse_arguments():
     """
@@ -34,6 +38,13 @@ def parse_arguments():
     parser.add_argument("--cache-dir", type=str, default=None, help="Répertoire pour le cache")
     parser.add_argument("--rss-only", action="store_true", help="Collecte uniquement les flux RSS")
     parser.add_argument("--web-only", action="store_true", help="Collecte uniquement les sites web")
+    parser.add_argument("--no-fast-parser", action="store_true", help="Analyse les flux RSS avec feedparser au lieu de l'analyse incrémentale lxml")
+    parser.add_argument("--compact", action="store_true", help="Compacte les fichiers bruts dans l'archive compressée après la collecte")
+    parser.add_argument("--remove-compacted", action="store_true", help="Supprime les fichiers bruts une fois compactés dans l'archive (avec --compact)")
+    parser.add_argument("--watch", action="store_true", help="Collecte continue: chaque source à son intervalle, sources.json surveillé")
+    parser.add_argument("--tick", type=float, default=5.0, help="Intervalle de surveillance de sources.json en mode --watch (par défaut: 5s)")
+    parser.add_argument("--profile", action="store_true", help="Profile la collecte (cProfile, piles par étape) dans data/profiles")
+    parser.add_argument("--profile-memory", action="store_true", help="Profile aussi les allocations mémoire (tracemalloc, implique --profile)")
     
     return parser.parse_args()
 
@@ -41,14 +52,27 @@ def main():
     """
     Fonction principale pour lancer la collecte de données
     """
+    # Parsing des arguments
+    args = parse_arguments()
+    
+    # Profilage optionnel du processus et des workers
+    with ProfileSession("collectors", enabled=args.profile, memory=args.profile_memory) as session:
+        run_collection(args)
+    if session.report_path:
+        print(f"Rapport de profilage: {session.report_path}")
+
+def run_collection(args: argparse.Namespace):
+    """
+    Lance la collecte de données
+    
+    Args:
+        args (argparse.Namespace): Arguments de la ligne de commande
+    """
     start_time = time.time()
     
     print("=== Démarrage de la collecte de données ===")
     print(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # Parsing des arguments
-    args = parse_arguments()
-    
     # Chargement des variables d'environnement
     load_environment_variables()
     
@@ -71,6 +95,20 @@ def main():
     print(f"Utilisation du cache: {'Non' if args.no_cache else 'Oui'}")
     print(f"Workers simultanés: {max_workers}")
     
+    # Collecte continue: les sources ajoutées ou supprimées sont prises en compte sans redémarrage
+    if args.watch:
+        print("\n=== Collecte continue (Ctrl+C pour arrêter) ===")
+        scheduler = SourceScheduler(get_source_registry(), raw_dir, cache_dir, max_workers, use_cache)
+        if args.no_fast_parser:
+            scheduler.collectors["rss"].fast_parser = False
+        try:
+            scheduler.run(tick=args.tick)
+        except KeyboardInterrupt:
+            print("Arrêt demandé")
+        print(f"Tours: {scheduler.stats['cycles']} - Collectes: {scheduler.stats['collections']} - "
+              f"Éléments: {scheduler.stats['items']} - Échecs: {scheduler.stats['failures']}")
+        return
+    
     # Chargement des sources
     sources = load_sources()
     
@@ -91,7 +129,8 @@ def main():
                 raw_dir, 
                 cache_dir, 
                 max_workers, 
-                use_cache
+                use_cache,
+                not args.no_fast_parser
             )
             
             web_future = executor.submit(
@@ -113,13 +152,23 @@ def main():
         # Collecte des données RSS si demandé
         if not args.web_only and rss_count > 0:
             print("\n=== Collecte des flux RSS ===")
-            collect_rss_feeds(sources.get("rss_feeds", []), raw_dir, cache_dir, max_workers, use_cache)
+            collect_rss_feeds(sources.get("rss_feeds", []), raw_dir, cache_dir, max_workers, use_cache,
+                              fast_parser=not args.no_fast_parser)
         
         # Collecte des sites web si demandé
         if not args.rss_only and web_count > 0:
             print("\n=== Collecte des sites web ===")
             collect_websites(sources.get("websites", []), raw_dir, cache_dir, max_workers, use_cache)
     
+    # Compaction des fichiers par exécution dans les segments de l'archive
+    if args.compact:
+        print("\n=== Compaction des données brutes ===")
+        with RawArchive(os.path.join(raw_dir, "archive")) as archive:
+            result = archive.compact(raw_dir, remove_source=args.remove_compacted)
+            print(f"Fichiers compactés: {result['files']} - Articles ajoutés: {result['added']} "
+                  f"(doublons ignorés: {result['skipped']})")
+            print(f"Archive: {archive.stats()}")
+    
     # Affichage du temps d'exécution
     elapsed_time = time.time() - start_time
     print(f"\n=== Collecte de données terminée en {elapsed_time:.2f} secondes ===")
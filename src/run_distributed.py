@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Script principal pour la collecte distribuée (sources partitionnées par hôte)
+
+Exemples:
+    # Initialiser une exécution pour 3 workers puis lancer chaque worker (éventuellement sur d'autres machines)
+    python src/run_distributed.py --init --num-workers 3
+    python src/run_distributed.py --shard 0
+
+    # Tout exécuter localement avec 3 processus
+    python src/run_distributed.py --local-workers 3
+"""
+
+import os
+import sys
+import time
+import argparse
+import multiprocessing
+from datetime import datetime
+
+# Ajout du répertoire parent au chemin de recherche des modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Import des modules
+from src.utils.config_loader import load_sources, load_environment_variables
+from src.pipeline.distributed import WorkCoordinator, run_worker
+
+def parse_arguments():
+    """
+    Parse les arguments de la ligne de commande
+
+    Returns:
+        argparse.Namespace: Arguments parsés
+    """
+    parser = argparse.ArgumentParser(description="Collecte distribuée des sources RSS et web")
+    parser.add_argument("--coordinator", type=str, default=None, help="Base SQLite du coordinateur (par défaut: data/cache/coordinator.sqlite)")
+    parser.add_argument("--init", action="store_true", help="Initialise une nouvelle exécution et répartit les sources")
+    parser.add_argument("--num-workers", type=int, default=2, help="Nombre de workers/shards pour --init (par défaut: 2)")
+    parser.add_argument("--shard", type=int, default=None, help="Lance un worker pour ce shard")
+    parser.add_argument("--local-workers", type=int, default=None, help="Initialise et lance N workers locaux")
+    parser.add_argument("--no-cache", action="store_true", help="Désactive l'utilisation du cache")
+    parser.add_argument("--output-dir", type=str, default=None, help="Répertoire brut partagé par les workers")
+    parser.add_argument("--cache-dir", type=str, default=None, help="Répertoire pour le cache")
+
+    return parser.parse_args()
+
+def _worker_process(coordinator_path: str, shard: int, raw_dir: str, cache_dir: str, use_cache: bool):
+    """Point d'entrée d'un worker local"""
+    stats = run_worker(coordinator_path, shard, raw_dir, cache_dir, use_cache)
+    print(f"Worker du shard {shard} terminé: {stats['sources']} sources, {stats['items']} éléments, "
+          f"{stats['failures']} échecs, {stats['lost']} baux perdus")
+
+def initialize(coordinator_path: str, num_workers: int):
+    """
+    Répartit les sources de sources.json entre les shards
+
+    Args:
+        coordinator_path (str): Base SQLite du coordinateur
+        num_workers (int): Nombre de shards
+    """
+    sources = load_sources()
+    tasks = [("rss", feed) for feed in sources.get("rss_feeds", [])]
+    tasks += [("web", site) for site in sources.get("websites", [])]
+
+    coordinator = WorkCoordinator(coordinator_path)
+    distribution = coordinator.init_run(tasks, num_workers)
+    coordinator.close()
+
+    print(f"Exécution initialisée: {len(tasks)} sources, {num_workers} shards")
+    for shard, count in sorted(distribution.items()):
+        print(f"  - Shard {shard}: {count} sources")
+
+def main():
+    """
+    Fonction principale pour la collecte distribuée
+    """
+    start_time = time.time()
+    args = parse_arguments()
+
+    print("=== Collecte distribuée ===")
+    print(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+    load_environment_variables()
+
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    data_dir = os.path.join(base_dir, "data")
+    raw_dir = args.output_dir if args.output_dir else os.path.join(data_dir, "raw")
+    cache_dir = args.cache_dir if args.cache_dir else os.path.join(data_dir, "cache")
+    coordinator_path = args.coordinator if args.coordinator else os.path.join(cache_dir, "coordinator.sqlite")
+    os.makedirs(raw_dir, exist_ok=True)
+    os.makedirs(cache_dir, exist_ok=True)
+    use_cache = not args.no_cache
+
+    if args.local_workers:
+        initialize(coordinator_path, args.local_workers)
+        processes = [
+            multiprocessing.Process(target=_worker_process,
+                                    args=(coordinator_path, shard, raw_dir, cache_dir, use_cache))
+            for shard in range(args.local_workers)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+    elif args.init:
+        initialize(coordinator_path, args.num_workers)
+    elif args.shard is not None:
+        coordinator = WorkCoordinator(coordinator_path)
+        num_shards = coordinator.num_shards()
+        coordinator.close()
+        if num_shards is None or not 0 <= args.shard < num_shards:
+            print(f"Shard {args.shard} invalide (shards initialisés: {num_shards}). Lancez d'abord --init.")
+            sys.exit(1)
+        _worker_process(coordinator_path, args.shard, raw_dir, cache_dir, use_cache)
+    else:
+        print("Aucune action: utilisez --init, --shard ou --local-workers")
+        sys.exit(1)
+
+    coordinator = WorkCoordinator(coordinator_path)
+    print(f"Progression: {coordinator.progress()}")
+    coordinator.close()
+
+    elapsed_time = time.time() - start_time
+    print(f"\n=== Collecte distribuée terminée en {elapsed_time:.2f} secondes ===")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Script de consultation de l'index des entités (CVE, FIPS, SP 800, RFC, algorithmes)
+"""
+
+import os
+import sys
+import json
+import argparse
+import logging
+from datetime import datetime, timezone
+
+# Ajout du répertoire parent au chemin de recherche des modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Import des modules
+from src.utils.logging_utils import configure_logging
+from src.processors.entity_index import EntityIndex
+
+# Configuration du logging
+configure_logging()
+logger = logging.getLogger("run_entities")
+
+def parse_arguments():
+    """
+    Parse les arguments de la ligne de commande
+
+    Returns:
+        argparse.Namespace: Arguments parsés
+    """
+    parser = argparse.ArgumentParser(description="Consultation de l'index des entités")
+
+    parser.add_argument(
+        "--processed-dir",
+        default="data/processed",
+        help="Répertoire des données traitées et de l'index (défaut: data/processed)"
+    )
+
+    parser.add_argument(
+        "--entity",
+        default=None,
+        help="Entité recherchée, sous une forme quelconque (\"FIPS 204\", \"Kyber\", \"CVE-2024-3094\")"
+    )
+
+    parser.add_argument(
+        "--top",
+        action="store_true",
+        help="Lister les entités les plus citées"
+    )
+
+    parser.add_argument(
+        "--kind",
+        default=None,
+        help="Type d'entité pour --top (cve, fips, sp800, nistir, rfc, algorithm, protocol)"
+    )
+
+    parser.add_argument(
+        "--days",
+        type=float,
+        default=None,
+        help="Limiter aux derniers jours (défaut: tout l'historique)"
+    )
+
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=50,
+        help="Nombre maximal de résultats (défaut: 50)"
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Sortie JSON"
+    )
+
+    return parser.parse_args()
+
+def main():
+    """
+    Fonction principale pour consulter l'index
+    """
+    args = parse_arguments()
+
+    db_path = os.path.join(args.processed_dir, "entity_index.sqlite")
+    if not os.path.exists(db_path):
+        logger.error(f"Index des entités introuvable: {db_path} (lancer le traitement)")
+        return
+    if not args.entity and not args.top:
+        logger.error("Préciser --entity ou --top")
+        return
+
+    with EntityIndex(db_path) as index:
+        if args.top:
+            entities = index.top_entities(kind=args.kind, days=args.days, limit=args.limit)
+            if args.json:
+                print(json.dumps([{"type": kind, "name": name, "articles": count}
+                                  for kind, name, count in entities], ensure_ascii=False, indent=2))
+            for kind, name, count in ([] if args.json else entities):
+                print(f"{count:6d}  {name} ({kind})")
+            return
+
+        entity = index.resolve(args.entity)
+        if entity is None:
+            logger.info(f"Entité inconnue de l'index: {args.entity}")
+            return
+        articles = index.articles(args.entity, days=args.days, limit=args.limit)
+        if args.json:
+            print(json.dumps(articles, ensure_ascii=False, indent=2))
+            return
+        period = f" ces {args.days:g} derniers jours" if args.days is not None else ""
+        logger.info(f"{entity[2]} ({entity[1]}): {len(articles)} articles{period}")
+        for article in articles:
+            day = datetime.fromtimestamp(article["ts"], tz=timezone.utc).strftime("%Y-%m-%d")
+            print(f"{day}  [{article['source'] or ''}] {article['title'] or ''}\n            {article['link']}")
+
+if __name__ == "__main__":
+    main()
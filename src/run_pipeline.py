@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Script principal pour lancer le pipeline unifié collecte -> traitement
+"""
+
+import os
+import sys
+import argparse
+import logging
+from datetime import datetime
+
+# Ajout du répertoire parent au chemin de recherche des modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Import des modules
+from src.utils.logging_utils import configure_logging
+from src.utils.config_loader import load_sources, load_environment_variables
+from src.pipeline.streaming_pipeline import StreamingPipeline
+
+# Configuration du logging (messages des workers et barres de progression)
+configure_logging()
+logger = logging.getLogger("run_pipeline")
+
+def parse_arguments():
+    """
+    Parse les arguments de la ligne de commande
+
+    Returns:
+        argparse.Namespace: Arguments parsés
+    """
+    parser = argparse.ArgumentParser(description="Pipeline unifié de collecte et de traitement en flux")
+    parser.add_argument("--no-cache", action="store_true", help="Désactive l'utilisation du cache")
+    parser.add_argument("--workers", type=int, default=5, help="Nombre de threads de collecte (par défaut: 5)")
+    parser.add_argument("--process-workers", type=int, default=4, help="Nombre de processus de traitement (par défaut: 4)")
+    parser.add_argument("--queue-size", type=int, default=500, help="Capacité de la file collecte -> traitement (par défaut: 500)")
+    parser.add_argument("--batch-size", type=int, default=50, help="Articles par lot de traitement (par défaut: 50)")
+    parser.add_argument("--save-raw", action="store_true", help="Conserver aussi les données brutes (rejouables)")
+    parser.add_argument("--drop-raw-html", action="store_true", help="Ne pas conserver le HTML brut dans les données traitées")
+    parser.add_argument("--raw-dir", type=str, default=None, help="Répertoire des données brutes")
+    parser.add_argument("--output-dir", type=str, default=None, help="Répertoire de sortie des données traitées")
+    parser.add_argument("--cache-dir", type=str, default=None, help="Répertoire pour le cache")
+    parser.add_argument("--rss-only", action="store_true", help="Collecte uniquement les flux RSS")
+    parser.add_argument("--web-only", action="store_true", help="Collecte uniquement les sites web")
+
+    return parser.parse_args()
+
+def main():
+    """
+    Fonction principale pour lancer le pipeline
+    """
+    args = parse_arguments()
+
+    logger.info("=== Démarrage du pipeline collecte -> traitement ===")
+    logger.info(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+    # Chargement des variables d'environnement
+    load_environment_variables()
+
+    # Création des répertoires de données
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    data_dir = os.path.join(base_dir, "data")
+    raw_dir = args.raw_dir if args.raw_dir else os.path.join(data_dir, "raw")
+    output_dir = args.output_dir if args.output_dir else os.path.join(data_dir, "processed")
+    cache_dir = args.cache_dir if args.cache_dir else os.path.join(data_dir, "cache")
+
+    for directory in (raw_dir, output_dir, cache_dir):
+        os.makedirs(directory, exist_ok=True)
+
+    # Chargement des sources
+    sources = load_sources()
+    rss_feeds = [] if args.web_only else sources.get("rss_feeds", [])
+    websites = [] if args.rss_only else sources.get("websites", [])
+    logger.info(f"Sources RSS: {len(rss_feeds)} - Sites web: {len(websites)}")
+    logger.info(f"Données brutes conservées: {'Oui' if args.save_raw else 'Non'}")
+
+    pipeline = StreamingPipeline(
+        output_dir=output_dir,
+        raw_dir=raw_dir,
+        cache_dir=cache_dir,
+        fetch_workers=args.workers,
+        process_workers=args.process_workers,
+        queue_size=args.queue_size,
+        batch_size=args.batch_size,
+        save_raw=args.save_raw,
+        use_cache=not args.no_cache,
+        keep_raw_html=not args.drop_raw_html
+    )
+    stats = pipeline.run(rss_feeds, websites)
+
+    # Affichage des mesures
+    logger.info("\n=== Mesures du pipeline ===")
+    logger.info(f"Articles collectés: {stats['collected_articles']} (doublons ignorés: {stats['duplicates_skipped']})")
+    logger.info(f"Articles traités: {stats['processed_articles']} en {stats['batches']} lots (échecs: {stats['failed_articles']})")
+    logger.info(f"Durée: {stats['elapsed_seconds']}s - Débit: {stats['throughput_per_second']} articles/s")
+    logger.info(f"Latence collecte -> traitement: p50={stats['lag_p50_seconds']}s, "
+                f"p95={stats['lag_p95_seconds']}s, max={stats['lag_max_seconds']}s")
+    logger.info(f"Contre-pression: {stats['fetch_blocked_seconds']}s de collecte bloquée, "
+                f"file max {stats['max_queue_depth']}")
+
+    logger.info("\n=== Pipeline terminé ===")
+
+if __name__ == "__main__":
+    main()
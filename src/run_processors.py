@@ -15,14 +15,16 @@ from datetime import datetime
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import des modules
+from src.utils.logging_utils import configure_logging
 from src.utils.config_loader import load_environment_variables
 from src.processors.text_processor import process_all_data
+from src.processors.reprocessing import reprocess_all_data
+from src.processors.topic_clusters import VECTORIZERS
+from src.utils.profiling import ProfileSession
+from src.utils.relevance import DEFAULT_RELEVANCE_PATH
 
-# Configuration du logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configuration du logging (messages des workers et barres de progression)
+configure_logging()
 logger = logging.getLogger("run_processors")
 
 def parse_arguments():
@@ -55,8 +57,8 @@ def parse_arguments():
     parser.add_argument(
         "--workers", 
         type=int, 
-        default=4,
-        help="Nombre de workers pour le traitement parallèle (défaut: 4)"
+        default=None,
+        help="Nombre de workers pour le traitement parallèle (défaut: 4, tous les cœurs avec --reprocess)"
     )
     
     parser.add_argument(
@@ -65,6 +67,49 @@ def parse_arguments():
         help="Ne pas sauvegarder les données au format CSV"
     )
     
+    parser.add_argument(
+        "--drop-raw-html", 
+        action="store_true",
+        help="Ne pas conserver le HTML brut (content, summary) une fois nettoyé"
+    )
+    
+    parser.add_argument(
+        "--reprocess", 
+        action="store_true",
+        help="Recalculer uniquement les articles traités par une autre version du processeur (reprise possible)"
+    )
+    
+    parser.add_argument(
+        "--topics", 
+        choices=list(VECTORIZERS) + ["none"],
+        default="tfidf",
+        help="Regroupement incrémental en thèmes: TF-IDF haché, embeddings ou désactivé (défaut: tfidf)"
+    )
+    
+    parser.add_argument(
+        "--no-prefilter", 
+        action="store_true",
+        help="Traiter complètement tous les articles, sans préfiltre de pertinence (relevance.json)"
+    )
+    
+    parser.add_argument(
+        "--no-entities", 
+        action="store_true",
+        help="Ne pas extraire les entités (CVE, FIPS, RFC, algorithmes) ni alimenter leur index"
+    )
+    
+    parser.add_argument(
+        "--profile", 
+        action="store_true",
+        help="Profiler le traitement (processus principal et workers) dans data/profiles"
+    )
+    
+    parser.add_argument(
+        "--profile-memory", 
+        action="store_true",
+        help="Profiler aussi les allocations mémoire avec tracemalloc (implique --profile)"
+    )
+    
     return parser.parse_args()
 
 def main():
@@ -73,6 +118,19 @@ def main():
     """
     args = parse_arguments()
     
+    # Profilage optionnel du processus et des workers
+    with ProfileSession("processors", enabled=args.profile, memory=args.profile_memory) as session:
+        run_processing(args)
+    if session.report_path:
+        logger.info(f"Rapport de profilage: {session.report_path}")
+
+def run_processing(args: argparse.Namespace):
+    """
+    Lance le traitement des données
+    
+    Args:
+        args (argparse.Namespace): Arguments de la ligne de commande
+    """
     logger.info("=== Démarrage du traitement des données ===")
     logger.info(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
@@ -87,17 +145,46 @@ def main():
     logger.info("\n=== Traitement des données ===")
     logger.info(f"Répertoire d'entrée: {args.input_dir}")
     logger.info(f"Répertoire de sortie: {args.output_dir}")
+    
+    topic_vectorizer = None if args.topics == "none" else args.topics
+    relevance_path = None if args.no_prefilter else DEFAULT_RELEVANCE_PATH
+    
+    # Retraitement des sorties obsolètes uniquement
+    if args.reprocess:
+        logger.info("Mode: retraitement")
+        stats = reprocess_all_data(
+            input_dir=args.input_dir,
+            output_dir=args.output_dir,
+            max_workers=args.workers,
+            save_csv=not args.no_csv,
+            keep_raw_html=not args.drop_raw_html,
+            topic_vectorizer=topic_vectorizer,
+            relevance_path=relevance_path,
+            extract_entities=not args.no_entities
+        )
+        logger.info("\n=== Statistiques de retraitement ===")
+        logger.info(f"Version du processeur: {stats['processor_version']}")
+        logger.info(f"Fichiers: {stats['reprocessed_files']} retraités, {stats['skipped_files']} déjà à jour, "
+                    f"{stats['failed_files']} en échec (sur {stats['total_files']})")
+        logger.info(f"Articles recalculés: {stats['recomputed_articles']} - conservés: {stats['kept_articles']}")
+        logger.info("\n=== Retraitement des données terminé ===")
+        return
+    
     logger.info(f"Mode: {'séquentiel' if args.sequential else 'parallèle'}")
     
     if not args.sequential:
-        logger.info(f"Nombre de workers: {args.workers}")
+        logger.info(f"Nombre de workers: {args.workers or 4}")
     
     # Exécution du traitement
     stats = process_all_data(
         input_dir=args.input_dir,
         output_dir=args.output_dir,
         parallel=not args.sequential,
-        max_workers=args.workers
+        max_workers=args.workers or 4,
+        keep_raw_html=not args.drop_raw_html,
+        topic_vectorizer=topic_vectorizer,
+        relevance_path=relevance_path,
+        extract_entities=not args.no_entities
     )
     
     # Affichage des statistiques
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Script principal pour générer les rapports de veille (quotidiens ou hebdomadaires)
+"""
+
+import os
+import sys
+import json
+import argparse
+import logging
+from datetime import datetime
+
+# Ajout du répertoire parent au chemin de recherche des modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Import des modules
+from src.utils.logging_utils import configure_logging
+from src.utils.config_loader import load_environment_variables
+from src.reports.report_engine import ReportEngine, PERIODS
+from src.reports.digest import generate_report, FORMATS
+from src.reports.summarizer import BACKENDS
+
+# Configuration du logging (messages des workers et barres de progression)
+configure_logging()
+logger = logging.getLogger("run_reports")
+
+def parse_arguments():
+    """
+    Parse les arguments de la ligne de commande
+
+    Returns:
+        argparse.Namespace: Arguments parsés
+    """
+    parser = argparse.ArgumentParser(description="Génération des rapports de veille")
+
+    parser.add_argument(
+        "--processed-dir",
+        default="data/processed",
+        help="Répertoire des données traitées et des agrégats (défaut: data/processed)"
+    )
+
+    parser.add_argument(
+        "--output-dir",
+        default="data/reports",
+        help="Répertoire de sortie des rapports (défaut: data/reports)"
+    )
+
+    parser.add_argument(
+        "--period",
+        choices=list(PERIODS),
+        default="daily",
+        help="Période du rapport (défaut: daily)"
+    )
+
+    parser.add_argument(
+        "--date",
+        default=None,
+        help="Dernier jour couvert par le rapport, YYYY-MM-DD (défaut: aujourd'hui)"
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=list(FORMATS) + ["all"],
+        default="markdown",
+        help="Format du rapport (défaut: markdown)"
+    )
+
+    parser.add_argument(
+        "--categories",
+        nargs="+",
+        help="Catégories à inclure (défaut: toutes)"
+    )
+
+    parser.add_argument(
+        "--summarize",
+        action="store_true",
+        help="Ajouter un résumé par catégorie (mis en cache)"
+    )
+
+    parser.add_argument(
+        "--backend",
+        choices=list(BACKENDS),
+        default="extractive",
+        help="Backend de résumé (défaut: extractive, local)"
+    )
+
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Alimenter les agrégats à partir des fichiers traités existants (historique antérieur)"
+    )
+
+    return parser.parse_args()
+
+def rebuild_buckets(processed_dir: str, db_path: str) -> int:
+    """
+    Alimente les agrégats à partir des fichiers traités (un fichier à la fois)
+
+    Args:
+        processed_dir (str): Répertoire des données traitées
+        db_path (str): Base des agrégats
+
+    Returns:
+        int: Nombre d'articles ajoutés
+    """
+    added = 0
+    with ReportEngine(db_path) as engine:
+        for filename in sorted(os.listdir(processed_dir)):
+            if not (filename.startswith("processed_") and filename.endswith(".json")):
+                continue
+            try:
+                with open(os.path.join(processed_dir, filename), "r", encoding="utf-8") as f:
+                    added += engine.add_articles(json.load(f))
+            except Exception as e:
+                logger.error(f"Erreur lors de la lecture de {filename}: {e}")
+    return added
+
+def main():
+    """
+    Fonction principale pour générer les rapports
+    """
+    args = parse_arguments()
+
+    logger.info("=== Génération des rapports ===")
+    logger.info(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+    # Chargement des variables d'environnement (clé OpenAI pour le backend openai)
+    load_environment_variables()
+
+    db_path = os.path.join(args.processed_dir, "report_buckets.sqlite")
+    if args.rebuild:
+        added = rebuild_buckets(args.processed_dir, db_path)
+        logger.info(f"Agrégats alimentés: {added} articles ajoutés")
+    elif not os.path.exists(db_path):
+        logger.error(f"Agrégats introuvables: {db_path} (lancer le traitement ou --rebuild)")
+        return
+
+    formats = list(FORMATS) if args.format == "all" else [args.format]
+    paths = generate_report(
+        db_path,
+        output_dir=args.output_dir,
+        period=args.period,
+        day=args.date,
+        formats=formats,
+        categories=args.categories,
+        summarize=args.summarize,
+        backend=args.backend
+    )
+
+    for path in paths:
+        logger.info(f"Rapport: {path}")
+
+    logger.info("\n=== Génération des rapports terminée ===")
+
+if __name__ == "__main__":
+    main()
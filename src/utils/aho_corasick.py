@@ -0,0 +1,165 @@
+import unicodedata
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+# Correspondance: (début, fin, indice du motif) dans le texte normalisé
+Match = Tuple[int, int, int]
+
+
+def fold_text(text: str) -> str:
+    """
+    Normalise un texte pour la recherche: minuscules, sans accents
+
+    La longueur peut changer (ligatures, caractères décomposés): les positions
+    des correspondances se rapportent au texte normalisé.
+
+    Args:
+        text (str): Texte à normaliser
+
+    Returns:
+        str: Texte normalisé
+    """
+    text = text.casefold()
+    if text.isascii():
+        return text
+    return "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+class AhoCorasick:
+    """
+    Automate d'Aho-Corasick: recherche de tous les motifs d'un ensemble en un seul
+    passage sur le texte
+
+    Le coût d'une recherche est linéaire en la longueur du texte (plus le nombre de
+    correspondances), quel que soit le nombre de motifs. Les caractères absents de
+    tous les motifs ramènent directement à la racine.
+    """
+
+    def __init__(self, patterns: Iterable[str], whole_words: bool = True, fold: bool = True):
+        """
+        Compile l'automate
+
+        Args:
+            patterns (Iterable[str]): Motifs (les doublons après normalisation sont conservés
+                sous leur premier indice)
+            whole_words (bool): Ne retenir que les correspondances délimitées par des
+                caractères non alphanumériques
+            fold (bool): Ignorer la casse et les accents (fold_text)
+        """
+        self.whole_words = whole_words
+        self.fold = fold
+        self.patterns: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[Tuple[int, int], ...]] = [()]
+        self._index: Dict[str, int] = {}
+
+        outputs: List[List[Tuple[int, int]]] = [[]]
+        for pattern in patterns:
+            key = fold_text(pattern) if fold else pattern
+            self.patterns.append(key)
+            if not key or key in self._index:
+                continue
+            index = len(self.patterns) - 1
+            self._index[key] = index
+            state = 0
+            for c in key:
+                nxt = self._goto[state].get(c)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][c] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                state = nxt
+            outputs[state].append((index, len(key)))
+
+        # Liens d'échec en largeur; les sorties d'un état incluent celles de son lien d'échec
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for c, nxt in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and c not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(c, 0)
+                outputs[nxt].extend(outputs[self._fail[nxt]])
+                queue.append(nxt)
+        self._out = [tuple(output) for output in outputs]
+        self._alphabet = frozenset(c for transitions in self._goto for c in transitions)
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def index_of(self, pattern: str) -> int:
+        """Indice d'un motif (après normalisation), -1 s'il est absent"""
+        return self._index.get(fold_text(pattern) if self.fold else pattern, -1)
+
+    def iter_matches(self, text: str, folded: bool = False) -> Iterator[Match]:
+        """
+        Parcourt les correspondances de tous les motifs
+
+        Args:
+            text (str): Texte à analyser
+            folded (bool): Le texte est déjà normalisé
+
+        Yields:
+            Match: (début, fin, indice du motif), par position de fin croissante
+        """
+        if self.fold and not folded:
+            text = fold_text(text)
+        goto, fail, out, alphabet = self._goto, self._fail, self._out, self._alphabet
+        whole_words = self.whole_words
+        size = len(text)
+        state = 0
+        for i, c in enumerate(text):
+            if c not in alphabet:
+                state = 0
+                continue
+            while True:
+                nxt = goto[state].get(c)
+                if nxt is not None:
+                    state = nxt
+                    break
+                if not state:
+                    break
+                state = fail[state]
+            if out[state]:
+                end = i + 1
+                for index, length in out[state]:
+                    start = end - length
+                    if whole_words and ((start > 0 and _is_word_char(text[start - 1]))
+                                        or (end < size and _is_word_char(text[end]))):
+                        continue
+                    yield start, end, index
+
+    def find_all(self, text: str, folded: bool = False) -> List[Match]:
+        """
+        Liste des correspondances de tous les motifs
+
+        Args:
+            text (str): Texte à analyser
+            folded (bool): Le texte est déjà normalisé
+
+        Returns:
+            List[Match]: Correspondances (début, fin, indice du motif)
+        """
+        return list(self.iter_matches(text, folded))
+
+    def matched(self, text: str, folded: bool = False) -> Dict[int, int]:
+        """
+        Nombre d'occurrences de chaque motif présent
+
+        Args:
+            text (str): Texte à analyser
+            folded (bool): Le texte est déjà normalisé
+
+        Returns:
+            Dict[int, int]: Indice du motif -> occurrences
+        """
+        counts: Dict[int, int] = {}
+        for _, _, index in self.iter_matches(text, folded):
+            counts[index] = counts.get(index, 0) + 1
+        return counts
@@ -1,21 +1,34 @@
 import json
 import os
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+
+from .source_config import DEFAULT_SOURCES_PATH, SOURCE_SECTIONS, file_signature, read_sources_file, valid_sources
+
+# Dernier chargement de sources.json: (signature du fichier, sources valides)
+_SOURCES: Optional[Tuple[Tuple[int, int], Dict[str, List[Dict[str, Any]]]]] = None
 
 def load_sources() -> Dict[str, List[Dict[str, Any]]]:
     """
     Charge les sources de données définies dans le fichier sources.json
     
+    Le fichier n'est relu et validé que s'il a changé depuis le dernier appel;
+    les sources invalides sont écartées.
+    
     Returns:
         Dict[str, List[Dict[str, Any]]]: Dictionnaire contenant les sources RSS et sites web
     """
+    global _SOURCES
     try:
-        current_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        sources_path = os.path.join(current_dir, 'sources.json')
-        
-        with open(sources_path, 'r', encoding='utf-8') as file:
-            sources = json.load(file)
-        
+        signature = file_signature(DEFAULT_SOURCES_PATH)
+        if _SOURCES is not None and signature is not None and _SOURCES[0] == signature:
+            return _SOURCES[1]
+        entries, errors = valid_sources(read_sources_file(DEFAULT_SOURCES_PATH))
+        for error in errors:
+            print(f"Source ignorée: {error}")
+        sources = {section: [info for source_kind, info in entries if source_kind == kind]
+                   for kind, section in SOURCE_SECTIONS.items()}
+        if signature is not None:
+            _SOURCES = (signature, sources)
         return sources
     except Exception as e:
         print(f"Erreur lors du chargement des sources: {e}")
@@ -32,4 +45,4 @@ def load_environment_variables():
     # Vérification de la présence de la clé API OpenAI
     if not os.environ.get('OPENAI_API_KEY'):
         print("ATTENTION: La clé API OpenAI n'est pas définie dans le fichier .env")
-        print("Veuillez copier le fichier .env.example en .env et ajouter votre clé API") 
\ No newline at end of file
+        print("Veuillez copier le fichier .env.example en .env et ajouter votre clé API") 
@@ -0,0 +1,334 @@
+import calendar
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from zoneinfo import ZoneInfo
+    PARIS_TZ = ZoneInfo("Europe/Paris")
+except Exception:
+    # Base tzdata absente: on se rabat sur UTC plutôt que d'échouer
+    PARIS_TZ = timezone.utc
+
+# Partition utilisée pour les enregistrements sans date exploitable
+UNDATED_PARTITION = "undated"
+
+# Mois et jours tels qu'ils apparaissent dans les sources francophones (ANSSI, iTPro, ...)
+FRENCH_MONTHS = {
+    "janvier": 1, "janv": 1,
+    "février": 2, "fevrier": 2, "févr": 2, "fevr": 2, "fév": 2, "fev": 2,
+    "mars": 3,
+    "avril": 4, "avr": 4,
+    "mai": 5,
+    "juin": 6,
+    "juillet": 7, "juil": 7,
+    "août": 8, "aout": 8,
+    "septembre": 9, "sept": 9,
+    "octobre": 10, "oct": 10,
+    "novembre": 11, "nov": 11,
+    "décembre": 12, "decembre": 12, "déc": 12, "dec": 12,
+}
+
+_FRENCH_TEXT_DATE = re.compile(
+    r"^(?:(?:lun|mar|mer|jeu|ven|sam|dim)[a-z]*\.?,?\s+)?"
+    r"(?P<day>\d{1,2})(?:er)?\s+(?P<month>[a-zéû]+)\.?\s+(?P<year>\d{4})"
+    r"(?:\s*(?:à|-|,)?\s*(?P<hour>\d{1,2})\s*[h:]\s*(?P<minute>\d{2})?(?::(?P<second>\d{2}))?)?"
+    r"\s*(?P<tz>z|utc|gmt|[+-]\d{2}:?\d{2})?$"
+)
+
+_FRENCH_NUMERIC_DATE = re.compile(
+    r"^(?P<day>\d{1,2})[/.-](?P<month>\d{1,2})[/.-](?P<year>\d{4})"
+    r"(?:\s*(?:à|-|,)?\s*(?P<hour>\d{1,2})\s*[h:]\s*(?P<minute>\d{2})?(?::(?P<second>\d{2}))?)?$"
+)
+
+
+def _to_result(dt: datetime, default_tz: timezone = timezone.utc) -> Tuple[int, str]:
+    """
+    Convertit un datetime en couple (epoch UTC, ISO 8601 UTC)
+
+    Args:
+        dt (datetime): Date à convertir
+        default_tz (timezone): Fuseau appliqué si la date est naïve
+
+    Returns:
+        Tuple[int, str]: Timestamp epoch et représentation ISO en UTC
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=default_tz)
+    dt = dt.astimezone(timezone.utc).replace(microsecond=0)
+    return int(dt.timestamp()), dt.isoformat()
+
+
+def _parse_tz(value: Optional[str]):
+    """
+    Interprète un suffixe de fuseau horaire d'une date française
+
+    Args:
+        value (Optional[str]): Suffixe capturé (z, utc, +02:00, ...)
+
+    Returns:
+        Fuseau correspondant (Europe/Paris par défaut)
+    """
+    if not value:
+        return PARIS_TZ
+    if value in ("z", "utc", "gmt"):
+        return timezone.utc
+    value = value.replace(":", "")
+    sign = -1 if value[0] == "-" else 1
+    minutes = int(value[1:3]) * 60 + int(value[3:5])
+    return timezone(sign * timedelta(minutes=minutes))
+
+
+def _parse_french(value: str) -> Optional[Tuple[int, str]]:
+    """
+    Analyse les formats de date non standard des sources francophones
+
+    Args:
+        value (str): Date en minuscules, espaces normalisés
+
+    Returns:
+        Optional[Tuple[int, str]]: Timestamp et ISO, ou None si le format est inconnu
+    """
+    match = _FRENCH_TEXT_DATE.match(value)
+    if match:
+        month = FRENCH_MONTHS.get(match.group("month").rstrip("."))
+        if month is None:
+            return None
+        tz = _parse_tz(match.group("tz"))
+    else:
+        match = _FRENCH_NUMERIC_DATE.match(value)
+        if not match:
+            return None
+        month = int(match.group("month"))
+        tz = PARIS_TZ
+
+    try:
+        dt = datetime(
+            int(match.group("year")), month, int(match.group("day")),
+            int(match.group("hour") or 0), int(match.group("minute") or 0),
+            int(match.group("second") or 0)
+        )
+    except ValueError:
+        return None
+    return _to_result(dt, tz)
+
+
+@lru_cache(maxsize=8192)
+def parse_date_string(value: str) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Analyse une date textuelle hétérogène (RFC 822, ISO 8601, formats français)
+
+    Le résultat est mémoïsé: les flux répètent souvent les mêmes chaînes d'un
+    article à l'autre et d'une exécution à l'autre.
+
+    Args:
+        value (str): Date brute telle que fournie par la source
+
+    Returns:
+        Tuple[Optional[int], Optional[str]]: Timestamp epoch UTC et date ISO UTC,
+            (None, None) si la date n'a pas pu être interprétée
+    """
+    if not value:
+        return None, None
+
+    value = " ".join(value.split())
+
+    # RFC 822 (RSS 2.0)
+    try:
+        return _to_result(parsedate_to_datetime(value))
+    except (TypeError, ValueError, IndexError):
+        pass
+
+    # ISO 8601 (Atom, métadonnées HTML)
+    try:
+        return _to_result(datetime.fromisoformat(value.replace("Z", "+00:00")))
+    except ValueError:
+        pass
+
+    result = _parse_french(value.lower())
+    if result:
+        return result
+
+    return None, None
+
+
+def normalize_entry_date(entry: Dict[str, Any]) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Normalise la date de publication d'une entrée feedparser
+
+    Les champs `*_parsed` déjà calculés par feedparser (struct_time UTC) sont
+    privilégiés; la chaîne brute n'est analysée qu'en dernier recours.
+
+    Args:
+        entry (Dict[str, Any]): Entrée du flux
+
+    Returns:
+        Tuple[Optional[int], Optional[str]]: Timestamp epoch UTC et date ISO UTC
+    """
+    for key in ("published_parsed", "updated_parsed", "created_parsed"):
+        parsed = entry.get(key)
+        if isinstance(parsed, time.struct_time):
+            try:
+                ts = calendar.timegm(parsed)
+                return ts, datetime.fromtimestamp(ts, timezone.utc).isoformat()
+            except (OverflowError, ValueError):
+                continue
+
+    for key in ("published", "updated", "created"):
+        raw = entry.get(key)
+        if raw:
+            ts, iso = parse_date_string(raw)
+            if ts is not None:
+                return ts, iso
+
+    return None, None
+
+
+def record_timestamp(item: Dict[str, Any]) -> Optional[int]:
+    """
+    Clé temporelle d'un enregistrement collecté
+
+    Utilise la date de publication normalisée, sinon la date de collecte
+    (cas des pages web qui n'ont pas de date de publication).
+
+    Args:
+        item (Dict[str, Any]): Enregistrement collecté
+
+    Returns:
+        Optional[int]: Timestamp epoch UTC ou None
+    """
+    ts = item.get("published_ts")
+    if ts is not None:
+        return ts
+    if item.get("published"):
+        ts, _ = parse_date_string(item["published"])
+        if ts is not None:
+            return ts
+    collected_at = item.get("collected_at")
+    if collected_at:
+        try:
+            # collected_at est produit par datetime.now() (heure locale naïve)
+            return int(datetime.fromisoformat(collected_at).timestamp())
+        except ValueError:
+            return None
+    return None
+
+
+def date_partition(ts: Optional[int]) -> str:
+    """
+    Partition mensuelle (YYYY-MM) d'un timestamp
+
+    Args:
+        ts (Optional[int]): Timestamp epoch UTC
+
+    Returns:
+        str: Nom de la partition
+    """
+    if ts is None:
+        return UNDATED_PARTITION
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m")
+
+
+def partition_by_date(items: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Trie les enregistrements par date et les regroupe par partition mensuelle
+
+    Args:
+        items (List[Dict[str, Any]]): Enregistrements à partitionner
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: Enregistrements triés par date croissante, par partition
+    """
+    keyed = [(record_timestamp(item), index, item) for index, item in enumerate(items)]
+    # Les enregistrements non datés restent dans leur ordre d'origine, en fin de liste
+    keyed.sort(key=lambda x: (x[0] is None, x[0] or 0, x[1]))
+
+    partitions: Dict[str, List[Dict[str, Any]]] = {}
+    for ts, _, item in keyed:
+        partitions.setdefault(date_partition(ts), []).append(item)
+    return partitions
+
+
+def partition_bounds(partition: str) -> Optional[Tuple[int, int]]:
+    """
+    Bornes [début, fin) d'une partition mensuelle
+
+    Args:
+        partition (str): Nom de la partition (YYYY-MM)
+
+    Returns:
+        Optional[Tuple[int, int]]: Timestamps de début et de fin, None pour "undated"
+    """
+    try:
+        start = datetime.strptime(partition, "%Y-%m").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+    if start.month == 12:
+        end = start.replace(year=start.year + 1, month=1)
+    else:
+        end = start.replace(month=start.month + 1)
+    return int(start.timestamp()), int(end.timestamp())
+
+
+def partition_overlaps(partition: str, start_ts: Optional[int], end_ts: Optional[int]) -> bool:
+    """
+    Indique si une partition peut contenir des enregistrements de l'intervalle
+
+    Args:
+        partition (str): Nom de la partition
+        start_ts (Optional[int]): Début de l'intervalle (inclus)
+        end_ts (Optional[int]): Fin de l'intervalle (exclue)
+
+    Returns:
+        bool: True si la partition doit être lue
+    """
+    bounds = partition_bounds(partition)
+    if bounds is None:
+        return False
+    if start_ts is not None and bounds[1] <= start_ts:
+        return False
+    if end_ts is not None and bounds[0] >= end_ts:
+        return False
+    return True
+
+
+def _bisect_left(items: List[Dict[str, Any]], value: Any, key, lo: int, hi: int) -> int:
+    """Première position de [lo, hi) dont la clé n'est pas inférieure à value (clé calculée à la demande)"""
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if key(items[mid]) < value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _is_undated(item: Dict[str, Any]) -> bool:
+    return record_timestamp(item) is None
+
+
+def select_time_range(sorted_items: List[Dict[str, Any]], start_ts: Optional[int],
+                      end_ts: Optional[int]) -> List[Dict[str, Any]]:
+    """
+    Sélectionne par recherche dichotomique les enregistrements d'un intervalle
+
+    Seules les clés des enregistrements visités par la recherche sont calculées
+    (O(log n) appels à record_timestamp).
+
+    Args:
+        sorted_items (List[Dict[str, Any]]): Enregistrements triés par date croissante
+        start_ts (Optional[int]): Début de l'intervalle (inclus)
+        end_ts (Optional[int]): Fin de l'intervalle (exclue)
+
+    Returns:
+        List[Dict[str, Any]]: Enregistrements compris dans l'intervalle
+    """
+    # Les enregistrements non datés sont en fin de liste et exclus
+    dated = _bisect_left(sorted_items, True, _is_undated, 0, len(sorted_items))
+
+    lo = 0 if start_ts is None else _bisect_left(sorted_items, start_ts, record_timestamp, 0, dated)
+    hi = dated if end_ts is None else _bisect_left(sorted_items, end_ts, record_timestamp, lo, dated)
+    return sorted_items[lo:hi]
@@ -0,0 +1,202 @@
+import sys
+import time
+import logging
+import logging.handlers
+import multiprocessing
+from typing import Dict, Optional
+
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Intervalle des messages de progression sans tqdm (secondes)
+PROGRESS_LOG_INTERVAL = 10.0
+
+
+class _ProgressAwareHandler(logging.StreamHandler):
+    """Écrit les messages au-dessus des barres de progression tqdm actives"""
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            tqdm.write(self.format(record), file=self.stream)
+        except Exception:
+            self.handleError(record)
+
+
+class _RootForwarder(logging.Handler):
+    """Transmet les messages des workers aux gestionnaires actuels du processus principal"""
+
+    def emit(self, record: logging.LogRecord):
+        # Gestionnaires lus à chaque message (pas de copie figée); sans gestionnaire,
+        # logging.lastResort écrit les avertissements et erreurs sur stderr
+        logging.getLogger().handle(record)
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Configure le logging du processus principal (à appeler par les scripts)
+
+    Remplace logging.basicConfig: les modules ne configurent plus le logging à
+    l'import, et les messages ne cassent pas l'affichage des barres de progression.
+
+    Args:
+        level (int): Niveau minimal des messages
+    """
+    root = logging.getLogger()
+    if not any(getattr(handler, "_veille_handler", False) for handler in root.handlers):
+        handler = _ProgressAwareHandler(sys.stderr) if TQDM_AVAILABLE else logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        handler._veille_handler = True
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+def init_worker_logging(log_queue, level: int) -> None:
+    """
+    Initialiseur des processus workers: les messages sont envoyés au processus principal
+
+    Args:
+        log_queue: File multiprocessing du LogListener
+        level (int): Niveau minimal des messages
+    """
+    root = logging.getLogger()
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level)
+
+
+class LogListener:
+    """
+    Collecte des messages des processus workers dans le processus principal
+
+    Les workers (initialisés par init_worker_logging) n'écrivent plus eux-mêmes:
+    leurs messages passent par une file et sont écrits par un seul thread, avec
+    les gestionnaires du processus principal au moment de l'écriture (même si le
+    logging n'a pas été configuré). Les sorties ne s'entremêlent plus.
+
+    Usage:
+        with LogListener() as listener:
+            ProcessPoolExecutor(initializer=init_worker_logging, initargs=listener.initargs)
+    """
+
+    def __init__(self):
+        self.level = logging.getLogger().getEffectiveLevel()
+        self.queue = multiprocessing.Queue(-1)
+        self.listener = logging.handlers.QueueListener(self.queue, _RootForwarder())
+
+    @property
+    def initargs(self):
+        """Arguments de init_worker_logging"""
+        return (self.queue, self.level)
+
+    def __enter__(self):
+        self.listener.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.listener.stop()
+        self.queue.close()
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:d}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
+
+
+class StageProgress:
+    """
+    Progression et débit d'un traitement par lots, par étape
+
+    Mise à jour une fois par lot (fichier, lot d'articles), jamais par article.
+    Affiche le nombre de lots traités avec l'ETA et le débit global en articles/s
+    (barre tqdm, ou message périodique sans tqdm); le temps passé dans chaque
+    étape est cumulé pour en donner le débit propre en fin de traitement.
+    """
+
+    def __init__(self, description: str, total: Optional[int] = None, unit: str = "fichier",
+                 logger: Optional[logging.Logger] = None):
+        """
+        Initialise la progression
+
+        Args:
+            description (str): Libellé de la barre
+            total (Optional[int]): Nombre de lots attendus (ETA si connu)
+            unit (str): Unité des lots
+            logger (Optional[logging.Logger]): Logger des messages sans tqdm et du bilan
+        """
+        self.description = description
+        self.total = total
+        self.unit = unit
+        self.logger = logger or logging.getLogger("Progress")
+        self.batches = 0
+        self.articles = 0
+        self.stage_seconds: Dict[str, float] = {}
+        self.stage_articles: Dict[str, int] = {}
+        self.start = time.perf_counter()
+        self._last_log = self.start
+        self.bar = (tqdm(total=total, desc=description, unit=unit, dynamic_ncols=True, leave=True)
+                    if TQDM_AVAILABLE else None)
+
+    def add_stage_time(self, stage: str, seconds: float, articles: int) -> None:
+        """
+        Cumule le temps passé dans une étape
+
+        Args:
+            stage (str): Nom de l'étape
+            seconds (float): Durée de l'étape pour le lot
+            articles (int): Articles du lot
+        """
+        self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+        self.stage_articles[stage] = self.stage_articles.get(stage, 0) + articles
+
+    def update(self, articles: int, batches: int = 1) -> None:
+        """
+        Enregistre la fin d'un lot
+
+        Args:
+            articles (int): Articles du lot
+            batches (int): Nombre de lots terminés
+        """
+        self.batches += batches
+        self.articles += articles
+        now = time.perf_counter()
+        rate = self.articles / max(now - self.start, 1e-9)
+        if self.bar is not None:
+            self.bar.set_postfix_str(f"{self.articles} articles, {rate:.0f} articles/s", refresh=False)
+            self.bar.update(batches)
+        elif now - self._last_log >= PROGRESS_LOG_INTERVAL:
+            self._last_log = now
+            eta = ""
+            if self.total and self.batches:
+                eta = f", ETA {_format_duration((now - self.start) / self.batches * (self.total - self.batches))}"
+            progress = f"{self.batches}/{self.total}" if self.total else str(self.batches)
+            self.logger.info(f"{self.description}: {progress} {self.unit}s, {self.articles} articles "
+                             f"({rate:.0f} articles/s{eta})")
+
+    def close(self) -> Dict[str, float]:
+        """
+        Termine la progression et journalise le débit de chaque étape
+
+        Returns:
+            Dict[str, float]: Débit (articles/s) global ("total") et de chaque étape
+        """
+        if self.bar is not None:
+            self.bar.close()
+        elapsed = time.perf_counter() - self.start
+        rates = {"total": self.articles / elapsed if elapsed > 0 else 0.0}
+        for stage, seconds in self.stage_seconds.items():
+            rates[stage] = self.stage_articles[stage] / seconds if seconds > 0 else 0.0
+        details = ", ".join(f"{stage} {rate:.0f}/s" for stage, rate in rates.items() if stage != "total")
+        self.logger.info(f"{self.description}: {self.articles} articles en {_format_duration(elapsed)} "
+                         f"({rates['total']:.0f} articles/s{'; ' + details if details else ''})")
+        return rates
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,429 @@
+import os
+import sys
+import json
+import time
+import pstats
+import cProfile
+import logging
+import threading
+import tracemalloc
+import multiprocessing.util
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("Profiling")
+
+# Étapes attribuées aux mesures (stage() dans le code instrumenté)
+STAGES = ("fetch", "parse", "clean", "keyword", "serialize")
+NO_STAGE = "other"
+
+# Intervalle d'échantillonnage des piles (secondes)
+SAMPLE_INTERVAL = 0.005
+
+# Profondeur des tracebacks tracemalloc
+TRACEMALLOC_FRAMES = 10
+
+# Attentes: un thread dont la pile s'arrête dans ces fonctions ou modules est inactif (pas
+# échantillonné). Les lectures réseau (socket, ssl) restent comptées: c'est le temps de fetch.
+IDLE_FUNCTIONS = frozenset(["wait", "select", "poll", "_poll", "_recv", "_recv_bytes", "recv_bytes",
+                            "_wait_for_tstate_lock", "accept", "_worker"])
+IDLE_MODULES = frozenset(["threading.py", "synchronize.py", "queues.py", "connection.py", "selectors.py"])
+
+# Fonctions C d'attente exclues du classement par temps propre (blocage, pas calcul)
+IDLE_BUILTINS = ("acquire", "poll", "select", "posix.read", "posix.waitpid", "SemLock", "SimpleQueue", "time.sleep")
+
+# Profileur du processus courant (None: profilage inactif, stage() ne coûte rien)
+_PROFILER: Optional["_ProcessProfiler"] = None
+# Session du processus principal (transmise aux workers des pools)
+_SESSION: Optional["ProfileSession"] = None
+# Étape courante de chaque thread
+_THREAD_STAGES: Dict[int, str] = {}
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    Attribue le code exécuté dans le bloc à une étape (fetch, parse, clean, keyword, serialize)
+
+    Sans profilage actif, le bloc est exécuté tel quel. Sinon, les piles échantillonnées
+    du thread sont rangées sous l'étape et sa durée (et son pic mémoire avec tracemalloc)
+    est cumulée.
+
+    Args:
+        name (str): Nom de l'étape
+    """
+    profiler = _PROFILER
+    if profiler is None:
+        yield
+        return
+    thread_id = threading.get_ident()
+    previous = _THREAD_STAGES.get(thread_id)
+    _THREAD_STAGES[thread_id] = name
+    if profiler.memory:
+        tracemalloc.reset_peak()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.add_stage(name, time.perf_counter() - start)
+        if previous is None:
+            _THREAD_STAGES.pop(thread_id, None)
+        else:
+            _THREAD_STAGES[thread_id] = previous
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _is_idle(key: Tuple[str, int, str]) -> bool:
+    """Attente (verrou, sélecteur, pipe des workers) ou fonction du profileur lui-même"""
+    filename, _, name = key
+    if filename == "~":
+        return any(pattern in name for pattern in IDLE_BUILTINS)
+    return os.path.basename(filename) in IDLE_MODULES or filename == __file__
+
+
+def _stats_label(key: Tuple[str, int, str]) -> str:
+    filename, line, name = key
+    return f"{name} ({os.path.basename(filename)}:{line})" if filename != "~" else name
+
+
+class _ProcessProfiler:
+    """
+    Profilage d'un processus: cProfile (tous les threads), échantillonnage des piles
+    par étape et, en option, tracemalloc. Les résultats sont écrits dans le
+    répertoire de la session à l'arrêt.
+    """
+
+    def __init__(self, directory: str, role: str, memory: bool = False, interval: float = SAMPLE_INTERVAL):
+        self.directory = directory
+        self.role = role
+        self.memory = memory
+        self.interval = interval
+        self.stage_seconds: Dict[str, float] = defaultdict(float)
+        self.stage_calls: Counter = Counter()
+        self.stage_peaks: Dict[str, int] = {}
+        self.stacks: Counter = Counter()
+        self._labels: Dict[Any, str] = {}
+        self._lock = threading.Lock()
+        self._profile = cProfile.Profile()
+        self._thread_profiles: List[cProfile.Profile] = []
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._sample_loop, name="profiling-sampler", daemon=True)
+        self._started = time.perf_counter()
+
+    def add_stage(self, name: str, seconds: float):
+        with self._lock:
+            self.stage_seconds[name] += seconds
+            self.stage_calls[name] += 1
+            if self.memory:
+                self.stage_peaks[name] = max(self.stage_peaks.get(name, 0), tracemalloc.get_traced_memory()[1])
+
+    def _thread_hook(self, frame, event, arg):
+        """Premier événement d'un nouveau thread: un profileur cProfile propre au thread le remplace"""
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Python >= 3.12: le profileur du processus voit déjà tous les threads
+            sys.setprofile(None)
+            return
+        with self._lock:
+            self._thread_profiles.append(profile)
+
+    def _sample_loop(self):
+        own = threading.get_ident()
+        labels = self._labels
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if (thread_id == own or frame.f_code.co_name in IDLE_FUNCTIONS
+                        or os.path.basename(frame.f_code.co_filename) in IDLE_MODULES):
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    label = labels.get(code)
+                    if label is None:
+                        label = labels[code] = _frame_label(code)
+                    stack.append(label)
+                    frame = frame.f_back
+                stack.append(_THREAD_STAGES.get(thread_id, NO_STAGE))
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def start(self):
+        if self.memory:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        threading.setprofile(self._thread_hook)
+        self._sampler.start()
+        self._profile.enable()
+
+    def stop(self) -> str:
+        """
+        Arrête le profilage et écrit les résultats du processus
+
+        Returns:
+            str: Préfixe des fichiers écrits ({rôle}-{pid})
+        """
+        self._profile.disable()
+        threading.setprofile(None)
+        self._stop.set()
+        self._sampler.join()
+        prefix = os.path.join(self.directory, f"{self.role}-{os.getpid()}")
+
+        stats = None
+        for profile in [self._profile] + self._thread_profiles:
+            profile.create_stats()
+            if not profile.stats:
+                continue
+            if stats is None:
+                stats = pstats.Stats(profile)
+            else:
+                stats.add(profile)
+        if stats is not None:
+            stats.dump_stats(prefix + ".prof")
+
+        with open(prefix + ".stacks", "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.items():
+                f.write(f"{stack} {count}\n")
+
+        summary = {
+            "role": self.role,
+            "pid": os.getpid(),
+            "elapsed": time.perf_counter() - self._started,
+            "stage_seconds": dict(self.stage_seconds),
+            "stage_calls": dict(self.stage_calls),
+            "stage_peaks": self.stage_peaks,
+        }
+        if self.memory:
+            snapshot = tracemalloc.take_snapshot()
+            summary["memory_peak"] = tracemalloc.get_traced_memory()[1]
+            summary["allocations"] = [
+                {"size": stat.size, "count": stat.count, "traceback": stat.traceback.format()[-3:]}
+                for stat in snapshot.statistics("traceback")[:25]]
+            tracemalloc.stop()
+        with open(prefix + ".json", "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False)
+        return prefix
+
+
+def _profiled_worker_init(config: Dict[str, Any], initializer: Optional[Callable], initargs: tuple):
+    """Initialiseur des workers profilés: initialiseur d'origine, puis profilage jusqu'à la sortie"""
+    global _PROFILER
+    if initializer is not None:
+        initializer(*initargs)
+    _PROFILER = _ProcessProfiler(config["directory"], "worker", config["memory"], config["interval"])
+    _PROFILER.start()
+    # Exécuté à la sortie normale du worker (arrêt du pool)
+    multiprocessing.util.Finalize(None, _PROFILER.stop, exitpriority=100)
+
+
+def worker_initializer(initializer: Optional[Callable] = None, initargs: tuple = ()) -> Dict[str, Any]:
+    """
+    Initialiseur des workers d'un pool de processus, profilés si une session est active
+
+    Usage:
+        ProcessPoolExecutor(max_workers=4, **worker_initializer(init_worker_logging, listener.initargs))
+
+    Args:
+        initializer (Optional[Callable]): Initialiseur d'origine
+        initargs (tuple): Arguments de l'initialiseur d'origine
+
+    Returns:
+        Dict[str, Any]: Arguments initializer et initargs du pool
+    """
+    if _SESSION is None:
+        return {"initializer": initializer, "initargs": initargs}
+    return {"initializer": _profiled_worker_init, "initargs": (_SESSION.config, initializer, initargs)}
+
+
+class ProfileSession:
+    """
+    Profilage d'une exécution: processus principal et workers des pools
+
+    Chaque processus écrit son profil cProfile, ses piles échantillonnées et ses
+    durées par étape dans le répertoire de la session; à l'arrêt, les résultats
+    sont fusionnés en un profil unique (profile.prof, lisible par pstats ou
+    snakeviz), des piles repliées (stacks.collapsed, pour flamegraph.pl ou
+    speedscope) et un rapport des points chauds par étape (report.txt).
+    """
+
+    def __init__(self, name: str, output_dir: str = "data/profiles", enabled: bool = True,
+                 memory: bool = False, interval: float = SAMPLE_INTERVAL, top: int = 40):
+        """
+        Prépare la session
+
+        Args:
+            name (str): Nom de l'exécution (préfixe du répertoire)
+            output_dir (str): Répertoire des profils
+            enabled (bool): Profilage actif (sinon la session ne fait rien)
+            memory (bool): Suivre aussi les allocations (tracemalloc)
+            interval (float): Intervalle d'échantillonnage des piles
+            top (int): Nombre de fonctions du rapport
+        """
+        self.enabled = enabled or memory
+        self.memory = memory
+        self.top = top
+        self.directory = os.path.join(output_dir, f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        self.config = {"directory": self.directory, "memory": memory, "interval": interval}
+        self.report_path: Optional[str] = None
+
+    def start(self):
+        global _PROFILER, _SESSION
+        if not self.enabled:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        _SESSION = self
+        _PROFILER = _ProcessProfiler(self.directory, "main", self.memory, self.config["interval"])
+        _PROFILER.start()
+
+    def stop(self) -> Optional[str]:
+        """
+        Arrête le profilage du processus principal et fusionne les résultats
+
+        Les pools doivent être fermés (workers terminés) avant l'appel.
+
+        Returns:
+            Optional[str]: Chemin du rapport
+        """
+        global _PROFILER, _SESSION
+        if not self.enabled or _PROFILER is None:
+            return None
+        _PROFILER.stop()
+        _PROFILER = None
+        _SESSION = None
+        self.report_path = merge_profiles(self.directory, self.top)
+        logger.info(f"Profil écrit: {self.report_path}")
+        return self.report_path
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def merge_profiles(directory: str, top: int = 40) -> str:
+    """
+    Fusionne les profils des processus d'une session
+
+    Args:
+        directory (str): Répertoire de la session
+        top (int): Nombre de fonctions du classement
+
+    Returns:
+        str: Chemin du rapport (report.txt)
+    """
+    files = sorted(os.listdir(directory))
+
+    # Piles repliées: une ligne "étape;cadre;...;cadre nombre" par pile distincte
+    stacks: Counter = Counter()
+    for name in files:
+        if name.endswith(".stacks"):
+            with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+                for line in f:
+                    stack, _, count = line.rstrip("\n").rpartition(" ")
+                    stacks[stack] += int(count)
+    with open(os.path.join(directory, "stacks.collapsed"), "w", encoding="utf-8") as f:
+        for stack, count in stacks.most_common():
+            f.write(f"{stack} {count}\n")
+
+    # Étape de chaque fonction: celle sous laquelle elle apparaît le plus souvent
+    frame_stages: Dict[str, Counter] = defaultdict(Counter)
+    self_samples: Dict[str, Counter] = defaultdict(Counter)
+    stage_samples: Counter = Counter()
+    for stack, count in stacks.items():
+        frames = stack.split(";")
+        stage_name = frames[0]
+        stage_samples[stage_name] += count
+        for frame in set(frames[1:]):
+            frame_stages[frame][stage_name] += count
+        if len(frames) > 1:
+            self_samples[stage_name][frames[-1]] += count
+
+    summaries = []
+    for name in files:
+        if name.endswith(".json"):
+            with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+                summaries.append(json.load(f))
+    stage_seconds: Counter = Counter()
+    stage_calls: Counter = Counter()
+    stage_peaks: Dict[str, int] = {}
+    for summary in summaries:
+        stage_seconds.update(summary["stage_seconds"])
+        stage_calls.update(summary["stage_calls"])
+        for stage_name, peak in summary.get("stage_peaks", {}).items():
+            stage_peaks[stage_name] = max(stage_peaks.get(stage_name, 0), peak)
+
+    lines = [f"Profil: {directory}",
+             f"Processus: {sum(1 for s in summaries if s['role'] == 'main')} principal, "
+             f"{sum(1 for s in summaries if s['role'] == 'worker')} workers", ""]
+
+    lines.append("Étapes (durée cumulée sur tous les processus et threads, échantillons actifs)")
+    total_samples = sum(stage_samples.values()) or 1
+    for stage_name in list(STAGES) + sorted((set(stage_seconds) | set(stage_samples)) - set(STAGES)):
+        if stage_name not in stage_seconds and stage_name not in stage_samples:
+            continue
+        peak = f"  pic {stage_peaks[stage_name] / 1e6:8.1f} Mo" if stage_name in stage_peaks else ""
+        lines.append(f"  {stage_name:10s} {stage_seconds.get(stage_name, 0.0):10.2f} s  "
+                     f"{stage_calls.get(stage_name, 0):8d} appels  "
+                     f"{stage_samples.get(stage_name, 0) / total_samples * 100:5.1f} % des échantillons{peak}")
+    lines.append("")
+
+    profiles = [os.path.join(directory, name) for name in files if name.endswith(".prof")]
+    if profiles:
+        stats = pstats.Stats(*profiles)
+        stats.dump_stats(os.path.join(directory, "profile.prof"))
+        entries = sorted((item for item in stats.stats.items() if not _is_idle(item[0])),
+                         key=lambda item: item[1][2], reverse=True)[:top]
+
+        stage_cache: Dict[Any, str] = {}
+
+        def stage_of(key) -> str:
+            # Fonction absente des piles (C ou trop brève): étape de l'appelant le plus coûteux
+            path = []
+            while key not in stage_cache and key not in path:
+                stages = frame_stages.get(_stats_label(key))
+                if stages:
+                    stage_cache[key] = stages.most_common(1)[0][0]
+                    break
+                path.append(key)
+                callers = stats.stats.get(key, (0, 0, 0, 0, {}))[4]
+                if not callers:
+                    break
+                key = max(callers.items(), key=lambda item: item[1][3])[0]
+            found = stage_cache.get(key, "-")
+            for visited in path:
+                stage_cache[visited] = found
+            return found
+
+        lines.append(f"Fonctions les plus coûteuses (temps propre, {len(profiles)} profils fusionnés)")
+        lines.append(f"  {'propre (s)':>10s} {'cumulé (s)':>10s} {'appels':>10s}  {'étape':10s} fonction")
+        for key, (_, calls, tottime, cumtime, _) in entries:
+            lines.append(f"  {tottime:10.3f} {cumtime:10.3f} {calls:10d}  {stage_of(key):10s} {_stats_label(key)}")
+        lines.append("")
+
+    lines.append("Points chauds par étape (échantillons, fonction en cours d'exécution)")
+    for stage_name, functions in sorted(self_samples.items(), key=lambda item: -stage_samples[item[0]]):
+        lines.append(f"  [{stage_name}]")
+        for frame, count in functions.most_common(10):
+            lines.append(f"    {count / stage_samples[stage_name] * 100:5.1f} %  {frame}")
+    lines.append("")
+
+    if any("allocations" in summary for summary in summaries):
+        lines.append("Mémoire (tracemalloc)")
+        for summary in summaries:
+            if "allocations" not in summary:
+                continue
+            lines.append(f"  {summary['role']} {summary['pid']}: pic {summary['memory_peak'] / 1e6:.1f} Mo")
+            for allocation in summary["allocations"][:5]:
+                lines.append(f"    {allocation['size'] / 1e6:8.2f} Mo  {allocation['count']:8d} blocs  "
+                             f"{' <- '.join(line.strip() for line in reversed(allocation['traceback']) if line.strip().startswith('File'))}")
+
+    report_path = os.path.join(directory, "report.txt")
+    with open(report_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    return report_path
@@ -0,0 +1,525 @@
+import os
+import re
+import json
+import gzip
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .date_utils import record_timestamp
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    # zstandard est optionnel: gzip est toujours disponible
+    ZSTD_AVAILABLE = False
+
+# Fichiers bruts par exécution: {collecteur}_{catégorie}_{timestamp}[...].json
+RAW_FILENAME = re.compile(r"^(?P<collector>[a-z]+)_(?P<category>.+?)_\d{8}_\d{6}.*\.json$")
+
+# Champs dont le contenu distingue deux versions d'un même lien (instantanés d'une page)
+VERSION_FIELDS = ("title", "summary", "content")
+
+# Préfixe des unités de travail lues depuis l'archive: archive://{type}/{unité} (cf. TextProcessor)
+ARCHIVE_SCHEME = "archive://"
+
+
+def record_id(item: Dict[str, Any]) -> str:
+    """
+    Identifiant d'un enregistrement brut (lien, URL ou contenu à défaut)
+
+    Args:
+        item (Dict[str, Any]): Enregistrement collecté
+
+    Returns:
+        str: Identifiant
+    """
+    return item.get("link") or item.get("url") or json.dumps(item, sort_keys=True, ensure_ascii=False)
+
+
+def link_hash(identifier: str) -> int:
+    """
+    Hachage 64 bits signé d'un identifiant (clé de l'index)
+
+    Args:
+        identifier (str): Identifiant de l'enregistrement
+
+    Returns:
+        int: Clé de l'index
+    """
+    digest = hashlib.blake2b(identifier.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def record_key(item: Dict[str, Any]) -> int:
+    """
+    Clé de dédoublonnage d'un enregistrement: lien et version de son contenu
+
+    Deux collectes identiques d'un même lien partagent la clé; un nouvel instantané
+    d'une page (contenu différent sous la même URL) en obtient une nouvelle.
+
+    Args:
+        item (Dict[str, Any]): Enregistrement collecté
+
+    Returns:
+        int: Clé de l'index
+    """
+    version = json.dumps([item.get(field) for field in VERSION_FIELDS], ensure_ascii=False)
+    return link_hash(f"{record_id(item)}\n{version}")
+
+
+def _compress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+class RawArchive:
+    """
+    Archive compressée des données brutes avec accès direct par article
+
+    Les enregistrements sont stockés par blocs compressés (zstd si disponible,
+    gzip sinon) dans de gros segments en ajout seul. Un index SQLite associe chaque
+    version d'un article (lien et contenu, cf. record_key) à (segment, position du
+    bloc, rang dans le bloc) et à sa date: lire un article ou un intervalle de temps
+    ne décompresse que les blocs concernés.
+    """
+
+    def __init__(self, archive_dir: str, block_records: int = 256,
+                 segment_max_bytes: int = 256 * 1024 * 1024, codec: Optional[str] = None,
+                 block_cache_size: int = 8):
+        """
+        Ouvre (ou crée) l'archive
+
+        Args:
+            archive_dir (str): Répertoire de l'archive
+            block_records (int): Nombre maximal d'enregistrements par bloc
+            segment_max_bytes (int): Taille au-delà de laquelle un nouveau segment est ouvert
+            codec (Optional[str]): "zstd" ou "gzip" (zstd par défaut s'il est installé)
+            block_cache_size (int): Nombre de blocs décompressés gardés en mémoire
+        """
+        self.archive_dir = archive_dir
+        self.block_records = block_records
+        self.segment_max_bytes = segment_max_bytes
+        self.codec = codec or ("zstd" if ZSTD_AVAILABLE else "gzip")
+        self.block_cache_size = block_cache_size
+        self._block_cache: "OrderedDict[int, List[Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        os.makedirs(archive_dir, exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(archive_dir, "index.sqlite"), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS segments (
+                segment_id INTEGER PRIMARY KEY,
+                filename TEXT NOT NULL,
+                codec TEXT NOT NULL,
+                created_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS blocks (
+                block_id INTEGER PRIMARY KEY,
+                segment_id INTEGER NOT NULL,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                records INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS records (
+                link_hash INTEGER PRIMARY KEY,
+                link TEXT NOT NULL,
+                collector_type TEXT NOT NULL,
+                category TEXT NOT NULL,
+                block_id INTEGER NOT NULL,
+                position INTEGER NOT NULL,
+                ts INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS idx_records_source ON records (collector_type, category);
+            CREATE INDEX IF NOT EXISTS idx_records_link ON records (link);
+            CREATE INDEX IF NOT EXISTS idx_records_time ON records (collector_type, category, ts);
+            CREATE INDEX IF NOT EXISTS idx_blocks_segment ON blocks (segment_id);
+            CREATE TABLE IF NOT EXISTS seen (
+                link_hash INTEGER PRIMARY KEY,
+                link TEXT NOT NULL,
+                collector_type TEXT NOT NULL,
+                category TEXT NOT NULL,
+                seen_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_seen_source ON seen (collector_type, category);
+            CREATE TABLE IF NOT EXISTS files (
+                filename TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                compacted_at REAL NOT NULL
+            );
+        """)
+
+    @staticmethod
+    def exists(archive_dir: str) -> bool:
+        """Indique si une archive existe dans le répertoire"""
+        return os.path.exists(os.path.join(archive_dir, "index.sqlite"))
+
+    def _current_segment(self) -> Tuple[int, str, str]:
+        """
+        Segment ouvert en écriture (nouveau segment si le courant est plein)
+
+        Returns:
+            Tuple[int, str, str]: Identifiant, chemin et codec du segment
+        """
+        row = self.conn.execute(
+            "SELECT segment_id, filename, codec FROM segments ORDER BY segment_id DESC LIMIT 1").fetchone()
+        if row:
+            path = os.path.join(self.archive_dir, row[1])
+            if row[2] == self.codec and (not os.path.exists(path) or os.path.getsize(path) < self.segment_max_bytes):
+                return row[0], path, row[2]
+        segment_id = (row[0] + 1) if row else 1
+        filename = f"segment_{segment_id:06d}.dat"
+        self.conn.execute("INSERT INTO segments (segment_id, filename, codec, created_at) VALUES (?, ?, ?, ?)",
+                          (segment_id, filename, self.codec, time.time()))
+        return segment_id, os.path.join(self.archive_dir, filename), self.codec
+
+    def append(self, collector_type: str, category: str, items: List[Dict[str, Any]]) -> int:
+        """
+        Ajoute des enregistrements (les versions déjà archivées sont ignorées)
+
+        Args:
+            collector_type (str): Type de collecteur ("rss", "web")
+            category (str): Catégorie
+            items (List[Dict[str, Any]]): Enregistrements bruts
+
+        Returns:
+            int: Nombre d'enregistrements ajoutés
+        """
+        with self._lock:
+            # Dédoublonnage par lien et version, dans le lot et avec l'archive existante
+            pending: "OrderedDict[int, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+            for item in items:
+                key = record_key(item)
+                if key not in pending:
+                    pending[key] = (record_id(item), item)
+            keys = list(pending.keys())
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                for (existing,) in self.conn.execute(
+                        f"SELECT link_hash FROM records WHERE link_hash IN ({','.join('?' * len(chunk))})", chunk):
+                    pending.pop(existing, None)
+            if not pending:
+                return 0
+
+            entries = list(pending.items())
+            with self.conn:
+                segment_id, path, codec = self._current_segment()
+                with open(path, "ab") as f:
+                    for start in range(0, len(entries), self.block_records):
+                        block = entries[start:start + self.block_records]
+                        payload = _compress(codec, "\n".join(
+                            json.dumps(item, ensure_ascii=False) for _, (_, item) in block).encode("utf-8"))
+                        offset = f.tell()
+                        f.write(payload)
+                        cursor = self.conn.execute(
+                            "INSERT INTO blocks (segment_id, offset, length, records) VALUES (?, ?, ?, ?)",
+                            (segment_id, offset, len(payload), len(block)))
+                        block_id = cursor.lastrowid
+                        self.conn.executemany(
+                            "INSERT INTO records (link_hash, link, collector_type, category, block_id, position, ts) "
+                            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            [(key, identifier, collector_type, category, block_id, position, record_timestamp(item))
+                             for position, (key, (identifier, item)) in enumerate(block)])
+                    f.flush()
+                    os.fsync(f.fileno())
+            return len(entries)
+
+    def _read_block(self, block_id: int) -> List[Dict[str, Any]]:
+        """
+        Lit et décompresse un seul bloc (avec cache LRU)
+
+        Args:
+            block_id (int): Identifiant du bloc
+
+        Returns:
+            List[Dict[str, Any]]: Enregistrements du bloc
+        """
+        with self._lock:
+            cached = self._block_cache.get(block_id)
+            if cached is not None:
+                self._block_cache.move_to_end(block_id)
+                return cached
+
+        row = self.conn.execute(
+            "SELECT s.filename, s.codec, b.offset, b.length FROM blocks b "
+            "JOIN segments s ON s.segment_id = b.segment_id WHERE b.block_id = ?", (block_id,)).fetchone()
+        if row is None:
+            return []
+        filename, codec, offset, length = row
+        with open(os.path.join(self.archive_dir, filename), "rb") as f:
+            f.seek(offset)
+            data = _decompress(codec, f.read(length))
+        records = [json.loads(line) for line in data.decode("utf-8").split("\n") if line]
+
+        with self._lock:
+            self._block_cache[block_id] = records
+            if len(self._block_cache) > self.block_cache_size:
+                self._block_cache.popitem(last=False)
+        return records
+
+    def get(self, link: str) -> Optional[Dict[str, Any]]:
+        """
+        Récupère un article par son lien (ou son URL), dans sa dernière version archivée
+
+        Args:
+            link (str): Lien de l'article
+
+        Returns:
+            Optional[Dict[str, Any]]: Enregistrement brut ou None
+        """
+        row = self.conn.execute(
+            "SELECT block_id, position FROM records WHERE link = ? ORDER BY block_id DESC, position DESC LIMIT 1",
+            (link,)).fetchone()
+        if row is None:
+            return None
+        records = self._read_block(row[0])
+        return records[row[1]] if row[1] < len(records) else None
+
+    def mark_seen(self, collector_type: str, category: str, links: List[str]) -> int:
+        """
+        Enregistre des liens traités sans que leur enregistrement brut soit conservé
+
+        Le pipeline de flux ne sauvegarde les données brutes qu'à la demande: ses
+        articles sont marqués vus ici pour ne pas être retraités à l'exécution suivante.
+
+        Args:
+            collector_type (str): Type de collecteur
+            category (str): Catégorie
+            links (List[str]): Liens (ou URLs) des articles
+
+        Returns:
+            int: Nombre de liens nouvellement marqués
+        """
+        now = time.time()
+        with self._lock, self.conn:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO seen (link_hash, link, collector_type, category, seen_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(link_hash(link), link, collector_type, category, now) for link in links if link])
+            return self.conn.total_changes - before
+
+    def known_ids(self, collector_type: Optional[str] = None, category: Optional[str] = None) -> Set[str]:
+        """
+        Liens archivés ou marqués vus (sans décompression)
+
+        Args:
+            collector_type (Optional[str]): Type de collecteur (tous par défaut)
+            category (Optional[str]): Catégorie (toutes par défaut)
+
+        Returns:
+            Set[str]: Liens connus
+        """
+        known = set()
+        for table in ("records", "seen"):
+            known.update(row[0] for row in self.conn.execute(
+                f"SELECT link FROM {table} WHERE (? IS NULL OR collector_type = ?) AND (? IS NULL OR category = ?)",
+                (collector_type, collector_type, category, category)))
+        return known
+
+    def time_range(self, collector_type: str, category: str, start_ts: Optional[int] = None,
+                   end_ts: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Enregistrements d'une source publiés dans un intervalle de temps
+
+        L'intervalle est résolu dans l'index; seuls les blocs qui contiennent des
+        enregistrements de l'intervalle sont décompressés.
+
+        Args:
+            collector_type (str): Type de collecteur
+            category (str): Catégorie
+            start_ts (Optional[int]): Début de l'intervalle, timestamp UTC inclus
+            end_ts (Optional[int]): Fin de l'intervalle, timestamp UTC exclu
+
+        Returns:
+            List[Dict[str, Any]]: Enregistrements triés par date croissante
+        """
+        rows = self.conn.execute(
+            "SELECT block_id, position FROM records WHERE collector_type = ? AND category = ? "
+            "AND ts IS NOT NULL AND (? IS NULL OR ts >= ?) AND (? IS NULL OR ts < ?) ORDER BY ts",
+            (collector_type, category, start_ts, start_ts, end_ts, end_ts)).fetchall()
+        blocks: Dict[int, List[Dict[str, Any]]] = {}
+        items = []
+        for block_id, position in rows:
+            if block_id not in blocks:
+                blocks[block_id] = self._read_block(block_id)
+            if position < len(blocks[block_id]):
+                items.append(blocks[block_id][position])
+        return items
+
+    def units(self, blocks_per_unit: int = 16) -> List[Tuple[str, int]]:
+        """
+        Unités de traitement de l'archive: couples (type de collecteur, groupe de blocs)
+
+        Les groupes sont définis par block_id // blocks_per_unit, donc stables quand
+        de nouveaux blocs sont ajoutés, et bornent la mémoire de chaque worker.
+
+        Args:
+            blocks_per_unit (int): Nombre de blocs par unité
+
+        Returns:
+            List[Tuple[str, int]]: Unités triées
+        """
+        return list(self.conn.execute(
+            "SELECT DISTINCT collector_type, block_id / ? AS unit FROM records "
+            "ORDER BY unit, collector_type", (blocks_per_unit,)))
+
+    def count(self, collector_type: Optional[str] = None, unit: Optional[int] = None,
+              blocks_per_unit: int = 16) -> int:
+        """
+        Nombre d'enregistrements, éventuellement filtrés (cf. iter_records)
+
+        Args:
+            collector_type (Optional[str]): Filtre sur le type de collecteur
+            unit (Optional[int]): Filtre sur le groupe de blocs
+            blocks_per_unit (int): Nombre de blocs par unité
+
+        Returns:
+            int: Nombre d'enregistrements
+        """
+        query = "SELECT COUNT(*) FROM records WHERE 1 = 1"
+        params: list = []
+        if collector_type:
+            query += " AND collector_type = ?"
+            params.append(collector_type)
+        if unit is not None:
+            query += " AND block_id >= ? AND block_id < ?"
+            params.extend([unit * blocks_per_unit, (unit + 1) * blocks_per_unit])
+        return self.conn.execute(query, params).fetchone()[0]
+
+    def iter_records(self, collector_type: Optional[str] = None, unit: Optional[int] = None,
+                     blocks_per_unit: int = 16) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt séquentiellement les enregistrements, bloc par bloc
+
+        Args:
+            collector_type (Optional[str]): Filtre sur le type de collecteur
+            unit (Optional[int]): Filtre sur le groupe de blocs (cf. units)
+            blocks_per_unit (int): Nombre de blocs par unité
+
+        Yields:
+            Dict[str, Any]: Enregistrements bruts
+        """
+        query = "SELECT block_id, position FROM records WHERE 1 = 1"
+        params: list = []
+        if collector_type:
+            query += " AND collector_type = ?"
+            params.append(collector_type)
+        if unit is not None:
+            query += " AND block_id >= ? AND block_id < ?"
+            params.extend([unit * blocks_per_unit, (unit + 1) * blocks_per_unit])
+        query += " ORDER BY block_id, position"
+
+        current_block, records = None, []
+        for block_id, position in self.conn.execute(query, params).fetchall():
+            if block_id != current_block:
+                current_block, records = block_id, self._read_block(block_id)
+            if position < len(records):
+                yield records[position]
+
+    def compacted_files(self, raw_dir: str) -> Set[str]:
+        """
+        Fichiers bruts déjà compactés et inchangés depuis (leur contenu est lu dans l'archive)
+
+        Args:
+            raw_dir (str): Répertoire des fichiers bruts par exécution
+
+        Returns:
+            Set[str]: Noms des fichiers
+        """
+        compacted = set()
+        for filename, size, mtime_ns in self.conn.execute("SELECT filename, size, mtime_ns FROM files"):
+            try:
+                stat = os.stat(os.path.join(raw_dir, filename))
+            except OSError:
+                continue
+            if stat.st_size == size and stat.st_mtime_ns == mtime_ns:
+                compacted.add(filename)
+        return compacted
+
+    def compact(self, raw_dir: str, remove_source: bool = False) -> Dict[str, int]:
+        """
+        Compaction: fusionne les petits fichiers JSON par exécution dans l'archive
+
+        Les fichiers sont conservés par défaut: ceux déjà compactés et inchangés sont
+        ignorés aux compactions suivantes, et les lecteurs (chargement par intervalle,
+        traitement) les lisent dans l'archive.
+
+        Args:
+            raw_dir (str): Répertoire des fichiers bruts par exécution
+            remove_source (bool): Supprimer les fichiers une fois archivés
+
+        Returns:
+            Dict[str, int]: Fichiers compactés, enregistrements ajoutés et ignorés (doublons)
+        """
+        stats = {"files": 0, "added": 0, "skipped": 0}
+        compacted = self.compacted_files(raw_dir)
+        for filename in sorted(os.listdir(raw_dir)):
+            match = RAW_FILENAME.match(filename)
+            if not match:
+                continue
+            filepath = os.path.join(raw_dir, filename)
+            if filename in compacted:
+                if remove_source:
+                    os.remove(filepath)
+                continue
+            try:
+                stat = os.stat(filepath)
+                with open(filepath, "r", encoding="utf-8") as f:
+                    items = json.load(f)
+            except Exception as e:
+                print(f"Erreur lors de la lecture du fichier {filepath}: {e}")
+                continue
+
+            added = self.append(match.group("collector"), match.group("category"), items)
+            with self._lock, self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO files (filename, size, mtime_ns, compacted_at) VALUES (?, ?, ?, ?)",
+                    (filename, stat.st_size, stat.st_mtime_ns, time.time()))
+            stats["files"] += 1
+            stats["added"] += added
+            stats["skipped"] += len(items) - added
+            if remove_source:
+                os.remove(filepath)
+        return stats
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Statistiques de l'archive
+
+        Returns:
+            Dict[str, Any]: Nombre de segments, blocs, enregistrements et taille compressée
+        """
+        segments = [row[0] for row in self.conn.execute("SELECT filename FROM segments")]
+        size = sum(os.path.getsize(os.path.join(self.archive_dir, s))
+                   for s in segments if os.path.exists(os.path.join(self.archive_dir, s)))
+        return {
+            "codec": self.codec,
+            "segments": len(segments),
+            "blocks": self.conn.execute("SELECT COUNT(*) FROM blocks").fetchone()[0],
+            "records": self.conn.execute("SELECT COUNT(*) FROM records").fetchone()[0],
+            "compressed_bytes": size
+        }
+
+    def close(self):
+        """Ferme l'index"""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,255 @@
+import os
+import re
+import json
+import html
+import hashlib
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .aho_corasick import AhoCorasick, fold_text
+
+# Fichier de configuration du préfiltre, à la racine du projet (absent: pas de filtrage)
+DEFAULT_RELEVANCE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "relevance.json")
+
+# Traitement des articles sous le seuil: marqués seulement, traitement allégé, ou écartés à la collecte
+ACTIONS = ("tag", "cheap", "drop")
+
+# Valeurs par défaut d'une règle de catégorie
+DEFAULT_RULE = {
+    "threshold": 1.0,
+    "action": "tag",
+    "title_weight": 2.0,
+    "terms": {},
+}
+
+# Intervalle minimal entre deux vérifications de la date de modification du fichier (secondes)
+RELOAD_CHECK_INTERVAL = 2.0
+
+# Le préfiltre ne lit que le début du résumé (ou du contenu, à défaut de résumé)
+MAX_SCAN_CHARS = 2000
+
+_TAGS = re.compile(r"<[^>]*>")
+
+
+class RelevanceConfigError(ValueError):
+    """Configuration du préfiltre invalide"""
+
+
+class Relevance(NamedTuple):
+    """
+    Résultat du préfiltre pour un article
+
+    Attributes:
+        score (float): Score de pertinence (somme des poids des termes trouvés)
+        relevant (bool): Score au moins égal au seuil de la catégorie
+        action (str): Action de la catégorie sous le seuil ("tag", "cheap" ou "drop")
+        terms (Tuple[str, ...]): Termes trouvés
+    """
+    score: float
+    relevant: bool
+    action: str
+    terms: Tuple[str, ...]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Valeur du champ "relevance" d'un article"""
+        return {"score": round(self.score, 3), "relevant": self.relevant, "terms": list(self.terms)}
+
+
+class _Rule(NamedTuple):
+    threshold: float
+    action: str
+    title_weight: float
+    weights: Dict[int, float]
+
+
+def _plain_text(text: Any) -> str:
+    """Début du texte sans balises HTML (sans analyse: le préfiltre doit rester peu coûteux)"""
+    if not isinstance(text, str) or not text:
+        return ""
+    text = text[:MAX_SCAN_CHARS * 2]
+    if "<" in text:
+        text = _TAGS.sub(" ", text)
+    if "&" in text:
+        text = html.unescape(text)
+    return text[:MAX_SCAN_CHARS]
+
+
+def _validate_rule(name: str, rule: Any) -> Dict[str, Any]:
+    if not isinstance(rule, dict):
+        raise RelevanceConfigError(f"{name}: la règle doit être un objet")
+    unknown = set(rule) - set(DEFAULT_RULE)
+    if unknown:
+        raise RelevanceConfigError(f"{name}: clés inconnues {sorted(unknown)}")
+    rule = {**DEFAULT_RULE, **rule}
+    if rule["action"] not in ACTIONS:
+        raise RelevanceConfigError(f"{name}: action inconnue {rule['action']!r} (attendu: {', '.join(ACTIONS)})")
+    for key in ("threshold", "title_weight"):
+        if not isinstance(rule[key], (int, float)) or isinstance(rule[key], bool):
+            raise RelevanceConfigError(f"{name}: {key} doit être un nombre")
+    if not isinstance(rule["terms"], dict) or not all(
+            isinstance(term, str) and term.strip() and isinstance(weight, (int, float)) and not isinstance(weight, bool)
+            for term, weight in rule["terms"].items()):
+        raise RelevanceConfigError(f"{name}: terms doit associer des termes à des poids")
+    return rule
+
+
+class RelevanceFilter:
+    """
+    Préfiltre de pertinence par catégorie, sur le titre et le résumé
+
+    Les termes de toutes les catégories sont compilés en un seul automate
+    (Aho-Corasick): un article est lu une fois, en temps linéaire, quel que soit
+    le nombre de termes. Le score est la somme des poids des termes distincts
+    trouvés (poids négatifs permis), multipliés par title_weight pour les termes
+    du titre. Une catégorie sans règle utilise la règle "default" si elle existe,
+    sinon ses articles ne sont pas filtrés.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Compile la configuration
+
+        Args:
+            config (Dict[str, Any]): {"default": règle, "categories": {catégorie: règle}}
+
+        Raises:
+            RelevanceConfigError: Configuration invalide
+        """
+        if not isinstance(config, dict) or set(config) - {"default", "categories"}:
+            raise RelevanceConfigError("clés attendues: default, categories")
+        rules = {name: _validate_rule(name, rule) for name, rule in (config.get("categories") or {}).items()}
+        default = _validate_rule("default", config["default"]) if config.get("default") else None
+
+        terms: List[str] = []
+        for rule in list(rules.values()) + ([default] if default else []):
+            terms.extend(rule["terms"])
+        self.matcher = AhoCorasick(terms)
+
+        def compile_rule(rule: Dict[str, Any]) -> _Rule:
+            weights = {}
+            for term, weight in rule["terms"].items():
+                weights[self.matcher.index_of(term)] = float(weight)
+            return _Rule(float(rule["threshold"]), rule["action"], float(rule["title_weight"]), weights)
+
+        self.rules = {name: compile_rule(rule) for name, rule in rules.items()}
+        self.default = compile_rule(default) if default else None
+        self.fingerprint = hashlib.blake2b(
+            json.dumps(config, sort_keys=True, ensure_ascii=False).encode("utf-8"), digest_size=4).hexdigest()
+
+    def rule_for(self, category: Optional[str]) -> Optional[_Rule]:
+        return self.rules.get(category, self.default) if category is not None else self.default
+
+    def score(self, category: Optional[str], title: Any, summary: Any) -> Optional[Relevance]:
+        """
+        Évalue un article
+
+        Args:
+            category (Optional[str]): Catégorie de la source
+            title (Any): Titre
+            summary (Any): Résumé ou début du contenu (HTML accepté)
+
+        Returns:
+            Optional[Relevance]: Résultat, None si la catégorie n'est pas filtrée
+        """
+        rule = self.rule_for(category)
+        if rule is None:
+            return None
+        weights = rule.weights
+        found: Dict[int, float] = {}
+        title = fold_text(_plain_text(title))
+        for _, _, index in self.matcher.iter_matches(title, folded=True):
+            if index in weights:
+                found[index] = weights[index] * rule.title_weight
+        for _, _, index in self.matcher.iter_matches(fold_text(_plain_text(summary)), folded=True):
+            if index in weights and index not in found:
+                found[index] = weights[index]
+        score = sum(found.values())
+        patterns = self.matcher.patterns
+        return Relevance(score, score >= rule.threshold, rule.action,
+                         tuple(patterns[index] for index in sorted(found)))
+
+    def score_article(self, article: Dict[str, Any]) -> Optional[Relevance]:
+        """
+        Évalue un article collecté (titre, puis résumé ou à défaut contenu)
+
+        Args:
+            article (Dict[str, Any]): Article brut
+
+        Returns:
+            Optional[Relevance]: Résultat, None si la catégorie n'est pas filtrée
+        """
+        return self.score(article.get("category"), article.get("title"),
+                          article.get("summary") or article.get("content"))
+
+    def apply(self, category: str, items: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Marque les articles d'une catégorie et écarte ceux que la règle abandonne
+
+        Chaque article évalué reçoit un champ "relevance" (score, relevant, terms),
+        relu ensuite par le processeur pour choisir le traitement complet ou allégé.
+
+        Args:
+            category (str): Catégorie des articles
+            items (List[Dict[str, Any]]): Articles collectés (modifiés en place)
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: Articles conservés et nombre d'articles écartés
+        """
+        rule = self.rule_for(category)
+        if rule is None:
+            return items, 0
+        kept = []
+        for item in items:
+            relevance = self.score(category, item.get("title"), item.get("summary") or item.get("content"))
+            item["relevance"] = relevance.as_dict()
+            if relevance.relevant or relevance.action != "drop":
+                kept.append(item)
+        return kept, len(items) - len(kept)
+
+
+# Préfiltres du processus, rechargés quand le fichier change: (date de modification,
+# préfiltre, date de la dernière vérification)
+_FILTERS: Dict[str, Tuple[Optional[float], Optional[RelevanceFilter], float]] = {}
+_FILTERS_LOCK = threading.Lock()
+
+
+def get_relevance_filter(path: Optional[str] = DEFAULT_RELEVANCE_PATH) -> Optional[RelevanceFilter]:
+    """
+    Préfiltre partagé du processus, recompilé seulement si le fichier a changé
+
+    Appelé pour chaque article: la date de modification du fichier n'est relue
+    qu'une fois par RELOAD_CHECK_INTERVAL, le préfiltre en cache est rendu
+    sans appel système entre deux vérifications.
+
+    Args:
+        path (Optional[str]): Fichier de configuration (None: pas de filtrage)
+
+    Returns:
+        Optional[RelevanceFilter]: Préfiltre, None si le fichier est absent ou invalide
+    """
+    if not path:
+        return None
+    now = time.monotonic()
+    cached = _FILTERS.get(path)
+    if cached is not None and now - cached[2] < RELOAD_CHECK_INTERVAL:
+        return cached[1]
+    with _FILTERS_LOCK:
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = None
+        cached = _FILTERS.get(path)
+        if cached is not None and cached[0] == mtime:
+            _FILTERS[path] = (mtime, cached[1], now)
+            return cached[1]
+        relevance_filter = None
+        if mtime is not None:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    relevance_filter = RelevanceFilter(json.load(f))
+            except (OSError, ValueError) as e:
+                print(f"Préfiltre de pertinence ignoré ({path}): {e}")
+        _FILTERS[path] = (mtime, relevance_filter, now)
+        return relevance_filter
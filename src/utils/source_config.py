@@ -0,0 +1,176 @@
+import os
+import re
+import json
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Fichier des sources à la racine du projet
+DEFAULT_SOURCES_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "sources.json")
+
+# Section de sources.json pour chaque type de collecteur
+SOURCE_SECTIONS = {"rss": "rss_feeds", "web": "websites"}
+
+# Intervalle de collecte par défaut d'une source (ordonnanceur), en secondes
+DEFAULT_INTERVAL = 3600
+
+# Schéma des sources: clé -> (types acceptés, obligatoire, types de collecteur concernés)
+SOURCE_SCHEMA = {
+    "name": ((str,), True, ("rss", "web")),
+    "url": ((str,), True, ("rss", "web")),
+    "category": ((str,), True, ("rss", "web")),
+    "interval": ((int, float), False, ("rss", "web")),
+    "enabled": ((bool,), False, ("rss", "web")),
+    "selector": ((str,), False, ("web",)),
+    "fallback_selectors": ((list,), False, ("web",)),
+    "headers": ((dict,), False, ("web",)),
+    "max_bytes": ((int,), False, ("rss", "web")),
+    "stop_marker": ((str,), False, ("web",)),
+    "crawl": ((dict,), False, ("web",)),
+}
+
+CRAWL_SCHEMA = {
+    "max_depth": (int,),
+    "max_pages": (int,),
+    "link_selector": (str, type(None)),
+    "allow_pattern": (str, type(None)),
+    "article_selector": (str, type(None)),
+    "same_host": (bool,),
+    "delay": (int, float),
+}
+
+
+class SourceValidationError(ValueError):
+    """Source invalide dans sources.json"""
+
+
+def validate_source(kind: str, info: Any) -> List[str]:
+    """
+    Vérifie une source par rapport au schéma
+
+    Args:
+        kind (str): Type de collecteur ("rss" ou "web")
+        info (Any): Source lue dans sources.json
+
+    Returns:
+        List[str]: Erreurs trouvées (liste vide si la source est valide)
+    """
+    if not isinstance(info, dict):
+        return [f"une source doit être un objet, pas {type(info).__name__}"]
+    # Clé inconnue (faute de frappe): elle serait ignorée sans avertissement
+    errors = [f"clé inconnue: {key}" for key in info if key not in SOURCE_SCHEMA]
+    for key, (types, required, kinds) in SOURCE_SCHEMA.items():
+        if key not in info:
+            if required:
+                errors.append(f"clé obligatoire manquante: {key}")
+            continue
+        value = info[key]
+        if kind not in kinds:
+            errors.append(f"clé {key} non prise en charge pour une source {kind}")
+        elif not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+            errors.append(f"{key}: type {type(value).__name__} invalide")
+    if errors:
+        return errors
+
+    url = urlsplit(info["url"])
+    if url.scheme not in ("http", "https") or not url.netloc:
+        errors.append(f"url invalide: {info['url']}")
+    if not info["name"].strip() or not info["category"].strip():
+        errors.append("name et category ne peuvent pas être vides")
+    if "interval" in info and info["interval"] <= 0:
+        errors.append("interval doit être positif")
+    if "max_bytes" in info and info["max_bytes"] <= 0:
+        errors.append("max_bytes doit être positif")
+    if "stop_marker" in info and not info["stop_marker"]:
+        errors.append("stop_marker ne peut pas être vide")
+    if not all(isinstance(s, str) for s in info.get("fallback_selectors", [])):
+        errors.append("fallback_selectors doit être une liste de sélecteurs")
+    if not all(isinstance(k, str) and isinstance(v, str) for k, v in info.get("headers", {}).items()):
+        errors.append("headers doit associer des chaînes à des chaînes")
+    for key, value in (info.get("crawl") or {}).items():
+        if key not in CRAWL_SCHEMA:
+            errors.append(f"crawl: clé inconnue {key}")
+        elif not isinstance(value, CRAWL_SCHEMA[key]) or (isinstance(value, bool) and bool not in CRAWL_SCHEMA[key]):
+            errors.append(f"crawl.{key}: type {type(value).__name__} invalide")
+    pattern = (info.get("crawl") or {}).get("allow_pattern")
+    if isinstance(pattern, str):
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            errors.append(f"crawl.allow_pattern invalide: {e}")
+    return errors
+
+
+def file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """
+    Signature d'un fichier (date de modification, taille), None s'il est absent
+
+    Args:
+        path (str): Chemin du fichier
+
+    Returns:
+        Optional[Tuple[int, int]]: Signature du fichier
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def read_sources_file(path: str) -> Dict[str, Any]:
+    """
+    Lit sources.json
+
+    Args:
+        path (str): Chemin de sources.json
+
+    Returns:
+        Dict[str, Any]: Contenu du fichier
+
+    Raises:
+        OSError: Si le fichier est illisible
+        ValueError: Si le fichier n'est pas un objet JSON
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise SourceValidationError("sources.json doit contenir un objet")
+    return data
+
+
+def valid_sources(data: Dict[str, Any]) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[str]]:
+    """
+    Sources valides et actives de sources.json, dans l'ordre du fichier
+
+    Args:
+        data (Dict[str, Any]): Contenu de sources.json
+
+    Returns:
+        Tuple[List[Tuple[str, Dict[str, Any]]], List[str]]: Couples (type, source) et erreurs
+            des sources écartées (invalides ou en double)
+    """
+    sources: List[Tuple[str, Dict[str, Any]]] = []
+    seen = set()
+    errors = []
+    for kind, section in SOURCE_SECTIONS.items():
+        entries = data.get(section, [])
+        if not isinstance(entries, list):
+            errors.append(f"{section} doit être une liste")
+            continue
+        for position, info in enumerate(entries):
+            source_errors = validate_source(kind, info)
+            if source_errors:
+                name = info.get("name") if isinstance(info, dict) else None
+                errors.append(f"{section}[{position}]: Source {kind} {name or '?'} invalide: "
+                              f"{'; '.join(source_errors)}")
+                continue
+            if not info.get("enabled", True):
+                continue
+            key = f"{kind}:{info['url']}"
+            if key in seen:
+                errors.append(f"{section}[{position}]: source en double ({info['url']})")
+                continue
+            seen.add(key)
+            sources.append((kind, info))
+    return sources, errors
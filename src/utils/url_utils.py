@@ -0,0 +1,55 @@
+from typing import Optional
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Paramètres de suivi retirés lors de la canonicalisation
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "xtor"}
+TRACKING_PREFIXES = ("utm_",)
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonicalize_url(href: str, base_url: Optional[str] = None) -> Optional[str]:
+    """
+    Résout un lien relatif et le met sous forme canonique
+
+    - résolution par rapport à l'URL de l'article (`urljoin`)
+    - schéma et hôte en minuscules, port par défaut et identifiants retirés
+    - fragment et paramètres de suivi (utm_*, fbclid, ...) supprimés
+
+    Args:
+        href (str): Lien tel qu'extrait du HTML
+        base_url (Optional[str]): URL de l'article contenant le lien
+
+    Returns:
+        Optional[str]: URL canonique, ou None pour les liens non HTTP (ancres, mailto, ...)
+    """
+    if not href:
+        return None
+    href = href.strip()
+    if not href or href.startswith("#"):
+        return None
+
+    url = urljoin(base_url, href) if base_url else href
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return None
+
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return None
+
+    netloc = parts.hostname.lower().rstrip(".")
+    if port and port != DEFAULT_PORTS[scheme]:
+        netloc = f"{netloc}:{port}"
+
+    query = ""
+    if parts.query:
+        params = [
+            (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+        ]
+        query = urlencode(params)
+
+    return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
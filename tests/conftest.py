@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Ajout du répertoire racine au chemin de recherche des modules (comme les scripts de src/)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,202 @@
+"""
+Réclamation concurrente et expiration des baux du coordinateur distribué,
+avec de vrais processus partageant la base SQLite
+"""
+
+import os
+import time
+import multiprocessing
+
+import pytest
+
+from src.pipeline.distributed import STATUS_DONE, STATUS_LEASED, LeaseKeeper, WorkCoordinator
+
+LEASE = 0.6
+
+
+def make_sources(count):
+    return [("rss", {"url": f"https://host-{i}.example.org/feed", "category": "test"}) for i in range(count)]
+
+
+def drain(path, shard, worker, results):
+    """Réclame et termine les tâches jusqu'à ce qu'il n'en reste plus"""
+    coordinator = WorkCoordinator(path, lease_seconds=LEASE)
+    claimed = []
+    while True:
+        coordinator.heartbeat(worker, shard)
+        task = coordinator.claim(worker, shard)
+        if task is None:
+            if coordinator.unfinished() == 0:
+                break
+            time.sleep(0.05)
+            continue
+        claimed.append(task[0])
+        coordinator.complete(task[0], worker, 1)
+    coordinator.close()
+    results.put((worker, claimed))
+
+
+def drain_own_shard(path, shard, worker, results):
+    """Réclame les tâches tant que le coordinateur en donne, sans attendre"""
+    coordinator = WorkCoordinator(path, lease_seconds=LEASE)
+    claimed = []
+    coordinator.heartbeat(worker, shard)
+    task = coordinator.claim(worker, shard)
+    while task is not None:
+        claimed.append(task[0])
+        coordinator.complete(task[0], worker, 1)
+        task = coordinator.claim(worker, shard)
+    coordinator.close()
+    results.put((worker, claimed))
+
+
+def claim_and_crash(path, shard, worker):
+    """Réclame une tâche puis disparaît sans la terminer"""
+    coordinator = WorkCoordinator(path, lease_seconds=LEASE)
+    coordinator.heartbeat(worker, shard)
+    assert coordinator.claim(worker, shard) is not None
+    os._exit(0)
+
+
+def heartbeat_and_exit(path, shard, worker):
+    coordinator = WorkCoordinator(path, lease_seconds=LEASE)
+    coordinator.heartbeat(worker, shard)
+    coordinator.close()
+
+
+def long_task(path, shard, worker, duration):
+    """Tâche plus longue que le bail, gardée par un LeaseKeeper"""
+    coordinator = WorkCoordinator(path, lease_seconds=LEASE)
+    coordinator.heartbeat(worker, shard)
+    source_key, _, _ = coordinator.claim(worker, shard)
+    with LeaseKeeper(path, coordinator.run_id, source_key, worker, shard, LEASE):
+        time.sleep(duration)
+    coordinator.complete(source_key, worker, 1)
+    coordinator.close()
+
+
+def run(target, *args):
+    process = multiprocessing.Process(target=target, args=args)
+    process.start()
+    return process
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "coordinator.sqlite")
+
+
+def test_concurrent_workers_claim_each_task_once(db_path):
+    coordinator = WorkCoordinator(db_path, lease_seconds=LEASE)
+    sources = make_sources(80)
+    coordinator.init_run(sources, 4)
+
+    results = multiprocessing.Queue()
+    processes = [run(drain, db_path, shard, f"w{shard}", results) for shard in range(4)]
+    claimed = [results.get(timeout=30) for _ in processes]
+    for process in processes:
+        process.join()
+
+    keys = [key for _, worker_keys in claimed for key in worker_keys]
+    assert sorted(keys) == sorted(f"rss:{source['url']}" for _, source in sources)
+    assert coordinator.progress() == {STATUS_DONE: 80}
+    coordinator.close()
+
+
+def test_expired_lease_is_reclaimed(db_path):
+    coordinator = WorkCoordinator(db_path, lease_seconds=LEASE)
+    coordinator.init_run(make_sources(1), 1)
+
+    crashed = run(claim_and_crash, db_path, 0, "crashed")
+    crashed.join()
+    coordinator.heartbeat("survivor", 0)
+    assert coordinator.claim("survivor", 0) is None
+
+    time.sleep(LEASE + 0.1)
+    task = coordinator.claim("survivor", 0)
+    assert task is not None
+    attempts = coordinator.conn.execute("SELECT attempts FROM tasks WHERE source_key = ?", (task[0],)).fetchone()[0]
+    assert attempts == 2
+    coordinator.close()
+
+
+def test_unstarted_shard_is_not_stolen_until_its_worker_goes_silent(db_path):
+    coordinator = WorkCoordinator(db_path, lease_seconds=LEASE)
+    distribution = coordinator.init_run(make_sources(40), 2)
+    assert distribution[0] and distribution[1]
+
+    results = multiprocessing.Queue()
+    worker = run(drain_own_shard, db_path, 0, "w0", results)
+    _, claimed = results.get(timeout=30)
+    worker.join()
+    # Le worker du shard 1 n'a pas démarré: ses hôtes lui restent réservés
+    assert len(claimed) == distribution[0]
+    assert coordinator.unfinished() == distribution[1]
+
+    # Le worker du shard 1 s'est signalé puis s'est tu: ses tâches sont reprises
+    run(heartbeat_and_exit, db_path, 1, "w1").join()
+    time.sleep(LEASE + 0.1)
+    worker = run(drain_own_shard, db_path, 0, "w0", results)
+    _, claimed = results.get(timeout=30)
+    worker.join()
+    assert len(claimed) == distribution[1]
+    assert coordinator.unfinished() == 0
+    coordinator.close()
+
+
+def test_lease_keeper_renews_long_tasks(db_path):
+    coordinator = WorkCoordinator(db_path, lease_seconds=LEASE)
+    coordinator.init_run(make_sources(1), 1)
+
+    worker = run(long_task, db_path, 0, "slow", 3 * LEASE)
+    deadline = time.time() + 2.5 * LEASE
+    while time.time() < deadline:
+        status = coordinator.conn.execute("SELECT status FROM tasks").fetchone()[0]
+        if status == STATUS_LEASED:
+            # Bail renouvelé: un autre worker ne peut pas reprendre la tâche en cours
+            assert coordinator.claim("other", 0) is None
+        time.sleep(0.05)
+    worker.join()
+
+    assert coordinator.progress() == {STATUS_DONE: 1}
+    attempts = coordinator.conn.execute("SELECT attempts FROM tasks").fetchone()[0]
+    assert attempts == 1
+    coordinator.close()
+
+
+def test_new_run_is_not_claimed_by_previous_run_workers(db_path):
+    first = WorkCoordinator(db_path, lease_seconds=LEASE)
+    first.init_run(make_sources(5), 1)
+    old_worker = WorkCoordinator(db_path, lease_seconds=LEASE)
+    old_worker.heartbeat("old", 0)
+
+    second = WorkCoordinator(db_path, lease_seconds=LEASE)
+    second.init_run(make_sources(5), 1)
+    assert old_worker.claim("old", 0) is None
+    assert old_worker.unfinished() == 0
+    assert second.unfinished() == 5
+    assert second.conn.execute("SELECT COUNT(*) FROM workers").fetchone()[0] == 0
+
+    for coordinator in (first, old_worker, second):
+        coordinator.close()
+
+
+def test_lost_lease_cannot_complete(db_path):
+    coordinator = WorkCoordinator(db_path, lease_seconds=LEASE)
+    coordinator.init_run(make_sources(1), 1)
+    coordinator.heartbeat("slow", 0)
+    source_key, _, _ = coordinator.claim("slow", 0)
+
+    # Bail expiré puis repris: le premier worker ne peut plus ni terminer ni échouer la tâche
+    time.sleep(LEASE + 0.1)
+    coordinator.heartbeat("other", 0)
+    assert coordinator.claim("other", 0)[0] == source_key
+    assert not coordinator.renew(source_key, "slow")
+    assert not coordinator.complete(source_key, "slow", 3)
+    coordinator.fail(source_key, "slow", "timeout")
+    assert coordinator.progress() == {STATUS_LEASED: 1}
+
+    assert coordinator.complete(source_key, "other", 3)
+    assert not coordinator.complete(source_key, "other", 3)
+    assert coordinator.progress() == {STATUS_DONE: 1}
+    coordinator.close()
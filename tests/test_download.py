@@ -0,0 +1,130 @@
+"""
+Téléchargement borné: une bombe de décompression ne dépasse jamais la limite,
+pour chaque Content-Encoding pris en charge
+"""
+
+import zlib
+import gzip
+
+import pytest
+
+from src.collectors import download
+from src.collectors.download import DEFAULT_MAX_BYTES, _Decompressor, fetch_bounded
+
+# Corps décompressé bien au-delà de la limite (64 Mo de zéros, quelques dizaines de Ko compressés)
+BOMB_SIZE = 64 * 1024 * 1024
+
+
+class FakeRaw:
+    def __init__(self, body):
+        self.body = body
+        self.read_bytes = 0
+
+    def stream(self, amount, decode_content=False):
+        # Blocs plus petits que demandé, comme sur le réseau: la bombe tient en quelques blocs
+        amount = min(amount, 8192)
+        for start in range(0, len(self.body), amount):
+            chunk = self.body[start:start + amount]
+            self.read_bytes += len(chunk)
+            yield chunk
+
+
+class FakeResponse:
+    def __init__(self, body, content_encoding):
+        self.url = "https://example.org/bomb"
+        self.status_code = 200
+        self.headers = {"Content-Encoding": content_encoding, "Content-Type": "text/html"}
+        self.raw = FakeRaw(body)
+        self.closed = False
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    def __init__(self, body, content_encoding):
+        self.response = FakeResponse(body, content_encoding)
+
+    def get(self, url, headers=None, timeout=None, stream=False):
+        self.headers = headers
+        return self.response
+
+
+def zeros():
+    return bytes(BOMB_SIZE)
+
+
+def compress_deflate(data, wbits):
+    compressor = zlib.compressobj(9, zlib.DEFLATED, wbits)
+    return compressor.compress(data) + compressor.flush()
+
+
+def decompressed_sizes(body, content_encoding):
+    """Taille de sortie de chaque appel du décodeur, avec la limite de fetch_bounded"""
+    decompressor = _Decompressor(content_encoding)
+    sizes = []
+    total = 0
+    for start in range(0, len(body), 8192):
+        data = decompressor.decompress(body[start:start + 8192], DEFAULT_MAX_BYTES - total + 1)
+        sizes.append(len(data))
+        total += len(data)
+        if total > DEFAULT_MAX_BYTES:
+            break
+    return sizes
+
+
+@pytest.mark.parametrize("content_encoding, body", [
+    ("gzip", lambda: gzip.compress(zeros(), 9)),
+    ("deflate", lambda: compress_deflate(zeros(), zlib.MAX_WBITS)),
+    ("deflate", lambda: compress_deflate(zeros(), -zlib.MAX_WBITS)),
+], ids=["gzip", "deflate-zlib", "deflate-raw"])
+def test_zlib_bomb_is_capped(content_encoding, body):
+    body = body()
+    # Aucun appel du décodeur ne produit plus que la limite plus un octet
+    assert max(decompressed_sizes(body, content_encoding)) <= DEFAULT_MAX_BYTES + 1
+
+    session = FakeSession(body, content_encoding)
+    result = fetch_bounded("https://example.org/bomb", {}, 5, session=session)
+    assert len(result.data) == DEFAULT_MAX_BYTES
+    assert result.truncated
+    assert result.data == bytes(DEFAULT_MAX_BYTES)
+    # Lecture arrêtée à la limite: le reste de la réponse n'est pas téléchargé
+    assert session.response.raw.read_bytes < len(body)
+    assert session.response.closed
+
+
+def test_brotli_bomb_is_capped():
+    brotli = pytest.importorskip("brotli")
+    if not download.BROTLI_AVAILABLE:
+        pytest.skip("brotli sans sortie bornée (output_buffer_limit)")
+    body = brotli.compress(zeros(), quality=11)
+    assert max(decompressed_sizes(body, "br")) <= DEFAULT_MAX_BYTES + 1
+
+    session = FakeSession(body, "br")
+    result = fetch_bounded("https://example.org/bomb", {}, 5, session=session)
+    assert len(result.data) == DEFAULT_MAX_BYTES
+    assert result.truncated
+    assert "br" in session.headers["Accept-Encoding"]
+
+
+def test_brotli_small_body_is_complete():
+    brotli = pytest.importorskip("brotli")
+    if not download.BROTLI_AVAILABLE:
+        pytest.skip("brotli sans sortie bornée (output_buffer_limit)")
+    text = b"<html><body>" + b"veille " * 50000 + b"</body></html>"
+    result = fetch_bounded("https://example.org/page", {}, 5, session=FakeSession(brotli.compress(text), "br"))
+    assert result.data == text
+    assert not result.truncated
+
+
+def test_brotli_not_announced_without_bounded_decoder():
+    if download.BROTLI_AVAILABLE:
+        assert "br" in download.SUPPORTED_ENCODINGS
+        return
+    assert "br" not in download.ACCEPT_ENCODING
+    assert download.supported_accept_encoding("gzip, deflate, br, zstd") == "gzip, deflate"
+    with pytest.raises(ValueError):
+        _Decompressor("br")
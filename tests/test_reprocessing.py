@@ -0,0 +1,100 @@
+"""
+Retraitement interrompu puis repris: les fichiers terminés ne sont pas refaits,
+aucune sortie tronquée n'est installée ni marquée à jour
+"""
+
+import os
+import json
+
+import pytest
+
+from src.processors import reprocessing, text_processor
+from src.processors.reprocessing import ReprocessCheckpoint, reprocess_all_data
+
+FILES = 4
+ARTICLES = 3
+
+
+@pytest.fixture
+def dirs(tmp_path, monkeypatch):
+    # Pas d'alertes pendant les tests (watchlist.json du projet)
+    monkeypatch.setattr(text_processor, "get_watchlist_engine", lambda path: None)
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    for f in range(FILES):
+        articles = [{"title": f"Article {f}-{i}", "link": f"https://example.org/{f}/{i}",
+                     "summary": "<p>Post-quantum cryptography</p>", "content": "<p>Lattice based schemes</p>",
+                     "published": "2024-05-01", "category": "pq", "source_name": "example"}
+                    for i in range(ARTICLES)]
+        (raw / f"rss_{f}.json").write_text(json.dumps(articles), encoding="utf-8")
+    return str(raw), str(tmp_path / "processed")
+
+
+def reprocess(raw, out):
+    return reprocess_all_data(raw, out, max_workers=1, save_csv=False, topic_vectorizer=None,
+                              relevance_path=None, extract_entities=False)
+
+
+def outputs(out):
+    return sorted(name for name in os.listdir(out) if name.startswith("processed_") and name.endswith(".json"))
+
+
+def test_interrupted_run_resumes(dirs, monkeypatch):
+    raw, out = dirs
+    write_output = reprocessing._write_output
+    calls = []
+
+    def interrupted(data, output_path):
+        calls.append(output_path)
+        if len(calls) == 3:
+            # Arrêt en pleine écriture: fichier temporaire partiel
+            with open(output_path + ".tmp", "w", encoding="utf-8") as f:
+                f.write('[{"title": "tronq')
+            raise KeyboardInterrupt
+        write_output(data, output_path)
+
+    monkeypatch.setattr(reprocessing, "_write_output", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        reprocess(raw, out)
+    monkeypatch.setattr(reprocessing, "_write_output", write_output)
+
+    # Seules les sorties terminées existent, et elles sont complètes
+    assert len(outputs(out)) == 2
+    assert not os.path.exists(calls[2])
+    for name in outputs(out):
+        with open(os.path.join(out, name), encoding="utf-8") as f:
+            assert len(json.load(f)) == ARTICLES
+
+    stats = reprocess(raw, out)
+    assert stats["skipped_files"] == 2
+    assert stats["reprocessed_files"] == FILES - 2
+    assert stats["failed_files"] == 0
+    assert len(outputs(out)) == FILES
+    with open(os.path.join(out, "all_processed_data.json"), encoding="utf-8") as f:
+        assert len(json.load(f)) == FILES * ARTICLES
+
+    # Tout est à jour: rien n'est refait
+    stats = reprocess(raw, out)
+    assert stats["skipped_files"] == FILES
+    assert stats["reprocessed_files"] == 0
+
+
+def test_serialization_error_is_not_marked_done(dirs, monkeypatch):
+    raw, out = dirs
+
+    def failing(value):
+        raise TypeError("non sérialisable")
+
+    monkeypatch.setattr(reprocessing, "to_serializable", failing)
+    stats = reprocess(raw, out)
+    assert stats["failed_files"] == FILES
+    assert outputs(out) == []
+    assert not [name for name in os.listdir(out) if name.endswith(".tmp")]
+    with ReprocessCheckpoint(os.path.join(out, "reprocess_state.sqlite")) as checkpoint:
+        assert checkpoint.conn.execute("SELECT COUNT(*) FROM units").fetchone()[0] == 0
+
+    monkeypatch.undo()
+    monkeypatch.setattr(text_processor, "get_watchlist_engine", lambda path: None)
+    stats = reprocess(raw, out)
+    assert stats["reprocessed_files"] == FILES
+    assert len(outputs(out)) == FILES